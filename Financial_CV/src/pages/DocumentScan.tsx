@@ -24,7 +24,7 @@ export default function DocumentScanAccessible(): JSX.Element {
 
   // ===== 백엔드 연결 =====
   const API_BASE = "";
-  const OCR_PREVIEW_ENDPOINT = `/ocr/ingest-preview`;
+  const OCR_PREVIEW_RAW_ENDPOINT = `/ocr/ingest-preview/raw`;
   const OCR_CREATE_ENDPOINT  = `/ocr/ingest-create`;
   const DEFAULT_MODEL = "gpt-4o-mini";
   const DEFAULT_USER_ID = 1;
@@ -325,20 +325,23 @@ export default function DocumentScanAccessible(): JSX.Element {
 
   // ===== 서버 통신 =====
   const analyzeCanvasOCR = useCallback(async (canvas: HTMLCanvasElement) => {
-    const dataURL = canvas.toDataURL("image/png");
-    const payload = { user_id: getUserId(), image: dataURL, model: DEFAULT_MODEL };
-
     setStatus("OCR 인식 중...");
     try {
-      const { data } = await api.post(`${API_BASE}${OCR_PREVIEW_ENDPOINT}`, payload);
+      // base64 data URL 대신 이미지 바이너리 그대로 전송 (본문 약 25% 감소, 서버 디코딩 없음)
+      const blob: Blob = await new Promise((resolve, reject) =>
+        canvas.toBlob(b => (b ? resolve(b) : reject(new Error("이미지 변환 실패"))), "image/png"));
+      const { data } = await api.post(`${API_BASE}${OCR_PREVIEW_RAW_ENDPOINT}`, blob, {
+        params: { model: DEFAULT_MODEL },
+        headers: { 'Content-Type': blob.type },
+      });
       const text = (data?.ocr_text || "").replace(/(^|\n)\s*document\.?context\s*:.+$/gmi, "").trim();
-      return { text, dataURL };
+      return { text };
     } catch (err: any) {
       const detail = err?.response?.data?.detail;
       const msg = typeof detail === 'string' ? detail : (err?.message || '요청 실패');
       throw new Error(msg);
     }
-  }, [API_BASE, getUserId]);
+  }, [API_BASE]);
 
   const createDocumentWithServer = useCallback(async (ocr_text: string) => {
     setStatus("문서 생성 중...");
@@ -1,12 +1,13 @@
-from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel import Session, SQLModel
 import os
 from dotenv import load_dotenv
 
+from app.dependencies.database import get_domain_engine
+
 load_dotenv()
 
 account_db_url = 'sqlite:///accounts.db'
-db_conn_args = {'check_same_thread': False}
-account_db_engine = create_engine(account_db_url, connect_args=db_conn_args)
+account_db_engine = get_domain_engine(account_db_url)
 
 def get_account_session():
     with Session(account_db_engine) as session:
@@ -0,0 +1,162 @@
+# app/dependencies/auth.py
+"""
+요청 인증 의존성 (JWT + Redis 세션 + 사용자 캐시)
+
+- Authorization: Bearer <access_token> 의 JWT 검증 (JWTUtil.decode_token)
+- Redis 한 번(MGET)으로 세션 키 user:{id} (로그인/가입 시 저장) 와 사용자 캐시 user_cache:{id} 를 같이 조회
+    세션 없음 → 401 (만료/로그아웃)
+    세션의 access_token 과 다른 토큰 → 401 (다시 로그인해서 교체된 이전 토큰)
+    캐시 적중 → DB 조회 없이 반환
+    캐시 없음 → DB 조회 후 캐시에 기록 (write-through)
+- update_user / delete_user / 계정 잠금 시 invalidate_user 로 캐시 삭제
+- Redis 장애 시에는 JWT 검증 + DB 조회로 동작
+
+환경변수
+    USER_CACHE_TTL_SECONDS=300
+"""
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Optional
+
+from dotenv import load_dotenv
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlmodel import Session
+
+from app.dependencies.jwt_db import JWTUtil
+from app.dependencies.redis_db import asetex_many, get_redis
+from app.dependencies.user_db import get_user_session
+from app.models.user_models import User
+
+load_dotenv()
+
+logger = logging.getLogger("auth")
+
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+
+_bearer = HTTPBearer(auto_error=False)
+_jwt = JWTUtil()
+
+
+class AuthUser(BaseModel):
+    """요청 경로에서 쓰는 사용자 정보 (비밀번호 해시 제외)"""
+    user_id: int
+    user_name: str
+    user_login_id: str
+    user_locked: bool
+    created_at: datetime
+
+
+def session_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def user_cache_key(user_id: int) -> str:
+    return f"user_cache:{user_id}"
+
+
+def _to_auth_user(user: User) -> AuthUser:
+    return AuthUser(
+        user_id=user.user_id,
+        user_name=user.user_name,
+        user_login_id=user.user_login_id,
+        user_locked=user.user_locked,
+        created_at=user.created_at,
+    )
+
+
+def cache_user(redisDB, user: User) -> AuthUser:
+    auth_user = _to_auth_user(user)
+    try:
+        redisDB.setex(user_cache_key(user.user_id), USER_CACHE_TTL_SECONDS, auth_user.model_dump_json())
+    except RedisError as e:
+        logger.warning("user cache write failed: %s", e)
+    return auth_user
+
+
+def _session_items(user: User, token: str, session_ttl: int) -> list:
+    session_json = json.dumps({
+        "user_id": user.user_id,
+        "user_login_id": user.user_login_id,
+        "user_name": user.user_name,
+        "created_at": user.created_at.isoformat(),
+        "access_token": token,
+    })
+    return [
+        (session_key(user.user_id), session_ttl, session_json),
+        (user_cache_key(user.user_id), USER_CACHE_TTL_SECONDS, _to_auth_user(user).model_dump_json()),
+    ]
+
+
+async def astore_session(redisDB, user: User, token: str, session_ttl: int) -> None:
+    """세션 + 사용자 캐시를 파이프라인 1회로 기록 (로그인/가입, redis.asyncio 클라이언트)"""
+    await asetex_many(redisDB, _session_items(user, token, session_ttl))
+
+
+def invalidate_user(user_id: int, drop_session: bool = False, redisDB=None) -> None:
+    """사용자 정보가 바뀌면 캐시 삭제 (drop_session=True 면 세션도 삭제 → 기존 토큰 무효)"""
+    redisDB = redisDB or get_redis()
+    keys = [user_cache_key(user_id)]
+    if drop_session:
+        keys.append(session_key(user_id))
+    try:
+        redisDB.delete(*keys)
+    except RedisError as e:
+        logger.warning("user cache invalidate failed (user_id=%s): %s", user_id, e)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _session_token(session_raw: str) -> Optional[str]:
+    try:
+        return json.loads(session_raw).get("access_token")
+    except (ValueError, AttributeError):
+        return None
+
+
+def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+    session: Session = Depends(get_user_session),
+    redisDB=Depends(get_redis),
+) -> AuthUser:
+    if credentials is None:
+        raise _unauthorized("Not authenticated")
+    payload = _jwt.decode_token(credentials.credentials)
+    if not payload or "user_id" not in payload:
+        raise _unauthorized("Invalid or expired token")
+    user_id = int(payload["user_id"])
+
+    cached = None
+    try:
+        session_raw, cached_raw = redisDB.mget(session_key(user_id), user_cache_key(user_id))
+    except RedisError as e:
+        # 세션 확인 불가 → JWT 검증만으로 통과, 사용자는 DB 에서
+        logger.warning("redis unavailable, falling back to DB: %s", e)
+    else:
+        if session_raw is None:
+            raise _unauthorized("Session expired")
+        if _session_token(session_raw) != credentials.credentials:
+            raise _unauthorized("Session superseded")
+        cached = cached_raw
+
+    if cached is not None:
+        auth_user = AuthUser.model_validate_json(cached)
+    else:
+        user = session.get(User, user_id)
+        if user is None:
+            raise _unauthorized("User not found")
+        auth_user = cache_user(redisDB, user)
+
+    if auth_user.user_locked:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account locked")
+    return auth_user
@@ -0,0 +1,147 @@
+# app/dependencies/blob_store.py
+"""
+첨부 파일 content-addressed 저장소
+
+- 원본: {FILE_STORAGE_DIR}/blobs/ab/cd/<sha256>  (해시 앞 4자리로 2단계 샤딩 → 디렉터리당 파일 수 제한)
+  같은 내용은 한 번만 저장, 참조 수는 Files 테이블에서 sha256 이 같은 행 수 (file_service 에서 관리)
+- 파생 이미지: 처음 요청할 때 한 번 만들고 디스크에 캐시 → 이후 원본 디코딩 없음
+    thumbnail : 긴 변 THUMBNAIL_MAX_SIDE px JPEG (목록 화면)
+  {FILE_STORAGE_DIR}/derived/ab/cd/<sha256>.<kind>.<ext>
+  JPEG 원본은 draft 모드로 디코딩 단계에서 축소 (전체 해상도 디코딩 생략)
+- 이미지가 아닌 파일(PDF 등), 깨진 이미지, 픽셀 수가 Pillow 한도(MAX_IMAGE_PIXELS)를 넘는 이미지는 파생 이미지 없음 (→ 404)
+
+환경변수
+    FILE_STORAGE_DIR=app/files
+    THUMBNAIL_MAX_SIDE=320 / THUMBNAIL_QUALITY=80
+"""
+import os
+import threading
+import uuid
+from typing import Dict, NamedTuple, Optional
+
+from dotenv import load_dotenv
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+load_dotenv()
+
+FILE_STORAGE_DIR = os.getenv("FILE_STORAGE_DIR", os.path.join('app', 'files'))
+THUMBNAIL_MAX_SIDE = int(os.getenv("THUMBNAIL_MAX_SIDE", "320"))
+THUMBNAIL_QUALITY = int(os.getenv("THUMBNAIL_QUALITY", "80"))
+
+BLOB_DIR = os.path.join(FILE_STORAGE_DIR, "blobs")
+DERIVED_DIR = os.path.join(FILE_STORAGE_DIR, "derived")
+
+
+class Derivative(NamedTuple):
+    max_side: int
+    mode: str
+    format: str
+    ext: str
+    media_type: str
+
+
+DERIVATIVES: Dict[str, Derivative] = {
+    "thumbnail": Derivative(THUMBNAIL_MAX_SIDE, "RGB", "JPEG", "jpg", "image/jpeg"),
+}
+# 예전에 만들던 파생 이미지 (원본 삭제 시 같이 정리)
+_RETIRED_DERIVATIVE_SUFFIXES = ("ocr.png",)
+
+# 같은 파생 이미지를 동시에 여러 번 만들지 않도록 해시 기준 락 (고정 개수로 분산)
+_LOCK_STRIPES = 64
+_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+
+def _shard(root: str, sha256: str) -> str:
+    return os.path.join(root, sha256[:2], sha256[2:4])
+
+
+def blob_path(sha256: str) -> str:
+    return os.path.join(_shard(BLOB_DIR, sha256), sha256)
+
+
+def derivative_path(sha256: str, kind: str) -> str:
+    spec = DERIVATIVES[kind]
+    return os.path.join(_shard(DERIVED_DIR, sha256), f"{sha256}.{kind}.{spec.ext}")
+
+
+def temp_path() -> str:
+    """업로드 임시 파일 경로 (원본과 같은 파일시스템 → os.replace 가 원자적)"""
+    os.makedirs(FILE_STORAGE_DIR, exist_ok=True)
+    return os.path.join(FILE_STORAGE_DIR, f".{uuid.uuid4().hex}.part")
+
+
+def store_blob(tmp_path: str, sha256: str) -> str:
+    """임시 파일을 원본 위치로 이동 (이미 있으면 같은 내용으로 원자적 교체 → 결과적으로 1벌만 남음)"""
+    path = blob_path(sha256)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def trash_blob(sha256: str) -> Optional[str]:
+    """
+    참조가 없어진 원본을 삭제 대기 이름으로 이동 (DB 커밋 전에 호출)
+    - 커밋 성공 → purge_trash, 실패 → restore_blob
+    """
+    path = blob_path(sha256)
+    trash = f"{path}.{uuid.uuid4().hex}.trash"
+    try:
+        os.replace(path, trash)
+    except FileNotFoundError:
+        return None
+    return trash
+
+
+def restore_blob(trash: str) -> None:
+    os.replace(trash, trash.rsplit(".", 2)[0])
+
+
+def purge_trash(trash: str, sha256: str) -> None:
+    _remove_quietly(trash)
+    for kind in DERIVATIVES:
+        _remove_quietly(derivative_path(sha256, kind))
+    for suffix in _RETIRED_DERIVATIVE_SUFFIXES:
+        _remove_quietly(os.path.join(_shard(DERIVED_DIR, sha256), f"{sha256}.{suffix}"))
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _render(src: str, dest: str, spec: Derivative) -> None:
+    with Image.open(src) as im:
+        # JPEG 는 디코딩 시 1/2, 1/4, 1/8 로 줄여서 읽음 (목표 크기 이상 유지)
+        im.draft(spec.mode, (spec.max_side, spec.max_side))
+        out = ImageOps.exif_transpose(im).convert(spec.mode)
+    out.thumbnail((spec.max_side, spec.max_side), Image.LANCZOS)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp = f"{dest}.{uuid.uuid4().hex}.tmp"
+    try:
+        if spec.format == "JPEG":
+            out.save(tmp, spec.format, quality=THUMBNAIL_QUALITY, optimize=True)
+        else:
+            out.save(tmp, spec.format)
+        os.replace(tmp, dest)
+    finally:
+        _remove_quietly(tmp)
+
+
+def get_derivative(sha256: str, kind: str) -> Optional[str]:
+    """파생 이미지 경로 (없으면 생성), 원본이 없거나 이미지가 아니거나 너무 크면(decompression bomb) None"""
+    dest = derivative_path(sha256, kind)
+    if os.path.exists(dest):
+        return dest
+    with _locks[int(sha256[:4], 16) % _LOCK_STRIPES]:
+        if os.path.exists(dest):
+            return dest
+        src = blob_path(sha256)
+        if not os.path.exists(src):
+            return None
+        try:
+            _render(src, dest, DERIVATIVES[kind])
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+            return None
+    return dest
@@ -0,0 +1,169 @@
+# app/dependencies/database.py
+"""
+공용 DB 엔진 팩토리
+
+- 도메인별(user/file/document/account/transaction/reminder) DB 모듈이 모두 이 팩토리로 엔진을 생성
+- sqlite 연결마다 WAL / synchronous=NORMAL / busy_timeout / mmap_size PRAGMA 적용
+- 같은 URL이면 엔진(=커넥션 풀)을 하나만 생성해서 공유
+- DB_SINGLE_FILE=true 이면 모든 도메인이 DATABASE_URL 하나의 파일을 사용 (도메인 간 JOIN 가능)
+- begin_write(session): 읽고-쓰는 트랜잭션 시작 시 sqlite 쓰기 락을 먼저 확보 (BEGIN IMMEDIATE)
+- add_missing_columns(engine, table): 기존 테이블에 모델에서 새로 생긴 nullable 컬럼 추가 (create_all 은 추가하지 않음)
+"""
+import os
+import threading
+from typing import Dict, List
+
+from dotenv import load_dotenv
+from sqlalchemy import Table, event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine
+
+load_dotenv()
+
+# ----------------------------
+# 설정 (환경변수로 조정)
+# ----------------------------
+DB_SINGLE_FILE = os.getenv("DB_SINGLE_FILE", "false").lower() in ("1", "true", "yes")
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./financial_cv.db")
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return _is_sqlite(url) and (url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url)
+
+
+def _apply_sqlite_pragmas(dbapi_conn, connection_record):
+    """새 sqlite 커넥션이 풀에 들어올 때 한 번만 실행"""
+    cursor = dbapi_conn.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        # 음수 값은 KiB 단위
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+def build_engine(url: str, echo: bool = False) -> Engine:
+    """캐시 없이 엔진을 새로 생성 (벤치마크/테스트용으로도 사용)"""
+    if _is_sqlite_memory(url):
+        # 인메모리 DB는 커넥션 하나를 공유해야 데이터가 유지됨
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            echo=echo,
+        )
+    elif _is_sqlite(url):
+        engine = create_engine(
+            url,
+            connect_args={
+                "check_same_thread": False,
+                # 드라이버 레벨 lock 대기(초) - busy_timeout 과 동일하게 맞춤
+                "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+            },
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            echo=echo,
+        )
+    else:
+        engine = create_engine(
+            url,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_pre_ping=True,
+            echo=echo,
+        )
+
+    if _is_sqlite(url) and not _is_sqlite_memory(url):
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def get_engine(url: str) -> Engine:
+    """URL 당 하나의 엔진(커넥션 풀)을 공유"""
+    engine = _engines.get(url)
+    if engine is not None:
+        return engine
+    with _engines_lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = build_engine(url)
+            _engines[url] = engine
+    return engine
+
+
+def get_domain_engine(default_url: str) -> Engine:
+    """
+    도메인 DB 모듈에서 사용하는 엔진
+    - 단일 파일 모드: 모든 도메인이 DATABASE_URL 엔진을 공유
+    - 기본 모드: 도메인별 기존 파일(default_url) 사용
+    """
+    if DB_SINGLE_FILE:
+        return get_engine(DATABASE_URL)
+    return get_engine(default_url)
+
+
+def begin_write(session: Session) -> None:
+    """
+    쓰기 트랜잭션 시작
+    - sqlite 기본(DEFERRED) 트랜잭션은 첫 쓰기 때 락을 올리므로, 읽은 값으로 판단 후 쓰는 동안 다른 쓰기가 끼어들 수 있음
+      → BEGIN IMMEDIATE 로 시작부터 RESERVED 락을 잡아 같은 DB 의 쓰기 트랜잭션을 직렬화 (대기는 busy_timeout)
+    - 이미 트랜잭션이 열려 있거나 sqlite 가 아니면 아무것도 하지 않음 (조건부 UPDATE 로 보호)
+    """
+    conn = session.connection()
+    if conn.dialect.name != "sqlite":
+        return
+    if not conn.connection.dbapi_connection.in_transaction:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def add_missing_columns(engine: Engine, table: Table) -> List[str]:
+    """
+    create_all 이후 호출: 이미 있는 테이블에 없는 컬럼을 ALTER TABLE ADD COLUMN 으로 추가하고 인덱스 생성
+    - 기존 행은 NULL 이므로 새 컬럼은 nullable 이어야 함
+    - 추가한 컬럼 이름 목록 반환
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table(table.name):
+        return []
+    existing = {column["name"] for column in inspector.get_columns(table.name)}
+    quote = engine.dialect.identifier_preparer.quote
+    added = []
+    with engine.begin() as conn:
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} {column_type}")
+            added.append(column.name)
+    for index in table.indexes:
+        index.create(bind=engine, checkfirst=True)
+    return added
+
+
+def dispose_engines():
+    """서버 종료 시 모든 풀의 커넥션 정리 (엔진 객체는 유지되어 재사용 가능)"""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
@@ -1,12 +1,13 @@
-from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel import Session, SQLModel
 import os
 from dotenv import load_dotenv
 
+from app.dependencies.database import get_domain_engine
+
 load_dotenv()
 
 document_db_url = 'sqlite:///documents.db'
-db_conn_args = {'check_same_thread': False}
-document_db_engine = create_engine(document_db_url, connect_args=db_conn_args)
+document_db_engine = get_domain_engine(document_db_url)
 
 def get_document_session():
     with Session(document_db_engine) as session:
@@ -1,14 +1,15 @@
-from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel import Session, SQLModel
 import os
 from dotenv import load_dotenv
 
+from app.dependencies.database import add_missing_columns, get_domain_engine
+from app.models.file_models import Files
+
 load_dotenv()
 
 file_db_url = 'sqlite:///file.db'
 
-db_conn_args = {'check_same_thread': False}
-
-file_db_engine = create_engine(file_db_url, connect_args=db_conn_args)
+file_db_engine = get_domain_engine(file_db_url)
 
 def get_files_session():
     with Session(file_db_engine) as session:
@@ -16,4 +17,6 @@ def get_files_session():
 
 def create_file_db():
     SQLModel.metadata.create_all(file_db_engine)
+    # 기존 file.db 에 file_name/file_size/content_type/sha256 컬럼 추가
+    add_missing_columns(file_db_engine, Files.__table__)
     
\ No newline at end of file
@@ -0,0 +1,282 @@
+# app/dependencies/file_serving.py
+"""
+첨부 파일 전송 (조건부 요청 + Range + zero-copy) / 게시글 파일 zip 스트리밍
+
+- ETag: 내용 해시 기반 강한 ETag ("<sha256>", 파생 이미지는 "<sha256>.<kind>")
+  해시가 없는 기존 파일은 약한 ETag (W/"mtime-크기")
+- If-None-Match(우선) / If-Modified-Since 가 맞으면 본문 없이 304
+- Range: bytes=a-b / a- / -n 단일 구간 → 206 + Content-Range, 파일 밖이면 416, 여러 구간은 전체(200)로 응답
+  If-Range 가 현재 강한 ETag / Last-Modified 와 다르면 전체 전송
+- Cache-Control: 해시 기반 파일은 file_id 별 내용이 바뀌지 않으므로 private, max-age=FILE_CACHE_MAX_AGE, immutable
+  기존 파일은 private, no-cache (매번 재검증 → 대부분 304)
+- 서버가 ASGI zero-copy 확장을 지원하면 커널 sendfile 로 전송
+    http.response.zerocopysend : 파일 + offset/count (Range 포함)
+    http.response.pathsend     : 파일 전체 경로
+  지원하지 않는 서버(uvicorn 등)는 FILE_SEND_CHUNK_BYTES 단위로 스레드에서 읽어 전송
+- zip: zipfile 이 탐색 불가 스트림에 쓰도록 해서(로컬 헤더 + 데이터 디스크립터) 청크마다 바로 전송
+  → 아카이브 전체를 메모리나 임시 파일에 만들지 않음, 이미지/PDF 는 이미 압축되어 있으므로 무압축(STORED)
+
+환경변수
+    FILE_CACHE_MAX_AGE=86400
+    FILE_SEND_CHUNK_BYTES=262144
+"""
+import asyncio
+import io
+import os
+import zipfile
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
+
+load_dotenv()
+
+FILE_CACHE_MAX_AGE = int(os.getenv("FILE_CACHE_MAX_AGE", "86400"))
+FILE_SEND_CHUNK_BYTES = int(os.getenv("FILE_SEND_CHUNK_BYTES", str(256 * 1024)))
+
+
+# ----------------------------
+# 조건부 요청 / Range
+# ----------------------------
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match 약한 비교"""
+    if header.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(tag.strip()) for tag in header.split(",")}
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _if_range_ok(request: Request, etag: str, last_modified: str) -> bool:
+    """If-Range 는 강한 비교 - 약한 ETag 나 다른 값이면 Range 무시"""
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        return not etag.startswith("W/") and if_range == etag
+    return if_range == last_modified
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """(시작, 끝 포함) / 형식이 틀리거나 여러 구간이면 None (전체 전송), 만족할 수 없으면 416"""
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_s, sep, end_s = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if start_s == "":
+            length = int(end_s)
+            if length <= 0 or size == 0:
+                raise _range_not_satisfiable(size)
+            return max(0, size - length), size - 1
+        start = int(start_s)
+        end = int(end_s) if end_s else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise _range_not_satisfiable(size)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _range_not_satisfiable(size: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+        detail="Requested range not satisfiable",
+        headers={"Content-Range": f"bytes */{size}"},
+    )
+
+
+def content_disposition(filename: str, disposition: str = "inline") -> str:
+    # 한글 파일명은 RFC 5987 filename* 로 (ASCII 대체 이름도 함께)
+    fallback = filename.encode("ascii", "ignore").decode().replace('"', "").strip() or "download"
+    return f"{disposition}; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+
+# ----------------------------
+# 응답
+# ----------------------------
+class _FileRangeResponse(Response):
+    """path 의 [start, end] 구간 전송 (zero-copy 확장이 있으면 사용)"""
+
+    def __init__(self, path: str, start: int, end: int, size: int, status_code: int,
+                 headers: Dict[str, str], media_type: str):
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.path = path
+        self.start = start
+        self.count = end - start + 1
+        self.size = size
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope.get("method") == "HEAD" or self.count <= 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if "http.response.pathsend" in extensions and self.start == 0 and self.count == self.size:
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(self.path)})
+            return
+
+        f = await asyncio.to_thread(open, self.path, "rb")
+        try:
+            if "http.response.zerocopysend" in extensions:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": f,
+                    "offset": self.start,
+                    "count": self.count,
+                    "more_body": False,
+                })
+                return
+            await asyncio.to_thread(f.seek, self.start)
+            remaining = self.count
+            while remaining > 0:
+                chunk = await asyncio.to_thread(f.read, min(FILE_SEND_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # 전송 중 파일이 줄어든 경우 응답 종료
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            f.close()
+
+
+def file_response(request: Request, path: str, media_type: str,
+                  content_hash: Optional[str] = None, filename: Optional[str] = None) -> Response:
+    """
+    조건부 요청 / Range 를 처리한 파일 응답
+    - content_hash 가 있으면 강한 ETag + immutable 캐시, 없으면 약한 ETag + 재검증
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    last_modified = formatdate(st.st_mtime, usegmt=True)
+    if content_hash:
+        etag = f'"{content_hash}"'
+        cache_control = f"private, max-age={FILE_CACHE_MAX_AGE}, immutable"
+    else:
+        etag = f'W/"{int(st.st_mtime)}-{st.st_size}"'
+        cache_control = "private, no-cache"
+    headers = {
+        "etag": etag,
+        "last-modified": last_modified,
+        "cache-control": cache_control,
+        "accept-ranges": "bytes",
+    }
+
+    if _not_modified(request, etag, st.st_mtime):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if filename:
+        headers["content-disposition"] = content_disposition(filename)
+    size = st.st_size
+    start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    range_header = request.headers.get("range")
+    if range_header and _if_range_ok(request, etag, last_modified):
+        byte_range = _parse_range(range_header, size)
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            headers["content-range"] = f"bytes {start}-{end}/{size}"
+    headers["content-length"] = str(end - start + 1)
+    return _FileRangeResponse(path, start, end, size, status_code, headers, media_type)
+
+
+# ----------------------------
+# zip 스트리밍
+# ----------------------------
+class _ZipSink(io.RawIOBase):
+    """zipfile 이 쓰는 바이트를 모아뒀다가 제너레이터가 꺼내 가는 쓰기 전용 스트림 (seek 불가)"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._offset = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        self._chunks.append(data)
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        if chunks:
+            yield b"".join(chunks)
+
+
+def unique_arcnames(names: Iterable[str]) -> List[str]:
+    """zip 안 파일명 중복 시 '이름 (1).jpg' 형태로 구분"""
+    seen: Dict[str, int] = {}
+    result = []
+    for name in names:
+        candidate = name
+        stem, ext = os.path.splitext(name)
+        while candidate in seen:
+            seen[name] += 1
+            candidate = f"{stem} ({seen[name]}){ext}"
+        seen[candidate] = 0
+        result.append(candidate)
+    return result
+
+
+def _iter_zip(entries: List[Tuple[str, str]]) -> Iterator[bytes]:
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for arcname, path in entries:
+            try:
+                info = zipfile.ZipInfo.from_file(path, arcname)
+            except FileNotFoundError:
+                continue
+            with open(path, "rb") as src, archive.open(info, mode="w") as dst:
+                while True:
+                    chunk = src.read(FILE_SEND_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+    # 중앙 디렉터리
+    yield from sink.drain()
+
+
+def zip_response(entries: List[Tuple[str, str]], filename: str) -> StreamingResponse:
+    """[(zip 안 이름, 경로)] → zip 스트리밍 응답 (동기 제너레이터라 Starlette 가 스레드에서 파일을 읽음)"""
+    return StreamingResponse(
+        _iter_zip(entries),
+        media_type="application/zip",
+        headers={"content-disposition": content_disposition(filename, "attachment")},
+    )
@@ -0,0 +1,157 @@
+# app/dependencies/http_clients.py
+"""
+외부 API(CLOVA OCR / OpenAI) 공용 비동기 클라이언트
+
+- httpx.AsyncClient 하나를 공유 (keep-alive 커넥션 풀, h2 패키지가 있으면 HTTP/2)
+- AsyncOpenAI 도 같은 커넥션 풀을 사용
+- 프로바이더별 동시 호출 수 / 타임아웃 / 재시도(지수 백오프 + 지터)를 환경변수로 설정
+    CLOVA_MAX_CONCURRENCY, CLOVA_TIMEOUT, CLOVA_MAX_RETRIES, CLOVA_BACKOFF_BASE
+    OPENAI_MAX_CONCURRENCY, OPENAI_TIMEOUT, OPENAI_MAX_RETRIES, OPENAI_BACKOFF_BASE
+"""
+import asyncio
+import logging
+import os
+import random
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+import openai
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+
+load_dotenv()
+
+logger = logging.getLogger("http_clients")
+
+T = TypeVar("T")
+
+try:
+    import h2  # noqa: F401
+    _H2_AVAILABLE = True
+except ImportError:
+    _H2_AVAILABLE = False
+
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() in ("1", "true", "yes") and _H2_AVAILABLE
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "200"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "50"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+
+# 재시도 대상 HTTP 상태코드
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class ProviderLimits:
+    """프로바이더별 동시성/타임아웃/재시도 설정"""
+
+    def __init__(self, name: str, max_concurrency: int, timeout: float, max_retries: int, backoff_base: float):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_env(cls, prefix: str, max_concurrency: int, timeout: float, max_retries: int, backoff_base: float):
+        return cls(
+            name=prefix.lower(),
+            max_concurrency=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", str(max_concurrency))),
+            timeout=float(os.getenv(f"{prefix}_TIMEOUT", str(timeout))),
+            max_retries=int(os.getenv(f"{prefix}_MAX_RETRIES", str(max_retries))),
+            backoff_base=float(os.getenv(f"{prefix}_BACKOFF_BASE", str(backoff_base))),
+        )
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    def backoff(self, attempt: int) -> float:
+        return self.backoff_base * (2 ** attempt) * (0.5 + random.random() / 2)
+
+
+CLOVA_LIMITS = ProviderLimits.from_env("CLOVA", max_concurrency=32, timeout=20, max_retries=2, backoff_base=0.5)
+OPENAI_LIMITS = ProviderLimits.from_env("OPENAI", max_concurrency=64, timeout=60, max_retries=2, backoff_base=0.5)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (httpx.TimeoutException, httpx.TransportError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUS_CODES
+    if isinstance(exc, (openai.APIConnectionError, openai.APITimeoutError, openai.RateLimitError)):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in RETRY_STATUS_CODES
+    return False
+
+
+async def call_with_retry(limits: ProviderLimits, fn: Callable[[], Awaitable[T]]) -> T:
+    """동시성 제한 안에서 fn() 호출, 일시적 오류면 백오프 후 재시도"""
+    attempt = 0
+    while True:
+        async with limits.semaphore:
+            try:
+                return await fn()
+            except Exception as e:
+                if attempt >= limits.max_retries or not is_retryable(e):
+                    raise
+                logger.warning(f"[{limits.name}] retry {attempt + 1}/{limits.max_retries}: {e!r}")
+        # 세마포어를 반납한 상태로 대기
+        await asyncio.sleep(limits.backoff(attempt))
+        attempt += 1
+
+
+# ----------------------------
+# 공용 클라이언트
+# ----------------------------
+_http_client: Optional[httpx.AsyncClient] = None
+_openai_client: Optional[AsyncOpenAI] = None
+_openai_key: Optional[str] = None
+_openai_http: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(CLOVA_LIMITS.timeout),
+        )
+    return _http_client
+
+
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    global _openai_client, _openai_key, _openai_http
+    http_client = get_http_client()
+    if _openai_client is None or _openai_key != api_key or _openai_http is not http_client:
+        _openai_client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=http_client,
+            timeout=OPENAI_LIMITS.timeout,
+            max_retries=0,  # 재시도는 call_with_retry 에서 일괄 처리
+        )
+        _openai_key = api_key
+        _openai_http = http_client
+    return _openai_client
+
+
+async def close_http_clients():
+    """서버 종료 시 커넥션 풀 정리"""
+    global _http_client, _openai_client, _openai_key, _openai_http
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _openai_client = None
+    _openai_key = None
+    _openai_http = None
@@ -0,0 +1,153 @@
+# app/dependencies/image_normalize.py
+"""
+외부 OCR/LLM 호출 전 이미지 정규화 (카메라 원본 해상도 → 작고 가벼운 이미지)
+
+- 디코딩 1회: JPEG 는 draft 모드로 디코딩 단계에서 1/2, 1/4, 1/8 축소 (전체 해상도 디코딩 생략)
+- EXIF 방향(Orientation) 적용 후 픽셀만 남기고 다시 인코딩 → EXIF(위치/기기 정보 포함) 제거
+- 긴 변 IMAGE_MAX_LONG_SIDE 로 제한
+- IMAGE_MAX_BYTES 이하가 될 때까지 품질을 IMAGE_QUALITY → IMAGE_MIN_QUALITY 로 낮추고,
+  그래도 크면 해상도를 줄여서 다시 인코딩
+- provider 별 형식: CLOVA 는 webp 를 받지 않으므로 기본 jpeg, OpenAI 는 webp
+- 이미 조건(크기/용량/방향/형식)을 만족하고 다시 인코딩해도 작아지지 않으면 원본 그대로 사용
+- 이미지가 아니면(PDF 등) None → 원본 사용
+
+환경변수
+    IMAGE_NORMALIZE=true
+    IMAGE_MAX_LONG_SIDE=2048 / IMAGE_MAX_BYTES=1048576
+    IMAGE_QUALITY=85 / IMAGE_MIN_QUALITY=50
+    CLOVA_IMAGE_FORMAT=jpeg / OPENAI_IMAGE_FORMAT=webp
+"""
+import io
+import os
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from dotenv import load_dotenv
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+load_dotenv()
+
+IMAGE_NORMALIZE = os.getenv("IMAGE_NORMALIZE", "true").lower() in ("1", "true", "yes")
+IMAGE_MAX_LONG_SIDE = int(os.getenv("IMAGE_MAX_LONG_SIDE", "2048"))
+IMAGE_MAX_BYTES = int(os.getenv("IMAGE_MAX_BYTES", str(1024 * 1024)))
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", "85"))
+IMAGE_MIN_QUALITY = int(os.getenv("IMAGE_MIN_QUALITY", "50"))
+
+# 형식 → (PIL 저장 형식, 확장자 / CLOVA format / data URL 서브타입)
+_FORMATS = {"jpeg": ("JPEG", "jpg"), "webp": ("WEBP", "webp")}
+
+
+def _parse_format(name: str, value: str) -> str:
+    value = value.strip().lower()
+    if value not in _FORMATS:
+        raise ValueError(f"{name} 는 {sorted(_FORMATS)} 중 하나여야 합니다: {value}")
+    return value
+
+
+class ProviderImage(NamedTuple):
+    format: str                 # 다시 인코딩할 형식
+    accepts: FrozenSet[str]     # 원본 그대로 보낼 수 있는 형식 (PIL 형식 이름)
+
+
+PROVIDER_IMAGES: Dict[str, ProviderImage] = {
+    "clova": ProviderImage(_parse_format("CLOVA_IMAGE_FORMAT", os.getenv("CLOVA_IMAGE_FORMAT", "jpeg")),
+                           frozenset({"JPEG", "PNG", "TIFF"})),
+    "openai": ProviderImage(_parse_format("OPENAI_IMAGE_FORMAT", os.getenv("OPENAI_IMAGE_FORMAT", "webp")),
+                            frozenset({"JPEG", "PNG", "WEBP", "GIF"})),
+}
+
+_QUALITY_STEP = 10
+# draft 축소 허용 범위: 4032px 사진을 2048 상한으로 줄일 때 1/2 디코딩(2016px)이 가능하도록 (전체 디코딩 + 리샘플 생략)
+_DRAFT_SLACK = 0.75
+_DOWNSCALE_STEP = 0.8
+_MIN_LONG_SIDE = 640
+
+_EXIF_ORIENTATION = 0x0112
+
+
+class DecodedImage(NamedTuple):
+    image: Image.Image            # 방향 적용 + 긴 변 제한된 RGB 또는 L
+    source_format: Optional[str]  # PIL 형식 이름 ("JPEG", "PNG" ...)
+    changed: bool                 # 회전 또는 축소가 있었는지 (원본을 그대로 쓸 수 없는지)
+    has_exif: bool                # 원본에 EXIF 가 있었는지
+
+
+def decode_image(raw: bytes, max_side: int = IMAGE_MAX_LONG_SIDE, gray: bool = False) -> Optional[DecodedImage]:
+    """인코딩된 바이트 → 방향 적용 + 긴 변 제한 이미지 / 이미지가 아니면 None (gray 면 L 로 디코딩)"""
+    try:
+        im = Image.open(io.BytesIO(raw))
+        source_format = im.format
+        original_size = im.size
+        has_exif = bool(im.info.get("exif"))
+        orientation = im.getexif().get(_EXIF_ORIENTATION, 1)
+        # JPEG 는 디코딩하면서 1/2, 1/4, 1/8 축소 (목표 크기의 _DRAFT_SLACK 배 이상 유지)
+        scale = min(1.0, max_side / max(original_size)) * _DRAFT_SLACK
+        im.draft("L" if gray else "RGB", (round(original_size[0] * scale), round(original_size[1] * scale)))
+        out = _flatten(ImageOps.exif_transpose(im))
+        if gray:
+            out = out.convert("L")
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        return None
+    out.thumbnail((max_side, max_side), Image.LANCZOS)
+    changed = orientation != 1 or out.size != original_size
+    return DecodedImage(out, source_format, changed, has_exif)
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """투명 영역은 흰 배경으로 (그냥 RGB 변환하면 검게 되어 글자가 묻힘), 그레이스케일은 L 유지"""
+    if image.mode in ("L", "RGB"):
+        return image
+    if image.mode == "P" and "transparency" in image.info:
+        image = image.convert("RGBA")
+    if image.mode in ("RGBA", "LA"):
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image.convert("RGBA"), mask=image.getchannel("A"))
+        return background
+    return image.convert("L" if image.mode in ("1", "I", "I;16") else "RGB")
+
+
+def _encode(image: Image.Image, pil_format: str, quality: int) -> bytes:
+    buf = io.BytesIO()
+    if pil_format == "JPEG":
+        image.save(buf, pil_format, quality=quality, optimize=True)
+    else:
+        image.save(buf, pil_format, quality=quality, method=2)  # method 4(기본)는 3~4배 느리고 크기 차이 작음
+    return buf.getvalue()
+
+
+def encode_image(image: Image.Image, fmt: str, max_bytes: int = IMAGE_MAX_BYTES) -> Tuple[str, bytes]:
+    """max_bytes 이하가 되도록 품질 → 해상도 순으로 낮춰서 인코딩, (확장자, 바이트)"""
+    pil_format, ext = _FORMATS[fmt]
+    while True:
+        for quality in range(IMAGE_QUALITY, IMAGE_MIN_QUALITY - 1, -_QUALITY_STEP):
+            data = _encode(image, pil_format, quality)
+            if len(data) <= max_bytes:
+                return ext, data
+        long_side = max(image.size)
+        if long_side <= _MIN_LONG_SIDE:
+            return ext, data   # 더 줄이면 글자를 읽을 수 없음 → 상한 초과라도 반환
+        scale = max(_MIN_LONG_SIDE / long_side, _DOWNSCALE_STEP)
+        image = image.resize((round(image.width * scale), round(image.height * scale)), Image.LANCZOS)
+
+
+def keep_original(raw: bytes, decoded: DecodedImage, accepts: FrozenSet[str], max_bytes: int = IMAGE_MAX_BYTES) -> bool:
+    """원본이 이미 조건을 만족하는지 (회전/축소 불필요, 용량 이하, 받는 형식, EXIF 없음)"""
+    return (not decoded.changed and not decoded.has_exif and len(raw) <= max_bytes
+            and decoded.source_format in accepts)
+
+
+def normalize_bytes(raw: bytes, provider: str, max_side: int = IMAGE_MAX_LONG_SIDE,
+                    max_bytes: int = IMAGE_MAX_BYTES) -> Optional[Tuple[str, bytes]]:
+    """
+    provider("clova" / "openai") 전송용 (확장자, 바이트) / 원본을 그대로 쓰면 되면 None
+    - 정규화가 꺼져 있거나 이미지가 아니면 None
+    """
+    if not IMAGE_NORMALIZE:
+        return None
+    decoded = decode_image(raw, max_side)
+    if decoded is None:
+        return None
+    spec = PROVIDER_IMAGES[provider]
+    ext, data = encode_image(decoded.image, spec.format, max_bytes)
+    if keep_original(raw, decoded, spec.accepts, max_bytes) and len(data) >= len(raw):
+        return None
+    return ext, data
@@ -0,0 +1,248 @@
+# app/dependencies/image_preprocess.py
+"""
+OCR 전처리 파이프라인 (OpenCV/NumPy 연산만 사용, 픽셀 단위 파이썬 루프 없음)
+
+폰으로 찍은 서류 사진 → 작고 깨끗한 그레이스케일/흑백 이미지
+단계 (쉼표로 나열한 순서대로 실행, 감지 실패한 단계는 건너뜀)
+    resize   : 긴 변을 OCR_TARGET_DPI × OCR_PAGE_LONG_INCH 픽셀로 제한 (기본 200dpi × A4 11.7in ≈ 2340px)
+    quad     : 축소본에서 문서 외곽 사각형 검출 → 원근 보정 (배경 제거)
+    deskew   : 축소본에서 기울기 추정(deskew.determine_skew) → 회전
+    denoise  : median 3x3
+    binarize : 적응형 임계값 (조명 불균일에 강함)
+    crop     : 글자 영역 bounding box + OCR_CROP_MARGIN 만 남김
+인코딩: 흑백이면 PNG(압축률 높음), 아니면 image_normalize.encode_image (JPEG, IMAGE_MAX_BYTES 이하)
+
+- 로컬 OCR(EasyOCR) : OCR_PREPROCESS_STEPS
+- CLOVA 전송 전     : image_normalize.decode_image 로 한 번 디코딩(EXIF 방향 적용, 긴 변 제한) 후 CLOVA_PREPROCESS_STEPS
+  빈 값이면 정규화(image_normalize.normalize_bytes)만, 디코딩할 수 없는 형식(PDF 등)이면 원본 전송
+
+환경변수
+    OCR_PREPROCESS_STEPS=resize,quad,deskew,denoise,binarize,crop
+    CLOVA_PREPROCESS_STEPS=resize,quad,deskew,crop
+    OCR_TARGET_DPI=200 / OCR_PAGE_LONG_INCH=11.7
+    OCR_THRESHOLD_C=15 / OCR_CROP_MARGIN=16
+"""
+import os
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+from deskew import determine_skew
+from dotenv import load_dotenv
+from PIL import Image
+
+from app.dependencies.image_normalize import PROVIDER_IMAGES, decode_image, encode_image, keep_original, normalize_bytes
+
+load_dotenv()
+
+ALL_STEPS = ("resize", "quad", "deskew", "denoise", "binarize", "crop")
+
+
+def _parse_steps(value: str) -> Tuple[str, ...]:
+    steps = tuple(step.strip().lower() for step in value.split(",") if step.strip())
+    unknown = set(steps) - set(ALL_STEPS)
+    if unknown:
+        raise ValueError(f"알 수 없는 전처리 단계: {sorted(unknown)}")
+    return steps
+
+
+OCR_PREPROCESS_STEPS = _parse_steps(os.getenv("OCR_PREPROCESS_STEPS", "resize,quad,deskew,denoise,binarize,crop"))
+CLOVA_PREPROCESS_STEPS = _parse_steps(os.getenv("CLOVA_PREPROCESS_STEPS", "resize,quad,deskew,crop"))
+OCR_TARGET_DPI = int(os.getenv("OCR_TARGET_DPI", "200"))
+OCR_PAGE_LONG_INCH = float(os.getenv("OCR_PAGE_LONG_INCH", "11.7"))
+OCR_THRESHOLD_C = int(os.getenv("OCR_THRESHOLD_C", "15"))
+OCR_CROP_MARGIN = int(os.getenv("OCR_CROP_MARGIN", "16"))
+
+TARGET_LONG_SIDE = round(OCR_TARGET_DPI * OCR_PAGE_LONG_INCH)
+
+_PROBE_SIDE = 640          # 사각형/기울기 검출용 축소본 긴 변
+_QUAD_MIN_AREA = 0.2       # 문서 사각형이 사진에서 차지해야 하는 최소 비율
+_SKEW_MIN_DEGREES = 0.3
+_SKEW_MAX_DEGREES = 45.0
+_CROP_BORDER = 0.02        # 보정 후 가장자리 잔상은 글자 영역 계산에서 제외
+
+
+class PreprocessResult(NamedTuple):
+    image: np.ndarray               # uint8 그레이스케일 (binarize 후에는 0/255)
+    steps: Tuple[str, ...]          # 실제 적용된 단계
+    binary: bool
+    skew_angle: Optional[float]
+
+
+def load_bgr(image) -> np.ndarray:
+    """파일 경로 / 인코딩된 바이트 / ndarray → ndarray (BGR 또는 그레이스케일)"""
+    if isinstance(image, np.ndarray):
+        return image
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        img = cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_COLOR)
+    else:
+        img = cv2.imread(image)
+    if img is None:
+        raise IOError("이미지를 디코딩할 수 없습니다.")
+    return img
+
+
+def _to_gray(img: np.ndarray) -> np.ndarray:
+    if img.ndim == 2:
+        return img
+    code = cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+    return cv2.cvtColor(img, code)
+
+
+def scale_to_long_side(img: np.ndarray, long_side: int) -> np.ndarray:
+    """긴 변이 long_side 를 넘으면 축소 (확대는 하지 않음)"""
+    h, w = img.shape[:2]
+    scale = long_side / max(h, w)
+    if scale >= 1:
+        return img
+    return cv2.resize(img, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+
+
+# ----------------------------
+# 단계
+# ----------------------------
+def _order_corners(pts: np.ndarray) -> np.ndarray:
+    """좌상, 우상, 우하, 좌하 순서 (x+y 최소/최대, y-x 최소/최대)"""
+    s = pts.sum(axis=1)
+    d = np.diff(pts, axis=1).ravel()
+    return np.array([pts[s.argmin()], pts[d.argmin()], pts[s.argmax()], pts[d.argmax()]], dtype=np.float32)
+
+
+def find_document_quad(gray: np.ndarray) -> Optional[np.ndarray]:
+    """문서 외곽 사각형 4점 (원본 좌표) / 못 찾으면 None"""
+    probe = scale_to_long_side(gray, _PROBE_SIDE)
+    ratio = gray.shape[1] / probe.shape[1]
+    edges = cv2.Canny(cv2.GaussianBlur(probe, (5, 5), 0), 50, 150)
+    edges = cv2.dilate(edges, np.ones((3, 3), np.uint8), iterations=2)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    min_area = _QUAD_MIN_AREA * probe.shape[0] * probe.shape[1]
+    for contour in sorted(contours, key=cv2.contourArea, reverse=True)[:5]:
+        if cv2.contourArea(contour) < min_area:
+            break
+        approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+        if len(approx) == 4 and cv2.isContourConvex(approx):
+            return _order_corners(approx.reshape(4, 2).astype(np.float32) * ratio)
+    return None
+
+
+def _warp_quad(gray: np.ndarray, quad: np.ndarray) -> np.ndarray:
+    tl, tr, br, bl = quad
+    width = max(np.linalg.norm(br - bl), np.linalg.norm(tr - tl))
+    height = max(np.linalg.norm(tr - br), np.linalg.norm(tl - bl))
+    scale = min(1.0, TARGET_LONG_SIDE / max(width, height))
+    out_w, out_h = max(1, int(width * scale)), max(1, int(height * scale))
+    dst = np.array([[0, 0], [out_w - 1, 0], [out_w - 1, out_h - 1], [0, out_h - 1]], dtype=np.float32)
+    matrix = cv2.getPerspectiveTransform(quad, dst)
+    return cv2.warpPerspective(gray, matrix, (out_w, out_h), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+
+
+def rotate(img: np.ndarray, angle: float) -> np.ndarray:
+    """잘리지 않도록 캔버스를 넓혀서 회전 (가장자리는 복제)"""
+    h, w = img.shape[:2]
+    m = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+    cos, sin = abs(m[0, 0]), abs(m[0, 1])
+    new_w, new_h = int(h * sin + w * cos), int(h * cos + w * sin)
+    m[0, 2] += (new_w - w) / 2
+    m[1, 2] += (new_h - h) / 2
+    return cv2.warpAffine(img, m, (new_w, new_h), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+
+
+def _threshold_block(gray: np.ndarray) -> int:
+    # 글자 획보다 충분히 큰 홀수 창 (긴 변의 약 1/60)
+    return max(15, (max(gray.shape[:2]) // 60) | 1)
+
+
+def binarize(gray: np.ndarray) -> np.ndarray:
+    return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+                                 _threshold_block(gray), OCR_THRESHOLD_C)
+
+
+def crop_to_content(gray: np.ndarray, is_binary: bool, margin: int = OCR_CROP_MARGIN) -> np.ndarray:
+    """글자(어두운 픽셀) 영역 bounding box + margin"""
+    ink = (gray < 128) if is_binary else (binarize(gray) < 128)
+    ink = cv2.morphologyEx(ink.astype(np.uint8), cv2.MORPH_OPEN, np.ones((2, 2), np.uint8)).astype(bool)
+    h, w = ink.shape
+    by, bx = int(h * _CROP_BORDER), int(w * _CROP_BORDER)
+    ink[:by] = ink[h - by:] = False
+    ink[:, :bx] = ink[:, w - bx:] = False
+    rows = np.flatnonzero(ink.any(axis=1))
+    cols = np.flatnonzero(ink.any(axis=0))
+    if rows.size == 0 or cols.size == 0:
+        return gray
+    top, bottom = max(0, rows[0] - margin), min(h, rows[-1] + margin + 1)
+    left, right = max(0, cols[0] - margin), min(w, cols[-1] + margin + 1)
+    return gray[top:bottom, left:right]
+
+
+# ----------------------------
+# 실행
+# ----------------------------
+def load_gray(image) -> np.ndarray:
+    """인코딩된 바이트는 처음부터 그레이스케일로 디코딩 (컬러 디코딩 + 변환 생략)"""
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        img = cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            raise IOError("이미지를 디코딩할 수 없습니다.")
+        return img
+    return _to_gray(load_bgr(image))
+
+
+def run_pipeline(image, steps: Sequence[str] = OCR_PREPROCESS_STEPS) -> PreprocessResult:
+    gray = load_gray(image)
+    applied: List[str] = []
+    is_binary = False
+    angle = None
+    for step in steps:
+        if step == "resize":
+            resized = scale_to_long_side(gray, TARGET_LONG_SIDE)
+            if resized is gray:
+                continue
+            gray = resized
+        elif step == "quad":
+            quad = find_document_quad(gray)
+            if quad is None:
+                continue
+            gray = _warp_quad(gray, quad)
+        elif step == "deskew":
+            angle = determine_skew(scale_to_long_side(gray, _PROBE_SIDE))
+            if angle is None or not _SKEW_MIN_DEGREES <= abs(angle) <= _SKEW_MAX_DEGREES:
+                continue
+            gray = rotate(gray, angle)
+        elif step == "denoise":
+            gray = cv2.medianBlur(gray, 3)
+        elif step == "binarize":
+            gray = binarize(gray)
+            is_binary = True
+        elif step == "crop":
+            gray = crop_to_content(gray, is_binary)
+        applied.append(step)
+    return PreprocessResult(gray, tuple(applied), is_binary, angle)
+
+
+def encode(result: PreprocessResult, fmt: str = PROVIDER_IMAGES["clova"].format) -> Tuple[str, bytes]:
+    """(CLOVA format, 바이트) - 흑백은 PNG, 그레이스케일은 fmt (IMAGE_MAX_BYTES 이하)"""
+    if not result.binary:
+        return encode_image(Image.fromarray(result.image), fmt)
+    ok, buf = cv2.imencode(".png", result.image, [cv2.IMWRITE_PNG_COMPRESSION, 6])
+    if not ok:
+        raise IOError("전처리 이미지 인코딩 실패")
+    return "png", buf.tobytes()
+
+
+def preprocess_bytes(raw: bytes, steps: Sequence[str] = CLOVA_PREPROCESS_STEPS) -> Optional[Tuple[str, bytes]]:
+    """
+    CLOVA 전송용: (format, 바이트) / 원본을 그대로 쓰면 되거나 디코딩 불가이면 None (원본 사용)
+    - 디코딩은 한 번 (JPEG draft 축소 + EXIF 방향 적용), 그 배열로 전처리 후 인코딩 → EXIF 없음
+    """
+    if not steps:
+        return normalize_bytes(raw, "clova")
+    decoded = decode_image(raw, TARGET_LONG_SIDE, gray=True)
+    if decoded is None:
+        return None
+    try:
+        ext, data = encode(run_pipeline(np.asarray(decoded.image), steps))
+    except (IOError, cv2.error):
+        return None
+    if keep_original(raw, decoded, PROVIDER_IMAGES["clova"].accepts) and len(data) >= len(raw):
+        return None
+    return ext, data
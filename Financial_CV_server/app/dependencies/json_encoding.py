@@ -0,0 +1,99 @@
+# app/dependencies/json_encoding.py
+"""
+API 공통 JSON 인코딩 규칙 (main.CustomJSONResponse 와 스트리밍 응답이 같이 사용)
+
+- datetime : "%Y-%m-%d/%H:%M:%S" (DB 에 한국 시간으로 저장된 값을 그대로 표기)
+- date     : "%Y-%m-%d"
+- 한글은 이스케이프하지 않음 (ensure_ascii=False)
+- 구분자는 공백 없는 "," ":" (orjson 유무와 관계없이 같은 바이트 출력)
+
+jsonable_encoder 처럼 중간 dict 트리를 만들지 않고, 직렬화기가 객체를 바로 쓰다가
+모르는 타입(날짜, pydantic 모델 등)을 만났을 때만 _default 를 호출한다.
+
+pip install orjson   // 설치되어 있으면 orjson, 없으면 표준 json 으로 같은 결과
+JSON_ENCODER=auto|orjson|json
+"""
+import dataclasses
+import json
+import os
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
+
+load_dotenv()
+
+DATETIME_FORMAT = "%Y-%m-%d/%H:%M:%S"
+DATE_FORMAT = "%Y-%m-%d"
+
+JSON_ENCODER = os.getenv("JSON_ENCODER", "auto").lower()
+USE_ORJSON = _ORJSON_AVAILABLE and JSON_ENCODER != "json"
+
+_ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if _ORJSON_AVAILABLE else 0
+
+
+def format_datetime(v: datetime) -> str:
+    return v.strftime(DATETIME_FORMAT)
+
+
+def format_date(v: date) -> str:
+    return v.strftime(DATE_FORMAT)
+
+
+def _decimal(v: Decimal):
+    # fastapi.encoders.decimal_encoder 와 동일: 정수면 int, 아니면 float
+    return int(v) if v.as_tuple().exponent >= 0 else float(v)
+
+
+def _default(o: Any):
+    """직렬화기가 모르는 타입 처리 (jsonable_encoder 와 같은 결과)"""
+    if isinstance(o, datetime):
+        return format_datetime(o)
+    if isinstance(o, date):
+        return format_date(o)
+    if isinstance(o, BaseModel):
+        # python 모드로 덤프 → 안의 날짜도 다시 _default 를 거쳐 같은 형식으로
+        return o.model_dump()
+    if isinstance(o, time):
+        return o.isoformat()
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, Decimal):
+        return _decimal(o)
+    if isinstance(o, (UUID, PurePath)):
+        return str(o)
+    if isinstance(o, bytes):
+        return o.decode()
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """응답 본문 전체 → UTF-8 JSON bytes"""
+    if USE_ORJSON:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def dumps_row(row: dict) -> str:
+    """DB 행(dict) 1건 → JSON 문자열 (CustomJSONResponse 와 같은 구분자/형식)"""
+    if USE_ORJSON:
+        return orjson.dumps(row, default=_default, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(row, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
@@ -45,3 +45,25 @@ REMINDERS:
 """
 
 INSTRUCTIONS_TEXT = INSTRUCTIONS
+
+# 서류 종류를 로컬 분류기(app/services/doc_classifier.py)가 정할 때 쓰는 추출 전용 프롬프트 (7개 key, 분류 지시 없음)
+INSTRUCTIONS_EXTRACT = """You extract key information from financial documents.
+
+You will be given OCR TEXT (not an image). ONLY use the provided text verbatim.
+
+RULES:
+- VERBATIM-ONLY: Every value MUST be an exact, contiguous substring of the OCR TEXT. Do NOT correct typos, normalize, infer, or change spacing, hyphens, dots, or masking (****-1234 stays ****-1234). Never "fix" unrealistic years or amounts.
+- DATES: Output ONLY a date that appears in the OCR TEXT exactly as YYYY-MM-DD. Otherwise leave blank. Never reformat.
+- AMOUNTS: Copy one contiguous amount substring, then keep digits only. Prefer a total (합계/총액/결제금액). If uncertain, leave blank.
+- MISSING OR UNCLEAR: leave the field blank. Never fabricate.
+- If the document is unclear or not a financial document, return exactly: 서류를 인식할 수 없습니다.
+
+Output ONLY these 7 lines, in this order, with no explanations:
+제목 : <short title or blank>
+거래금액 : <digits only or blank>
+거래대상 : <issuer or recipient or blank>
+계좌 은행 : <verbatim or blank>
+계좌번호 : <verbatim or blank>
+거래대상 계좌번호 : <verbatim or blank>
+지불기일 : <YYYY-MM-DD or blank>
+"""
@@ -0,0 +1,215 @@
+# app/dependencies/local_ocr.py
+"""
+로컬 EasyOCR 엔진 (오프라인 OCR, /ocr/ingest-preview provider="easyocr")
+
+- easyocr.Reader 생성(검출/인식 모델 로드)은 수 초 + 수백 MB
+  → 프로세스마다 언어 조합별로 한 번만 만들어 재사용 (get_reader)
+- EASYOCR_WORKERS 개의 spawn 프로세스 풀, 각 워커는 시작할 때 EASYOCR_LANGUAGES 리더를 미리 로드 (warm)
+  다른 언어 조합은 그 워커에서 처음 쓸 때 로드 후 캐시
+- 디코딩 + 전처리(ocr.preprocess_image) + readtext 를 모두 워커에서 실행 → 이벤트 루프/스레드풀을 막지 않음
+  워커마다 torch 스레드 수를 CPU 수 / 워커 수로 제한 (워커끼리 코어 경쟁 방지)
+- 워커가 죽어서(OOM 등) 풀이 깨지면(BrokenProcessPool) 풀을 버리고 새로 만들어 한 번 재시도
+  easyocr/torch 가 없으면 워커는 살려 두고 요청에서 ImportError → 503
+- EASYOCR_WORKERS=0 이면 서버 프로세스 안에서 스레드로 실행 (리더별 락으로 한 번에 하나씩)
+- 같은 이미지는 ocr_cache("easyocr") 결과 재사용
+
+환경변수
+    EASYOCR_WORKERS=1
+    EASYOCR_LANGUAGES=ko,en
+    EASYOCR_GPU=false
+    EASYOCR_PRELOAD=true
+    EASYOCR_MODEL_DIR=(없으면 easyocr 기본 ~/.EasyOCR/model)
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Optional, Tuple
+
+from dotenv import load_dotenv
+from fastapi import HTTPException
+
+load_dotenv()
+
+logger = logging.getLogger("local_ocr")
+
+EASYOCR_WORKERS = int(os.getenv("EASYOCR_WORKERS", "1"))
+EASYOCR_LANGUAGES = tuple(lang.strip() for lang in os.getenv("EASYOCR_LANGUAGES", "ko,en").split(",") if lang.strip())
+EASYOCR_GPU = os.getenv("EASYOCR_GPU", "false").lower() in ("1", "true", "yes")
+EASYOCR_PRELOAD = os.getenv("EASYOCR_PRELOAD", "true").lower() in ("1", "true", "yes")
+EASYOCR_MODEL_DIR = os.getenv("EASYOCR_MODEL_DIR") or None
+
+# ----------------------------
+# 리더 캐시 (워커 프로세스 / 서버 프로세스 각각)
+# ----------------------------
+_readers: Dict[Tuple[Tuple[str, ...], bool], object] = {}
+_reader_locks: Dict[Tuple[Tuple[str, ...], bool], threading.Lock] = {}
+_readers_lock = threading.Lock()
+
+
+def _reader_key(languages: Optional[Iterable[str]], gpu: Optional[bool]) -> Tuple[Tuple[str, ...], bool]:
+    return tuple(languages or EASYOCR_LANGUAGES), EASYOCR_GPU if gpu is None else gpu
+
+
+def get_reader(languages: Optional[Iterable[str]] = None, gpu: Optional[bool] = None):
+    """언어 조합별 easyocr.Reader (처음 한 번만 모델 로드)"""
+    key = _reader_key(languages, gpu)
+    reader = _readers.get(key)
+    if reader is not None:
+        return reader
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            import easyocr
+
+            reader = easyocr.Reader(list(key[0]), gpu=key[1], model_storage_directory=EASYOCR_MODEL_DIR, verbose=False)
+            _readers[key] = reader
+            _reader_locks[key] = threading.Lock()
+    return reader
+
+
+def _init_worker(languages: Tuple[str, ...], torch_threads: int):
+    # initializer 에서 예외가 나면 풀 전체가 BrokenProcessPool 이 되므로 여기서는 로그만 남김
+    # (easyocr/torch 가 없으면 요청 시 recognize_sync 에서 ImportError 로 드러남)
+    try:
+        import torch
+
+        torch.set_num_threads(torch_threads)
+        if languages:
+            get_reader(languages)
+    except Exception as e:
+        logger.warning("easyocr worker preload failed: %r", e)
+
+
+def _warm() -> int:
+    return os.getpid()
+
+
+# ----------------------------
+# 워커에서 실행되는 함수 (pickle 가능하도록 모듈 최상위)
+# ----------------------------
+def recognize_sync(image_bytes: bytes, languages: Tuple[str, ...] = EASYOCR_LANGUAGES,
+                   use_preprocess: bool = True) -> str:
+    """인코딩된 이미지 → 줄 단위 텍스트 (CLOVA 결과처럼 인식 영역마다 한 줄)"""
+    from app.dependencies.ocr import load_bgr, preprocess_image
+
+    img = preprocess_image(image_bytes) if use_preprocess else load_bgr(image_bytes)
+    key = _reader_key(languages, None)
+    reader = get_reader(*key)
+    with _reader_locks[key]:
+        results = reader.readtext(img, detail=1, paragraph=False)
+    lines = [res[1].strip() for res in results if isinstance(res, (tuple, list)) and len(res) >= 2]
+    return "\n".join(line for line in lines if line)
+
+
+# ----------------------------
+# 풀 관리
+# ----------------------------
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> Optional[Executor]:
+    global _executor
+    if EASYOCR_WORKERS <= 0:
+        return None
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                torch_threads = max(1, (os.cpu_count() or 1) // EASYOCR_WORKERS)
+                # fork 는 서버의 스레드/락 상태(torch 포함)까지 복제하므로 spawn 사용
+                _executor = ProcessPoolExecutor(
+                    max_workers=EASYOCR_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(EASYOCR_LANGUAGES if EASYOCR_PRELOAD else (), torch_threads),
+                )
+    return _executor
+
+
+def _discard_executor(broken: Executor):
+    """깨진 풀을 버림 (다음 _get_executor 에서 새로 생성), 다른 요청이 이미 교체했으면 그대로 둠"""
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def start_local_ocr():
+    """서버 시작 시 워커를 띄워 리더를 미리 로드 (첫 요청이 모델 로드 시간을 내지 않도록)"""
+    if not EASYOCR_PRELOAD:
+        return
+    executor = _get_executor()
+    if executor is None:
+        threading.Thread(target=_preload_in_process, name="easyocr-preload", daemon=True).start()
+        return
+    # 워커 수만큼 제출하면 풀이 워커를 모두 생성 (각 워커 initializer 에서 로드)
+    for _ in range(EASYOCR_WORKERS):
+        executor.submit(_warm)
+
+
+def _preload_in_process():
+    try:
+        get_reader(EASYOCR_LANGUAGES)
+    except Exception as e:
+        logger.warning("easyocr preload failed: %r", e)
+
+
+def close_local_ocr():
+    """서버 종료 시 워커 프로세스 정리"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+# ----------------------------
+# 사용 API
+# ----------------------------
+async def _run(image_bytes: bytes, languages: Tuple[str, ...]) -> str:
+    """워커 풀에서 실행, 풀이 깨져 있으면 새 풀로 한 번 재시도"""
+    for attempt in range(2):
+        executor = _get_executor()
+        if executor is None:
+            return await asyncio.to_thread(recognize_sync, image_bytes, languages)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, recognize_sync, image_bytes, languages)
+        except BrokenProcessPool:
+            logger.warning("easyocr process pool broken, recreating (attempt %d)", attempt + 1)
+            _discard_executor(executor)
+            if attempt:
+                raise
+
+
+async def recognize(image_bytes: bytes, languages: Optional[Iterable[str]] = None) -> str:
+    """이미지 바이트 → 로컬 OCR 텍스트 (같은 이미지 + 언어면 캐시)"""
+    from app.dependencies.ocr_cache import get_ocr_cache, image_cache_key
+
+    languages = tuple(languages or EASYOCR_LANGUAGES)
+    cache = get_ocr_cache()
+    cache_key = f"{image_cache_key(image_bytes)}:{','.join(languages)}"
+    cached = await cache.aget("easyocr", cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        text = await _run(image_bytes, languages)
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail=f"로컬 OCR(easyocr) 사용 불가: {e}")
+    except BrokenProcessPool as e:
+        raise HTTPException(status_code=503, detail=f"로컬 OCR 워커 사용 불가: {e}")
+    except IOError as e:
+        raise HTTPException(status_code=400, detail=f"이미지 디코딩 실패: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"로컬 OCR 실패: {e}")
+
+    text = (text or "").strip()
+    if not text:
+        raise HTTPException(status_code=502, detail="로컬 OCR 빈 결과")
+    await cache.aset("easyocr", cache_key, text)
+    return text
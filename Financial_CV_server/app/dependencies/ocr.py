@@ -5,11 +5,12 @@ import uuid
 import time
 import json
 import os
-import easyocr
 from PIL import Image
 import math
 from deskew import determine_skew
 
+from app.dependencies.image_preprocess import OCR_PREPROCESS_STEPS, load_bgr, run_pipeline
+
 
 
 def call_clova_ocr(image_bytes: bytes, clova_secret: str, api_url: str,
@@ -51,11 +52,16 @@ def run_clova_ocr(path: str, clova_secret: str, api_url: str) -> str:
     return "\n".join(lines)
 
 
-
-
-
-
-
+# ----------------------------
+# 로컬 OCR 전처리
+# ----------------------------
+def preprocess_image(image, steps=OCR_PREPROCESS_STEPS) -> np.ndarray:
+    """
+    로컬 OCR 용 전처리 → BGR ndarray
+    - image_preprocess.run_pipeline (축소 → 문서 원근 보정 → 기울기 보정 → 노이즈 제거 → 이진화 → 여백 자르기)
+    - easyocr 는 3채널 입력을 기대하므로 마지막에 BGR 로 변환
+    """
+    return cv2.cvtColor(run_pipeline(load_bgr(image), steps).image, cv2.COLOR_GRAY2BGR)
 
 
 def run_easyocr_ocr(path: str,
@@ -70,29 +76,14 @@ def run_easyocr_ocr(path: str,
     :param gpu: GPU 사용 여부
     :param detail: 0=텍스트만 반환, 1=박스+텍스트+신뢰도 반환
     :return: 텍스트 문자열(detail=0) 또는 (bbox, text, confidence) 리스트(detail=1)
+    - 리더(모델)는 local_ocr 에서 언어 조합별로 한 번만 로드해서 재사용
     """
-    if use_preprocess:
-        result = preprocess_image(path)
+    from app.dependencies.local_ocr import get_reader
 
-        # bytes → imdecode, ndarray → 그대로
-        if isinstance(result, (bytes, bytearray)):
-            arr = np.frombuffer(result, dtype=np.uint8)
-            img = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-            if img is None:
-                raise IOError(f"전처리된 이미지를 디코딩할 수 없습니다: {path}")
-        elif isinstance(result, np.ndarray):
-            # preprocess_image이 RGB ndarray를 반환했다면…
-            # EasyOCR에 넣으려면 RGB → BGR → RGB 컨버전을 건너뛰어야 할 수도 있습니다.
-            # EasyOCR은 내부에서 RGB 순서로 처리하니, BGR → RGB 변환 필요할 수 있음
-            img = cv2.cvtColor(result, cv2.COLOR_RGB2BGR)
-        else:
-            raise TypeError(f"preprocess_image 반환값 타입을 알 수 없습니다: {type(result)}")
-    else:
-        img = cv2.imread(path)
-        if img is None:
-            raise IOError(f"이미지를 로드할 수 없습니다: {path}")
-    reader = easyocr.Reader(languages, gpu=gpu)
-    raw_results = reader.readtext(img, detail=1)
+    img = preprocess_image(path) if use_preprocess else load_bgr(path)
+    if isinstance(languages, str):
+        languages = [languages]
+    raw_results = get_reader(languages, gpu=gpu).readtext(img, detail=1)
 
     if detail == 1:
         return raw_results
@@ -105,4 +96,3 @@ def run_easyocr_ocr(path: str,
         else:
             texts.append(str(res))
     return ' '.join(texts).strip()
-
@@ -0,0 +1,255 @@
+# app/dependencies/ocr_cache.py
+"""
+OCR / LLM 추출 결과 캐시 (content-addressed)
+
+- CLOVA OCR 결과 : 디코딩된 이미지 바이트의 SHA-256 으로 키 생성
+- GPT 추출 결과  : 정규화한 OCR 텍스트 + 모델명 + 프롬프트 해시로 키 생성
+- 백엔드: redis (app/dependencies/redis_db.py) 또는 로컬 디스크, TTL + LRU(최대 항목 수) 적용
+- 캐시 장애 시 요청은 실패시키지 않고 miss 로 처리
+
+환경변수
+    OCR_CACHE_BACKEND=disk|redis|none   (기본 disk)
+    OCR_CACHE_TTL_SECONDS=86400
+    OCR_CACHE_MAX_ENTRIES=10000
+    OCR_CACHE_DIR=<tempdir>/financial_cv_ocr_cache
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger("ocr_cache")
+
+OCR_CACHE_BACKEND = os.getenv("OCR_CACHE_BACKEND", "disk").lower()
+OCR_CACHE_TTL_SECONDS = int(os.getenv("OCR_CACHE_TTL_SECONDS", "86400"))
+OCR_CACHE_MAX_ENTRIES = int(os.getenv("OCR_CACHE_MAX_ENTRIES", "10000"))
+OCR_CACHE_DIR = os.getenv("OCR_CACHE_DIR", os.path.join(tempfile.gettempdir(), "financial_cv_ocr_cache"))
+
+
+# ----------------------------
+# 키 생성
+# ----------------------------
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_ocr_text(text: str) -> str:
+    """유니코드 NFC + 공백 정규화 (줄바꿈/연속 공백 차이는 같은 문서로 취급)"""
+    text = unicodedata.normalize("NFC", text or "")
+    return _WS_RE.sub(" ", text).strip()
+
+
+def image_cache_key(image_bytes: bytes) -> str:
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+def text_cache_key(ocr_text: str, model: str, prompt: str = "") -> str:
+    h = hashlib.sha256()
+    h.update(model.encode("utf-8"))
+    h.update(b"\0")
+    h.update(hashlib.sha256(prompt.encode("utf-8")).digest())
+    h.update(b"\0")
+    h.update(normalize_ocr_text(ocr_text).encode("utf-8"))
+    return h.hexdigest()
+
+
+# ----------------------------
+# 백엔드
+# ----------------------------
+class DiskCacheBackend:
+    """디렉터리에 키별 JSON 파일 저장, 메모리 인덱스로 LRU 순서 관리"""
+
+    name = "disk"
+
+    def __init__(self, directory: str, max_entries: int):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._index: "OrderedDict[str, None]" = OrderedDict()
+        self._load_index()
+
+    @staticmethod
+    def _safe(key: str) -> str:
+        # "namespace:hash" → 파일명으로 쓸 수 있게 ':' 치환 (Windows 호환)
+        return key.replace(":", "_")
+
+    def _path(self, key: str) -> str:
+        # 해시 끝 2글자로 하위 디렉터리 분산
+        return os.path.join(self.directory, key[-2:], f"{key}.json")
+
+    def _load_index(self):
+        found = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        found.append((os.path.getmtime(path), name[:-5]))
+                    except OSError:
+                        continue
+        for _, key in sorted(found):
+            self._index[key] = None
+
+    def _remove(self, key: str):
+        self._index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def get(self, key: str) -> Optional[str]:
+        key = self._safe(key)
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            if record.get("expires_at", 0) < time.time():
+                self._remove(key)
+                return None
+            self._index[key] = None
+            self._index.move_to_end(key)
+        try:
+            os.utime(path)  # 재시작 후에도 LRU 순서 유지
+        except OSError:
+            pass
+        return record.get("value")
+
+    def set(self, key: str, value: str, ttl: int):
+        key = self._safe(key)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"expires_at": time.time() + ttl, "value": value}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        with self._lock:
+            self._index[key] = None
+            self._index.move_to_end(key)
+            while len(self._index) > self.max_entries:
+                oldest, _ = self._index.popitem(last=False)
+                self._remove(oldest)
+
+
+class RedisCacheBackend:
+    """값은 SETEX(TTL), 접근 시각은 sorted set 으로 관리해서 max_entries 초과분을 LRU 순으로 삭제"""
+
+    name = "redis"
+    PREFIX = "ocrcache:"
+    LRU_KEY = "ocrcache:__lru__"
+
+    def __init__(self, client, max_entries: int):
+        self.client = client
+        self.max_entries = max_entries
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.PREFIX + key)
+        if value is None:
+            self.client.zrem(self.LRU_KEY, key)
+            return None
+        self.client.zadd(self.LRU_KEY, {key: time.time()})
+        return value
+
+    def set(self, key: str, value: str, ttl: int):
+        from app.dependencies.redis_db import execute_pipeline
+
+        pipe = self.client.pipeline()
+        pipe.setex(self.PREFIX + key, ttl, value)
+        pipe.zadd(self.LRU_KEY, {key: time.time()})
+        pipe.zcard(self.LRU_KEY)
+        size = execute_pipeline(pipe)[-1]
+        overflow = size - self.max_entries
+        if overflow > 0:
+            evicted = self.client.zpopmin(self.LRU_KEY, overflow)
+            if evicted:
+                self.client.delete(*(self.PREFIX + k for k, _ in evicted))
+
+
+# ----------------------------
+# 캐시 + 적중률 카운터
+# ----------------------------
+class OcrCache:
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, namespace: str, field: str):
+        with self._lock:
+            ns = self._stats.setdefault(namespace, {"hits": 0, "misses": 0, "errors": 0})
+            ns[field] += 1
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        if self.backend is None:
+            return None
+        try:
+            value = self.backend.get(f"{namespace}:{key}")
+        except Exception as e:
+            logger.warning(f"[cache] get failed ({namespace}): {e!r}")
+            self._count(namespace, "errors")
+            value = None
+        self._count(namespace, "hits" if value is not None else "misses")
+        return value
+
+    def set(self, namespace: str, key: str, value: str):
+        if self.backend is None:
+            return
+        try:
+            self.backend.set(f"{namespace}:{key}", value, self.ttl)
+        except Exception as e:
+            logger.warning(f"[cache] set failed ({namespace}): {e!r}")
+            self._count(namespace, "errors")
+
+    # 이벤트 루프를 막지 않도록 async 라우터에서는 아래 래퍼 사용
+    async def aget(self, namespace: str, key: str) -> Optional[str]:
+        if self.backend is None:
+            return None
+        return await asyncio.to_thread(self.get, namespace, key)
+
+    async def aset(self, namespace: str, key: str, value: str):
+        if self.backend is None:
+            return
+        await asyncio.to_thread(self.set, namespace, key, value)
+
+    def stats(self) -> dict:
+        with self._lock:
+            namespaces = {ns: dict(v) for ns, v in self._stats.items()}
+        for v in namespaces.values():
+            total = v["hits"] + v["misses"]
+            v["hit_rate"] = round(v["hits"] / total, 4) if total else 0.0
+        return {
+            "backend": self.backend.name if self.backend is not None else "none",
+            "ttl_seconds": self.ttl,
+            "namespaces": namespaces,
+        }
+
+
+def _create_backend():
+    if OCR_CACHE_BACKEND == "none":
+        return None
+    if OCR_CACHE_BACKEND == "redis":
+        from app.dependencies.redis_db import get_redis
+        return RedisCacheBackend(get_redis(), OCR_CACHE_MAX_ENTRIES)
+    return DiskCacheBackend(OCR_CACHE_DIR, OCR_CACHE_MAX_ENTRIES)
+
+
+ocr_cache = OcrCache(_create_backend(), OCR_CACHE_TTL_SECONDS)
+
+
+def get_ocr_cache() -> OcrCache:
+    return ocr_cache
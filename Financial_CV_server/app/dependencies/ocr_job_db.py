@@ -0,0 +1,20 @@
+from sqlmodel import Session, SQLModel
+import os
+from dotenv import load_dotenv
+
+from app.dependencies.database import add_missing_columns, get_domain_engine
+from app.models.ocr_job_models import OcrJob
+
+load_dotenv()
+
+ocr_job_db_url = 'sqlite:///ocr_jobs.db'
+ocr_job_db_engine = get_domain_engine(ocr_job_db_url)
+
+def get_ocr_job_session():
+    with Session(ocr_job_db_engine) as session:
+        yield session
+
+def create_ocr_job_db():
+    SQLModel.metadata.create_all(ocr_job_db_engine)
+    # 기존 ocr_jobs.db 에 owner/heartbeat_at 컬럼 추가
+    add_missing_columns(ocr_job_db_engine, OcrJob.__table__)
@@ -0,0 +1,284 @@
+# app/dependencies/ocr_provider_router.py
+"""
+OCR provider 라우터 (CLOVA / OpenAI 비전 / 로컬 EasyOCR)
+
+- provider 별 지연 추적: 성공 호출의 EWMA + 최근 OCR_LATENCY_WINDOW 건 p95
+- 헤지 요청: 첫 요청이 지연 기준(표본이 OCR_HEDGE_MIN_SAMPLES 이상이면 p95, 아니면 OCR_HEDGE_AFTER_MS)을 넘기면
+  같은 provider 에 두 번째 요청을 보내고 먼저 끝난 쪽 사용 (나머지는 취소)
+  헤지는 요청당 OCR_HEDGE_MAX_RATIO 개씩 쌓이는 토큰으로 제한 (provider 전체가 느릴 때 부하 2배 방지)
+  로컬 OCR 은 CPU 작업이라 헤지하지 않음 (OCR_HEDGE_PROVIDERS)
+- 서킷 브레이커: 연속 OCR_BREAKER_FAILURES 번 실패하면 OCR_BREAKER_COOLDOWN_SECONDS 동안 호출하지 않고 바로 다음 provider,
+  쿨다운 후 1건만 시험 호출(half-open) → 성공하면 복구
+- 폴백: 요청한 provider → OCR_FALLBACK 순서 (기본 로컬 EasyOCR)
+  마지막이 아닌 provider 는 OCR_PROVIDER_DEADLINE_SECONDS 안에 끝나지 않으면 실패로 보고 다음으로
+  4xx(이미지 형식 오류 등)는 다른 provider 로 넘기지 않고 그대로 반환
+- 상태 조회: GET /ocr/providers/stats
+
+환경변수
+    OCR_FALLBACK=easyocr (쉼표 구분, 빈 값이면 폴백 없음)
+    OCR_PROVIDER_DEADLINE_SECONDS=15
+    OCR_HEDGE_PROVIDERS=clova,openai / OCR_HEDGE_AFTER_MS=2000 / OCR_HEDGE_MIN_MS=300
+    OCR_HEDGE_MIN_SAMPLES=20 / OCR_HEDGE_MAX_RATIO=0.1
+    OCR_LATENCY_WINDOW=200 / OCR_LATENCY_EWMA_ALPHA=0.2
+    OCR_BREAKER_FAILURES=5 / OCR_BREAKER_COOLDOWN_SECONDS=30
+"""
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+
+load_dotenv()
+
+logger = logging.getLogger("ocr_provider_router")
+
+T = TypeVar("T")
+
+
+def _env_list(name: str, default: str) -> Tuple[str, ...]:
+    return tuple(item.strip() for item in os.getenv(name, default).split(",") if item.strip())
+
+
+OCR_FALLBACK = _env_list("OCR_FALLBACK", "easyocr")
+OCR_PROVIDER_DEADLINE_SECONDS = float(os.getenv("OCR_PROVIDER_DEADLINE_SECONDS", "15"))
+OCR_HEDGE_PROVIDERS = _env_list("OCR_HEDGE_PROVIDERS", "clova,openai")
+OCR_HEDGE_AFTER_MS = float(os.getenv("OCR_HEDGE_AFTER_MS", "2000"))
+OCR_HEDGE_MIN_MS = float(os.getenv("OCR_HEDGE_MIN_MS", "300"))
+OCR_HEDGE_MIN_SAMPLES = int(os.getenv("OCR_HEDGE_MIN_SAMPLES", "20"))
+OCR_HEDGE_MAX_RATIO = float(os.getenv("OCR_HEDGE_MAX_RATIO", "0.1"))
+OCR_LATENCY_WINDOW = int(os.getenv("OCR_LATENCY_WINDOW", "200"))
+OCR_LATENCY_EWMA_ALPHA = float(os.getenv("OCR_LATENCY_EWMA_ALPHA", "0.2"))
+OCR_BREAKER_FAILURES = int(os.getenv("OCR_BREAKER_FAILURES", "5"))
+OCR_BREAKER_COOLDOWN_SECONDS = float(os.getenv("OCR_BREAKER_COOLDOWN_SECONDS", "30"))
+
+_HEDGE_TOKEN_CAP = 10.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderTimeout(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """연속 실패 기준 서킷 브레이커 (이벤트 루프 한 곳에서만 사용 → 락 없음)"""
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+
+    def allow(self) -> bool:
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+            self.state = HALF_OPEN   # 시험 호출 1건만 통과
+            return True
+        return False
+
+    def record_success(self):
+        self.state = CLOSED
+        self.consecutive_failures = 0
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or (self.failure_threshold and self.consecutive_failures >= self.failure_threshold):
+            if self.state != OPEN:
+                self.opens += 1
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self):
+        """시험 호출이 결과 없이 취소됨 → 다음 요청이 바로 다시 시험할 수 있도록"""
+        if self.state == HALF_OPEN:
+            self.state = OPEN
+            self.opened_at = time.monotonic() - self.cooldown
+
+
+class ProviderStats:
+    """provider 1개의 지연 / 헤지 토큰 / 브레이커 / 카운터"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: deque = deque(maxlen=OCR_LATENCY_WINDOW)
+        self.ewma_ms: Optional[float] = None
+        self.breaker = CircuitBreaker(OCR_BREAKER_FAILURES, OCR_BREAKER_COOLDOWN_SECONDS)
+        self.hedge_tokens = 1.0
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.fallback_served = 0
+        self.skipped_open = 0
+
+    def record_latency(self, ms: float):
+        self.latencies.append(ms)
+        self.ewma_ms = ms if self.ewma_ms is None else OCR_LATENCY_EWMA_ALPHA * ms + (1 - OCR_LATENCY_EWMA_ALPHA) * self.ewma_ms
+
+    def p95_ms(self) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def hedge_delay(self) -> float:
+        """헤지 요청을 보낼 때까지 기다릴 시간 (초)"""
+        if len(self.latencies) < OCR_HEDGE_MIN_SAMPLES:
+            return OCR_HEDGE_AFTER_MS / 1000
+        return max(OCR_HEDGE_MIN_MS, self.p95_ms()) / 1000
+
+    def take_hedge_token(self) -> bool:
+        if self.hedge_tokens < 1:
+            return False
+        self.hedge_tokens -= 1
+        return True
+
+    def snapshot(self) -> dict:
+        p95 = self.p95_ms()
+        return {
+            "state": self.breaker.state,
+            "ewma_ms": round(self.ewma_ms, 1) if self.ewma_ms is not None else None,
+            "p95_ms": round(p95, 1) if p95 is not None else None,
+            "samples": len(self.latencies),
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "breaker_opens": self.breaker.opens,
+            "skipped_open": self.skipped_open,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "fallback_served": self.fallback_served,
+        }
+
+
+def _should_fall_back(e: BaseException) -> bool:
+    # 4xx 는 요청 자체의 문제 (다른 provider 도 같은 결과)
+    return not (isinstance(e, HTTPException) and e.status_code < 500)
+
+
+def _error_detail(e: BaseException) -> str:
+    if isinstance(e, HTTPException):
+        return str(e.detail)
+    if isinstance(e, ProviderTimeout):
+        return f"{OCR_PROVIDER_DEADLINE_SECONDS:g}초 안에 응답 없음"
+    return repr(e)
+
+
+class ProviderRouter:
+    def __init__(self):
+        self._stats: Dict[str, ProviderStats] = {}
+
+    def stats_for(self, name: str) -> ProviderStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = ProviderStats(name)
+        return stats
+
+    def chain(self, preferred: str, available) -> List[str]:
+        return [preferred] + [p for p in OCR_FALLBACK if p != preferred and p in available]
+
+    async def run(self, preferred: str, calls: Mapping[str, Callable[[], Awaitable[T]]]) -> Tuple[str, T]:
+        """
+        calls: provider 이름 → 호출 함수 (부를 때마다 새 코루틴)
+        → (실제로 응답한 provider, 결과)
+        """
+        chain = self.chain(preferred, calls)
+        errors: List[str] = []
+        last_error: Optional[BaseException] = None
+        attempted = 0
+        for index, name in enumerate(chain):
+            stats = self.stats_for(name)
+            if not stats.breaker.allow():
+                stats.skipped_open += 1
+                errors.append(f"{name}: 일시 차단(서킷 open)")
+                continue
+            is_last = index == len(chain) - 1
+            attempted += 1
+            stats.calls += 1
+            stats.hedge_tokens = min(_HEDGE_TOKEN_CAP, stats.hedge_tokens + OCR_HEDGE_MAX_RATIO)
+            try:
+                result = await self._call_hedged(stats, calls[name], None if is_last else OCR_PROVIDER_DEADLINE_SECONDS)
+            except asyncio.CancelledError:
+                stats.breaker.release()
+                raise
+            except Exception as e:
+                if not _should_fall_back(e):
+                    stats.breaker.record_success()   # provider 는 정상 응답
+                    raise
+                stats.failures += 1
+                stats.breaker.record_failure()
+                last_error = e
+                errors.append(f"{name}: {_error_detail(e)}")
+                logger.warning("ocr provider %s failed (%s), state=%s", name, _error_detail(e), stats.breaker.state)
+                continue
+            stats.successes += 1
+            stats.breaker.record_success()
+            if name != preferred:
+                stats.fallback_served += 1
+            return name, result
+
+        if attempted == 1 and len(chain) == 1 and isinstance(last_error, HTTPException):
+            raise last_error   # 폴백이 없으면 기존과 같은 오류
+        code = status.HTTP_503_SERVICE_UNAVAILABLE if attempted == 0 else status.HTTP_502_BAD_GATEWAY
+        raise HTTPException(status_code=code, detail="모든 OCR provider 실패 - " + " / ".join(errors))
+
+    async def _call_hedged(self, stats: ProviderStats, fn: Callable[[], Awaitable[T]], deadline: Optional[float]) -> T:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        end = now + deadline if deadline else None
+        hedge_at = now + stats.hedge_delay() if stats.name in OCR_HEDGE_PROVIDERS else None
+
+        async def _timed() -> T:
+            started = time.perf_counter()
+            result = await fn()
+            stats.record_latency((time.perf_counter() - started) * 1000)
+            return result
+
+        primary = asyncio.ensure_future(_timed())
+        pending = {primary}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                wake = [t for t in (hedge_at, end) if t is not None]
+                timeout = max(0.0, min(wake) - loop.time()) if wake else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            stats.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+                now = loop.time()
+                if pending and hedge_at is not None and now >= hedge_at:
+                    hedge_at = None
+                    if stats.take_hedge_token():
+                        stats.hedges += 1
+                        pending.add(asyncio.ensure_future(_timed()))
+                if pending and end is not None and now >= end:
+                    raise ProviderTimeout()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def snapshot(self) -> dict:
+        return {
+            "fallback": list(OCR_FALLBACK),
+            "hedge_providers": list(OCR_HEDGE_PROVIDERS),
+            "providers": {name: stats.snapshot() for name, stats in self._stats.items()},
+        }
+
+
+ocr_provider_router = ProviderRouter()
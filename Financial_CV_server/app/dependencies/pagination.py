@@ -0,0 +1,180 @@
+# app/dependencies/pagination.py
+"""
+목록 API 공용 keyset(커서) 페이지네이션 + 필드 프로젝션
+
+- 응답 본문은 기존과 같은 JSON 배열, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달 (마지막 페이지면 헤더 없음)
+- limit / cursor 를 둘 다 보내지 않으면 기존처럼 전체 목록 반환 (커서를 따라가지 않는 기존 클라이언트 호환)
+  cursor 만 보내면 LIST_DEFAULT_LIMIT 건씩
+- 정렬 키 (예: created_at, id) 기준 WHERE (키) > (커서) 로 이어 읽기 → OFFSET 없이 인덱스 범위 스캔
+- fields=a,b,c 로 필요한 컬럼만 SELECT, 무거운 컬럼(document_content 등)은 요청할 때만 포함
+
+환경변수
+    LIST_DEFAULT_LIMIT=200
+    LIST_MAX_LIMIT=1000
+"""
+import base64
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, Query, Response, status
+from pydantic import create_model
+from sqlalchemy import literal, select, tuple_
+from sqlmodel import Session, SQLModel
+
+load_dotenv()
+
+LIST_DEFAULT_LIMIT = int(os.getenv("LIST_DEFAULT_LIMIT", "200"))
+LIST_MAX_LIMIT = int(os.getenv("LIST_MAX_LIMIT", "1000"))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """목록 라우트 공통 쿼리 파라미터 (Depends() 로 주입)"""
+
+    def __init__(
+        self,
+        limit: Optional[int] = Query(None, ge=1, le=LIST_MAX_LIMIT, description="페이지 크기 (limit/cursor 모두 없으면 전체)"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+        fields: Optional[str] = Query(None, description="응답에 포함할 컬럼 (쉼표 구분)"),
+    ):
+        # limit/cursor 둘 다 없으면 None = 페이지 나누지 않음
+        self.limit = limit if limit is not None or cursor is None else LIST_DEFAULT_LIMIT
+        self.cursor = cursor
+        self.fields = fields
+
+
+@dataclass
+class Page:
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+def set_next_cursor(response: Response, page: Page) -> List[Dict[str, Any]]:
+    """다음 커서를 헤더에 싣고 본문(배열) 반환"""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+def range_filter(column, start=None, end=None) -> list:
+    """start <= column <= end (없는 쪽은 생략)"""
+    clauses = []
+    if start is not None:
+        clauses.append(column >= start)
+    if end is not None:
+        clauses.append(column <= end)
+    return clauses
+
+
+# ----------------------------
+# 커서 인코딩
+# ----------------------------
+def _encode_cursor(values: Sequence[Any]) -> str:
+    plain = [v.isoformat() if isinstance(v, (datetime, date)) else v for v in values]
+    raw = json.dumps(plain, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, columns) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        plain = json.loads(raw)
+        if not isinstance(plain, list) or len(plain) != len(columns):
+            raise ValueError("cursor length mismatch")
+        values = []
+        for v, col in zip(plain, columns):
+            py_type = col.type.python_type
+            if py_type is datetime:
+                v = datetime.fromisoformat(v)
+            elif py_type is date:
+                v = date.fromisoformat(v)
+            values.append(v)
+        return values
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor 입니다.")
+
+
+# ----------------------------
+# 목록 스펙
+# ----------------------------
+class ListSpec:
+    """
+    모델별 목록 조회 설정
+    - order_by : keyset 정렬 키 (마지막은 PK 처럼 유일한 컬럼)
+    - heavy    : 기본 응답에서 빼는 컬럼 (fields 로 요청 시 포함)
+    - hidden   : 어떤 경우에도 노출하지 않는 컬럼 (비밀번호 해시 등)
+    """
+
+    def __init__(
+        self,
+        model: Type[SQLModel],
+        order_by: Sequence[str],
+        descending: bool = False,
+        heavy: Sequence[str] = (),
+        hidden: Sequence[str] = (),
+    ):
+        table = model.__table__
+        self.columns = {name: col for name, col in table.columns.items() if name not in hidden}
+        self.order_names = list(order_by)
+        self.order_columns = [table.columns[name] for name in order_by]
+        self.descending = descending
+        self.default_fields = [name for name in self.columns if name not in heavy]
+        # 응답 스키마: 모든 필드 Optional, response_model_exclude_unset=True 로 요청한 필드만 출력
+        self.item_model = create_model(
+            f"{model.__name__}ListItem",
+            **{name: (Optional[model.model_fields[name].annotation], None) for name in self.columns},
+        )
+
+    def resolve_fields(self, fields: Optional[str]) -> List[str]:
+        if not fields:
+            return list(self.default_fields)
+        names = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [n for n in names if n not in self.columns]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"알 수 없는 필드: {', '.join(unknown)} (가능: {', '.join(self.columns)})",
+            )
+        return list(dict.fromkeys(names))
+
+    def select(self, fields: List[str], *where):
+        """fields + 정렬 키 컬럼만 SELECT, where 중 None 은 무시, 정렬 키 순 정렬"""
+        selected = list(dict.fromkeys(fields + self.order_names))
+        # sqlmodel.select 는 컬럼 1개일 때 스칼라를 돌려주므로 항상 Row 를 받도록 sqlalchemy.select 사용
+        stmt = select(*(self.columns[name] for name in selected))
+        for clause in where:
+            if clause is not None:
+                stmt = stmt.where(clause)
+        return stmt.order_by(*(col.desc() if self.descending else col.asc() for col in self.order_columns))
+
+    def row_to_item(self, row, fields: List[str]) -> Dict[str, Any]:
+        mapping = row._mapping
+        return {name: mapping[self.columns[name]] for name in fields}
+
+    def page(self, session: Session, params: PageParams, *where) -> Page:
+        fields = self.resolve_fields(params.fields)
+        stmt = self.select(fields, *where)
+
+        if params.cursor:
+            values = _decode_cursor(params.cursor, self.order_columns)
+            key = tuple_(*self.order_columns)
+            after = tuple_(*(literal(v, col.type) for v, col in zip(values, self.order_columns)))
+            stmt = stmt.where(key < after if self.descending else key > after)
+
+        if params.limit is None:
+            rows = session.exec(stmt).all()
+            return Page(items=[self.row_to_item(row, fields) for row in rows])
+
+        rows = session.exec(stmt.limit(params.limit + 1)).all()
+
+        next_cursor = None
+        if len(rows) > params.limit:
+            rows = rows[:params.limit]
+            last = rows[-1]._mapping
+            next_cursor = _encode_cursor([last[col] for col in self.order_columns])
+
+        return Page(items=[self.row_to_item(row, fields) for row in rows], next_cursor=next_cursor)
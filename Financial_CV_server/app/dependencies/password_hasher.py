@@ -0,0 +1,132 @@
+# app/dependencies/password_hasher.py
+"""
+bcrypt 해시/검증 전용 프로세스 풀
+
+- bcrypt 1회(cost 12 기준 100~300ms CPU)를 요청 스레드/이벤트 루프 밖의 고정 크기 프로세스 풀에서 실행
+  → 로그인 몰림이 있어도 FastAPI 스레드풀과 다른 엔드포인트는 막히지 않음
+- 검증 시 저장된 해시의 cost 가 현재 설정(BCRYPT_ROUNDS)과 다르면 같은 작업에서 새 해시도 만들어 돌려줌 (로그인 시 재해시)
+- 워커가 죽어서 풀이 깨지면(BrokenProcessPool) 풀을 버리고 새로 만들어 한 번 재시도 (해시/검증은 다시 해도 안전)
+- PASSWORD_HASH_WORKERS=0 이면 프로세스 풀 없이 스레드에서 실행 (개발/테스트용)
+
+환경변수
+    PASSWORD_HASH_WORKERS=(CPU 수, 최대 4)
+    BCRYPT_ROUNDS=12
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+
+from dotenv import load_dotenv
+from passlib.context import CryptContext
+
+load_dotenv()
+
+logger = logging.getLogger("password_hasher")
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# 워커 프로세스에서도 import 시 같은 설정으로 생성됨
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+# ----------------------------
+# 워커에서 실행되는 함수 (pickle 가능하도록 모듈 최상위)
+# ----------------------------
+def hash_password_sync(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password_sync(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """(일치 여부, cost 변경 시 새 해시 / 아니면 None)"""
+    return pwd_context.verify_and_update(password, hashed)
+
+
+# ----------------------------
+# 풀 관리
+# ----------------------------
+def _get_executor() -> Optional[Executor]:
+    global _executor
+    if PASSWORD_HASH_WORKERS <= 0:
+        return None
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # fork 는 서버의 스레드/락 상태까지 복제하므로 spawn 사용 (워커는 이 모듈만 import)
+                _executor = ProcessPoolExecutor(
+                    max_workers=PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _executor
+
+
+def _discard_executor(broken: Executor):
+    """깨진 풀을 버림 (다음 _get_executor 에서 새로 생성), 다른 요청이 이미 교체했으면 그대로 둠"""
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def start_password_hasher():
+    """서버 시작 시 풀 생성 (첫 로그인 요청이 풀 생성 비용을 내지 않도록)"""
+    _get_executor()
+
+
+def close_password_hasher():
+    """서버 종료 시 워커 프로세스 정리"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+# ----------------------------
+# 사용 API
+# ----------------------------
+async def _run(fn: Callable[..., Any], *args) -> Any:
+    """풀에서 실행, 풀이 깨져 있으면 새 풀로 한 번 재시도"""
+    for attempt in range(2):
+        executor = _get_executor()
+        if executor is None:
+            return await asyncio.to_thread(fn, *args)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            logger.warning("password hasher pool broken, recreating (attempt %d)", attempt + 1)
+            _discard_executor(executor)
+            if attempt:
+                raise
+
+
+async def hash_password(password: str) -> str:
+    return await _run(hash_password_sync, password)
+
+
+async def verify_password(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    return await _run(verify_password_sync, password, hashed)
+
+
+def hash_password_blocking(password: str) -> str:
+    """동기 코드(스레드풀에서 도는 라우트)용: 계산은 풀에서 하고 호출 스레드는 대기만"""
+    for attempt in range(2):
+        executor = _get_executor()
+        if executor is None:
+            return hash_password_sync(password)
+        try:
+            return executor.submit(hash_password_sync, password).result()
+        except BrokenProcessPool:
+            logger.warning("password hasher pool broken, recreating (attempt %d)", attempt + 1)
+            _discard_executor(executor)
+            if attempt:
+                raise
@@ -0,0 +1,58 @@
+# app/dependencies/rate_limit.py
+"""
+Redis 고정 윈도 요청 제한 (로그인/가입 무차별 대입 방지)
+
+- 제한 대상(클라이언트 IP, 로그인 아이디 ...) 카운터를 aincr_window 파이프라인 1회로 같이 증가
+- 하나라도 AUTH_RATE_LIMIT 를 넘으면 429 + Retry-After (윈도 길이)
+- Redis 장애 시에는 제한 없이 통과 (로그인 자체가 막히지 않도록, auth.get_current_user 와 같은 방식)
+
+환경변수
+    AUTH_RATE_LIMIT=10
+    AUTH_RATE_WINDOW_SECONDS=60
+"""
+import logging
+import os
+from typing import Iterable
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, Request, status
+from redis.exceptions import RedisError
+
+from app.dependencies.redis_db import aincr_window
+
+load_dotenv()
+
+logger = logging.getLogger("rate_limit")
+
+AUTH_RATE_LIMIT = int(os.getenv("AUTH_RATE_LIMIT", "10"))
+AUTH_RATE_WINDOW_SECONDS = int(os.getenv("AUTH_RATE_WINDOW_SECONDS", "60"))
+
+
+def rate_key(scope: str, subject: str) -> str:
+    return f"rate:{scope}:{subject}"
+
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+async def enforce_rate_limit(
+    redisDB,
+    scope: str,
+    subjects: Iterable[str],
+    limit: int = AUTH_RATE_LIMIT,
+    window_seconds: int = AUTH_RATE_WINDOW_SECONDS,
+) -> None:
+    """subjects (예: "ip:1.2.3.4", "id:alice") 카운터 증가, 윈도 안에서 limit 초과면 429"""
+    keys = [rate_key(scope, subject) for subject in subjects]
+    try:
+        counts = await aincr_window(redisDB, keys, window_seconds)
+    except RedisError as e:
+        logger.warning("rate limit check skipped (%s): %s", scope, e)
+        return
+    if any(count > limit for count in counts):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(window_seconds)},
+        )
@@ -1,7 +1,209 @@
+# app/dependencies/redis_db.py
+"""
+Redis 공용 클라이언트 (커넥션 풀 + 동기/비동기)
+
+- 동기 redis.Redis 와 비동기 redis.asyncio.Redis 가 각자 크기 제한 커넥션 풀 사용
+    동기 : get_redis()        (def 라우트, 스레드, 스케줄러)
+    비동기: get_async_redis()  (async 라우트 - 이벤트 루프를 막지 않음, 서버 종료 시 close_redis())
+- 소켓/연결 타임아웃, 유휴 커넥션 health check(PING), 타임아웃 시 1회 재시도
+- 여러 키를 한 번에 쓰는 작업은 pipeline 헬퍼로 왕복 1회 (로그인 세션 + 사용자 캐시, 로그인/가입 요청 제한 카운터)
+- 명령/파이프라인 수, 오류 수, 평균 지연, 풀 사용량을 redis_health() 로 노출 (GET /health/redis)
+
+환경변수
+    REDIS_URL=redis://localhost:6379/0
+    REDIS_MAX_CONNECTIONS=50
+    REDIS_SOCKET_TIMEOUT=2 / REDIS_CONNECT_TIMEOUT=2
+    REDIS_HEALTH_CHECK_INTERVAL=30
+"""
+import os
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
 import redis
-# Redis 클라이언트 설정 (localhost, 기본 포트 6379)
-redis_client = redis.Redis(host="localhost", port=6379, db=0, decode_responses=True)
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+from redis.exceptions import RedisError
+
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+
+_POOL_OPTIONS = dict(
+    max_connections=REDIS_MAX_CONNECTIONS,
+    socket_timeout=REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+    health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+    retry_on_timeout=True,
+    decode_responses=True,
+)
+
+
+# ----------------------------
+# 지표
+# ----------------------------
+class RedisMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {"commands": 0, "pipelines": 0, "pipelined_commands": 0, "errors": 0}
+        self._seconds = 0.0
+
+    def record(self, elapsed: float, pipelined: int = 0, error: bool = False):
+        with self._lock:
+            if pipelined:
+                self._counts["pipelines"] += 1
+                self._counts["pipelined_commands"] += pipelined
+            else:
+                self._counts["commands"] += 1
+            if error:
+                self._counts["errors"] += 1
+            self._seconds += elapsed
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+            seconds = self._seconds
+        round_trips = counts["commands"] + counts["pipelines"]
+        counts["avg_round_trip_ms"] = round(seconds * 1000 / round_trips, 3) if round_trips else 0.0
+        return counts
+
+
+metrics = RedisMetrics()
+
+
+class _MeteredRedis(redis.Redis):
+    def execute_command(self, *args, **options):
+        t0 = time.perf_counter()
+        try:
+            result = super().execute_command(*args, **options)
+        except RedisError:
+            metrics.record(time.perf_counter() - t0, error=True)
+            raise
+        metrics.record(time.perf_counter() - t0)
+        return result
+
+
+class _MeteredAsyncRedis(aioredis.Redis):
+    async def execute_command(self, *args, **options):
+        t0 = time.perf_counter()
+        try:
+            result = await super().execute_command(*args, **options)
+        except RedisError:
+            metrics.record(time.perf_counter() - t0, error=True)
+            raise
+        metrics.record(time.perf_counter() - t0)
+        return result
+
+
+# ----------------------------
+# 클라이언트
+# ----------------------------
+_sync_pool = redis.ConnectionPool.from_url(REDIS_URL, **_POOL_OPTIONS)
+redis_client = _MeteredRedis(connection_pool=_sync_pool)
+
+# asyncio 풀은 처음 사용하는 이벤트 루프에 묶이므로 첫 호출 때 생성
+_async_client: Optional[aioredis.Redis] = None
+
 
 def get_redis():
     return redis_client
 
+
+def get_async_redis() -> aioredis.Redis:
+    global _async_client
+    if _async_client is None:
+        _async_client = _MeteredAsyncRedis(connection_pool=aioredis.ConnectionPool.from_url(REDIS_URL, **_POOL_OPTIONS))
+    return _async_client
+
+
+async def close_redis():
+    """서버 종료 시 풀 커넥션 정리"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.connection_pool.disconnect()
+        _async_client = None
+    _sync_pool.disconnect()
+
+
+# ----------------------------
+# 파이프라인 헬퍼 (왕복 1회)
+# ----------------------------
+def execute_pipeline(pipe) -> list:
+    """pipeline.execute() + 지표 기록"""
+    size = len(pipe)
+    t0 = time.perf_counter()
+    try:
+        result = pipe.execute()
+    except RedisError:
+        metrics.record(time.perf_counter() - t0, pipelined=size, error=True)
+        raise
+    metrics.record(time.perf_counter() - t0, pipelined=size)
+    return result
+
+
+async def aexecute_pipeline(pipe) -> list:
+    size = len(pipe)
+    t0 = time.perf_counter()
+    try:
+        result = await pipe.execute()
+    except RedisError:
+        metrics.record(time.perf_counter() - t0, pipelined=size, error=True)
+        raise
+    metrics.record(time.perf_counter() - t0, pipelined=size)
+    return result
+
+
+async def asetex_many(client: aioredis.Redis, items: Iterable[Tuple[str, int, str]]) -> None:
+    """[(key, ttl, value), ...] 를 SETEX 파이프라인 1회로 기록 (auth.astore_session)"""
+    pipe = client.pipeline(transaction=False)
+    for key, ttl, value in items:
+        pipe.setex(key, ttl, value)
+    await aexecute_pipeline(pipe)
+
+
+async def aincr_window(client: aioredis.Redis, keys: List[str], window_seconds: int) -> List[int]:
+    """
+    고정 윈도 카운터 여러 개를 파이프라인 1회로 증가, 증가 후 값 반환 (윈도 첫 요청이 TTL 설정)
+    - rate_limit.enforce_rate_limit (로그인/가입 요청 제한)
+    """
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.set(key, 0, ex=window_seconds, nx=True)
+        pipe.incr(key)
+    return (await aexecute_pipeline(pipe))[1::2]
+
+
+# ----------------------------
+# 상태
+# ----------------------------
+def _pool_usage(pool) -> dict:
+    return {
+        "max_connections": pool.max_connections,
+        "created": getattr(pool, "_created_connections", None),
+        "in_use": len(getattr(pool, "_in_use_connections", ())),
+        "idle": len(getattr(pool, "_available_connections", ())),
+    }
+
+
+def redis_health() -> dict:
+    """PING 지연 + 지표 + 풀 사용량"""
+    t0 = time.perf_counter()
+    try:
+        redis_client.ping()
+        status, error = "ok", None
+    except RedisError as e:
+        status, error = "unavailable", str(e)
+    info = {
+        "status": status,
+        "ping_ms": round((time.perf_counter() - t0) * 1000, 3),
+        "metrics": metrics.snapshot(),
+        "sync_pool": _pool_usage(_sync_pool),
+        "async_pool": _pool_usage(_async_client.connection_pool) if _async_client is not None else None,
+    }
+    if error:
+        info["error"] = error
+    return info
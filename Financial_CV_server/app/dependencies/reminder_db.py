@@ -1,12 +1,13 @@
-from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel import Session, SQLModel
 import os
 from dotenv import load_dotenv
 
+from app.dependencies.database import get_domain_engine
+
 load_dotenv()
 
 reminder_db_url = 'sqlite:///reminders.db'
-db_conn_args = {'check_same_thread': False}
-reminder_db_engine = create_engine(reminder_db_url, connect_args=db_conn_args)
+reminder_db_engine = get_domain_engine(reminder_db_url)
 
 def get_reminder_session():
     with Session(reminder_db_engine) as session:
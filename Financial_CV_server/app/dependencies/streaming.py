@@ -0,0 +1,65 @@
+# app/dependencies/streaming.py
+"""
+대용량 목록 내보내기용 스트리밍 JSON 응답
+
+- DB 행을 yield_per 로 STREAM_BATCH_ROWS 건씩 읽고, 행 단위로 인코딩해서 바로 전송
+  → 전체 목록 객체 / 전체 JSON 문자열을 메모리에 만들지 않음
+- format=ndjson : 한 줄에 한 행 (application/x-ndjson)
+  format=json   : 청크 단위로 이어 보내는 JSON 배열 (application/json)
+- 날짜 형식은 CustomJSONResponse 와 동일 (app/dependencies/json_encoding.py)
+
+환경변수
+    STREAM_BATCH_ROWS=1000
+"""
+import os
+from typing import Iterator, List
+
+from dotenv import load_dotenv
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.dependencies.json_encoding import dumps_row
+from app.dependencies.pagination import ListSpec
+
+load_dotenv()
+
+STREAM_BATCH_ROWS = int(os.getenv("STREAM_BATCH_ROWS", "1000"))
+
+EXPORT_FORMAT_PATTERN = "^(ndjson|json)$"
+_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "json": "application/json"}
+
+
+def _iter_rows(engine: Engine, spec: ListSpec, fields: List[str], where, fmt: str) -> Iterator[bytes]:
+    # 요청 의존성 세션은 응답 전송 전에 닫힐 수 있으므로 제너레이터 안에서 세션을 직접 연다
+    with Session(engine) as session:
+        stmt = spec.select(fields, *where).execution_options(yield_per=STREAM_BATCH_ROWS)
+        result = session.exec(stmt)
+
+        chunk: List[str] = []
+        first = True
+        if fmt == "json":
+            chunk.append("[")
+        for partition in result.partitions():
+            for row in partition:
+                line = dumps_row(spec.row_to_item(row, fields))
+                if fmt == "ndjson":
+                    chunk.append(line + "\n")
+                else:
+                    chunk.append(line if first else "," + line)
+                first = False
+            yield "".join(chunk).encode("utf-8")
+            chunk = []
+        if fmt == "json":
+            chunk.append("]")
+        if chunk:
+            yield "".join(chunk).encode("utf-8")
+
+
+def stream_rows(engine: Engine, spec: ListSpec, fields: str | None, *where, fmt: str = "ndjson") -> StreamingResponse:
+    """조건에 맞는 전체 행을 스트리밍 응답으로 반환 (fields 검증은 응답 시작 전에 수행)"""
+    resolved = spec.resolve_fields(fields)
+    return StreamingResponse(
+        _iter_rows(engine, spec, resolved, where, fmt),
+        media_type=_MEDIA_TYPES[fmt],
+    )
@@ -1,12 +1,13 @@
-from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel import Session, SQLModel
 import os
 from dotenv import load_dotenv
 
+from app.dependencies.database import get_domain_engine
+
 load_dotenv()
 
 transaction_db_url = 'sqlite:///transaction.db'
-db_conn_args = {'check_same_thread': False}
-transaction_db_engine = create_engine(transaction_db_url, connect_args=db_conn_args)
+transaction_db_engine = get_domain_engine(transaction_db_url)
 
 def get_transaction_session():
     with Session(transaction_db_engine) as session:
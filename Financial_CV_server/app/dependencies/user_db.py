@@ -1,18 +1,16 @@
-from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel import Session, SQLModel
 from sqlalchemy import text
 import os
 from dotenv import load_dotenv
 
+from app.dependencies.database import get_domain_engine
+
 load_dotenv()
 
 USER_DB_URL = os.getenv("USER_DB_URL", "sqlite:///./user.db")
 
-# sqlite는 check_same_thread=False 필요
-user_db_engine = create_engine(
-    USER_DB_URL,
-    connect_args={"check_same_thread": False} if USER_DB_URL.startswith("sqlite") else {},
-    echo=False,
-)
+# sqlite PRAGMA/풀 설정은 공용 팩토리에서 처리
+user_db_engine = get_domain_engine(USER_DB_URL)
 
 def get_user_session():
     with Session(user_db_engine) as session:
@@ -25,7 +23,7 @@ def create_user_db():
 
     SQLModel.metadata.create_all(user_db_engine)
 
-    if USER_DB_URL.startswith("sqlite"):
+    if user_db_engine.dialect.name == "sqlite":
         _maybe_migrate_sqlite()
 
 def _maybe_migrate_sqlite():
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 
 class Account(SQLModel, table=True):
@@ -25,3 +26,76 @@ class Account(SQLModel, table=True):
 
     # 계좌 사용 횟수
     account_count: int = Field(default=0, nullable=False)                                
+
+
+class AccountTransfer(SQLModel, table=True):
+    """이체 원장 (이체 1건당 1행, 수정/삭제 없음)"""
+    __tablename__ = "account_transfers"
+
+    # 이체 아이디
+    transfer_id: Optional[int] = Field(default=None, primary_key=True, index=True)
+
+    # 클라이언트가 보낸 Idempotency-Key (같은 키로 재시도하면 이체를 다시 하지 않음)
+    idempotency_key: Optional[str] = Field(default=None, unique=True, index=True)
+
+    # 출금/입금 계좌 아이디
+    from_account_id: int = Field(foreign_key="accounts.account_id", index=True, nullable=False)
+    to_account_id: int = Field(foreign_key="accounts.account_id", index=True, nullable=False)
+
+    # 이체 금액
+    amount: int = Field(nullable=False)
+
+    # 이체 직후 잔액
+    from_balance_after: int = Field(nullable=False)
+    to_balance_after: int = Field(nullable=False)
+
+    # 만든 시각 (한국 시간)
+    created_at: datetime = Field(default_factory=lambda: datetime.utcnow() + timedelta(hours=9), index=True)
+
+
+class AccountPosting(SQLModel, table=True):
+    """계좌 원장 분개 (추가만 함, 잔액 변동 1건당 1행)"""
+    __tablename__ = "account_postings"
+    __table_args__ = (
+        # 계좌별 기간 조회 / 스냅샷 이후 구간 합계
+        Index("ix_account_postings_account_created", "account_id", "created_at", "posting_id"),
+    )
+
+    # 분개 아이디 (계좌 안에서 시간 순서와 같음)
+    posting_id: Optional[int] = Field(default=None, primary_key=True)
+
+    # 계좌 아이디
+    account_id: int = Field(foreign_key="accounts.account_id", index=True, nullable=False)
+
+    # 변동 금액 (입금 +, 출금 -)
+    amount: int = Field(nullable=False)
+
+    # 종류: opening | transfer_in | transfer_out | adjustment
+    kind: str = Field(nullable=False)
+
+    # 이체로 생긴 분개면 이체 아이디
+    transfer_id: Optional[int] = Field(default=None, foreign_key="account_transfers.transfer_id", index=True)
+
+    # 만든 시각 (한국 시간)
+    created_at: datetime = Field(default_factory=lambda: datetime.utcnow() + timedelta(hours=9), nullable=False)
+
+
+class AccountBalanceSnapshot(SQLModel, table=True):
+    """계좌 잔액 스냅샷 (posting_id 까지 반영한 잔액)"""
+    __tablename__ = "account_balance_snapshots"
+    __table_args__ = (
+        Index("ix_account_balance_snapshots_account_as_of", "account_id", "as_of", "last_posting_id"),
+    )
+
+    # 스냅샷 아이디
+    snapshot_id: Optional[int] = Field(default=None, primary_key=True)
+
+    # 계좌 아이디
+    account_id: int = Field(foreign_key="accounts.account_id", nullable=False)
+
+    # 스냅샷 잔액
+    balance: int = Field(nullable=False)
+
+    # 반영된 마지막 분개 아이디 / 그 분개 시각
+    last_posting_id: int = Field(nullable=False)
+    as_of: datetime = Field(nullable=False)
@@ -9,5 +9,10 @@ class Files(SQLModel, table=True):
     post_id: int = Field(index=True)
     url: str
     created_at: int | None = Field(index=True)
+    # 업로드 시 스트리밍하면서 계산 (기존 행은 NULL)
+    file_name: str | None = None
+    file_size: int | None = None
+    content_type: str | None = None
+    sha256: str | None = Field(default=None, index=True)
     
     
@@ -0,0 +1,44 @@
+# app/models/ocr_job_models.py
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlmodel import SQLModel, Field
+
+
+class OcrJob(SQLModel, table=True):
+    __tablename__ = "ocr_jobs"
+
+    # 작업 아이디 (uuid hex)
+    job_id: str = Field(primary_key=True, index=True)
+
+    # 요청 사용자 아이디 (자동 문서 생성 시 필요)
+    job_user_id: Optional[int] = Field(default=None, index=True, nullable=True)
+
+    # 상태: queued / running / succeeded / failed
+    status: str = Field(default="queued", nullable=False, index=True)
+
+    # 완료 후 create_document_from_ocr 까지 자동 진행 여부
+    auto_create: bool = Field(default=False, nullable=False)
+
+    # 사용 모델
+    model: Optional[str] = Field(default=None, nullable=True)
+
+    # 완료 알림 웹훅 주소
+    callback_url: Optional[str] = Field(default=None, nullable=True)
+
+    # 결과: 8개 key-value 텍스트
+    ocr_text: Optional[str] = Field(default=None, nullable=True)
+
+    # 자동 생성된 문서 아이디
+    document_id: Optional[int] = Field(default=None, nullable=True)
+
+    # 실패 사유
+    error: Optional[str] = Field(default=None, nullable=True)
+
+    # 작업을 맡은 서버 프로세스 ("호스트:pid:부팅 id"), 마지막 생존 신호 시각 (한국 시간)
+    owner: Optional[str] = Field(default=None, nullable=True, index=True)
+    heartbeat_at: Optional[datetime] = Field(default=None, nullable=True)
+
+    # 접수/시작/종료 시각 (한국 시간)
+    created_at: datetime = Field(default_factory=lambda: datetime.utcnow() + timedelta(hours=9), nullable=False)
+    started_at: Optional[datetime] = Field(default=None, nullable=True)
+    finished_at: Optional[datetime] = Field(default=None, nullable=True)
@@ -1,20 +1,26 @@
+from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from pydantic import BaseModel, conint
 from sqlmodel import Session
 
 from app.models.account_models import Account
 from app.dependencies.account_db import get_account_session
+from app.dependencies.pagination import PageParams, set_next_cursor
 from app.services.account_service import (
+    ACCOUNT_LIST,
     create_account,
     get_account_by_id,
     list_accounts_by_user,
     get_account_by_number,
     transfer_between_accounts,
+    transfer_batch,
+    TransferLeg,
     update_account,
     delete_account,
     list_accounts,
 )
+from app.services.ledger_service import POSTING_LIST, balance_at, list_postings, statement
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
@@ -32,18 +38,82 @@ class AccountUpdateModel(BaseModel):
     account_balance: Optional[int] = None
     account_bank: Optional[str] = None
 
+# 목록 응답 항목 (fields 로 고른 컬럼만 포함)
+AccountListItem = ACCOUNT_LIST.item_model
+
+# 분개 목록 응답 항목
+PostingListItem = POSTING_LIST.item_model
+
+class BalanceAtResponse(BaseModel):
+    account_id: int
+    at: Optional[datetime] = None
+    balance: int
+
+class StatementResponse(BaseModel):
+    account_id: int
+    start: datetime
+    end: datetime
+    opening_balance: int
+    closing_balance: int
+    total_credits: int
+    total_debits: int
+    posting_count: int
+
 class TransferModel(BaseModel):
     from_account_number: str
     withdraw_amount: conint(ge=1)
     to_account_number: str
     deposit_amount: conint(ge=1)
 
+class BatchTransferLegModel(BaseModel):
+    from_account_number: str
+    to_account_number: str
+    amount: conint(ge=1)
+    idempotency_key: Optional[str] = None
+
+class BatchTransferModel(BaseModel):
+    transfers: List[BatchTransferLegModel]
+    atomic: bool = True              # False 면 잔액 부족 건만 실패 처리하고 나머지는 적용
+
+class BatchTransferLegResult(BaseModel):
+    index: int
+    status: str                      # applied | replayed | failed
+    from_account_number: str
+    to_account_number: str
+    amount: int
+    transfer_id: Optional[int] = None
+    from_balance_after: Optional[int] = None
+    to_balance_after: Optional[int] = None
+    detail: Optional[str] = None
+
+class BatchTransferResponse(BaseModel):
+    applied: int
+    replayed: int
+    failed: int
+    results: List[BatchTransferLegResult]
+
 # ----------------------------
 # 라우트
 # ----------------------------
-@router.get("/", response_model=List[Account], status_code=status.HTTP_200_OK)
-def api_list_accounts(session: Session = Depends(get_account_session)) -> List[Account]:
-    return list_accounts(session)
+@router.get("/", response_model=List[AccountListItem], response_model_exclude_unset=True, status_code=status.HTTP_200_OK)
+def api_list_accounts(
+    response: Response,
+    session: Session = Depends(get_account_session),
+    account_user_id: Optional[int] = Query(None, description="계좌 주인 아이디"),
+    account_bank: Optional[str] = Query(None, description="계좌 은행"),
+    created_from: Optional[datetime] = Query(None, description="생성 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시각 끝 (포함)"),
+    params: PageParams = Depends(),
+):
+    page = list_accounts(
+        session,
+        params,
+        account_user_id=account_user_id,
+        account_bank=account_bank,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    return set_next_cursor(response, page)
 
 @router.post("/", response_model=Account, status_code=status.HTTP_201_CREATED)
 def api_create_account(
@@ -58,12 +128,16 @@ def api_create_account(
         account_balance=account_in.account_balance,
     )
 
-@router.get("/user/{account_user_id}", response_model=List[Account])
+@router.get("/user/{account_user_id}", response_model=List[AccountListItem], response_model_exclude_unset=True)
 def api_list_accounts_by_user(
     account_user_id: int,
-    session: Session = Depends(get_account_session)
-) -> List[Account]:
-    return list_accounts_by_user(session, account_user_id)
+    response: Response,
+    session: Session = Depends(get_account_session),
+    account_bank: Optional[str] = Query(None, description="계좌 은행"),
+    params: PageParams = Depends(),
+):
+    page = list_accounts_by_user(session, account_user_id, params, account_bank=account_bank)
+    return set_next_cursor(response, page)
 
 @router.get("/number/{account_number}", response_model=Account)
 def api_get_account_by_number(
@@ -79,6 +153,36 @@ def api_get_account(
 ) -> Account:
     return get_account_by_id(session, account_id)
 
+@router.get("/{account_id}/balance", response_model=BalanceAtResponse)
+def api_get_balance_at(
+    account_id: int,
+    at: Optional[datetime] = Query(None, description="조회 시점 (없으면 현재 잔액)"),
+    session: Session = Depends(get_account_session)
+) -> BalanceAtResponse:
+    return BalanceAtResponse(account_id=account_id, at=at, balance=balance_at(session, account_id, at))
+
+@router.get("/{account_id}/statement", response_model=StatementResponse)
+def api_get_statement(
+    account_id: int,
+    start: datetime = Query(..., description="기간 시작 (미포함, 기초 잔액 시점)"),
+    end: datetime = Query(..., description="기간 끝 (포함, 기말 잔액 시점)"),
+    session: Session = Depends(get_account_session)
+) -> StatementResponse:
+    return StatementResponse(**statement(session, account_id, start, end))
+
+@router.get("/{account_id}/postings", response_model=List[PostingListItem], response_model_exclude_unset=True)
+def api_list_postings(
+    account_id: int,
+    response: Response,
+    session: Session = Depends(get_account_session),
+    created_from: Optional[datetime] = Query(None, description="분개 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="분개 시각 끝 (포함)"),
+    kind: Optional[str] = Query(None, description="opening | transfer_in | transfer_out | adjustment"),
+    params: PageParams = Depends(),
+):
+    page = list_postings(session, account_id, params, created_from=created_from, created_to=created_to, kind=kind)
+    return set_next_cursor(response, page)
+
 @router.put("/{account_id}", response_model=Account)
 def api_update_account(
     account_id: int,
@@ -103,7 +207,9 @@ def api_delete_account(
 @router.post("/transfer", response_model=List[Account], status_code=status.HTTP_200_OK)
 def api_transfer_accounts(
     transfer_in: TransferModel,
-    session: Session = Depends(get_account_session)
+    session: Session = Depends(get_account_session),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255,
+                                            description="재시도 시 같은 값을 보내면 이체가 한 번만 적용됨"),
 ) -> List[Account]:
     from_acc, to_acc = transfer_between_accounts(
         session,
@@ -111,5 +217,28 @@ def api_transfer_accounts(
         transfer_in.withdraw_amount,
         transfer_in.to_account_number,
         transfer_in.deposit_amount,
+        idempotency_key=idempotency_key,
     )
     return [from_acc, to_acc]
+
+@router.post("/transfer/batch", response_model=BatchTransferResponse, status_code=status.HTTP_200_OK)
+def api_transfer_batch(
+    batch_in: BatchTransferModel,
+    session: Session = Depends(get_account_session),
+) -> BatchTransferResponse:
+    '''
+        여러 이체를 한 트랜잭션에서 처리하고 건별 결과를 반환합니다.\n
+        계좌는 account_id 순서로 잠그고, 전체 검증 후 커밋은 한 번입니다.\n
+    '''
+    results = transfer_batch(
+        session,
+        [
+            TransferLeg(leg.from_account_number, leg.to_account_number, leg.amount, leg.idempotency_key)
+            for leg in batch_in.transfers
+        ],
+        atomic=batch_in.atomic,
+    )
+    counts = {"applied": 0, "replayed": 0, "failed": 0}
+    for r in results:
+        counts[r["status"]] += 1
+    return BatchTransferResponse(**counts, results=results)
@@ -1,17 +1,21 @@
 # app/routers/document_router.py
+from datetime import date, datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from pydantic import BaseModel
 from sqlmodel import Session
 
 from app.models.document_models import Document
-from app.dependencies.document_db import get_document_session
+from app.dependencies.document_db import document_db_engine, get_document_session
+from app.dependencies.pagination import PageParams, set_next_cursor
+from app.dependencies.streaming import EXPORT_FORMAT_PATTERN, stream_rows
 from app.services.document_service import (
+    DOCUMENT_LIST,
+    document_filters,
     create_document,
     get_all_documents,
     get_document_by_id,
     get_documents_by_user_id,
-    get_documents_by_user_and_classification,
     update_document,
     delete_document,
     
@@ -37,36 +41,91 @@ class DocumentContentResponse(BaseModel):
     document_id: int
     document_content: Optional[str] = None
 
+# 목록 응답 항목 (fields 로 고른 컬럼만 포함)
+DocumentListItem = DOCUMENT_LIST.item_model
+
 
 # 전체 조회 + 조건 필터
-@router.get("/", response_model=List[Document])
+@router.get("/", response_model=List[DocumentListItem], response_model_exclude_unset=True)
 def api_get_documents(
+    response: Response,
     session: Session = Depends(get_document_session),
     document_user_id: Optional[int] = Query(None, description="필터링할 사용자 ID"),
     document_classification_id: Optional[int] = Query(None, description="필터링할 문서 분류 ID"),
-) -> List[Document]:
+    created_from: Optional[datetime] = Query(None, description="생성 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시각 끝 (포함)"),
+    due_from: Optional[date] = Query(None, description="만기일 시작 (포함)"),
+    due_to: Optional[date] = Query(None, description="만기일 끝 (포함)"),
+    params: PageParams = Depends(),
+):
     '''
-        쿼리에 user_id가 없다면, classification_id가 동작을 하지 않습니다.\n
-        user_id가 없다면, 애초에 필요한 기능이 아니라고 판단해서, 조건문을 아래와 같이 구성했습니다.\n
-        classificatiom_id와 user_id를 쿼리에 같이 넣어야 조건문이 동작합니다.\n
+        document_id 오름차순 keyset 페이지로 조회합니다.\n
+        다음 페이지는 응답 헤더 X-Next-Cursor 값을 cursor 쿼리로 넘기면 됩니다. (헤더가 없으면 마지막 페이지)\n
+        document_content(OCR 원문)는 fields=...,document_content 로 요청할 때만 포함됩니다.\n
     '''
-    if (document_user_id is not None) and (document_classification_id is not None):
-        return get_documents_by_user_and_classification(
-            session=session,
-            document_user_id=document_user_id,
-            document_classification_id=document_classification_id,
-        )
-    if document_user_id is not None:
-        return get_documents_by_user_id(session=session, document_user_id=document_user_id)
-    return get_all_documents(session=session)
+    page = get_all_documents(
+        session=session,
+        params=params,
+        document_user_id=document_user_id,
+        document_classification_id=document_classification_id,
+        created_from=created_from,
+        created_to=created_to,
+        due_from=due_from,
+        due_to=due_to,
+    )
+    return set_next_cursor(response, page)
 
 # 사용자별 조회
-@router.get("/user/{document_user_id}", response_model=List[Document])
+@router.get("/user/{document_user_id}", response_model=List[DocumentListItem], response_model_exclude_unset=True)
 def api_get_documents_by_user(
     document_user_id: int,
+    response: Response,
     session: Session = Depends(get_document_session),
-) -> List[Document]:
-    return get_documents_by_user_id(session=session, document_user_id=document_user_id)
+    document_classification_id: Optional[int] = Query(None, description="필터링할 문서 분류 ID"),
+    created_from: Optional[datetime] = Query(None, description="생성 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시각 끝 (포함)"),
+    params: PageParams = Depends(),
+):
+    page = get_documents_by_user_id(
+        session=session,
+        document_user_id=document_user_id,
+        params=params,
+        document_classification_id=document_classification_id,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    return set_next_cursor(response, page)
+
+# 전체 내보내기 (스트리밍)
+@router.get("/export")
+def api_export_documents(
+    document_user_id: Optional[int] = Query(None, description="필터링할 사용자 ID"),
+    document_classification_id: Optional[int] = Query(None, description="필터링할 문서 분류 ID"),
+    created_from: Optional[datetime] = Query(None, description="생성 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시각 끝 (포함)"),
+    due_from: Optional[date] = Query(None, description="만기일 시작 (포함)"),
+    due_to: Optional[date] = Query(None, description="만기일 끝 (포함)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 컬럼 (쉼표 구분)"),
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="ndjson | json"),
+):
+    '''
+        조건에 맞는 문서 전체를 페이지 없이 스트리밍합니다. (document_id 오름차순)\n
+        format=ndjson 은 한 줄에 문서 하나, format=json 은 JSON 배열입니다.\n
+    '''
+    return stream_rows(
+        document_db_engine,
+        DOCUMENT_LIST,
+        fields,
+        *document_filters(
+            document_user_id=document_user_id,
+            document_classification_id=document_classification_id,
+            created_from=created_from,
+            created_to=created_to,
+            due_from=due_from,
+            due_to=due_to,
+        ),
+        fmt=format,
+    )
 
 # 단건 조회
 @router.get("/{document_id}", response_model=Document)
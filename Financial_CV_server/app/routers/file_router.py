@@ -1,34 +1,46 @@
-from fastapi import APIRouter, UploadFile, File, Depends
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from app.dependencies.file_serving import file_response
 from app.dependencies.file_db import get_files_session
-from app.services.file_service import FileService
+from app.services.file_service import FileService, UPLOAD_MAX_FILES, check_upload_size
 from app.models.utils import RESULT_CODE
-from typing import List
+from typing import List, Literal
 from sqlmodel import select
 from app.models.file_models import *
 
 router = APIRouter(prefix='/v1/post', tags=["files"])
 
-@router.post('/{post_id}/upload', response_model=List[dict])
+def _file_item(file: Files) -> dict:
+    item = file.dict()
+    item["download_url"] = f"{router.prefix}/files/{file.file_id}"
+    if file.sha256 and (file.content_type or "").startswith("image/"):
+        item["thumbnail_url"] = f"{router.prefix}/files/{file.file_id}/thumbnail"
+    return item
+
+_UPLOAD_BODY_SCHEMA = {
+    "requestBody": {
+        "required": True,
+        "content": {"multipart/form-data": {"schema": {
+            "type": "object",
+            "properties": {"files": {"type": "array", "items": {"type": "string", "format": "binary"}}},
+            "required": ["files"],
+        }}},
+    }
+}
+
+@router.post('/{post_id}/upload', response_model=List[dict], openapi_extra=_UPLOAD_BODY_SCHEMA)
 async def upload_files(
     post_id: int,
-    files: List[UploadFile] = File(...),
+    request: Request,
     file_db=Depends(get_files_session),
     fileService: FileService = Depends()):
-
-    saved = []
-    
-    for upload in files:
-        data = await upload.read()
-        model = fileService.save_file(
-            post_id=post_id,
-            file_db=file_db,
-            file_name=upload.filename,
-           file_data=data
-        )
-        if model:
-            saved.append(model.dict())
-    return saved
+    # File(...) 파라미터는 핸들러 전에 본문 전체를 임시 파일로 받으므로, 크기 확인 후 직접 파싱
+    check_upload_size(request.headers.get("content-length"))
+    async with request.form(max_files=UPLOAD_MAX_FILES) as form:
+        files = [f for f in form.getlist("files") if not isinstance(f, str)]
+        if not files:
+            raise HTTPException(status_code=400, detail="files 가 필요합니다.")
+        saved = await fileService.save_uploads(post_id=post_id, file_db=file_db, uploads=files)
+    return [_file_item(model) for model in saved]
 
 @router.get('/{post_id}/files', response_model=List[dict])
 def get_files(
@@ -40,4 +52,35 @@ def get_files(
         select(Files)
         .filter(Files.post_id == post_id)
     ).all()
-    return [f.dict() for f in files]
\ No newline at end of file
+    return [_file_item(f) for f in files]
+
+@router.get('/{post_id}/files.zip')
+def download_files_zip(
+    post_id: int,
+    file_db=Depends(get_files_session),
+    fileService: FileService = Depends()
+):
+    # 게시글 파일 전체를 zip 으로 (아카이브를 메모리에 만들지 않고 스트리밍)
+    return fileService.zip_files(post_id=post_id, file_db=file_db)
+
+@router.api_route('/files/{file_id}', methods=["GET", "HEAD"])
+def download_file(
+    file_id: int,
+    request: Request,
+    file_db=Depends(get_files_session),
+    fileService: FileService = Depends()
+):
+    # ETag(sha256) / If-None-Match / If-Modified-Since → 304, Range → 206
+    return fileService.serve_file(file_id=file_id, file_db=file_db, request=request)
+
+@router.api_route('/files/{file_id}/{kind}', methods=["GET", "HEAD"])
+def get_file_derivative(
+    file_id: int,
+    kind: Literal["thumbnail"],
+    request: Request,
+    file_db=Depends(get_files_session),
+    fileService: FileService = Depends()
+):
+    # thumbnail: 목록 화면용 축소 JPEG (처음 요청 시 생성 후 캐시)
+    path, media_type, content_hash = fileService.get_derivative(file_id=file_id, kind=kind, file_db=file_db)
+    return file_response(request, path, media_type=media_type, content_hash=content_hash)
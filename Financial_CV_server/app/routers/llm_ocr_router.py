@@ -1,32 +1,57 @@
 # app/routers/ocr_ingest_router.py
 from __future__ import annotations
+import asyncio
 import os
 import base64
 import json
 import uuid
 import time
 import re
-import requests
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+import httpx
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlmodel import Session
 
 from app.dependencies.document_db import get_document_session
-from app.services.ocr_to_document import create_document_from_ocr
-from app.dependencies.llm_ocr import INSTRUCTIONS, INSTRUCTIONS_TEXT  # ← 추가
-from openai import OpenAI
+from app.dependencies.http_clients import (
+    CLOVA_LIMITS,
+    OPENAI_LIMITS,
+    RETRY_STATUS_CODES,
+    call_with_retry,
+    get_async_openai_client,
+    get_http_client,
+)
+from app.dependencies.ocr_cache import get_ocr_cache, image_cache_key, text_cache_key
+from app.dependencies.image_normalize import normalize_bytes
+from app.dependencies.image_preprocess import preprocess_bytes
+from app.dependencies.local_ocr import recognize as recognize_local
+from app.dependencies.ocr_provider_router import ocr_provider_router
+from app.services.ocr_to_document import create_document_from_ocr, create_documents_from_ocr
+from app.services import rule_extractor
+from app.services.doc_classifier import classifier_info, get_doc_classifier
+from app.services.ocr_job_service import TERMINAL_STATUSES, get_job, job_payload, ocr_job_queue
+from app.dependencies.llm_ocr import INSTRUCTIONS, INSTRUCTIONS_EXTRACT, INSTRUCTIONS_TEXT  # ← 추가
+from openai import AsyncOpenAI
 
 router = APIRouter(tags=["ocr"])
 
 # ---------- Preview ----------
+OCR_PROVIDER_PATTERN = "^(clova|openai|easyocr)$"
+# 바이너리/multipart 미리보기 (base64 data URL 없이 이미지 바이트 그대로) 최대 크기
+OCR_MAX_IMAGE_BYTES = int(os.getenv("OCR_MAX_IMAGE_MB", "20")) * 1024 * 1024
+
 class OcrPreviewRequest(BaseModel):
     image: str  # data URL (e.g., data:image/png;base64,xxxx)
     model: str | None = "gpt-4o-mini"
-    provider: str = Field("clova", pattern="^(clova|openai)$")  # 기본 clova
+    provider: str = Field("clova", pattern=OCR_PROVIDER_PATTERN)  # 기본 clova
 
 class OcrPreviewResponse(BaseModel):
     ocr_text: str  # 최종 8개 key-value 결과(프런트는 기존과 동일하게 사용)
+    provider: str | None = None  # 실제로 OCR 한 provider (폴백 시 요청과 다를 수 있음)
+    extractor: str | None = None  # 8개 key-value 를 만든 쪽: "rules"(규칙 기반, GPT 생략) / "llm"(GPT)
 
 # ---------- Create ----------
 class OcrIngestRequest(BaseModel):
@@ -39,28 +64,62 @@ class OcrIngestResponse(BaseModel):
     document_classification_id: int
     ocr_text: str
 
+# ---------- Batch (multi-page) ----------
+OCR_BATCH_MAX_PAGES = int(os.getenv("OCR_BATCH_MAX_PAGES", "20"))
+OCR_BATCH_CONCURRENCY = int(os.getenv("OCR_BATCH_CONCURRENCY", "8"))
+
+class OcrBatchPreviewRequest(BaseModel):
+    images: List[str] = Field(..., min_length=1)  # 페이지 순서대로 data URL 목록
+    model: str | None = "gpt-4o-mini"
+
+class OcrBatchPreviewResponse(BaseModel):
+    ocr_text: str    # 전체 페이지를 합쳐서 추출한 8개 key-value 결과
+    page_count: int
+    extractor: str | None = None  # "rules" / "llm"
+
+class OcrBatchIngestRequest(BaseModel):
+    user_id: int
+    ocr_texts: List[str] = Field(..., min_length=1)
+
+class OcrBatchIngestResponse(BaseModel):
+    documents: List[OcrIngestResponse]
+
+# ---------- Background Job ----------
+OCR_JOB_SSE_POLL_SECONDS = float(os.getenv("OCR_JOB_SSE_POLL_SECONDS", "2"))
+OCR_JOB_SSE_HEARTBEAT_SECONDS = float(os.getenv("OCR_JOB_SSE_HEARTBEAT_SECONDS", "15"))
+
+class OcrJobSubmitRequest(BaseModel):
+    image: str | None = None                 # 단일 페이지 data URL
+    images: List[str] | None = None          # 다중 페이지 data URL 목록 (페이지 순서)
+    model: str | None = "gpt-4o-mini"
+    user_id: Optional[int] = None
+    auto_create: bool = False                # 완료 후 문서 생성까지 진행 (user_id 필요)
+    callback_url: Optional[str] = None       # 종료 시 작업 상태를 POST 할 웹훅 주소
+
+class OcrJobSubmitResponse(BaseModel):
+    job_id: str
+    status: str
+
+class OcrJobResponse(BaseModel):
+    job_id: str
+    status: str                              # queued / running / succeeded / failed
+    user_id: Optional[int] = None
+    auto_create: bool
+    ocr_text: Optional[str] = None
+    document_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
 # ---------- OpenAI Helper ----------
-def _ensure_openai_client() -> OpenAI:
+def _ensure_openai_client() -> AsyncOpenAI:
     key = os.getenv("OPENAI_API_KEY")
     if not key:
         raise HTTPException(status_code=500, detail="OPENAI_API_KEY 미설정")
-    return OpenAI(api_key=key)
-
-def _call_openai_with_image(client: OpenAI, image_data_url: str, model: str | None) -> str:
-    try:
-        resp = client.responses.create(
-            model=model or "gpt-4o-mini",
-            input=[
-                {"role": "system", "content": INSTRUCTIONS},
-                {"role": "user", "content": [
-                    {"type": "input_image", "image_url": image_data_url}
-                ]},
-            ],
-            temperature=0.0,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"OCR 처리 실패: {e}")
+    return get_async_openai_client(key)
 
+def _extract_response_text(resp) -> str:
     text = ""
     try:
         if getattr(resp, "output", None):
@@ -79,51 +138,91 @@ def _call_openai_with_image(client: OpenAI, image_data_url: str, model: str | No
             text = msg.get("content", "") if isinstance(msg, dict) else getattr(msg, "content", "") or ""
     except Exception:
         text = getattr(resp, "output_text", "") or ""
+    return (text or "").strip()
 
-    text = (text or "").strip()
+async def _call_openai_with_image_bytes(client: AsyncOpenAI, ext: str, raw: bytes, model: str | None,
+                                        image_url: str | None = None) -> str:
+    """
+    이미지 바이트 → GPT(이미지OCR+분류/추출)
+    - Responses API 는 이미지를 data URL 로만 받으므로 캐시 미스일 때만 base64 인코딩 (이미 data URL 이면 그대로)
+    - 전송 전 정규화 (image_normalize: EXIF 방향 적용/제거, 긴 변 제한, OPENAI_IMAGE_FORMAT 재인코딩) → 캐시 키는 원본 기준
+    """
+    cache = get_ocr_cache()
+    cache_key = text_cache_key(image_cache_key(raw), model or "gpt-4o-mini", INSTRUCTIONS)
+    cached = await cache.aget("llm_image", cache_key)
+    if cached is not None:
+        return cached
+
+    normalized = await asyncio.to_thread(normalize_bytes, raw, "openai")
+    if normalized is not None:
+        ext, raw = normalized
+        image_url = None
+    if image_url is None:
+        subtype = "jpeg" if ext == "jpg" else ext
+        image_url = f"data:image/{subtype};base64,{base64.b64encode(raw).decode('ascii')}"
+
+    try:
+        resp = await call_with_retry(OPENAI_LIMITS, lambda: client.responses.create(
+            model=model or "gpt-4o-mini",
+            input=[
+                {"role": "system", "content": INSTRUCTIONS},
+                {"role": "user", "content": [
+                    {"type": "input_image", "image_url": image_url}
+                ]},
+            ],
+            temperature=0.0,
+        ))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"OCR 처리 실패: {e}")
+
+    text = _extract_response_text(resp)
     if not text:
         raise HTTPException(status_code=502, detail="빈 OCR 결과")
+    await cache.aset("llm_image", cache_key, text)
     return text
 
-def _call_openai_with_text(client: OpenAI, ocr_text: str, model: str | None) -> str:
+async def _call_openai_with_text(client: AsyncOpenAI, ocr_text: str, model: str | None) -> str:
     """
     CLOVA 결과 텍스트를 GPT에 넣어 분류+핵심정보 8개 key로만 반환.
+    - 로컬 분류기(doc_classifier)가 있으면 GPT 는 추출 전용 프롬프트(7개 key), 서류 종류는 분류기가 붙임
+    - 같은 (정규화된) OCR 텍스트 + 모델 + 프롬프트면 캐시 결과 반환 (분류는 캐시 뒤에서 매번, 1ms 미만)
     """
+    classifier = get_doc_classifier()
+    instructions = INSTRUCTIONS_EXTRACT if classifier is not None else INSTRUCTIONS_TEXT
+    cache = get_ocr_cache()
+    cache_key = text_cache_key(ocr_text, model or "gpt-4o-mini", instructions)
+    cached = await cache.aget("llm_text", cache_key)
+    if cached is not None:
+        return classifier.label_kv(cached) if classifier is not None else cached
+
     try:
-        resp = client.responses.create(
+        resp = await call_with_retry(OPENAI_LIMITS, lambda: client.responses.create(
             model=model or "gpt-4o-mini",
             input=[
-                {"role": "system", "content": INSTRUCTIONS_TEXT},
+                {"role": "system", "content": instructions},
                 {"role": "user", "content": f"OCR TEXT:\n{ocr_text}"},
             ],
             temperature=0.0,
-        )
+        ))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"분류/추출 실패: {e}")
 
-    text = ""
-    try:
-        if getattr(resp, "output", None):
-            for c in resp.output[0].content:
-                t = None
-                if isinstance(c, dict):
-                    if c.get("type") == "output_text":
-                        t = c.get("text")
-                else:
-                    if getattr(c, "type", None) == "output_text":
-                        t = getattr(c, "text", None)
-                if t:
-                    text += t
-        if not text and getattr(resp, "choices", None):
-            msg = resp.choices[0].message
-            text = msg.get("content", "") if isinstance(msg, dict) else getattr(msg, "content", "") or ""
-    except Exception:
-        text = getattr(resp, "output_text", "") or ""
-
-    text = (text or "").strip()
+    text = _extract_response_text(resp)
     if not text:
         raise HTTPException(status_code=502, detail="빈 분류/추출 결과")
-    return text
+    await cache.aset("llm_text", cache_key, text)
+    return classifier.label_kv(text) if classifier is not None else text
+
+async def _extract_kv(client: AsyncOpenAI, ocr_text: str, model: str | None) -> tuple[str, str]:
+    """
+    OCR 텍스트 → 8개 key-value, (결과, "rules" | "llm")
+    - 규칙 기반 추출(rule_extractor) confidence 가 OCR_RULE_MIN_CONFIDENCE 이상이면 GPT 호출 생략
+    - 아니면 GPT 분류/추출 (기존 경로)
+    """
+    extraction = rule_extractor.fast_path(ocr_text)  # 정규식만, 1ms 미만 → 이벤트 루프에서 바로 실행
+    if extraction is not None:
+        return extraction.kv_text, "rules"
+    return await _call_openai_with_text(client, ocr_text, model), "llm"
 
 # ---------- CLOVA Helper ----------
 def _ensure_clova_conf():
@@ -133,46 +232,68 @@ def _ensure_clova_conf():
         raise HTTPException(status_code=500, detail="CLOVA_OCR_URL/CLOVA_OCR_SECRET 미설정")
     return url, secret
 
-_DATAURL_RE = re.compile(r"^data:image/(\w+);base64,(.+)$", re.DOTALL)
+_DATAURL_HEADER_RE = re.compile(r"^data:image/(\w+);base64$")
 
 def _extract_base64_from_data_url(data_url: str) -> tuple[str, bytes]:
-    m = _DATAURL_RE.match(data_url or "")
-    if not m:
+    # 정규식은 헤더("data:image/png;base64")에만 적용 (수 MB 본문 전체를 훑지 않도록)
+    header, sep, b64 = (data_url or "").partition(",")
+    m = _DATAURL_HEADER_RE.match(header)
+    if not m or not sep or not b64:
         raise HTTPException(status_code=400, detail="image 필드는 data URL(base64) 형식이어야 합니다.")
     ext = m.group(1).lower()
-    b64 = m.group(2)
     try:
         raw = base64.b64decode(b64)
     except Exception:
         raise HTTPException(status_code=400, detail="이미지 base64 디코딩 실패")
     return ext, raw
 
-def _call_clova_ocr(image_data_url: str) -> str:
+async def _call_clova_ocr_bytes(ext: str, raw: bytes) -> str:
     """
     CLOVA OCR 호출 → 텍스트 병합 반환
     - General OCR 응답(images[].fields[].inferText) 기준
+    - 같은 이미지(바이트 해시 동일)는 캐시 결과 반환
+    - 전송 전 정규화 + 문서 영역 보정/축소 (image_preprocess, CLOVA_PREPROCESS_STEPS) → 업로드 바이트 감소
+      캐시 키는 원본 바이트 기준
+    - multipart 형식(message JSON + file 바이너리)으로 전송 (ocr.call_clova_ocr 와 같은 방식)
+      base64 JSON 대비 본문 약 25% 감소, 인코딩/JSON 직렬화 복사 없음
     """
     url, secret = _ensure_clova_conf()
-    ext, raw = _extract_base64_from_data_url(image_data_url)
-    image_b64 = base64.b64encode(raw).decode("utf-8")
 
-    payload = {
+    cache = get_ocr_cache()
+    cache_key = image_cache_key(raw)
+    cached = await cache.aget("clova", cache_key)
+    if cached is not None:
+        return cached
+
+    processed = await asyncio.to_thread(preprocess_bytes, raw)
+    if processed is not None:
+        ext, raw = processed
+
+    message = json.dumps({
         "version": "V2",
         "requestId": str(uuid.uuid4()),
         "timestamp": int(time.time() * 1000),
         "images": [{
             "format": ext,          # "jpg","png" 등
             "name": "preview",
-            "data": image_b64
         }]
-    }
-    headers = {
-        "Content-Type": "application/json; charset=UTF-8",
-        "X-OCR-SECRET": secret
-    }
+    })
+    headers = {"X-OCR-SECRET": secret}
+
+    async def _post() -> httpx.Response:
+        # 재시도마다 multipart 본문을 새로 만듦 (바이트는 복사 없이 그대로 스트리밍)
+        r = await get_http_client().post(
+            url, headers=headers, data={"message": message},
+            files={"file": (f"preview.{ext}", raw, f"image/{ext}")}, timeout=CLOVA_LIMITS.timeout,
+        )
+        if r.status_code in RETRY_STATUS_CODES:
+            r.raise_for_status()  # 일시적 오류 → 재시도
+        return r
 
     try:
-        r = requests.post(url, headers=headers, data=json.dumps(payload), timeout=20)
+        r = await call_with_retry(CLOVA_LIMITS, _post)
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(status_code=502, detail=f"CLOVA OCR 오류: HTTP {e.response.status_code} {e.response.text}")
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"CLOVA OCR 호출 실패: {e}")
 
@@ -198,22 +319,99 @@ def _call_clova_ocr(image_data_url: str) -> str:
     text = (text or "").strip()
     if not text:
         raise HTTPException(status_code=502, detail="CLOVA OCR 빈 결과")
+    await cache.aset("clova", cache_key, text)
     return text
 
 # ---------- Routes ----------
 @router.post("/ocr/ingest-preview", response_model=OcrPreviewResponse)
-def ocr_preview(payload: OcrPreviewRequest):
+async def ocr_preview(payload: OcrPreviewRequest):
     """
     provider:
-      - 'clova'  : 이미지 → CLOVA OCR → 텍스트 → GPT(분류/추출) → 8개 key-value
-      - 'openai' : 이미지 → GPT(이미지OCR+분류/추출) → 8개 key-value (기존 방식)
+      - 'clova'   : 이미지 → CLOVA OCR → 텍스트 → GPT(분류/추출) → 8개 key-value
+      - 'openai'  : 이미지 → GPT(이미지OCR+분류/추출) → 8개 key-value (기존 방식)
+      - 'easyocr' : 이미지 → 로컬 EasyOCR(서버 내 워커, 오프라인) → 텍스트 → GPT(분류/추출) → 8개 key-value
+    """
+    ext, raw = _extract_base64_from_data_url(payload.image)
+    image_url = payload.image if payload.provider == "openai" else None
+    return await _preview_image(ext, raw, payload.provider, payload.model, image_url=image_url)
+
+async def _preview_image(ext: str, raw: bytes, provider: str, model: str | None,
+                         image_url: str | None = None) -> OcrPreviewResponse:
+    """
+    미리보기 공통 처리 (data URL / multipart / 바이너리 본문 모두 여기로)
+    - 1) 단계는 provider 라우터가 실행 (지연 추적, 헤지, 서킷 브레이커, OCR_FALLBACK 폴백)
+    - openai 는 이미지에서 바로 8개 key-value, 나머지는 OCR 텍스트 → 2) 규칙 기반 추출 또는 GPT 분류/추출
     """
     client = _ensure_openai_client()
 
-    # 기본: CLOVA 경로
-    raw_text = _call_clova_ocr(payload.image)                  # 1) 이미지 → CLOVA OCR
-    kv_text  = _call_openai_with_text(client, raw_text, payload.model)  # 2) 텍스트 → GPT 분류/추출
-    return OcrPreviewResponse(ocr_text=kv_text)
+    used, text = await ocr_provider_router.run(provider, {
+        "clova": lambda: _call_clova_ocr_bytes(ext, raw),                              # 1) 이미지 → CLOVA OCR
+        "openai": lambda: _call_openai_with_image_bytes(client, ext, raw, model, image_url),
+        "easyocr": lambda: recognize_local(raw),                                       # 1) 이미지 → 로컬 OCR
+    })
+    extractor = "llm"
+    if used != "openai":
+        text, extractor = await _extract_kv(client, text, model)  # 2) 텍스트 → 규칙 기반 / GPT 분류/추출
+    return OcrPreviewResponse(ocr_text=text, provider=used, extractor=extractor)
+
+def _image_too_large() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                         detail=f"이미지는 최대 {OCR_MAX_IMAGE_BYTES // (1024 * 1024)}MB 입니다.")
+
+def _ext_from_content_type(content_type: str | None) -> str:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if not media_type.startswith("image/") or len(media_type) <= len("image/"):
+        raise HTTPException(status_code=415, detail="Content-Type 은 image/* 이어야 합니다.")
+    return media_type.split("/", 1)[1]
+
+@router.post(
+    "/ocr/ingest-preview/raw",
+    response_model=OcrPreviewResponse,
+    openapi_extra={"requestBody": {"required": True, "content": {
+        "image/jpeg": {"schema": {"type": "string", "format": "binary"}},
+        "image/png": {"schema": {"type": "string", "format": "binary"}},
+    }}},
+)
+async def ocr_preview_raw(
+    request: Request,
+    provider: str = Query("clova", pattern=OCR_PROVIDER_PATTERN),
+    model: str = Query("gpt-4o-mini"),
+):
+    """
+    요청 본문 = 이미지 바이너리 (Content-Type: image/jpeg 등), provider/model 은 쿼리
+    - base64/JSON 인코딩 없이 받은 바이트 그대로 OCR 로 전달 (OCR_MAX_IMAGE_MB 초과 시 413)
+    """
+    ext = _ext_from_content_type(request.headers.get("content-type"))
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > OCR_MAX_IMAGE_BYTES:
+        raise _image_too_large()
+
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > OCR_MAX_IMAGE_BYTES:
+            raise _image_too_large()
+        chunks.append(chunk)
+    if not size:
+        raise HTTPException(status_code=400, detail="이미지 본문이 비어 있습니다.")
+    raw = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    del chunks
+    return await _preview_image(ext, raw, provider, model)
+
+@router.post("/ocr/ingest-preview/upload", response_model=OcrPreviewResponse)
+async def ocr_preview_upload(
+    file: UploadFile = File(...),
+    provider: str = Form("clova", pattern=OCR_PROVIDER_PATTERN),
+    model: str = Form("gpt-4o-mini"),
+):
+    """multipart 이미지 1장 미리보기 (파일은 starlette 가 임시 파일로 받아 두고 한 번만 읽음)"""
+    if file.size is not None and file.size > OCR_MAX_IMAGE_BYTES:
+        raise _image_too_large()
+    raw = await file.read()
+    if not raw:
+        raise HTTPException(status_code=400, detail="이미지 파일이 비어 있습니다.")
+    return await _preview_image(_ext_from_upload(file), raw, provider, model)
 
 @router.post("/ocr/ingest-create", response_model=OcrIngestResponse)
 def ocr_ingest_create(
@@ -244,3 +442,188 @@ def ocr_ingest_create(
         document_classification_id=doc.document_classification_id,
         ocr_text=ocr_text,
     )
+
+# ---------- Batch Routes ----------
+def _ext_from_upload(upload: UploadFile) -> str:
+    content_type = (upload.content_type or "").lower()
+    if content_type.startswith("image/") or content_type == "application/pdf":
+        return content_type.split("/", 1)[1]
+    _, dot_ext = os.path.splitext(upload.filename or "")
+    if dot_ext:
+        return dot_ext[1:].lower()
+    raise HTTPException(status_code=400, detail=f"이미지 형식을 알 수 없습니다: {upload.filename}")
+
+def _check_page_count(count: int):
+    """페이지(건) 수 제한 - base64 디코딩/본문 읽기 전에 호출"""
+    if count > OCR_BATCH_MAX_PAGES:
+        raise HTTPException(status_code=400, detail=f"최대 {OCR_BATCH_MAX_PAGES}페이지까지 처리할 수 있습니다.")
+
+async def _preview_pages(pages: List[tuple[str, bytes]], model: str | None) -> OcrBatchPreviewResponse:
+    """
+    여러 페이지 → CLOVA OCR 동시 호출(OCR_BATCH_CONCURRENCY 제한) → 페이지 순서대로 텍스트 병합
+    → 규칙 기반 추출 또는 GPT 1회
+    """
+    _check_page_count(len(pages))
+    client = _ensure_openai_client()
+
+    sem = asyncio.Semaphore(OCR_BATCH_CONCURRENCY)
+
+    async def _ocr_page(ext: str, raw: bytes) -> str:
+        # 페이지별 텍스트가 필요하므로 텍스트 OCR provider 사이에서만 폴백
+        async with sem:
+            _, text = await ocr_provider_router.run("clova", {
+                "clova": lambda: _call_clova_ocr_bytes(ext, raw),
+                "easyocr": lambda: recognize_local(raw),
+            })
+            return text
+
+    page_texts = await asyncio.gather(*(_ocr_page(ext, raw) for ext, raw in pages))
+    merged = "\n\n".join(page_texts)
+    kv_text, extractor = await _extract_kv(client, merged, model)
+    return OcrBatchPreviewResponse(ocr_text=kv_text, page_count=len(pages), extractor=extractor)
+
+@router.post("/ocr/batch-preview", response_model=OcrBatchPreviewResponse)
+async def ocr_batch_preview(payload: OcrBatchPreviewRequest):
+    """여러 페이지(data URL 목록)를 하나의 문서로 미리보기"""
+    _check_page_count(len(payload.images))
+    pages = [_extract_base64_from_data_url(image) for image in payload.images]
+    return await _preview_pages(pages, payload.model)
+
+@router.post("/ocr/batch-preview/upload", response_model=OcrBatchPreviewResponse)
+async def ocr_batch_preview_upload(
+    files: List[UploadFile] = File(...),
+    model: str = Form("gpt-4o-mini"),
+):
+    """여러 페이지(multipart 파일)를 하나의 문서로 미리보기"""
+    _check_page_count(len(files))
+    pages = [(_ext_from_upload(upload), await upload.read()) for upload in files]
+    return await _preview_pages(pages, model)
+
+@router.post("/ocr/batch-create", response_model=OcrBatchIngestResponse)
+def ocr_batch_create(
+    payload: OcrBatchIngestRequest,
+    session: Session = Depends(get_document_session),
+):
+    """
+    key-value 텍스트 여러 건 → 문서 여러 건을 단일 DB 트랜잭션으로 생성
+    - 하나라도 파싱 실패 시 전체 미저장 (detail.index 로 실패 위치 안내)
+    - 한 번에 OCR_BATCH_MAX_PAGES 건까지
+    """
+    _check_page_count(len(payload.ocr_texts))
+    ocr_texts = [(t or "").strip() for t in payload.ocr_texts]
+
+    try:
+        docs = create_documents_from_ocr(session=session, user_id=payload.user_id, ocr_texts=ocr_texts)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"문서 생성 실패: {e}")
+
+    return OcrBatchIngestResponse(documents=[
+        OcrIngestResponse(
+            document_id=doc.document_id,
+            document_title=doc.document_title,
+            document_classification_id=doc.document_classification_id,
+            ocr_text=ocr_text,
+        )
+        for doc, ocr_text in zip(docs, ocr_texts)
+    ])
+
+# ---------- Background Job Routes ----------
+@router.post("/ocr/jobs", response_model=OcrJobSubmitResponse, status_code=status.HTTP_202_ACCEPTED)
+async def ocr_job_submit(payload: OcrJobSubmitRequest):
+    """
+    미리보기(+문서 생성)를 백그라운드 작업으로 제출하고 job_id 즉시 반환
+    - 결과는 GET /ocr/jobs/{job_id} 폴링 또는 GET /ocr/jobs/{job_id}/events (SSE) 로 확인
+    """
+    images = payload.images or ([payload.image] if payload.image else [])
+    if not images:
+        raise HTTPException(status_code=400, detail="image 또는 images 가 필요합니다.")
+    _check_page_count(len(images))
+    pages = [_extract_base64_from_data_url(image) for image in images]  # 형식 오류는 제출 시점에 400
+
+    async def _run() -> str:
+        return (await _preview_pages(pages, payload.model)).ocr_text
+
+    job = await ocr_job_queue.submit(
+        _run,
+        user_id=payload.user_id,
+        auto_create=payload.auto_create,
+        model=payload.model,
+        callback_url=payload.callback_url,
+    )
+    return OcrJobSubmitResponse(job_id=job.job_id, status=job.status)
+
+@router.get("/ocr/jobs/metrics")
+def ocr_job_metrics():
+    """작업 큐 길이 / 대기 시간 / 처리 시간"""
+    return ocr_job_queue.metrics()
+
+@router.get("/ocr/jobs/{job_id}", response_model=OcrJobResponse)
+def ocr_job_status(job_id: str):
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="OCR 작업을 찾을 수 없습니다.")
+    return OcrJobResponse(**job_payload(job))
+
+@router.get("/ocr/jobs/{job_id}/events")
+async def ocr_job_events(job_id: str):
+    """
+    작업 상태 SSE 스트림
+    - 상태가 바뀔 때마다 `event: status` 전송, 종료(succeeded/failed) 후 스트림 종료
+    - 다른 프로세스에서 처리 중인 작업도 OCR_JOB_SSE_POLL_SECONDS 간격 재조회로 반영
+    """
+    job = await asyncio.to_thread(get_job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="OCR 작업을 찾을 수 없습니다.")
+
+    async def _stream():
+        last_status = None
+        last_sent = time.monotonic()
+        while True:
+            changed = ocr_job_queue.changed_event(job_id)  # 조회 전에 잡아야 변경을 놓치지 않음
+            current = await asyncio.to_thread(get_job, job_id)
+            if current is None:
+                return
+            if current.status != last_status:
+                last_status = current.status
+                last_sent = time.monotonic()
+                data = json.dumps(job_payload(current), ensure_ascii=False)
+                yield f"event: status\ndata: {data}\n\n"
+            if current.status in TERMINAL_STATUSES:
+                return
+            try:
+                if changed is None:
+                    await asyncio.sleep(OCR_JOB_SSE_POLL_SECONDS)
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(changed.wait(), timeout=OCR_JOB_SSE_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                if time.monotonic() - last_sent >= OCR_JOB_SSE_HEARTBEAT_SECONDS:
+                    last_sent = time.monotonic()
+                    yield ": ping\n\n"
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/ocr/providers/stats")
+def ocr_provider_stats():
+    """provider 별 지연(EWMA/p95), 서킷 상태, 헤지/폴백 카운터"""
+    return ocr_provider_router.snapshot()
+
+@router.get("/ocr/extract/stats")
+def ocr_extract_stats():
+    """8개 key-value 추출: 규칙 기반(GPT 생략) / GPT 호출 횟수와 GPT 호출 비율"""
+    return rule_extractor.stats()
+
+@router.get("/ocr/classifier")
+def ocr_classifier_info():
+    """로컬 서류 종류 분류기 로드 여부, 학습 정보(문서 수, holdout 정확도/지연)"""
+    return classifier_info()
+
+@router.get("/ocr/cache/stats")
+def ocr_cache_stats():
+    """OCR/LLM 결과 캐시 적중/미스 카운터"""
+    return get_ocr_cache().stats()
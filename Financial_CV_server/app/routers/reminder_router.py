@@ -1,13 +1,16 @@
 # app/routers/reminder_router.py
-from typing import List
-from fastapi import APIRouter, Depends, Query, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlmodel import Session
 
 from app.models.reminder_models import Reminder
 # 프로젝트에 별도 세션 의존성이 없으면 아래 라인을 get_document_session 등으로 교체하세요.
 from app.dependencies.reminder_db import get_reminder_session
+from app.dependencies.pagination import PageParams, set_next_cursor
 
 from app.services.reminder_service import (
+    REMINDER_LIST,
     ReminderCreate,
     ReminderUpdate,
     create_reminder,
@@ -22,16 +25,33 @@ from app.services.reminder_service import (
 
 router = APIRouter(prefix="/reminders", tags=["reminders"])
 
+# 목록 응답 항목 (fields 로 고른 컬럼만 포함)
+ReminderListItem = REMINDER_LIST.item_model
+
 
 # -----------------------------
 # 전체 조회
 # -----------------------------
-@router.get("/", response_model=List[Reminder])
+@router.get("/", response_model=List[ReminderListItem], response_model_exclude_unset=True)
 def api_get_all_reminders(
+    response: Response,
     session: Session = Depends(get_reminder_session),
-) -> List[Reminder]:
-    """모든 리마인더 조회 (만기일 오름차순)"""
-    return get_all_reminders(session=session)
+    reminder_user_id: Optional[int] = Query(None, description="사용자 id"),
+    is_done: Optional[bool] = Query(None, description="완료 여부: true/false"),
+    due_from: Optional[datetime] = Query(None, description="만기 시각 시작 (포함)"),
+    due_to: Optional[datetime] = Query(None, description="만기 시각 끝 (포함)"),
+    params: PageParams = Depends(),
+):
+    """리마인더 조회 (만기일 오름차순 keyset 페이지, 다음 페이지: X-Next-Cursor 헤더 → cursor)"""
+    page = get_all_reminders(
+        session=session,
+        params=params,
+        reminder_user_id=reminder_user_id,
+        is_done=is_done,
+        due_from=due_from,
+        due_to=due_to,
+    )
+    return set_next_cursor(response, page)
 
 
 # -----------------------------
@@ -49,46 +69,64 @@ def api_get_reminder_by_id(
 # -----------------------------
 # 트랜잭션 id로 조회
 # -----------------------------
-@router.get("/transaction/{transaction_id}", response_model=List[Reminder])
+@router.get("/transaction/{transaction_id}", response_model=List[ReminderListItem], response_model_exclude_unset=True)
 def api_get_reminders_by_transaction(
     transaction_id: int,
+    response: Response,
     session: Session = Depends(get_reminder_session),
-) -> List[Reminder]:
+    params: PageParams = Depends(),
+):
     """특정 트랜잭션에 연결된 모든 리마인더 조회"""
-    return get_reminders_by_transaction_id(session=session, transaction_id=transaction_id)
+    page = get_reminders_by_transaction_id(session=session, transaction_id=transaction_id, params=params)
+    return set_next_cursor(response, page)
 
 
 # -----------------------------
 # 상태여부 + 유저 id로 조회
 # -----------------------------
-@router.get("/user/{reminder_user_id}/status", response_model=List[Reminder])
+@router.get("/user/{reminder_user_id}/status", response_model=List[ReminderListItem], response_model_exclude_unset=True)
 def api_get_reminders_by_status_and_user(
     reminder_user_id: int,
+    response: Response,
     is_done: bool = Query(..., description="완료 여부: true/false"),
     session: Session = Depends(get_reminder_session),
-) -> List[Reminder]:
+    params: PageParams = Depends(),
+):
     """
     상태(완료/미완료)와 사용자 id로 리마인더 조회
     - is_done=true  : 완료된 리마인더
     - is_done=false : 미완료 리마인더
     """
-    return get_reminders_by_status_and_user(
+    page = get_reminders_by_status_and_user(
         session=session,
         reminder_user_id=reminder_user_id,
         is_done=is_done,
+        params=params,
     )
+    return set_next_cursor(response, page)
 
 
 # -----------------------------
 # 유저 id로 조회
 # -----------------------------
-@router.get("/user/{reminder_user_id}", response_model=List[Reminder])
+@router.get("/user/{reminder_user_id}", response_model=List[ReminderListItem], response_model_exclude_unset=True)
 def api_get_reminders_by_user(
     reminder_user_id: int,
+    response: Response,
     session: Session = Depends(get_reminder_session),
-) -> List[Reminder]:
+    due_from: Optional[datetime] = Query(None, description="만기 시각 시작 (포함)"),
+    due_to: Optional[datetime] = Query(None, description="만기 시각 끝 (포함)"),
+    params: PageParams = Depends(),
+):
     """사용자 id로 모든 리마인더 조회"""
-    return get_reminders_by_user_id(session=session, reminder_user_id=reminder_user_id)
+    page = get_reminders_by_user_id(
+        session=session,
+        reminder_user_id=reminder_user_id,
+        params=params,
+        due_from=due_from,
+        due_to=due_to,
+    )
+    return set_next_cursor(response, page)
 
 
 # -----------------------------
@@ -1,6 +1,7 @@
 # app/routers/transaction_router.py
-from typing import List
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlmodel import Session
 
 from app.models.transaction_models import (
@@ -9,6 +10,8 @@ from app.models.transaction_models import (
     TransactionUpdate,
 )
 from app.services.transaction_service import (
+    TRANSACTION_LIST,
+    transaction_filters,
     list_transactions,
     list_transactions_by_user,
     create_transaction,
@@ -17,31 +20,104 @@ from app.services.transaction_service import (
     update_transaction_recurring,
     get_transaction_by_id,
 )
-from app.dependencies.transaction_db import get_transaction_session  # DB 세션 의존성
+from app.dependencies.transaction_db import get_transaction_session, transaction_db_engine  # DB 세션 의존성
+from app.dependencies.pagination import PageParams, set_next_cursor
+from app.dependencies.streaming import EXPORT_FORMAT_PATTERN, stream_rows
 
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+# 목록 응답 항목 (fields 로 고른 컬럼만 포함)
+TransactionListItem = TRANSACTION_LIST.item_model
+
 
 # -----------------------------
 # 모든 거래 조회
 # -----------------------------
-@router.get("/", response_model=List[Transaction])
-def api_list_transactions(session: Session = Depends(get_transaction_session)) -> List[Transaction]:
-    """모든 거래를 최신순으로 조회"""
-    return list_transactions(session)
+@router.get("/", response_model=List[TransactionListItem], response_model_exclude_unset=True)
+def api_list_transactions(
+    response: Response,
+    session: Session = Depends(get_transaction_session),
+    transaction_user_id: Optional[int] = Query(None, description="거래 유저 아이디"),
+    transaction_close: Optional[bool] = Query(None, description="거래 완료 여부"),
+    transaction_recurring: Optional[bool] = Query(None, description="거래 반복 여부"),
+    created_from: Optional[datetime] = Query(None, description="생성 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시각 끝 (포함)"),
+    due_from: Optional[datetime] = Query(None, description="만료 시각 시작 (포함)"),
+    due_to: Optional[datetime] = Query(None, description="만료 시각 끝 (포함)"),
+    params: PageParams = Depends(),
+):
+    """거래를 최신순 keyset 페이지로 조회 (다음 페이지: X-Next-Cursor 헤더 → cursor)"""
+    page = list_transactions(
+        session,
+        params,
+        transaction_user_id=transaction_user_id,
+        transaction_close=transaction_close,
+        transaction_recurring=transaction_recurring,
+        created_from=created_from,
+        created_to=created_to,
+        due_from=due_from,
+        due_to=due_to,
+    )
+    return set_next_cursor(response, page)
 
 
 # -----------------------------
 # 특정 유저의 거래만 조회
 # -----------------------------
-@router.get("/user/{transaction_user_id}", response_model=List[Transaction])
+@router.get("/user/{transaction_user_id}", response_model=List[TransactionListItem], response_model_exclude_unset=True)
 def api_list_transactions_by_user(
     transaction_user_id: int,
+    response: Response,
     session: Session = Depends(get_transaction_session),
-) -> List[Transaction]:
+    transaction_close: Optional[bool] = Query(None, description="거래 완료 여부"),
+    created_from: Optional[datetime] = Query(None, description="생성 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시각 끝 (포함)"),
+    params: PageParams = Depends(),
+):
     """거래 유저 아이디로만 필터링하여 조회"""
-    return list_transactions_by_user(session, transaction_user_id)
+    page = list_transactions_by_user(
+        session,
+        transaction_user_id,
+        params,
+        transaction_close=transaction_close,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    return set_next_cursor(response, page)
+
+
+# -----------------------------
+# 거래 전체 내보내기 (스트리밍)
+# -----------------------------
+@router.get("/export")
+def api_export_transactions(
+    transaction_user_id: Optional[int] = Query(None, description="거래 유저 아이디"),
+    transaction_close: Optional[bool] = Query(None, description="거래 완료 여부"),
+    transaction_recurring: Optional[bool] = Query(None, description="거래 반복 여부"),
+    created_from: Optional[datetime] = Query(None, description="생성 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시각 끝 (포함)"),
+    due_from: Optional[datetime] = Query(None, description="만료 시각 시작 (포함)"),
+    due_to: Optional[datetime] = Query(None, description="만료 시각 끝 (포함)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 컬럼 (쉼표 구분)"),
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="ndjson | json"),
+):
+    """조건에 맞는 거래 전체를 최신순으로 스트리밍 (format=ndjson | json)"""
+    return stream_rows(
+        transaction_db_engine,
+        TRANSACTION_LIST,
+        fields,
+        *transaction_filters(
+            transaction_user_id=transaction_user_id,
+            transaction_close=transaction_close,
+            transaction_recurring=transaction_recurring,
+            created_from=created_from,
+            created_to=created_to,
+            due_from=due_from,
+            due_to=due_to,
+        ),
+        fmt=format,
+    )
 
 
 # -----------------------------
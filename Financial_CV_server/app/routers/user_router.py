@@ -1,15 +1,18 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Request, Response, status, HTTPException
 from pydantic import BaseModel
 from sqlmodel import Session
 from datetime import datetime
-import json
 
 from app.models.user_models import User
 from app.dependencies.user_db import get_user_session
 from app.dependencies.jwt_db import JWTUtil
-from app.dependencies.redis_db import get_redis
+from app.dependencies.redis_db import get_async_redis
+from app.dependencies.auth import AuthUser, astore_session, get_current_user
+from app.dependencies.rate_limit import client_ip, enforce_rate_limit
+from app.dependencies.pagination import PageParams, set_next_cursor
 from app.services.user_service import (
+    USER_LIST,
     register_user,
     get_user_by_id,
     list_users,
@@ -50,19 +53,26 @@ class UserResponseModel(BaseModel):
     class Config:
         orm_mode = True  # SQLModel → Pydantic 변환 허용
 
+# 목록 응답 항목 (fields 로 고른 컬럼만 포함)
+UserListItem = USER_LIST.item_model
+
 # ----------------------------
 # 사용자 API
 # ----------------------------
 
 @router.post("/register", response_model=UserResponseModel, status_code=status.HTTP_201_CREATED)
-def api_register_user(
+async def api_register_user(
     user_in: UserCreateModel,
+    request: Request,
     session: Session = Depends(get_user_session),
     jwtUtil: JWTUtil = Depends(),
-    redisDB = Depends(get_redis),
+    redisDB = Depends(get_async_redis),
 ) -> UserResponseModel:
+    # 0) IP 별 가입 요청 제한 (Redis 카운터, 파이프라인 1회)
+    await enforce_rate_limit(redisDB, "register", [f"ip:{client_ip(request)}"])
+
     # 1) DB 저장
-    user = register_user(
+    user = await register_user(
         session=session,
         user_name=user_in.user_name,
         user_login_id=user_in.user_login_id,
@@ -76,15 +86,8 @@ def api_register_user(
         "user_name": user.user_name,
     })
 
-    # 3) Redis 저장(1시간 TTL) -> 5분으로 수정
-    redis_key = f"user:{user.user_id}"
-    redisDB.setex(redis_key, 300, json.dumps({
-        "user_id": user.user_id,
-        "user_login_id": user.user_login_id,
-        "user_name": user.user_name,
-        "created_at": user.created_at.isoformat(),
-        "access_token": token,
-    }))
+    # 3) Redis 저장(1시간 TTL) -> 5분으로 수정 (세션 + 사용자 캐시, 파이프라인 1회)
+    await astore_session(redisDB, user, token, 300)
 
     return UserResponseModel(
         user_id=user.user_id,
@@ -94,9 +97,21 @@ def api_register_user(
         access_token=token,
     )
 
-@router.get("/", response_model=List[UserResponseModel])
-def api_list_users(session: Session = Depends(get_user_session)) -> List[User]:
-    return list_users(session)
+@router.get("/", response_model=List[UserListItem], response_model_exclude_unset=True)
+def api_list_users(
+    response: Response,
+    session: Session = Depends(get_user_session),
+    created_from: Optional[datetime] = Query(None, description="가입 시각 시작 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="가입 시각 끝 (포함)"),
+    params: PageParams = Depends(),
+):
+    page = list_users(session, params, created_from=created_from, created_to=created_to)
+    return set_next_cursor(response, page)
+
+@router.get("/me", response_model=UserResponseModel)
+def api_get_me(current_user: AuthUser = Depends(get_current_user)) -> AuthUser:
+    # Authorization: Bearer <access_token> (세션/사용자 정보는 Redis 에서)
+    return current_user
 
 @router.get("/{user_id}", response_model=UserResponseModel)
 def api_get_user(
@@ -133,13 +148,19 @@ def api_delete_user(
 # ----------------------------
 
 @router.post("/login", response_model=UserResponseModel)
-def api_user_login(
+async def api_user_login(
     login_data: UserLoginModel,
+    request: Request,
     session: Session = Depends(get_user_session),
     jwtUtil: JWTUtil = Depends(),
-    redisDB = Depends(get_redis),
+    redisDB = Depends(get_async_redis),
 ) -> UserResponseModel:
-    user = signin(session, login_data.user_login_id, login_data.password)
+    # IP + 로그인 아이디 별 시도 제한 (bcrypt 검증 전에 거름, 카운터 2개를 파이프라인 1회로)
+    await enforce_rate_limit(
+        redisDB, "login", [f"ip:{client_ip(request)}", f"id:{login_data.user_login_id}"]
+    )
+
+    user = await signin(session, login_data.user_login_id, login_data.password)
     if not user:
         raise HTTPException(status_code=401, detail="로그인 실패")
 
@@ -149,14 +170,8 @@ def api_user_login(
         "user_name": user.user_name,
     })
 
-    redis_key = f"user:{user.user_id}"
-    redisDB.setex(redis_key, 3600, json.dumps({
-        "user_id": user.user_id,
-        "user_login_id": user.user_login_id,
-        "user_name": user.user_name,
-        "created_at": user.created_at.isoformat(),
-        "access_token": token,
-    }))
+    # 세션 + 사용자 캐시 (이후 요청의 get_current_user 가 DB 를 거치지 않도록), 파이프라인 1회
+    await astore_session(redisDB, user, token, 3600)
 
     return UserResponseModel(
         user_id=user.user_id,
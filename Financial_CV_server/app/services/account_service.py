@@ -1,18 +1,46 @@
-from typing import List, Optional, Tuple
+import os
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from fastapi import HTTPException, status
-from app.models.account_models import Account
+from app.models.account_models import Account, AccountTransfer
+from app.dependencies.database import begin_write
+from app.services.ledger_service import post
+from app.dependencies.pagination import ListSpec, Page, PageParams, range_filter
+
+load_dotenv()
+
+# 일괄 이체 1회 최대 건수
+BATCH_TRANSFER_MAX_LEGS = int(os.getenv("BATCH_TRANSFER_MAX_LEGS", "500"))
+
+# 목록: account_id 순 keyset
+ACCOUNT_LIST = ListSpec(Account, order_by=["account_id"])
 
 # -----------------------------
 # 조회
 # -----------------------------
-def list_accounts(session: Session) -> List[Account]:
-    return session.exec(select(Account)).all()
+def list_accounts(
+    session: Session,
+    params: PageParams,
+    account_user_id: Optional[int] = None,
+    account_bank: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+) -> Page:
+    return ACCOUNT_LIST.page(
+        session,
+        params,
+        Account.account_user_id == account_user_id if account_user_id is not None else None,
+        Account.account_bank == account_bank if account_bank is not None else None,
+        *range_filter(Account.created_at, created_from, created_to),
+    )
 
 
-def list_accounts_by_user(session: Session, account_user_id: int) -> List[Account]:
-    stmt = select(Account).where(Account.account_user_id == account_user_id)
-    return session.exec(stmt).all()
+def list_accounts_by_user(session: Session, account_user_id: int, params: PageParams, **filters) -> Page:
+    return list_accounts(session, params, account_user_id=account_user_id, **filters)
 
 
 def get_account_by_id(session: Session, account_id: int) -> Account:
@@ -60,6 +88,9 @@ def create_account(
         account_balance=account_balance,
     )
     session.add(account)
+    if account_balance:
+        session.flush()
+        post(session, account.account_id, account_balance, account_balance, "opening")
     session.commit()
     session.refresh(account)
     return account
@@ -72,6 +103,9 @@ def update_account(
     account_balance: Optional[int] = None,
     account_bank: Optional[str] = None,
 ) -> Account:
+    if account_balance is not None:
+        # 잔액 직접 수정은 조정 분개를 남기므로 이체와 같이 쓰기 락 안에서 읽는다
+        begin_write(session)
     account = get_account_by_id(session, account_id)
 
     if account_number is not None:
@@ -88,7 +122,8 @@ def update_account(
             )
         account.account_number = account_number
 
-    if account_balance is not None:
+    if account_balance is not None and account_balance != account.account_balance:
+        post(session, account_id, account_balance - account.account_balance, account_balance, "adjustment")
         account.account_balance = account_balance
 
     if account_bank is not None:
@@ -109,13 +144,114 @@ def delete_account(session: Session, account_id: int) -> None:
 # -----------------------------
 # 이체
 # -----------------------------
+def _account_ids(session: Session, account_numbers: List[str]) -> Dict[str, int]:
+    """계좌번호 → account_id (없는 번호는 404)"""
+    rows = session.exec(
+        select(Account.account_number, Account.account_id).where(Account.account_number.in_(account_numbers))
+    ).all()
+    ids = {number: account_id for number, account_id in rows}
+    for number in account_numbers:
+        if number not in ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Account with number '{number}' not found"
+            )
+    return ids
+
+
+def _balances(session: Session, account_ids: List[int]) -> Dict[int, int]:
+    rows = session.exec(
+        select(Account.account_id, Account.account_balance).where(Account.account_id.in_(account_ids))
+    ).all()
+    return {account_id: balance for account_id, balance in rows}
+
+
+def _find_transfer(session: Session, idempotency_key: str) -> Optional[AccountTransfer]:
+    return session.exec(
+        select(AccountTransfer).where(AccountTransfer.idempotency_key == idempotency_key)
+    ).first()
+
+
+def _replay_transfer(
+    session: Session,
+    done: AccountTransfer,
+    from_account_number: str,
+    to_account_number: str,
+    amount: int,
+) -> Tuple[Account, Account]:
+    """같은 Idempotency-Key 재요청: 같은 내용이면 이체 없이 계좌 반환, 다르면 409"""
+    from_acc = session.get(Account, done.from_account_id)
+    to_acc = session.get(Account, done.to_account_id)
+    if (
+        from_acc is None or to_acc is None
+        or from_acc.account_number != from_account_number
+        or to_acc.account_number != to_account_number
+        or done.amount != amount
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Idempotency-Key already used for a different transfer"
+        )
+    return from_acc, to_acc
+
+
+def apply_transfer(session: Session, from_account_id: int, to_account_id: int, amount: int,
+                   idempotency_key: Optional[str] = None) -> AccountTransfer:
+    """
+    열린 쓰기 트랜잭션 안에서 이체 1건 적용 (커밋은 호출자)
+    - 출금은 잔액 조건부 UPDATE 한 번 (balance >= amount 일 때만) → 읽고-쓰기 사이 경쟁 없음
+    - 잔액 부족이면 400, 아무것도 쓰지 않음
+    - 이체 원장 1행 + 계좌별 분개 2행 (ledger_service.post)
+    """
+    debit = session.connection().execute(
+        update(Account)
+        .where(Account.account_id == from_account_id, Account.account_balance >= amount)
+        .values(
+            account_balance=Account.account_balance - amount,
+            # 송신 계좌 사용 횟수 1 증가
+            account_count=Account.account_count + 1,
+        )
+    )
+    if debit.rowcount != 1:
+        current = _balances(session, [from_account_id]).get(from_account_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Insufficient balance in account {from_account_id} (current: {current})"
+        )
+    session.connection().execute(
+        update(Account)
+        .where(Account.account_id == to_account_id)
+        .values(account_balance=Account.account_balance + amount)
+    )
+
+    balances = _balances(session, [from_account_id, to_account_id])
+    transfer = AccountTransfer(
+        idempotency_key=idempotency_key,
+        from_account_id=from_account_id,
+        to_account_id=to_account_id,
+        amount=amount,
+        from_balance_after=balances[from_account_id],
+        to_balance_after=balances[to_account_id],
+    )
+    session.add(transfer)
+    session.flush()
+    post(session, from_account_id, -amount, transfer.from_balance_after, "transfer_out", transfer.transfer_id)
+    post(session, to_account_id, amount, transfer.to_balance_after, "transfer_in", transfer.transfer_id)
+    return transfer
+
+
 def transfer_between_accounts(
     session: Session,
     from_account_number: str,
     withdraw_amount: int,
     to_account_number: str,
-    deposit_amount: int
+    deposit_amount: int,
+    idempotency_key: Optional[str] = None,
 ) -> Tuple[Account, Account]:
+    """
+    한 트랜잭션(sqlite 는 BEGIN IMMEDIATE)에서 조건부 출금 + 입금 + 원장 기록 후 커밋 1회
+    idempotency_key 가 이미 처리된 키면 이체 없이 결과만 다시 반환
+    """
     if withdraw_amount <= 0 or deposit_amount <= 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -127,38 +263,182 @@ def transfer_between_accounts(
             detail="Withdraw and deposit amounts must be equal"
         )
 
-    from_acc = get_account_by_number(session, from_account_number)
-    to_acc = get_account_by_number(session, to_account_number)
+    try:
+        begin_write(session)
+
+        if idempotency_key is not None:
+            done = _find_transfer(session, idempotency_key)
+            if done is not None:
+                # 읽기만 했으므로 쓰기 락을 바로 놓는다
+                session.commit()
+                return _replay_transfer(session, done, from_account_number, to_account_number, withdraw_amount)
+
+        ids = _account_ids(session, [from_account_number, to_account_number])
+        from_id, to_id = ids[from_account_number], ids[to_account_number]
+        if from_id == to_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot transfer to the same account"
+            )
 
-    if from_acc.account_id == to_acc.account_id:
+        apply_transfer(session, from_id, to_id, withdraw_amount, idempotency_key)
+        session.commit()
+    except HTTPException:
+        session.rollback()
+        raise
+    except IntegrityError:
+        # sqlite 외 DB 에서 같은 키가 동시에 들어온 경우 - 먼저 커밋된 이체를 돌려준다
+        session.rollback()
+        done = _find_transfer(session, idempotency_key) if idempotency_key is not None else None
+        if done is None:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Transfer failed due to an internal error"
+            )
+        return _replay_transfer(session, done, from_account_number, to_account_number, withdraw_amount)
+    except Exception:
+        session.rollback()
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot transfer to the same account"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Transfer failed due to an internal error"
         )
 
-    if withdraw_amount > from_acc.account_balance:
+    return session.get(Account, from_id), session.get(Account, to_id)
+
+
+# -----------------------------
+# 일괄 이체
+# -----------------------------
+class TransferLeg(NamedTuple):
+    from_account_number: str
+    to_account_number: str
+    amount: int
+    idempotency_key: Optional[str] = None
+
+
+def _lock_accounts(session: Session, account_ids: List[int]) -> None:
+    """
+    account_id 오름차순으로 행 잠금 → 여러 일괄 이체가 겹쳐도 잠금 순서가 같아 교착 없음
+    (sqlite 는 FOR UPDATE 가 없고 begin_write 의 BEGIN IMMEDIATE 가 DB 쓰기 락을 이미 잡음)
+    """
+    session.exec(
+        select(Account.account_id)
+        .where(Account.account_id.in_(account_ids))
+        .order_by(Account.account_id)
+        .with_for_update()
+    ).all()
+
+
+def _leg_result(index: int, leg: TransferLeg, status_: str, transfer: Optional[AccountTransfer] = None,
+                detail: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "status": status_,
+        "from_account_number": leg.from_account_number,
+        "to_account_number": leg.to_account_number,
+        "amount": leg.amount,
+        "transfer_id": transfer.transfer_id if transfer else None,
+        "from_balance_after": transfer.from_balance_after if transfer else None,
+        "to_balance_after": transfer.to_balance_after if transfer else None,
+        "detail": detail,
+    }
+
+
+def _validate_legs(legs: List[TransferLeg]) -> None:
+    if not legs:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No transfers given")
+    if len(legs) > BATCH_TRANSFER_MAX_LEGS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Insufficient balance in '{from_account_number}' (current: {from_acc.account_balance})"
+            detail=f"Too many transfers (max {BATCH_TRANSFER_MAX_LEGS})"
         )
+    seen_keys = set()
+    for i, leg in enumerate(legs):
+        if leg.amount <= 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"transfers[{i}]: Amounts must be positive integers"
+            )
+        if leg.from_account_number == leg.to_account_number:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"transfers[{i}]: Cannot transfer to the same account"
+            )
+        if leg.idempotency_key is not None:
+            if leg.idempotency_key in seen_keys:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"transfers[{i}]: Duplicate idempotency_key in batch"
+                )
+            seen_keys.add(leg.idempotency_key)
+
+
+def transfer_batch(session: Session, legs: List[TransferLeg], atomic: bool = True) -> List[Dict[str, Any]]:
+    """
+    여러 이체를 한 트랜잭션에서 적용하고 건별 결과 반환 (커밋 1회)
+    - 모든 건을 먼저 검증 (금액, 같은 계좌, 계좌 존재, 배치 안 키 중복) → 하나라도 틀리면 아무것도 하지 않음
+    - 이미 처리된 idempotency_key 는 다시 적용하지 않고 status="replayed"
+    - 잔액 부족: atomic=True 면 전체 롤백 후 400, False 면 그 건만 status="failed" 로 두고 나머지 커밋
+    """
+    _validate_legs(legs)
 
     try:
-        # 금액 이동
-        from_acc.account_balance -= withdraw_amount
-        to_acc.account_balance += deposit_amount
+        begin_write(session)
 
-        # 송신 계좌 사용 횟수 1 증가
-        from_acc.account_count = (from_acc.account_count or 0) + 1
+        numbers = list(dict.fromkeys(n for leg in legs for n in (leg.from_account_number, leg.to_account_number)))
+        ids = _account_ids(session, numbers)
+
+        keys = [leg.idempotency_key for leg in legs if leg.idempotency_key is not None]
+        done: Dict[str, AccountTransfer] = {}
+        if keys:
+            done = {
+                t.idempotency_key: t
+                for t in session.exec(select(AccountTransfer).where(AccountTransfer.idempotency_key.in_(keys))).all()
+            }
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(legs)
+        pending = []
+        for i, leg in enumerate(legs):
+            from_id, to_id = ids[leg.from_account_number], ids[leg.to_account_number]
+            previous = done.get(leg.idempotency_key) if leg.idempotency_key is not None else None
+            if previous is None:
+                pending.append((i, leg, from_id, to_id))
+            elif (previous.from_account_id, previous.to_account_id, previous.amount) == (from_id, to_id, leg.amount):
+                results[i] = _leg_result(i, leg, "replayed", previous)
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"transfers[{i}]: Idempotency-Key already used for a different transfer"
+                )
+
+        if pending:
+            _lock_accounts(session, sorted({a for _, _, f, t in pending for a in (f, t)}))
+
+        for i, leg, from_id, to_id in pending:
+            try:
+                transfer = apply_transfer(session, from_id, to_id, leg.amount, leg.idempotency_key)
+            except HTTPException as e:
+                if atomic:
+                    raise HTTPException(status_code=e.status_code, detail=f"transfers[{i}]: {e.detail}")
+                results[i] = _leg_result(i, leg, "failed", detail=e.detail)
+            else:
+                results[i] = _leg_result(i, leg, "applied", transfer)
 
-        session.add(from_acc)
-        session.add(to_acc)
         session.commit()
-        session.refresh(from_acc)
-        session.refresh(to_acc)
-        return from_acc, to_acc
+        return results
+    except HTTPException:
+        session.rollback()
+        raise
+    except IntegrityError:
+        # sqlite 외 DB 에서 같은 키가 동시에 들어온 경우 - 다시 보내면 replayed 로 처리됨
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A transfer with one of these idempotency keys was committed concurrently; retry the batch"
+        )
     except Exception:
         session.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Transfer failed due to an internal error"
+            detail="Batch transfer failed due to an internal error"
         )
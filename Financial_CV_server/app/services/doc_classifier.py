@@ -0,0 +1,376 @@
+# app/services/doc_classifier.py
+"""
+로컬 서류 종류 분류기 (GPT 분류 대체, CPU 1ms 미만)
+
+- 입력: 8개 key-value 텍스트에서 "서류 종류" 줄을 뺀 나머지 (저장된 Document.document_content 와 같은 형식)
+  → 학습(저장된 문서)과 추론(GPT 추출 결과 7줄)이 같은 형식
+- 특징: 문자 1~3-gram TF-IDF (단어 경계 포함, sublinear tf, L2 정규화) / 모델: 소프트맥스 선형 분류 (NumPy, AdaGrad)
+- 분류기 파일이 있으면 GPT 는 추출 전용 프롬프트(INSTRUCTIONS_EXTRACT)만 사용하고 서류 종류 줄은 여기서 붙임
+  파일이 없으면(학습 전) 기존처럼 GPT 가 분류까지
+- 학습/평가 CLI (Financial_CV_server 디렉터리에서):
+    python -m app.services.doc_classifier train [--db-url (기본: 서버와 같은 문서 DB, DB_SINGLE_FILE 반영)] [--out doc_classifier.npz]
+      → 층화 holdout 정확도/클래스별 재현율/혼동행렬/문서당 지연 출력 후 전체 문서로 다시 학습해서 저장
+    python -m app.services.doc_classifier eval [--db-url ...] [--model ...]   // 저장된 모델을 DB 문서로 평가
+
+환경변수
+    DOC_CLASSIFIER=true
+    DOC_CLASSIFIER_PATH=doc_classifier.npz
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+from app.services.ocr_to_document import CATEGORY_LABELS, KEY_ALIASES, KV_LINE_RE, _normalize_key
+
+load_dotenv()
+
+logger = logging.getLogger("doc_classifier")
+
+DOC_CLASSIFIER = os.getenv("DOC_CLASSIFIER", "true").lower() in ("1", "true", "yes")
+DOC_CLASSIFIER_PATH = os.getenv("DOC_CLASSIFIER_PATH", "doc_classifier.npz")
+
+NGRAM_RANGE = (1, 3)
+MIN_DF = 2
+MAX_FEATURES = 50000
+
+_CATEGORY_KEY = "document_classification_label"
+
+
+def _is_category_line(line: str) -> bool:
+    m = KV_LINE_RE.match(line)
+    return bool(m) and KEY_ALIASES.get(_normalize_key(m.group(1))) == _CATEGORY_KEY
+
+
+def document_text(content: str) -> str:
+    """학습/추론 공통 입력: "서류 종류" 줄 제거 (정답 누출 방지), 소문자, 줄마다 공백 정리"""
+    lines = []
+    for line in (content or "").splitlines():
+        if _is_category_line(line):
+            continue
+        line = " ".join(line.lower().split())
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def _ngrams(text: str) -> Dict[str, int]:
+    """단어마다 앞뒤 공백을 붙인 문자 n-gram 개수 (scikit-learn char_wb 와 같은 방식)"""
+    counts: Dict[str, int] = {}
+    lo, hi = NGRAM_RANGE
+    for word in text.split():
+        padded = f" {word} "
+        for n in range(lo, hi + 1):
+            for i in range(len(padded) - n + 1):
+                gram = padded[i:i + n]
+                if gram != " ":
+                    counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+class Prediction(NamedTuple):
+    classification_id: int
+    label: str
+    probability: float
+
+
+class DocClassifier:
+    def __init__(self, vocab: Sequence[str], idf: np.ndarray, weights: np.ndarray, bias: np.ndarray,
+                 classes: Sequence[int], meta: Optional[dict] = None):
+        self.vocab = {term: i for i, term in enumerate(vocab)}
+        self.idf = idf.astype(np.float32)
+        self.weights = weights.astype(np.float32)   # (특징 수, 클래스 수)
+        self.bias = bias.astype(np.float32)
+        self.classes = [int(c) for c in classes]     # 열 → document_classification_id
+        self.meta = meta or {}
+
+    # ---------- 특징 ----------
+    def features(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """document_text 결과 → (특징 번호, TF-IDF 값), L2 정규화"""
+        counts = _ngrams(text)
+        ids, tfs = [], []
+        for gram, count in counts.items():
+            idx = self.vocab.get(gram)
+            if idx is not None:
+                ids.append(idx)
+                tfs.append(count)
+        ids_arr = np.asarray(ids, dtype=np.int64)
+        values = (1.0 + np.log(np.asarray(tfs, dtype=np.float32))) * self.idf[ids_arr]
+        norm = float(np.linalg.norm(values))
+        if norm > 0:
+            values /= norm
+        return ids_arr, values
+
+    # ---------- 추론 ----------
+    def predict_proba(self, content: str) -> np.ndarray:
+        ids, values = self.features(document_text(content))
+        logits = values @ self.weights[ids] + self.bias
+        logits -= logits.max()
+        exp = np.exp(logits)
+        return exp / exp.sum()
+
+    def predict(self, content: str) -> Prediction:
+        proba = self.predict_proba(content)
+        col = int(proba.argmax())
+        cid = self.classes[col]
+        return Prediction(cid, CATEGORY_LABELS[cid], float(proba[col]))
+
+    def label_kv(self, kv_text: str) -> str:
+        """
+        GPT 추출 결과(7줄) 앞에 "서류 종류 : <라벨>" 줄을 붙여 기존 8줄 형식으로
+        - key-value 줄이 없으면(서류를 인식할 수 없습니다. 등) 그대로 반환
+        """
+        lines = [line for line in kv_text.splitlines() if not _is_category_line(line)]
+        if not any(KV_LINE_RE.match(line) for line in lines):
+            return kv_text
+        body = "\n".join(lines)
+        return f"서류 종류 : {self.predict(body).label}\n{body}"
+
+    # ---------- 저장/로드 ----------
+    def save(self, path: str):
+        """임시 파일에 쓴 뒤 교체 (서버가 읽는 도중 반쯤 쓰인 파일을 보지 않도록)"""
+        vocab = sorted(self.vocab, key=self.vocab.get)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez_compressed(
+                f, vocab=np.asarray(vocab), idf=self.idf, weights=self.weights, bias=self.bias,
+                classes=np.asarray(self.classes), meta=np.asarray(json.dumps(self.meta, ensure_ascii=False)),
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "DocClassifier":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["vocab"].tolist(), data["idf"], data["weights"], data["bias"],
+                       data["classes"].tolist(), json.loads(str(data["meta"])))
+
+
+# ----------------------------
+# 학습
+# ----------------------------
+def _build_vocab(docs: List[Dict[str, int]]) -> Tuple[List[str], np.ndarray]:
+    """문서 빈도 MIN_DF 이상 n-gram, 빈도 상위 MAX_FEATURES 개 + smooth idf"""
+    df: Dict[str, int] = {}
+    for counts in docs:
+        for gram in counts:
+            df[gram] = df.get(gram, 0) + 1
+    terms = sorted((g for g, n in df.items() if n >= MIN_DF), key=lambda g: (-df[g], g))[:MAX_FEATURES]
+    n_docs = len(docs)
+    idf = np.array([np.log((1 + n_docs) / (1 + df[g])) + 1.0 for g in terms], dtype=np.float32)
+    return terms, idf
+
+
+def fit(contents: Sequence[str], class_ids: Sequence[int], epochs: int = 40, batch_size: int = 64,
+        learning_rate: float = 0.5, l2: float = 1e-4, seed: int = 0) -> DocClassifier:
+    """document_content 목록 + classification_id 목록 → DocClassifier (미니배치 AdaGrad, 교차 엔트로피 + L2)"""
+    texts = [document_text(c) for c in contents]
+    vocab, idf = _build_vocab([_ngrams(t) for t in texts])
+    classes = sorted(set(int(c) for c in class_ids))
+    model = DocClassifier(vocab, idf, np.zeros((len(vocab), len(classes))), np.zeros(len(classes)), classes)
+
+    rows = [model.features(t) for t in texts]
+    col_of = {c: i for i, c in enumerate(classes)}
+    targets = np.array([col_of[int(c)] for c in class_ids])
+    weights, bias = model.weights, model.bias
+    grad_sq_w = np.full_like(weights, 1e-8)
+    grad_sq_b = np.full_like(bias, 1e-8)
+    rng = np.random.default_rng(seed)
+
+    for _ in range(epochs):
+        order = rng.permutation(len(rows))
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            # 배치만 dense 로 (배치 × 특징 수), 전체 행렬은 만들지 않음
+            x = np.zeros((len(batch), len(vocab)), dtype=np.float32)
+            for r, i in enumerate(batch):
+                ids, values = rows[i]
+                x[r, ids] = values
+            logits = x @ weights + bias
+            logits -= logits.max(axis=1, keepdims=True)
+            proba = np.exp(logits)
+            proba /= proba.sum(axis=1, keepdims=True)
+            proba[np.arange(len(batch)), targets[batch]] -= 1.0
+            grad_w = x.T @ proba / len(batch) + l2 * weights
+            grad_b = proba.mean(axis=0)
+            grad_sq_w += grad_w ** 2
+            grad_sq_b += grad_b ** 2
+            weights -= learning_rate * grad_w / np.sqrt(grad_sq_w)
+            bias -= learning_rate * grad_b / np.sqrt(grad_sq_b)
+
+    model.meta = {
+        "trained_at": datetime.now().isoformat(timespec="seconds"),
+        "documents": len(rows),
+        "features": len(vocab),
+        "ngram_range": list(NGRAM_RANGE),
+        "class_counts": {str(c): int((targets == col_of[c]).sum()) for c in classes},
+    }
+    return model
+
+
+def _split(class_ids: Sequence[int], test_ratio: float, seed: int) -> Tuple[List[int], List[int]]:
+    """클래스별 비율을 유지한 (학습, 평가) 인덱스"""
+    rng = np.random.default_rng(seed)
+    train, test = [], []
+    for c in sorted(set(class_ids)):
+        idx = rng.permutation([i for i, cid in enumerate(class_ids) if cid == c]).tolist()
+        n_test = int(round(len(idx) * test_ratio)) if len(idx) > 1 else 0
+        test.extend(idx[:n_test])
+        train.extend(idx[n_test:])
+    return sorted(train), sorted(test)
+
+
+def evaluate(model: DocClassifier, contents: Sequence[str], class_ids: Sequence[int]) -> dict:
+    """정확도, 클래스별 재현율/정밀도, 혼동행렬(행=정답, 열=예측, 0~4), 문서당 지연(특징 추출 포함)"""
+    n = len(CATEGORY_LABELS)
+    confusion = np.zeros((n, n), dtype=int)
+    latencies = []
+    for content, cid in zip(contents, class_ids):
+        t0 = time.perf_counter()
+        pred = model.predict(content).classification_id
+        latencies.append((time.perf_counter() - t0) * 1e6)
+        confusion[int(cid), pred] += 1
+    total = int(confusion.sum())
+    per_class = {}
+    for c in range(n):
+        support, predicted = int(confusion[c].sum()), int(confusion[:, c].sum())
+        if support or predicted:
+            per_class[CATEGORY_LABELS[c]] = {
+                "support": support,
+                "recall": round(confusion[c, c] / support, 4) if support else None,
+                "precision": round(confusion[c, c] / predicted, 4) if predicted else None,
+            }
+    latencies.sort()
+    return {
+        "documents": total,
+        "accuracy": round(float(np.trace(confusion)) / total, 4) if total else None,
+        "per_class": per_class,
+        "confusion": confusion.tolist(),
+        "latency_us": {"p50": round(latencies[len(latencies) // 2], 1),
+                       "p99": round(latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))], 1)}
+        if latencies else None,
+    }
+
+
+def load_documents(db_url: Optional[str] = None) -> Tuple[List[str], List[int]]:
+    """
+    저장된 문서 중 document_content 가 있는 것의 (content 목록, classification_id 목록)
+    - db_url 이 없으면 서버와 같은 document_db_engine (DB_SINGLE_FILE=true 면 DATABASE_URL)
+    """
+    from sqlmodel import Session, create_engine, select
+
+    from app.dependencies.document_db import document_db_engine
+    from app.models.document_models import Document
+
+    engine = create_engine(db_url) if db_url else document_db_engine
+    with Session(engine) as session:
+        rows = session.exec(
+            select(Document.document_content, Document.document_classification_id)
+            .where(Document.document_content.is_not(None))
+        ).all()
+    if db_url:
+        engine.dispose()
+    pairs = [(content, int(cid)) for content, cid in rows
+             if content and content.strip() and 0 <= int(cid) < len(CATEGORY_LABELS)]
+    return [p[0] for p in pairs], [p[1] for p in pairs]
+
+
+# ----------------------------
+# 서버용 (지연 로드)
+# ----------------------------
+_lock = threading.Lock()
+_classifier: Optional[DocClassifier] = None
+_loaded = False
+
+
+def get_doc_classifier() -> Optional[DocClassifier]:
+    """DOC_CLASSIFIER_PATH 의 분류기 (처음 호출 때 1번 로드) / 꺼져 있거나 파일이 없으면 None → GPT 가 분류"""
+    global _classifier, _loaded
+    if not DOC_CLASSIFIER:
+        return None
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                try:
+                    _classifier = DocClassifier.load(DOC_CLASSIFIER_PATH)
+                    logger.info("[doc_classifier] loaded %s %s", DOC_CLASSIFIER_PATH, _classifier.meta)
+                except FileNotFoundError:
+                    logger.info("[doc_classifier] %s 없음 → GPT 분류 사용", DOC_CLASSIFIER_PATH)
+                except Exception as e:
+                    logger.warning("[doc_classifier] load failed (%s): %r", DOC_CLASSIFIER_PATH, e)
+                _loaded = True
+    return _classifier
+
+
+def classifier_info() -> dict:
+    classifier = get_doc_classifier()
+    return {
+        "enabled": DOC_CLASSIFIER,
+        "path": DOC_CLASSIFIER_PATH,
+        "loaded": classifier is not None,
+        "meta": classifier.meta if classifier is not None else None,
+    }
+
+
+# ----------------------------
+# CLI
+# ----------------------------
+def _print_report(title: str, report: dict):
+    latency = report["latency_us"]
+    latency_text = f"latency p50={latency['p50']}us p99={latency['p99']}us" if latency else "latency -"
+    print(f"[{title}] documents={report['documents']} accuracy={report['accuracy']} {latency_text}")
+    for label, r in report["per_class"].items():
+        print(f"  {label:<14} support={r['support']:<5} recall={r['recall']} precision={r['precision']}")
+    print("  confusion (행=정답, 열=예측 0~4):")
+    for row in report["confusion"]:
+        print("   ", " ".join(f"{v:>5}" for v in row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    train = sub.add_parser("train", help="저장된 문서로 학습 + holdout 평가 후 저장")
+    train.add_argument("--db-url", default=None, help="기본: 서버와 같은 문서 DB (DB_SINGLE_FILE 반영)")
+    train.add_argument("--out", default=DOC_CLASSIFIER_PATH)
+    train.add_argument("--test-ratio", type=float, default=0.2)
+    train.add_argument("--epochs", type=int, default=40)
+    train.add_argument("--min-docs", type=int, default=20)
+    train.add_argument("--seed", type=int, default=0)
+    ev = sub.add_parser("eval", help="저장된 모델을 DB 문서로 평가")
+    ev.add_argument("--db-url", default=None, help="기본: 서버와 같은 문서 DB (DB_SINGLE_FILE 반영)")
+    ev.add_argument("--model", default=DOC_CLASSIFIER_PATH)
+    args = parser.parse_args()
+
+    contents, class_ids = load_documents(args.db_url)
+    if args.command == "eval":
+        model = DocClassifier.load(args.model)
+        print(f"model={args.model} {model.meta}")
+        _print_report("eval", evaluate(model, contents, class_ids))
+        return
+
+    if len(contents) < args.min_docs:
+        raise SystemExit(f"학습 문서가 부족합니다: {len(contents)}건 (최소 {args.min_docs}건, --min-docs)")
+    train_idx, test_idx = _split(class_ids, args.test_ratio, args.seed)
+    holdout = None
+    if test_idx:
+        model = fit([contents[i] for i in train_idx], [class_ids[i] for i in train_idx],
+                    epochs=args.epochs, seed=args.seed)
+        holdout = evaluate(model, [contents[i] for i in test_idx], [class_ids[i] for i in test_idx])
+        _print_report(f"holdout {len(train_idx)} train / {len(test_idx)} test", holdout)
+
+    model = fit(contents, class_ids, epochs=args.epochs, seed=args.seed)
+    if holdout is not None:
+        model.meta["holdout"] = {"accuracy": holdout["accuracy"], "documents": holdout["documents"],
+                                 "latency_us": holdout["latency_us"]}
+    model.save(args.out)
+    print(f"saved {args.out} (documents={len(contents)}, features={model.meta['features']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 # app/services/document_service.py
 from typing import List, Optional, Dict
-from datetime import date
+from datetime import date, datetime
 from fastapi import HTTPException, status
-from sqlmodel import Session, select, SQLModel
+from sqlmodel import Session, SQLModel
 
 from app.models.document_models import Document
+from app.dependencies.pagination import ListSpec, Page, PageParams, range_filter
+
+# 목록: document_id 순 keyset, OCR 원문(document_content)은 fields 로 요청할 때만
+DOCUMENT_LIST = ListSpec(Document, order_by=["document_id"], heavy=["document_content"])
 
 # ----------------------------
 # 요청 스키마 (Create / Update)
@@ -51,19 +55,34 @@ def get_document_by_id(session: Session, document_id: int) -> Document:
     return document
 
 # ----------------------------
-# 전체 목록
+# 전체 목록 (keyset 페이지 + 필터 + 필드 선택)
 # ----------------------------
-def get_all_documents(session: Session) -> List[Document]:
-    """전체 document 출력"""
-    return session.exec(select(Document)).all()
+def document_filters(
+    document_user_id: Optional[int] = None,
+    document_classification_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+) -> list:
+    """목록/내보내기 공통 WHERE 조건"""
+    return [
+        Document.document_user_id == document_user_id if document_user_id is not None else None,
+        Document.document_classification_id == document_classification_id if document_classification_id is not None else None,
+        *range_filter(Document.created_at, created_from, created_to),
+        *range_filter(Document.document_due, due_from, due_to),
+    ]
+
+def get_all_documents(session: Session, params: PageParams, **filters) -> Page:
+    """조건에 맞는 document 한 페이지 출력 (filters: document_filters 인자)"""
+    return DOCUMENT_LIST.page(session, params, *document_filters(**filters))
 
 # ----------------------------
 # 사용자별 목록
 # ----------------------------
-def get_documents_by_user_id(session: Session, document_user_id: int) -> List[Document]:
+def get_documents_by_user_id(session: Session, document_user_id: int, params: PageParams, **filters) -> Page:
     """user_id의 document 정보들 출력"""
-    stmt = select(Document).where(Document.document_user_id == document_user_id)
-    return session.exec(stmt).all()
+    return get_all_documents(session, params, document_user_id=document_user_id, **filters)
 
 # ----------------------------
 # 사용자 + 분류별 목록
@@ -72,13 +91,17 @@ def get_documents_by_user_and_classification(
     session: Session,
     document_user_id: int,
     document_classification_id: int,
-) -> List[Document]:
+    params: PageParams,
+    **filters,
+) -> Page:
     """document_user_id와 document_classification_id로 검색"""
-    stmt = select(Document).where(
-        (Document.document_user_id == document_user_id)
-        & (Document.document_classification_id == document_classification_id)
+    return get_all_documents(
+        session,
+        params,
+        document_user_id=document_user_id,
+        document_classification_id=document_classification_id,
+        **filters,
     )
-    return session.exec(stmt).all()
 
 # ----------------------------
 # 생성
@@ -92,6 +115,22 @@ def create_document(session: Session, doc_to_create: DocumentCreate) -> Document
     session.refresh(db_document)
     return db_document
 
+# ----------------------------
+# 일괄 생성 (단일 트랜잭션)
+# ----------------------------
+def create_documents(session: Session, docs_to_create: List[DocumentCreate]) -> List[Document]:
+    """document 여러 건을 커밋 1회로 추가 (하나라도 실패하면 전체 롤백)"""
+    db_documents = [Document(**doc.model_dump()) for doc in docs_to_create]
+    try:
+        session.add_all(db_documents)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    for db_document in db_documents:
+        session.refresh(db_document)
+    return db_documents
+
 # ----------------------------
 # 수정
 # ----------------------------
@@ -1,60 +1,236 @@
+# app/services/file_service.py
+"""
+게시글 첨부 파일 저장/조회/삭제
+
+- 업로드는 청크(UPLOAD_CHUNK_BYTES) 단위로 디스크에 복사하면서 크기/SHA-256 계산 → 파일 전체를 메모리에 올리지 않음
+  파일마다 복사 전체를 asyncio.to_thread 한 번으로 실행 (이벤트 루프를 막지 않음)
+- 파일당 UPLOAD_MAX_FILE_MB, 요청 합계 UPLOAD_MAX_TOTAL_MB 초과 시 413 (Content-Length 로 먼저 거르고, 복사 중에도 확인)
+  Content-Length 가 없으면(chunked) 411 → multipart 파서가 크기 제한 없이 임시 파일에 받기 전에 거절
+- 원본은 blob_store 에 SHA-256 기준으로 1벌만 저장 (같은 영수증 재업로드/파일명 충돌 시 덮어쓰기 없음)
+  Files 행 커밋 1회 후 임시 파일을 원본 위치로 이동, 실패하면 임시 파일 삭제
+- 삭제 시 같은 sha256 을 참조하는 행이 더 없으면 원본과 파생 이미지(썸네일/OCR용)도 삭제
+- sha256 이 없는 기존 행(app/files/{post_id}_{file_name})은 예전처럼 url 경로를 그대로 사용
+- 다운로드는 file_serving 의 조건부 요청/Range/캐시 헤더 응답, 게시글 파일 전체는 zip 스트리밍
+
+환경변수
+    UPLOAD_CHUNK_BYTES=1048576
+    UPLOAD_MAX_FILE_MB=100 / UPLOAD_MAX_TOTAL_MB=300 / UPLOAD_MAX_FILES=20
+    (저장 위치/파생 이미지 설정은 app/dependencies/blob_store.py)
+"""
 from sqlmodel import (Session, select)
-from fastapi.responses import FileResponse
+from fastapi import HTTPException, Request, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
+from dotenv import load_dotenv
+from typing import BinaryIO, List, Tuple
+import asyncio
+import hashlib
 import time
 import os
+from app.dependencies import blob_store
+from app.dependencies.database import begin_write
+from app.dependencies.file_serving import file_response, unique_arcnames, zip_response
 from app.models.utils import RESULT_CODE
 from app.models.file_models import *
 
+load_dotenv()
+
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_BYTES", str(1024 * 1024)))
+UPLOAD_MAX_FILE_BYTES = int(os.getenv("UPLOAD_MAX_FILE_MB", "100")) * 1024 * 1024
+UPLOAD_MAX_TOTAL_BYTES = int(os.getenv("UPLOAD_MAX_TOTAL_MB", "300")) * 1024 * 1024
+UPLOAD_MAX_FILES = int(os.getenv("UPLOAD_MAX_FILES", "20"))
+# multipart 경계/헤더 여유분
+UPLOAD_MAX_REQUEST_BYTES = UPLOAD_MAX_TOTAL_BYTES + 1024 * 1024
+
+
+def _too_large(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+
+def check_upload_size(content_length: str | None) -> None:
+    """
+    multipart 파싱(임시 파일 기록) 전에 Content-Length 로 합계 제한 확인
+    - 없거나 숫자가 아니면 411 (본문 길이를 모르면 파서가 전체를 받은 뒤에야 제한을 확인할 수 있음)
+    - 서버가 Content-Length 만큼만 본문을 읽으므로 이 값이 곧 실제 상한
+    """
+    if not content_length or not content_length.strip().isdigit():
+        raise HTTPException(status_code=status.HTTP_411_LENGTH_REQUIRED, detail="Content-Length 헤더가 필요합니다.")
+    if int(content_length) > UPLOAD_MAX_REQUEST_BYTES:
+        raise _too_large(f"업로드 합계는 최대 {UPLOAD_MAX_TOTAL_BYTES // (1024 * 1024)}MB 입니다.")
+
+
+def _safe_name(file_name: str | None) -> str:
+    # 경로 구분자 제거 (../ 등으로 저장 디렉터리 밖에 쓰지 않도록)
+    name = os.path.basename((file_name or "").replace("\\", "/")).strip()
+    return name or "upload"
+
+
+def _copy_upload(src: BinaryIO, dest_path: str, max_bytes: int, detail: str) -> Tuple[int, str]:
+    """src 를 청크 단위로 dest_path 에 복사하면서 (크기, sha256) 계산, max_bytes 초과 시 413"""
+    digest = hashlib.sha256()
+    size = 0
+    src.seek(0)
+    with open(dest_path, 'wb') as out:
+        while True:
+            chunk = src.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise _too_large(detail)
+            digest.update(chunk)
+            out.write(chunk)
+    return size, digest.hexdigest()
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 class FileService():
-    def save_file(self, post_id: int, file_db: Session, file_name: str, file_data: bytes):
-        #경로: app/files/{}.jpg
-        strPath = os.path.join('app', 'files', f"{post_id}_{file_name}")
-        
+    async def save_uploads(self, post_id: int, file_db: Session, uploads: List[UploadFile]) -> List[Files]:
+        """업로드 파일 여러 개를 스트리밍 저장 후 Files 행을 커밋 1회로 추가"""
+        if len(uploads) > UPLOAD_MAX_FILES:
+            raise _too_large(f"파일은 최대 {UPLOAD_MAX_FILES}개까지 업로드할 수 있습니다.")
+        staged: List[Tuple[str, Files]] = []
+        remaining = UPLOAD_MAX_TOTAL_BYTES
         try:
-            with open(strPath, 'wb') as f:
-                f.write(file_data)
-        except Exception as e:
-            print(e)
-            return None
-        
-        fileModel = Files()
-        fileModel.post_id = post_id
-        fileModel.url = strPath
-        fileModel.created_at = int(time.time())
-        
-        file_db.add(fileModel)
+            for upload in uploads:
+                file_name = _safe_name(upload.filename)
+                tmp_path = blob_store.temp_path()
+                staged.append((tmp_path, None))
+                if UPLOAD_MAX_FILE_BYTES <= remaining:
+                    limit, detail = UPLOAD_MAX_FILE_BYTES, f"{file_name}: 파일당 최대 {UPLOAD_MAX_FILE_BYTES // (1024 * 1024)}MB 입니다."
+                else:
+                    limit, detail = remaining, f"업로드 합계는 최대 {UPLOAD_MAX_TOTAL_BYTES // (1024 * 1024)}MB 입니다."
+                size, sha256 = await asyncio.to_thread(_copy_upload, upload.file, tmp_path, limit, detail)
+                remaining -= size
+
+                fileModel = Files()
+                fileModel.post_id = post_id
+                fileModel.url = blob_store.blob_path(sha256)
+                fileModel.created_at = int(time.time())
+                fileModel.file_name = file_name
+                fileModel.file_size = size
+                fileModel.content_type = upload.content_type
+                fileModel.sha256 = sha256
+                staged[-1] = (tmp_path, fileModel)
+
+            return await asyncio.to_thread(self._commit_uploads, file_db, staged)
+        finally:
+            # 커밋 후 이동된 파일은 이미 없음 → 실패/중단 시 남은 임시 파일만 정리
+            # (원본은 커밋 뒤에 놓으므로, 동시에 진행 중인 삭제가 참조 0 으로 판단해 지워도 다시 생김)
+            for tmp_path, _ in staged:
+                _remove_quietly(tmp_path)
+
+    def _commit_uploads(self, file_db: Session, staged: List[Tuple[str, Files]]) -> List[Files]:
+        models = [model for _, model in staged]
+        file_db.add_all(models)
         file_db.commit()
-        file_db.refresh(fileModel)
-        
-        return fileModel
-    
+        for tmp_path, model in staged:
+            blob_store.store_blob(tmp_path, model.sha256)
+            file_db.refresh(model)
+        return models
+
     def get_file(self,
                   post_id: int,
-                  file_db: Session):
+                  file_db: Session,
+                  request: Request):
         file = file_db.exec(
             select(Files)
             .filter(Files.post_id == post_id)
         ).first()
 
         if file:
-            return FileResponse(file.url)
+            return self._file_response(file, request)
         else:
             return ""
-    
-    def delete_files(self,
-                     post_id: int,
-                     file_db: Session):
+
+    def serve_file(self, file_id: int, file_db: Session, request: Request) -> Response:
+        """원본 다운로드 (ETag/304/Range/Cache-Control)"""
+        file = file_db.get(Files, file_id)
+        if file is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+        return self._file_response(file, request)
+
+    def _file_response(self, file: Files, request: Request) -> Response:
+        return file_response(
+            request,
+            file.url,
+            media_type=file.content_type or "application/octet-stream",
+            content_hash=file.sha256,
+            filename=file.file_name or os.path.basename(file.url),
+        )
+
+    def get_derivative(self, file_id: int, kind: str, file_db: Session) -> Tuple[str, str, str | None]:
+        """
+        (경로, media type, 내용 해시) - 썸네일, 처음 요청 시 생성 후 캐시
+        - sha256 이 없는 기존 행은 썸네일 없음
+        """
+        file = file_db.get(Files, file_id)
+        if file is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+        if file.sha256 is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="미리보기를 만들 수 없는 파일입니다.")
+        path = blob_store.get_derivative(file.sha256, kind)
+        if path is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="미리보기를 만들 수 없는 파일입니다.")
+        return path, blob_store.DERIVATIVES[kind].media_type, f"{file.sha256}.{kind}"
+
+    def zip_files(self, post_id: int, file_db: Session) -> StreamingResponse:
+        """게시글 파일 전체를 zip 으로 스트리밍 (파일 목록만 먼저 조회, 본문은 전송하면서 읽음)"""
         files = file_db.exec(
             select(Files)
             .filter(Files.post_id == post_id)
+            .order_by(Files.file_id)
         ).all()
-        for file in files:
-            filePath = file.url
-            try:
+        if not files:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+        names = unique_arcnames(file.file_name or os.path.basename(file.url) for file in files)
+        return zip_response([(name, file.url) for name, file in zip(names, files)], f"post_{post_id}_files.zip")
+
+    def delete_files(self,
+                     post_id: int,
+                     file_db: Session):
+        """
+        게시글 파일 삭제 (커밋 1회)
+        - 쓰기 락(BEGIN IMMEDIATE) 안에서 남은 참조 수를 확인하고, 0 이면 원본을 삭제 대기 이름으로 옮긴 뒤 커밋
+          → 같은 내용을 동시에 업로드하는 요청은 커밋 후 원본을 다시 놓으므로 참조 중인 원본이 사라지지 않음
+        """
+        trashed: List[Tuple[str, str]] = []
+        try:
+            begin_write(file_db)
+            files = file_db.exec(
+                select(Files)
+                .filter(Files.post_id == post_id)
+            ).all()
+            hashes = {file.sha256 for file in files if file.sha256}
+            legacy_paths = [file.url for file in files if not file.sha256]
+            for file in files:
                 file_db.delete(file)
-                file_db.commit()
-                if os.path.exists(filePath):
-                    os.remove(filePath)
-            except Exception as e:
-                return RESULT_CODE.FAILED
-        return RESULT_CODE.SUCCESS
\ No newline at end of file
+            file_db.flush()
+
+            referenced = set(file_db.exec(
+                select(Files.sha256)
+                .where(Files.sha256.in_(hashes))
+                .distinct()
+            ).all()) if hashes else set()
+            for sha256 in hashes - referenced:
+                trash = blob_store.trash_blob(sha256)
+                if trash:
+                    trashed.append((trash, sha256))
+            file_db.commit()
+        except Exception:
+            file_db.rollback()
+            for trash, _ in trashed:
+                blob_store.restore_blob(trash)
+            return RESULT_CODE.FAILED
+
+        for trash, sha256 in trashed:
+            blob_store.purge_trash(trash, sha256)
+        for filePath in legacy_paths:
+            if os.path.exists(filePath):
+                os.remove(filePath)
+        return RESULT_CODE.SUCCESS
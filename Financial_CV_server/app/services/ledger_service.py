@@ -0,0 +1,190 @@
+# app/services/ledger_service.py
+"""
+계좌 원장 (추가 전용 분개 + 잔액 스냅샷)
+
+- 현재 잔액은 Account.account_balance 에 그대로 유지 (O(1) 조회)
+- 잔액이 바뀌는 모든 쓰기(이체, 잔액 수정, 계좌 생성)는 같은 트랜잭션에서 post() 로 분개를 남김
+- 계좌별로 스냅샷 이후 분개가 LEDGER_SNAPSHOT_EVERY 건 쌓이면 스냅샷 1행 추가
+  → 시점 T 잔액 = T 이전 마지막 스냅샷 1개 + 그 뒤 최대 LEDGER_SNAPSHOT_EVERY 건 합계
+- 조회 시각(at/start/end/created_from/created_to)은 저장 형식과 같은 naive 한국 시간으로 맞춘 뒤 비교
+  (?at=2025-01-01T00:00:00Z 처럼 시간대가 있는 값은 KST 로 변환 후 tzinfo 제거)
+- 원장 도입 전에 만들어진 계좌는 첫 분개 때 그때까지의 잔액을 opening 분개(계좌 생성 시각)로 남김
+
+환경변수
+    LEDGER_SNAPSHOT_EVERY=500
+"""
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy import case, func
+from sqlmodel import Session, select
+
+from app.dependencies.pagination import ListSpec, Page, PageParams, range_filter
+from app.models.account_models import Account, AccountBalanceSnapshot, AccountPosting
+
+load_dotenv()
+
+LEDGER_SNAPSHOT_EVERY = int(os.getenv("LEDGER_SNAPSHOT_EVERY", "500"))
+
+# 분개 목록: posting_id 순 keyset
+POSTING_LIST = ListSpec(AccountPosting, order_by=["posting_id"])
+
+
+KST = timezone(timedelta(hours=9))
+
+
+def _now() -> datetime:
+    return datetime.utcnow() + timedelta(hours=9)
+
+
+def _to_kst_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """created_at 저장 형식(naive 한국 시간)으로 변환, 시간대 없는 값은 이미 한국 시간으로 간주"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(KST).replace(tzinfo=None)
+
+
+def _latest_snapshot(session: Session, account_id: int, at: Optional[datetime] = None) -> Optional[AccountBalanceSnapshot]:
+    stmt = select(AccountBalanceSnapshot).where(AccountBalanceSnapshot.account_id == account_id)
+    if at is not None:
+        stmt = stmt.where(AccountBalanceSnapshot.as_of <= at)
+    stmt = stmt.order_by(AccountBalanceSnapshot.as_of.desc(), AccountBalanceSnapshot.last_posting_id.desc())
+    return session.exec(stmt.limit(1)).first()
+
+
+def _get_account(session: Session, account_id: int) -> Account:
+    account = session.get(Account, account_id)
+    if not account:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
+    return account
+
+
+# -----------------------------
+# 쓰기
+# -----------------------------
+def post(
+    session: Session,
+    account_id: int,
+    amount: int,
+    balance_after: int,
+    kind: str,
+    transfer_id: Optional[int] = None,
+) -> AccountPosting:
+    """
+    열린 쓰기 트랜잭션 안에서 분개 1건 추가 (커밋은 호출자)
+    balance_after: 이 분개까지 반영한 Account.account_balance
+    """
+    snapshot = _latest_snapshot(session, account_id)
+    since = snapshot.last_posting_id if snapshot else 0
+    pending = session.exec(
+        select(func.count())
+        .select_from(AccountPosting)
+        .where(AccountPosting.account_id == account_id, AccountPosting.posting_id > since)
+    ).one()
+
+    opening = balance_after - amount
+    if snapshot is None and pending == 0 and opening != 0:
+        # 원장 도입 전부터 있던 잔액
+        created_at = session.exec(select(Account.created_at).where(Account.account_id == account_id)).one()
+        session.add(AccountPosting(account_id=account_id, amount=opening, kind="opening", created_at=created_at))
+        pending += 1
+
+    now = _now()
+    posting = AccountPosting(account_id=account_id, amount=amount, kind=kind, transfer_id=transfer_id, created_at=now)
+    session.add(posting)
+    session.flush()
+    pending += 1
+
+    if pending >= LEDGER_SNAPSHOT_EVERY:
+        session.add(AccountBalanceSnapshot(
+            account_id=account_id,
+            balance=balance_after,
+            last_posting_id=posting.posting_id,
+            as_of=now,
+        ))
+    return posting
+
+
+# -----------------------------
+# 조회
+# -----------------------------
+def balance_at(session: Session, account_id: int, at: Optional[datetime] = None) -> int:
+    """시점 at 의 잔액 (at 이하 분개까지 반영, None 이면 현재 잔액)"""
+    account = _get_account(session, account_id)
+    if at is None:
+        return account.account_balance
+    at = _to_kst_naive(at)
+
+    snapshot = _latest_snapshot(session, account_id, at)
+    stmt = select(func.coalesce(func.sum(AccountPosting.amount), 0), func.count()).where(
+        AccountPosting.account_id == account_id,
+        AccountPosting.created_at <= at,
+    )
+    if snapshot is not None:
+        # 스냅샷 이후 구간만 스캔 (최대 LEDGER_SNAPSHOT_EVERY 건)
+        stmt = stmt.where(AccountPosting.created_at >= snapshot.as_of, AccountPosting.posting_id > snapshot.last_posting_id)
+        delta, _ = session.exec(stmt).one()
+        return snapshot.balance + delta
+
+    delta, counted = session.exec(stmt).one()
+    if counted:
+        return delta
+    has_postings = session.exec(
+        select(AccountPosting.posting_id).where(AccountPosting.account_id == account_id).limit(1)
+    ).first()
+    if has_postings is None:
+        # 분개가 한 번도 없던 계좌: 생성 이후 잔액이 그대로
+        return account.account_balance if at >= account.created_at else 0
+    return 0
+
+
+def statement(session: Session, account_id: int, start: datetime, end: datetime) -> Dict[str, Any]:
+    """기간 (start, end] 거래내역 요약: 기초/기말 잔액, 입금/출금 합계, 분개 수"""
+    start, end = _to_kst_naive(start), _to_kst_naive(end)
+    if start > end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start must be before end")
+    opening = balance_at(session, account_id, start)
+    closing = balance_at(session, account_id, end)
+    credits, debits, count = session.exec(
+        select(
+            func.coalesce(func.sum(case((AccountPosting.amount > 0, AccountPosting.amount), else_=0)), 0),
+            func.coalesce(func.sum(case((AccountPosting.amount < 0, -AccountPosting.amount), else_=0)), 0),
+            func.count(),
+        ).where(
+            AccountPosting.account_id == account_id,
+            AccountPosting.created_at > start,
+            AccountPosting.created_at <= end,
+        )
+    ).one()
+    return {
+        "account_id": account_id,
+        "start": start,
+        "end": end,
+        "opening_balance": opening,
+        "closing_balance": closing,
+        "total_credits": credits,
+        "total_debits": debits,
+        "posting_count": count,
+    }
+
+
+def list_postings(
+    session: Session,
+    account_id: int,
+    params: PageParams,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    kind: Optional[str] = None,
+) -> Page:
+    """계좌 분개 한 페이지 (posting_id 순)"""
+    _get_account(session, account_id)
+    return POSTING_LIST.page(
+        session,
+        params,
+        AccountPosting.account_id == account_id,
+        AccountPosting.kind == kind if kind is not None else None,
+        *range_filter(AccountPosting.created_at, _to_kst_naive(created_from), _to_kst_naive(created_to)),
+    )
@@ -0,0 +1,454 @@
+# app/services/ocr_job_service.py
+"""
+OCR/LLM 인제스트 백그라운드 작업 큐
+
+- 제출 즉시 job_id 반환, 실제 CLOVA + GPT 처리는 워커 풀(asyncio 태스크 OCR_JOB_WORKERS 개)이 수행
+  (처리 과정이 대부분 외부 API 대기라 스레드/프로세스 대신 이벤트 루프 워커 사용, DB 작업만 스레드로 분리)
+- 작업 상태는 SQLite(ocr_jobs.db) 에 저장 → 폴링(GET /ocr/jobs/{id}) / SSE 로 조회
+- auto_create=True 이면 완료 후 create_document_from_ocr 까지 이어서 진행
+- callback_url 이 있으면 종료 시 작업 상태를 POST (웹훅)
+  · http(s) 만 허용, DNS 해석 결과가 사설/루프백/링크로컬 등 내부 주소면 거부 (SSRF 방지, 제출 시 + 전송 직전)
+  · OCR_JOB_WEBHOOK_ALLOWED_HOSTS (쉼표 구분) 를 지정하면 해당 호스트만 허용
+  · 전송은 별도 태스크에서 수행 → 느린 수신 서버가 워커를 붙잡지 않음
+- 큐 길이 / 대기 시간 / 처리 시간 계측 (metrics())
+- 작업마다 담당 프로세스(owner)를 기록하고 OCR_JOB_HEARTBEAT_SECONDS 마다 heartbeat_at 갱신
+  → 여러 uvicorn 워커가 같은 DB 를 써도, 죽은 프로세스(같은 호스트의 pid 없음) 또는
+    OCR_JOB_STALE_SECONDS 동안 생존 신호가 없는 작업만 실패 처리 (시작 시 + 주기적으로)
+
+환경변수
+    OCR_JOB_WORKERS=8
+    OCR_JOB_QUEUE_MAX=1000
+    OCR_JOB_WEBHOOK_TIMEOUT=10
+    OCR_JOB_WEBHOOK_ALLOWED_HOSTS=          (비우면 공인 주소 호스트 전부 허용)
+    OCR_JOB_HEARTBEAT_SECONDS=10
+    OCR_JOB_STALE_SECONDS=60
+"""
+import asyncio
+import ipaddress
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Set
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+
+from app.dependencies.document_db import document_db_engine
+from app.dependencies.http_clients import get_http_client
+from app.dependencies.ocr_job_db import ocr_job_db_engine
+from app.models.ocr_job_models import OcrJob
+from app.services.ocr_to_document import create_document_from_ocr
+
+load_dotenv()
+
+logger = logging.getLogger("ocr_jobs")
+
+OCR_JOB_WORKERS = int(os.getenv("OCR_JOB_WORKERS", "8"))
+OCR_JOB_QUEUE_MAX = int(os.getenv("OCR_JOB_QUEUE_MAX", "1000"))
+OCR_JOB_WEBHOOK_TIMEOUT = float(os.getenv("OCR_JOB_WEBHOOK_TIMEOUT", "10"))
+OCR_JOB_HEARTBEAT_SECONDS = float(os.getenv("OCR_JOB_HEARTBEAT_SECONDS", "10"))
+OCR_JOB_STALE_SECONDS = float(os.getenv("OCR_JOB_STALE_SECONDS", "60"))
+OCR_JOB_WEBHOOK_ALLOWED_HOSTS = {
+    h.strip().lower() for h in os.getenv("OCR_JOB_WEBHOOK_ALLOWED_HOSTS", "").split(",") if h.strip()
+}
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+TERMINAL_STATUSES = {SUCCEEDED, FAILED}
+ACTIVE_STATUSES = [QUEUED, RUNNING]
+
+# 이 프로세스의 작업 소유자 id (pid 재사용과 구분하기 위해 부팅 id 포함)
+_HOSTNAME = socket.gethostname()
+OWNER_ID = f"{_HOSTNAME}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# 작업 1건 처리 함수: () -> 8개 key-value 텍스트
+JobRunner = Callable[[], Awaitable[str]]
+
+
+def _now_kst() -> datetime:
+    return datetime.utcnow() + timedelta(hours=9)
+
+
+def _error_detail(e: Exception) -> str:
+    if isinstance(e, HTTPException):
+        return str(e.detail)
+    return f"{type(e).__name__}: {e}"
+
+
+# ----------------------------
+# 웹훅 주소 검증 (SSRF 방지)
+# ----------------------------
+def _resolve_addresses(host: str, port: int) -> Set[str]:
+    infos = socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)
+    return {info[4][0] for info in infos}
+
+
+def _is_public_address(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return not (
+        ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_multicast
+        or ip.is_reserved or ip.is_unspecified
+    )
+
+
+async def validate_callback_url(url: str) -> str:
+    """
+    웹훅 주소 검증: http(s) + (허용 목록) + 해석된 모든 IP 가 공인 주소
+    - 잘못된 주소면 400
+    """
+    def reject(reason: str):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"허용되지 않는 callback_url 입니다: {reason}")
+
+    try:
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+    except ValueError:
+        reject("주소 형식 오류")
+    if parts.scheme not in ("http", "https"):
+        reject("http/https 만 허용")
+    host = (parts.hostname or "").lower()
+    if not host:
+        reject("호스트 없음")
+    if OCR_JOB_WEBHOOK_ALLOWED_HOSTS and host not in OCR_JOB_WEBHOOK_ALLOWED_HOSTS:
+        reject("허용 목록에 없는 호스트")
+
+    try:
+        addresses = await asyncio.to_thread(_resolve_addresses, host, port)
+    except (OSError, UnicodeError):
+        reject("호스트 이름을 해석할 수 없음")
+    if not addresses or not all(_is_public_address(a) for a in addresses):
+        reject("내부 주소")
+    return url
+
+
+# ----------------------------
+# 상태 저장 (SQLite)
+# ----------------------------
+def _insert_job(job: OcrJob) -> OcrJob:
+    with Session(ocr_job_db_engine) as session:
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        return job
+
+
+def _update_job(job_id: str, **fields) -> Optional[OcrJob]:
+    with Session(ocr_job_db_engine) as session:
+        job = session.get(OcrJob, job_id)
+        if not job:
+            return None
+        for k, v in fields.items():
+            setattr(job, k, v)
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        return job
+
+
+def get_job(job_id: str) -> Optional[OcrJob]:
+    with Session(ocr_job_db_engine) as session:
+        return session.get(OcrJob, job_id)
+
+
+def _touch_jobs(owner: str) -> int:
+    """이 프로세스가 맡은 진행 중 작업의 heartbeat_at 갱신"""
+    with Session(ocr_job_db_engine) as session:
+        result = session.execute(
+            update(OcrJob)
+            .where(OcrJob.owner == owner, OcrJob.status.in_(ACTIVE_STATUSES))
+            .values(heartbeat_at=_now_kst())
+        )
+        session.commit()
+        return result.rowcount
+
+
+def _owner_is_dead(owner: Optional[str]) -> bool:
+    """같은 호스트의 소유자만 pid 로 판단 가능 (다른 호스트/형식 불명은 heartbeat 로만 판단)"""
+    if not owner:
+        return False
+    host, _, rest = owner.partition(":")
+    pid = rest.split(":", 1)[0]
+    if host != _HOSTNAME or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return False  # 권한 없음 = 살아 있는 다른 사용자 프로세스
+    return False
+
+
+def fail_interrupted_jobs() -> int:
+    """
+    담당 프로세스가 죽어서 끝나지 못한 작업(메모리 큐에만 있던 작업)은 실패 처리
+    - 다른 살아 있는 워커가 처리 중인 작업은 건드리지 않음
+    - 죽은 판단: 같은 호스트에서 owner pid 가 없거나, 생존 신호(heartbeat_at, 없으면 created_at)가 OCR_JOB_STALE_SECONDS 이상 지남
+    """
+    stale_before = _now_kst() - timedelta(seconds=OCR_JOB_STALE_SECONDS)
+    with Session(ocr_job_db_engine) as session:
+        jobs = session.exec(
+            select(OcrJob).where(
+                OcrJob.status.in_(ACTIVE_STATUSES),
+                func.coalesce(OcrJob.owner, "") != OWNER_ID,
+            )
+        ).all()
+        dead = [
+            job.job_id for job in jobs
+            if _owner_is_dead(job.owner) or (job.heartbeat_at or job.created_at) < stale_before
+        ]
+        if not dead:
+            return 0
+        # 조회 후 끝난 작업은 덮어쓰지 않도록 상태 조건 포함
+        result = session.execute(
+            update(OcrJob)
+            .where(OcrJob.job_id.in_(dead), OcrJob.status.in_(ACTIVE_STATUSES))
+            .values(status=FAILED, error="서버 재시작으로 작업이 중단되었습니다.", finished_at=_now_kst())
+        )
+        session.commit()
+        return result.rowcount
+
+
+def _create_document(user_id: int, ocr_text: str) -> int:
+    with Session(document_db_engine) as session:
+        doc = create_document_from_ocr(session=session, user_id=user_id, ocr_text=ocr_text)
+        return doc.document_id
+
+
+# ----------------------------
+# 계측
+# ----------------------------
+class _Timings:
+    """최근 N건의 소요 시간(초) 요약"""
+
+    def __init__(self, window: int = 1000):
+        self._values: deque = deque(maxlen=window)
+
+    def add(self, seconds: float):
+        self._values.append(seconds)
+
+    def summary(self) -> dict:
+        values = sorted(self._values)
+        if not values:
+            return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        pick = lambda q: values[min(len(values) - 1, int(len(values) * q))]
+        return {
+            "count": len(values),
+            "avg_ms": round(sum(values) / len(values) * 1000, 2),
+            "p50_ms": round(pick(0.5) * 1000, 2),
+            "p95_ms": round(pick(0.95) * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2),
+        }
+
+
+# ----------------------------
+# 작업 큐
+# ----------------------------
+class OcrJobQueue:
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list = []
+        self._webhook_tasks: Set[asyncio.Task] = set()
+        self._runners: Dict[str, JobRunner] = {}
+        self._enqueued_at: Dict[str, float] = {}
+        # 상태 변경 알림 (SSE 대기용), 변경 시마다 set 후 새 Event 로 교체
+        self._changed: Dict[str, asyncio.Event] = {}
+        self._running = 0
+        self._counters = {"submitted": 0, "rejected": 0, "succeeded": 0, "failed": 0}
+        self.wait_time = _Timings()
+        self.processing_time = _Timings()
+
+    # ---------- 수명주기 ----------
+    async def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._heartbeat()))
+        logger.info(f"[ocr_jobs] {self.workers} workers started")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._webhook_tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._webhook_tasks, return_exceptions=True)
+        self._tasks = []
+        self._webhook_tasks = set()
+        self._queue = None
+
+    # ---------- 제출 / 조회 ----------
+    async def submit(
+        self,
+        runner: JobRunner,
+        *,
+        user_id: Optional[int] = None,
+        auto_create: bool = False,
+        model: Optional[str] = None,
+        callback_url: Optional[str] = None,
+    ) -> OcrJob:
+        if auto_create and user_id is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="auto_create 에는 user_id 가 필요합니다.")
+        if callback_url:
+            await validate_callback_url(callback_url)
+        await self.start()  # lifespan 밖(단독 라우터 사용)에서도 동작하도록
+        if self._queue.full():
+            raise self._rejected()
+
+        job = await asyncio.to_thread(_insert_job, OcrJob(
+            job_id=uuid.uuid4().hex,
+            job_user_id=user_id,
+            auto_create=auto_create,
+            model=model,
+            callback_url=callback_url,
+            owner=OWNER_ID,
+            heartbeat_at=_now_kst(),
+        ))
+        # 행 저장(스레드 대기) 중 다른 제출이 마지막 자리를 가져갈 수 있음
+        # → 대기열에 못 넣으면 행을 실패로 닫음 (queued 로 영원히 남지 않도록)
+        try:
+            self._queue.put_nowait(job.job_id)
+        except asyncio.QueueFull:
+            await asyncio.to_thread(_update_job, job.job_id, status=FAILED,
+                                    error="OCR 작업 대기열이 가득 찼습니다.", finished_at=_now_kst())
+            raise self._rejected()
+        self._runners[job.job_id] = runner
+        self._enqueued_at[job.job_id] = time.perf_counter()
+        self._changed[job.job_id] = asyncio.Event()
+        self._counters["submitted"] += 1
+        return job
+
+    def _rejected(self) -> HTTPException:
+        self._counters["rejected"] += 1
+        return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="OCR 작업 대기열이 가득 찼습니다.")
+
+    def changed_event(self, job_id: str) -> Optional[asyncio.Event]:
+        """이 프로세스에서 처리 중인 작업이면 다음 상태 변경 시 set 되는 Event, 아니면 None"""
+        return self._changed.get(job_id)
+
+    def _notify(self, job_id: str, final: bool = False):
+        event = self._changed.pop(job_id, None)
+        if event is not None:
+            event.set()
+        if not final:
+            self._changed[job_id] = asyncio.Event()
+
+    # ---------- 생존 신호 ----------
+    async def _heartbeat(self):
+        """맡은 작업의 heartbeat_at 갱신 + 다른 프로세스가 남긴 고아 작업 정리"""
+        while True:
+            await asyncio.sleep(OCR_JOB_HEARTBEAT_SECONDS)
+            try:
+                await asyncio.to_thread(_touch_jobs, OWNER_ID)
+                failed = await asyncio.to_thread(fail_interrupted_jobs)
+                if failed:
+                    logger.warning(f"[ocr_jobs] {failed} orphaned jobs marked failed")
+            except Exception:
+                logger.exception("[ocr_jobs] heartbeat failed")
+
+    # ---------- 처리 ----------
+    async def _worker(self, idx: int):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            except Exception:
+                logger.exception(f"[ocr_jobs] worker {idx} crashed on {job_id}")
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job_id: str):
+        runner = self._runners.pop(job_id)
+        waited = time.perf_counter() - self._enqueued_at.pop(job_id)
+        self.wait_time.add(waited)
+
+        self._running += 1
+        t0 = time.perf_counter()
+        now = _now_kst()
+        job = await asyncio.to_thread(_update_job, job_id, status=RUNNING, started_at=now, heartbeat_at=now)
+        self._notify(job_id)
+
+        fields = {}
+        try:
+            fields["ocr_text"] = await runner()
+            if job.auto_create:
+                fields["document_id"] = await asyncio.to_thread(_create_document, job.job_user_id, fields["ocr_text"])
+            fields["status"] = SUCCEEDED
+        except Exception as e:
+            fields["status"] = FAILED
+            fields["error"] = _error_detail(e)
+        finally:
+            self._running -= 1
+
+        elapsed = time.perf_counter() - t0
+        self.processing_time.add(elapsed)
+        self._counters[fields["status"]] += 1
+        job = await asyncio.to_thread(_update_job, job_id, finished_at=_now_kst(), **fields)
+        self._notify(job_id, final=True)
+        logger.info(f"[ocr_jobs] {job_id} {job.status} wait={waited * 1000:.0f}ms run={elapsed * 1000:.0f}ms")
+
+        if job.callback_url:
+            # 웹훅은 워커와 분리 (수신 서버가 느려도 다음 작업 처리)
+            task = asyncio.create_task(self._send_webhook(job))
+            self._webhook_tasks.add(task)
+            task.add_done_callback(self._webhook_tasks.discard)
+
+    async def _send_webhook(self, job: OcrJob):
+        try:
+            # 제출 후 DNS 가 내부 주소로 바뀌었을 수 있으므로 전송 직전 다시 검증
+            await validate_callback_url(job.callback_url)
+            r = await get_http_client().post(
+                job.callback_url,
+                json=job_payload(job),
+                timeout=OCR_JOB_WEBHOOK_TIMEOUT,
+                follow_redirects=False,
+            )
+            if r.status_code >= 400:
+                logger.warning(f"[ocr_jobs] webhook {job.job_id} → HTTP {r.status_code}")
+        except Exception as e:
+            logger.warning(f"[ocr_jobs] webhook {job.job_id} failed: {e!r}")
+
+    # ---------- 계측 ----------
+    def metrics(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_max": self.max_queue,
+            "running": self._running,
+            **self._counters,
+            "wait_time": self.wait_time.summary(),
+            "processing_time": self.processing_time.summary(),
+        }
+
+
+def job_payload(job: OcrJob) -> dict:
+    """웹훅/SSE 용 작업 상태 (API 응답과 같은 날짜 형식)"""
+    fmt = lambda v: v.strftime("%Y-%m-%d/%H:%M:%S") if v else None
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "user_id": job.job_user_id,
+        "auto_create": job.auto_create,
+        "ocr_text": job.ocr_text,
+        "document_id": job.document_id,
+        "error": job.error,
+        "created_at": fmt(job.created_at),
+        "started_at": fmt(job.started_at),
+        "finished_at": fmt(job.finished_at),
+    }
+
+
+ocr_job_queue = OcrJobQueue(OCR_JOB_WORKERS, OCR_JOB_QUEUE_MAX)
@@ -2,12 +2,12 @@
 from __future__ import annotations
 import re
 from datetime import date, datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from fastapi import HTTPException, status
 from sqlmodel import Session
 
-from app.services.document_service import create_document, DocumentCreate
+from app.services.document_service import create_document, create_documents, DocumentCreate
 
 # key: value 형식 한 줄 파싱
 KV_LINE_RE = re.compile(r"^\s*([^:\n]+?)\s*:\s*(.+?)\s*$")
@@ -90,6 +90,15 @@ def _to_date(s: str) -> Optional[date]:
             continue
     return None
 
+# 서류 종류 라벨 (인덱스 = document_classification_id, 프롬프트의 카테고리 순서)
+CATEGORY_LABELS: List[str] = [
+    "정기구독 및 납부",
+    "송장 및 세금 계산서",
+    "이체 및 송금 전표",
+    "은행 거래내역서",
+    "카드명세서",
+]
+
 def _normalize_label(s: str) -> str:
     """카테고리 라벨 정규화(공백/구두점 제거, 소문자)."""
     s = (s or "").strip().lower()
@@ -109,13 +118,7 @@ def _classify_id_from_label(label: str) -> int:
     n = _normalize_label(label)
 
     # 기본 라벨
-    label_map = {
-        _normalize_label("정기구독 및 납부"): 0,
-        _normalize_label("송장 및 세금 계산서"): 1,
-        _normalize_label("이체 및 송금 전표"): 2,
-        _normalize_label("은행 거래내역서"): 3,
-        _normalize_label("카드명세서"): 4,
-    }
+    label_map = {_normalize_label(label): idx for idx, label in enumerate(CATEGORY_LABELS)}
 
     # 흔한 표기 변형/오탈자/동의어
     label_map[_normalize_label("세금계산서")] = 1
@@ -132,13 +135,12 @@ def _classify_id_from_label(label: str) -> int:
 
     return label_map.get(n, 0)  # 매칭 실패 시 0으로 디폴트(정책에 맞게 조정 가능)
 
-def create_document_from_ocr(session: Session, user_id: int, ocr_text: str):
+def build_document_from_ocr(user_id: int, ocr_text: str) -> DocumentCreate:
     """
     - OCR 원문(ocr_text)을 document_content에 그대로 저장
     - 한글 키 기반으로 필드 파싱
     - '서류 종류' 라벨을 0~4의 classification_id로 매핑
     - 날짜(document_due)는 필수로 검증
-    - document_user_id는 요청대로 '0'으로 고정(후에 사용자 함수로 교체 예정)
     """
     if not ocr_text or not ocr_text.strip():
         raise HTTPException(
@@ -168,8 +170,7 @@ def create_document_from_ocr(session: Session, user_id: int, ocr_text: str):
     classification_label = d.get("document_classification_label", "")
     classification_id = _classify_id_from_label(classification_label)
 
-    # 요청사항: document_user_id는 지금은 0으로 저장
-    payload = DocumentCreate(
+    return DocumentCreate(
         document_user_id=user_id,  # TODO: 나중에 실제 사용자 ID 획득 로직으로 교체
         document_title=title,
         document_balance=amount,
@@ -183,4 +184,21 @@ def create_document_from_ocr(session: Session, user_id: int, ocr_text: str):
         document_partner_id=0,       # 필요 시 후처리
     )
 
+def create_document_from_ocr(session: Session, user_id: int, ocr_text: str):
+    """OCR key-value 텍스트 1건 → Document 1건 생성"""
+    payload = build_document_from_ocr(user_id, ocr_text)
     return create_document(session, payload)
+
+def create_documents_from_ocr(session: Session, user_id: int, ocr_texts: List[str]):
+    """
+    여러 건을 한 번에 생성
+    - 모든 텍스트를 먼저 파싱/검증하고, 하나라도 실패하면 아무것도 저장하지 않음
+    - 저장은 단일 DB 트랜잭션(커밋 1회)
+    """
+    payloads = []
+    for idx, ocr_text in enumerate(ocr_texts):
+        try:
+            payloads.append(build_document_from_ocr(user_id, ocr_text))
+        except HTTPException as e:
+            raise HTTPException(status_code=e.status_code, detail={"index": idx, "error": e.detail})
+    return create_documents(session, payloads)
@@ -0,0 +1,225 @@
+# app/services/reminder_queue.py
+"""
+리마인더 발송 시각 최소 힙
+
+- 거래(transaction)당 힙 항목은 '다음 임계 시각' 1개만 유지
+- 거래가 수정/삭제되면 버전을 올려서 기존 힙 항목을 무효화(lazy deletion)
+- 스케줄러 스레드는 wait_until_due() 로 다음 발송 시각까지 정확히 대기하고,
+  더 이른 항목이 추가되면 즉시 깨어남
+"""
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, time as dtime, timezone
+from typing import Iterable, List, Optional, Tuple
+
+KST = timezone(timedelta(hours=9))
+
+# ✅ 남은 시간 임계값: 240/180/150/120/90/61
+THRESHOLDS_SECONDS = [240, 180, 150, 120, 90, 61]
+
+# 임계 시각이 이 시간보다 더 지났으면 (서버 중단 등) 발송하지 않고 건너뜀
+MISFIRE_GRACE_SECONDS = 60
+
+
+def to_datetime_due(tx_due) -> datetime:
+    if isinstance(tx_due, datetime):
+        due_dt = tx_due
+    else:
+        # Legacy date → compose at 09:00 KST
+        due_dt = datetime.combine(tx_due, dtime(hour=9, minute=0, second=0, tzinfo=KST))
+
+    if due_dt.tzinfo is None:
+        # Assume KST if naive (한국 시간 기준)
+        return due_dt.replace(tzinfo=KST)
+    return due_dt.astimezone(KST)
+
+
+@dataclass
+class _TxEntry:
+    version: int
+    user_id: int
+    title: str
+    due_at: datetime
+    fire_ts: float
+    threshold_idx: int
+
+
+@dataclass
+class DueReminder:
+    transaction_id: int
+    user_id: int
+    title: str
+    seconds: int
+    fire_at: datetime
+
+
+class ReminderQueue:
+    def __init__(self):
+        self._cond = threading.Condition()
+        # (fire_ts, transaction_id, version, threshold_idx)
+        self._heap: List[Tuple[float, int, int, int]] = []
+        self._entries: dict[int, _TxEntry] = {}
+        self._versions = itertools.count(1)
+        # begin_rebuild() 이후 schedule/remove 된 거래 id (DB 스냅샷보다 최신)
+        self._touched: Optional[set] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ----------------------------
+    # 내부 유틸
+    # ----------------------------
+    @staticmethod
+    def _next_threshold(due_at: datetime, start_idx: int, now_ts: float) -> Optional[Tuple[int, float]]:
+        """start_idx 이후 임계값 중 아직 발송 가능한 첫 번째 (idx, fire_ts)"""
+        due_ts = due_at.timestamp()
+        for idx in range(start_idx, len(THRESHOLDS_SECONDS)):
+            fire_ts = due_ts - THRESHOLDS_SECONDS[idx]
+            if fire_ts >= now_ts - MISFIRE_GRACE_SECONDS:
+                return idx, fire_ts
+        return None
+
+    def _put_locked(self, tx_id: int, user_id: int, title: str, due, now_ts: float) -> bool:
+        self._entries.pop(tx_id, None)
+        if self._touched is not None:
+            self._touched.add(tx_id)
+        due_at = to_datetime_due(due)
+        nxt = self._next_threshold(due_at, 0, now_ts)
+        if nxt is None:
+            return False
+        idx, fire_ts = nxt
+        version = next(self._versions)
+        self._entries[tx_id] = _TxEntry(version, user_id, title, due_at, fire_ts, idx)
+        heapq.heappush(self._heap, (fire_ts, tx_id, version, idx))
+        return True
+
+    def _maybe_compact_locked(self):
+        """무효 항목이 많이 쌓이면 살아있는 항목으로 힙 재구성"""
+        if len(self._heap) > 2 * len(self._entries) + 1024:
+            self._heap = [(e.fire_ts, tx_id, e.version, e.threshold_idx) for tx_id, e in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    # ----------------------------
+    # 등록 / 갱신 / 삭제
+    # ----------------------------
+    def begin_rebuild(self):
+        """DB 스냅샷 조회 직전에 호출 - 조회 중 들어온 갱신은 rebuild 시 보존"""
+        with self._cond:
+            self._touched = set()
+
+    def rebuild(self, rows: Iterable[Tuple[int, int, str, datetime]], now_ts: Optional[float] = None):
+        """(transaction_id, user_id, title, due) 목록으로 힙 전체 재구성 - O(n)"""
+        now_ts = time.time() if now_ts is None else now_ts
+        entries: dict[int, _TxEntry] = {}
+        heap: List[Tuple[float, int, int, int]] = []
+        for tx_id, user_id, title, due in rows:
+            due_at = to_datetime_due(due)
+            nxt = self._next_threshold(due_at, 0, now_ts)
+            if nxt is None:
+                continue
+            idx, fire_ts = nxt
+            version = next(self._versions)
+            entries[tx_id] = _TxEntry(version, user_id, title, due_at, fire_ts, idx)
+            heap.append((fire_ts, tx_id, version, idx))
+        with self._cond:
+            for tx_id in self._touched or ():
+                entries.pop(tx_id, None)
+                live = self._entries.get(tx_id)
+                if live is not None:
+                    entries[tx_id] = live
+                    heap.append((live.fire_ts, tx_id, live.version, live.threshold_idx))
+            self._touched = None
+            heapq.heapify(heap)
+            self._entries = entries
+            self._heap = heap
+            self._cond.notify_all()
+
+    def schedule(self, tx_id: int, user_id: int, title: str, due, now_ts: Optional[float] = None):
+        """거래 추가 또는 갱신 (기존 예약은 무효화)"""
+        now_ts = time.time() if now_ts is None else now_ts
+        with self._cond:
+            self._put_locked(tx_id, user_id, title, due, now_ts)
+            self._maybe_compact_locked()
+            self._cond.notify_all()
+
+    def schedule_transaction(self, tx) -> None:
+        """Transaction 객체 기준 등록 (완료된 거래는 제거)"""
+        if tx.transaction_close:
+            self.remove(tx.transaction_id)
+            return
+        self.schedule(tx.transaction_id, tx.transaction_user_id, tx.transaction_title, tx.transaction_due)
+
+    def remove(self, tx_id: int):
+        with self._cond:
+            self._entries.pop(tx_id, None)
+            if self._touched is not None:
+                self._touched.add(tx_id)
+            self._maybe_compact_locked()
+
+    # ----------------------------
+    # 발송 / 대기
+    # ----------------------------
+    def pop_due(self, now_ts: Optional[float] = None) -> List[DueReminder]:
+        """now 까지 도래한 항목을 꺼내고, 각 거래의 다음 임계값을 다시 예약"""
+        now_ts = time.time() if now_ts is None else now_ts
+        due: List[DueReminder] = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now_ts:
+                fire_ts, tx_id, version, idx = heapq.heappop(self._heap)
+                entry = self._entries.get(tx_id)
+                if entry is None or entry.version != version:
+                    continue  # 수정/삭제로 무효화된 항목
+
+                seconds = THRESHOLDS_SECONDS[idx]
+                due.append(DueReminder(
+                    transaction_id=tx_id,
+                    user_id=entry.user_id,
+                    title=entry.title,
+                    seconds=seconds,
+                    fire_at=entry.due_at - timedelta(seconds=seconds),
+                ))
+
+                nxt = self._next_threshold(entry.due_at, idx + 1, now_ts)
+                if nxt is None:
+                    del self._entries[tx_id]
+                    continue
+                entry.threshold_idx, entry.fire_ts = nxt
+                heapq.heappush(self._heap, (entry.fire_ts, tx_id, version, entry.threshold_idx))
+        return due
+
+    def seconds_until_next(self, now_ts: Optional[float] = None) -> Optional[float]:
+        now_ts = time.time() if now_ts is None else now_ts
+        with self._cond:
+            return self._seconds_until_next_locked(now_ts)
+
+    def _seconds_until_next_locked(self, now_ts: float) -> Optional[float]:
+        while self._heap:
+            fire_ts, tx_id, version, _ = self._heap[0]
+            entry = self._entries.get(tx_id)
+            if entry is None or entry.version != version:
+                heapq.heappop(self._heap)
+                continue
+            return max(0.0, fire_ts - now_ts)
+        return None
+
+    def wait_until_due(self, stop_event: threading.Event, max_timeout: Optional[float] = None):
+        """다음 발송 시각(또는 max_timeout)까지 대기. 더 이른 항목이 들어오거나 stop 시 즉시 복귀"""
+        with self._cond:
+            if stop_event.is_set():
+                return
+            timeout = self._seconds_until_next_locked(time.time())
+            if max_timeout is not None:
+                timeout = max_timeout if timeout is None else min(timeout, max_timeout)
+            if timeout is None or timeout > 0:
+                self._cond.wait(timeout)
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+
+# 프로세스 전역 큐 (transaction_service 에서 갱신, scheduler_service 에서 소비)
+reminder_queue = ReminderQueue()
@@ -1,5 +1,5 @@
 # app/services/reminder_service.py
-from typing import List, Optional, Dict
+from typing import Optional, Dict
 import logging
 # ⬇️ timedelta, timezone 추가
 from datetime import datetime, timedelta, timezone
@@ -8,10 +8,14 @@ from fastapi import HTTPException, status
 from sqlmodel import Session, select, SQLModel, Field
 
 from app.models.reminder_models import Reminder
+from app.dependencies.pagination import ListSpec, Page, PageParams, range_filter
 
 # module logger
 logger = logging.getLogger("reminder_service")
 
+# 목록: 만기일 오름차순 (due_at, reminder_id) keyset
+REMINDER_LIST = ListSpec(Reminder, order_by=["due_at", "reminder_id"])
+
 
 # ----------------------------
 # 요청 스키마 (Create / Update)
@@ -52,23 +56,32 @@ def get_reminder_by_id(session: Session, reminder_id: int) -> Reminder:
 # ----------------------------
 # 전체 조회 (요청 1)
 # ----------------------------
-def get_all_reminders(session: Session) -> List[Reminder]:
-    """모든 리마인더 조회 (만기일 오름차순)"""
-    stmt = select(Reminder).order_by(Reminder.due_at)
-    return session.exec(stmt).all()
+def get_all_reminders(
+    session: Session,
+    params: PageParams,
+    reminder_user_id: Optional[int] = None,
+    transaction_id: Optional[int] = None,
+    is_done: Optional[bool] = None,
+    due_from: Optional[datetime] = None,
+    due_to: Optional[datetime] = None,
+) -> Page:
+    """조건에 맞는 리마인더 한 페이지 조회 (만기일 오름차순)"""
+    return REMINDER_LIST.page(
+        session,
+        params,
+        Reminder.reminder_user_id == reminder_user_id if reminder_user_id is not None else None,
+        Reminder.transaction_id == transaction_id if transaction_id is not None else None,
+        Reminder.status == is_done if is_done is not None else None,
+        *range_filter(Reminder.due_at, due_from, due_to),
+    )
 
 
 # ----------------------------
 # 트랜잭션 id로 조회 (요청 3)
 # ----------------------------
-def get_reminders_by_transaction_id(session: Session, transaction_id: int) -> List[Reminder]:
+def get_reminders_by_transaction_id(session: Session, transaction_id: int, params: PageParams, **filters) -> Page:
     """특정 트랜잭션에 연결된 모든 리마인더 조회"""
-    stmt = (
-        select(Reminder)
-        .where(Reminder.transaction_id == transaction_id)
-        .order_by(Reminder.due_at)
-    )
-    return session.exec(stmt).all()
+    return get_all_reminders(session, params, transaction_id=transaction_id, **filters)
 
 
 # ----------------------------
@@ -78,34 +91,23 @@ def get_reminders_by_status_and_user(
     session: Session,
     reminder_user_id: int,
     is_done: bool,
-) -> List[Reminder]:
+    params: PageParams,
+    **filters,
+) -> Page:
     """
     상태(완료/미완료)와 사용자 id로 리마인더 조회
     - is_done=True  : 완료된 리마인더
     - is_done=False : 미완료 리마인더
     """
-    stmt = (
-        select(Reminder)
-        .where(
-            (Reminder.reminder_user_id == reminder_user_id)
-            & (Reminder.status == is_done)
-        )
-        .order_by(Reminder.due_at)
-    )
-    return session.exec(stmt).all()
+    return get_all_reminders(session, params, reminder_user_id=reminder_user_id, is_done=is_done, **filters)
 
 
 # ----------------------------
 # 유저 id로 조회 (요청 5)
 # ----------------------------
-def get_reminders_by_user_id(session: Session, reminder_user_id: int) -> List[Reminder]:
+def get_reminders_by_user_id(session: Session, reminder_user_id: int, params: PageParams, **filters) -> Page:
     """사용자 id로 모든 리마인더 조회"""
-    stmt = (
-        select(Reminder)
-        .where(Reminder.reminder_user_id == reminder_user_id)
-        .order_by(Reminder.due_at)
-    )
-    return session.exec(stmt).all()
+    return get_all_reminders(session, params, reminder_user_id=reminder_user_id, **filters)
 
 
 # =========================================================
@@ -0,0 +1,271 @@
+# app/services/rule_extractor.py
+"""
+정형 문서용 규칙 기반 8개 key-value 추출 (GPT 분류/추출 호출 전 빠른 경로)
+
+- 서류 종류: 카테고리별 키워드 점수 (_classify_id_from_label 의 5개 카테고리, CATEGORY_LABELS 순서)
+- 필드: 라벨(이체금액/합계/받는분/입금계좌 ...) 오른쪽, 라벨만 있는 줄이면 아래 두 줄까지 정규식으로 찾기
+  (CLOVA 결과는 fields(단어) 마다 한 줄)
+- 거래대상은 다음 라벨 / 금액 / 날짜 / 계좌번호 / (뒤쪽) 은행 이름 앞에서 끊고, 남은 값이 _PARTNER_MAX_LEN 자를 넘으면 빈 값
+  (한 줄에 여러 항목이 붙은 OCR 결과에서 줄 나머지 전체를 거래대상으로 잡지 않도록)
+- 프롬프트(INSTRUCTIONS_TEXT)와 같은 규칙: 값은 OCR 텍스트의 연속 부분문자열 그대로, 날짜는 YYYY-MM-DD 형태만,
+  금액은 합계/총액 등 라벨 우선 + 숫자만 남김, 못 찾으면 빈 값
+- confidence = 카테고리 확신도 × 카테고리별 필수 필드 채움 비율
+  (지불기일이 없거나 날짜가 아니면 0 → 문서 생성이 안 되므로 GPT 로)
+- confidence >= OCR_RULE_MIN_CONFIDENCE 이면 GPT 호출 생략, 아니면 기존대로 GPT
+
+환경변수
+    OCR_RULE_EXTRACTOR=true
+    OCR_RULE_MIN_CONFIDENCE=0.85
+"""
+import os
+import re
+import threading
+from typing import Callable, Dict, Match, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+from dotenv import load_dotenv
+
+from app.services.ocr_to_document import CATEGORY_LABELS, _to_date
+
+load_dotenv()
+
+OCR_RULE_EXTRACTOR = os.getenv("OCR_RULE_EXTRACTOR", "true").lower() in ("1", "true", "yes")
+OCR_RULE_MIN_CONFIDENCE = float(os.getenv("OCR_RULE_MIN_CONFIDENCE", "0.85"))
+
+# 카테고리 키워드 (공백 제거 + 소문자 텍스트에 포함되면 1점, 같은 키워드는 1번만)
+CATEGORY_KEYWORDS: Dict[int, Tuple[str, ...]] = {
+    0: ("정기구독", "구독", "정기결제", "자동납부", "납부", "고지서", "이용요금", "요금", "월정액",
+        "관리비", "공과금", "납기", "납입"),
+    1: ("세금계산서", "계산서", "공급가액", "세액", "공급자", "공급받는자", "사업자등록번호", "송장",
+        "인보이스", "invoice", "청구서", "품목", "부가세"),
+    2: ("이체", "송금", "출금계좌", "입금계좌", "받는분", "보내는분", "받는사람", "수취인", "이체확인증",
+        "송금확인증"),
+    3: ("거래내역", "입출금", "잔액", "거래일시", "적요", "찾으신금액", "맡기신금액", "입금액", "출금액",
+        "조회기간"),
+    4: ("카드", "카드명세서", "이용대금", "이용금액", "결제예정", "카드번호", "할부", "가맹점", "청구금액"),
+}
+# 이 개수 이상 맞으면 키워드 수로는 감점 없음
+_FULL_SCORE_KEYWORDS = 3
+
+# 카테고리별 필수 필드 (confidence 의 채움 비율 기준)
+REQUIRED_FIELDS: Dict[int, Tuple[str, ...]] = {
+    0: ("document_balance", "document_due"),
+    1: ("document_balance", "document_partner", "document_due"),
+    2: ("document_balance", "document_partner_number", "document_due"),
+    3: ("document_account_number", "document_due"),
+    4: ("document_balance", "document_account_number", "document_due"),
+}
+
+# 라벨 (앞에 있을수록 우선)
+AMOUNT_LABELS = ("합계금액", "합계", "총액", "총금액", "결제금액", "청구금액", "납부금액", "이체금액",
+                 "송금금액", "송금액", "이용금액", "출금액", "거래금액", "금액")
+DATE_LABELS = ("지불기일", "납부기한", "납기일", "결제예정일", "결제일", "이체일자", "이체일", "송금일",
+               "거래일자", "거래일시", "작성일자", "발행일", "청구일")
+PARTNER_LABELS = ("받는분", "받는사람", "수취인", "상호", "가맹점명", "가맹점", "서비스명", "상품명",
+                  "납부처", "이용기관", "예금주")
+# 카드명세서에 결제계좌가 없으면 (마스킹된) 카드번호를 계좌번호로
+ACCOUNT_LABELS = ("출금계좌", "보내는계좌", "납부계좌", "결제계좌", "계좌번호", "카드번호")
+PARTNER_ACCOUNT_LABELS = ("입금계좌", "받는계좌", "수취계좌", "가상계좌", "거래대상계좌번호")
+
+BANK_NAMES = ("KB국민은행", "IBK기업은행", "SC제일은행", "NH농협은행", "국민은행", "신한은행", "우리은행",
+              "하나은행", "농협은행", "기업은행", "카카오뱅크", "토스뱅크", "케이뱅크", "씨티은행", "부산은행",
+              "대구은행", "iM뱅크", "경남은행", "광주은행", "전북은행", "제주은행", "수협은행", "산업은행",
+              "새마을금고", "신협", "우체국", "농협", "수협")
+
+DATE_RE = re.compile(r"(?<!\d)\d{4}-\d{2}-\d{2}(?!\d)")
+AMOUNT_RE = re.compile(r"(?<![\d,.\-*])(?:\d{1,3}(?:,\d{3})+|\d+)(?![\d,\-*])")
+ACCOUNT_RE = re.compile(r"(?<![\d*\-])[\d*]{2,6}(?:-[\d*]{1,8}){1,4}(?![\d*\-])")
+BANK_RE = re.compile("|".join(re.escape(name) for name in sorted(BANK_NAMES, key=len, reverse=True)))
+PARTNER_RE = re.compile(r"[^\s:：](?:.*\S)?")
+# 거래대상 뒤에 붙는 금액 (단어 하나가 통째로 숫자인 경우만, "GS25" 같은 이름 속 숫자는 제외)
+_PARTNER_AMOUNT_STOP_RE = re.compile(r"(?:(?<=\s)|^)(?:\d{1,3}(?:,\d{3})+|\d+)\s*원?(?=\s|$)")
+_PARTNER_MAX_LEN = 30
+_SEPARATOR_RE = re.compile(r"^[\s:：]*")
+# 라벨만 있는 줄이면 아래 몇 줄까지 값을 찾을지 ("출금계좌 / 국민은행 / 123-..." 처럼 단어마다 줄바꿈)
+_LOOKAHEAD_LINES = 2
+
+# 출력 순서/키 (프롬프트 출력 형식, ocr_to_document.KEY_ALIASES 로 다시 파싱됨)
+KV_KEYS: Tuple[Tuple[str, str], ...] = (
+    ("서류 종류", "document_classification_label"),
+    ("제목", "document_title"),
+    ("거래금액", "document_balance"),
+    ("거래대상", "document_partner"),
+    ("계좌 은행", "document_bank"),
+    ("계좌번호", "document_account_number"),
+    ("거래대상 계좌번호", "document_partner_number"),
+    ("지불기일", "document_due"),
+)
+
+
+def _label_pattern(label: str) -> Pattern[str]:
+    # OCR 가 글자 사이에 공백을 넣는 경우("받는 분", "이 체 금 액")도 허용
+    return re.compile(r"\s*".join(re.escape(ch) for ch in label))
+
+
+_LABEL_PATTERNS: Dict[str, Pattern[str]] = {
+    label: _label_pattern(label)
+    for labels in (AMOUNT_LABELS, DATE_LABELS, PARTNER_LABELS, ACCOUNT_LABELS, PARTNER_ACCOUNT_LABELS)
+    for label in labels
+}
+_ANY_LABEL_RE = re.compile("|".join(p.pattern for p in _LABEL_PATTERNS.values()))
+
+
+class RuleExtraction(NamedTuple):
+    classification_id: Optional[int]
+    fields: Dict[str, str]     # 내부 표준 키 → 값 (못 찾으면 빈 문자열)
+    confidence: float          # 0 ~ 1
+    kv_text: str               # 프롬프트 출력과 같은 8줄
+
+
+def _compact(text: str) -> str:
+    return re.sub(r"\s+", "", text).lower()
+
+
+def classify(ocr_text: str) -> Tuple[Optional[int], float]:
+    """키워드 점수로 (classification_id, 확신도) / 키워드가 하나도 없으면 (None, 0)"""
+    compact = _compact(ocr_text)
+    scores = sorted(
+        ((sum(1 for kw in keywords if kw in compact), cid) for cid, keywords in CATEGORY_KEYWORDS.items()),
+        reverse=True,
+    )
+    (top, cid), (second, _) = scores[0], scores[1]
+    if top == 0:
+        return None, 0.0
+    # 키워드가 충분한지 × 2등과의 차이 (2등이 1등과 같으면 0.5)
+    return cid, min(1.0, top / _FULL_SCORE_KEYWORDS) * (1 - second / (2 * top))
+
+
+Finder = Callable[[str], Optional[Match[str]]]
+
+
+def _find_account(text: str) -> Optional[Match[str]]:
+    """계좌/카드번호 첫 매치 (날짜 모양 제외, 숫자/마스킹 8자 이상)"""
+    for m in ACCOUNT_RE.finditer(text):
+        value = m.group(0)
+        if not DATE_RE.fullmatch(value) and sum(ch.isdigit() or ch == "*" for ch in value) >= 8:
+            return m
+    return None
+
+
+def _find_partner(text: str) -> Optional[Match[str]]:
+    """
+    거래대상: 다음 라벨 / 날짜 / 금액 / 계좌번호 / 은행 이름(맨 앞 제외) 중 가장 앞 위치에서 끊은 값
+    - 끊은 값이 비었거나 _PARTNER_MAX_LEN 자를 넘으면 깔끔한 값이 아니므로 None (빈 값 → 필요하면 GPT)
+    """
+    ends = [len(text)]
+    for m in (_ANY_LABEL_RE.search(text), DATE_RE.search(text), _PARTNER_AMOUNT_STOP_RE.search(text),
+              _find_account(text), BANK_RE.search(text, 1)):
+        if m:
+            ends.append(m.start())
+    found = PARTNER_RE.match(text[:min(ends)])
+    if not found or len(found.group(0)) > _PARTNER_MAX_LEN:
+        return None
+    return found
+
+
+def _labeled(lines: Sequence[str], labels: Sequence[str], find: Finder,
+             skip: Sequence[str] = ()) -> Tuple[str, int, int]:
+    """
+    라벨 오른쪽에서 find 첫 매치, 라벨만 있는 줄이면 아래 _LOOKAHEAD_LINES 줄까지
+    → (값, 라벨 줄 번호, 값 줄 번호) / 없으면 ("", -1, -1)
+    - skip 라벨이 같이 있는 줄은 건너뜀 (계좌번호 ↔ 거래대상 계좌번호)
+    """
+    skip_patterns = [_LABEL_PATTERNS[label] for label in skip]
+    for label in labels:
+        label_re = _LABEL_PATTERNS[label]
+        for i, line in enumerate(lines):
+            m = label_re.search(line)
+            if not m or any(p.search(line) for p in skip_patterns):
+                continue
+            rest = line[m.end():]
+            rest = rest[_SEPARATOR_RE.match(rest).end():]
+            found = find(rest)
+            if found:
+                return found.group(0).strip(), i, i
+            if rest.strip():
+                continue
+            for j in range(i + 1, min(len(lines), i + 1 + _LOOKAHEAD_LINES)):
+                found = find(lines[j])
+                if found:
+                    return found.group(0).strip(), i, j
+    return "", -1, -1
+
+
+def _title(lines: Sequence[str]) -> str:
+    """첫 줄 중 숫자가 거의 없는 짧은 줄 (문서 제목: 이체확인증, 세금계산서 ...)"""
+    for line in lines[:3]:
+        line = line.strip()
+        if line and len(line) <= 30 and sum(ch.isdigit() for ch in line) < 4:
+            return line
+    return ""
+
+
+def extract_fields(ocr_text: str) -> RuleExtraction:
+    """OCR 텍스트 → 규칙 기반 8개 필드 + confidence"""
+    lines = [line for line in (ocr_text or "").splitlines() if line.strip()]
+    cid, category_confidence = classify(ocr_text or "")
+
+    amount = _labeled(lines, AMOUNT_LABELS, AMOUNT_RE.search)[0]
+    due = _labeled(lines, DATE_LABELS, DATE_RE.search)[0]
+    if not due:
+        dates = set(DATE_RE.findall(ocr_text or ""))
+        due = dates.pop() if len(dates) == 1 else ""   # 라벨 없이 날짜가 하나뿐이면 그 날짜
+    partner = _labeled(lines, PARTNER_LABELS, _find_partner)[0]
+    account, label_line, value_line = _labeled(lines, ACCOUNT_LABELS, _find_account, skip=PARTNER_ACCOUNT_LABELS)
+    partner_number = _labeled(lines, PARTNER_ACCOUNT_LABELS, _find_account)[0]
+
+    # 계좌 은행: 계좌번호 라벨 ~ 값 사이에서 은행 이름, 없으면 문서 전체에 은행이 하나뿐일 때 그 은행
+    bank = ""
+    if account:
+        m = BANK_RE.search("\n".join(lines[label_line:value_line + 1]))
+        bank = m.group(0) if m else ""
+    if not bank and account:
+        banks = set(BANK_RE.findall(ocr_text))
+        bank = banks.pop() if len(banks) == 1 else ""
+
+    fields = {
+        "document_classification_label": CATEGORY_LABELS[cid] if cid is not None else "",
+        "document_title": _title(lines),
+        "document_balance": re.sub(r"[^\d]", "", amount),
+        "document_partner": partner,
+        "document_bank": bank,
+        "document_account_number": account,
+        "document_partner_number": partner_number,
+        "document_due": due,
+    }
+
+    if cid is None or _to_date(due) is None:
+        confidence = 0.0
+    else:
+        required = REQUIRED_FIELDS[cid]
+        confidence = category_confidence * sum(1 for key in required if fields[key]) / len(required)
+
+    kv_text = "\n".join(f"{key} : {fields[std_key]}" for key, std_key in KV_KEYS)
+    return RuleExtraction(cid, fields, round(confidence, 4), kv_text)
+
+
+# ----------------------------
+# 빠른 경로 + 카운터
+# ----------------------------
+_lock = threading.Lock()
+_stats: Dict[str, int] = {"rules": 0, "llm": 0}
+
+
+def fast_path(ocr_text: str) -> Optional[RuleExtraction]:
+    """confidence 가 OCR_RULE_MIN_CONFIDENCE 이상이면 추출 결과, 아니면(또는 꺼져 있으면) None → GPT"""
+    result = extract_fields(ocr_text) if OCR_RULE_EXTRACTOR else None
+    accepted = result is not None and result.confidence >= OCR_RULE_MIN_CONFIDENCE
+    with _lock:
+        _stats["rules" if accepted else "llm"] += 1
+    return result if accepted else None
+
+
+def stats() -> dict:
+    with _lock:
+        counts = dict(_stats)
+    total = counts["rules"] + counts["llm"]
+    return {
+        "enabled": OCR_RULE_EXTRACTOR,
+        "min_confidence": OCR_RULE_MIN_CONFIDENCE,
+        **counts,
+        "llm_rate": round(counts["llm"] / total, 4) if total else 0.0,
+    }
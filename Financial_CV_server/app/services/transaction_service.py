@@ -1,32 +1,51 @@
 # app/services/transaction_service.py
-from typing import List
+from datetime import datetime
+from typing import Optional
 from fastapi import HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from app.models.transaction_models import (
     Transaction,
     TransactionCreate,
     TransactionUpdate,
 )
+from app.services.reminder_queue import reminder_queue
+from app.dependencies.pagination import ListSpec, Page, PageParams, range_filter
+
+# 목록: 최신순 (created_at, transaction_id) keyset
+TRANSACTION_LIST = ListSpec(Transaction, order_by=["created_at", "transaction_id"], descending=True)
 
 
 # -----------------------------
 # 조회
 # -----------------------------
-def list_transactions(session: Session) -> List[Transaction]:
-    """모든 거래 조회 (최신순)."""
-    stmt = select(Transaction).order_by(Transaction.created_at.desc())
-    return session.exec(stmt).all()
-
-
-def list_transactions_by_user(session: Session, transaction_user_id: int) -> List[Transaction]:
+def transaction_filters(
+    transaction_user_id: Optional[int] = None,
+    transaction_close: Optional[bool] = None,
+    transaction_recurring: Optional[bool] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    due_from: Optional[datetime] = None,
+    due_to: Optional[datetime] = None,
+) -> list:
+    """목록/내보내기 공통 WHERE 조건"""
+    return [
+        Transaction.transaction_user_id == transaction_user_id if transaction_user_id is not None else None,
+        Transaction.transaction_close == transaction_close if transaction_close is not None else None,
+        Transaction.transaction_recurring == transaction_recurring if transaction_recurring is not None else None,
+        *range_filter(Transaction.created_at, created_from, created_to),
+        *range_filter(Transaction.transaction_due, due_from, due_to),
+    ]
+
+
+def list_transactions(session: Session, params: PageParams, **filters) -> Page:
+    """조건에 맞는 거래 한 페이지 조회 (최신순, filters: transaction_filters 인자)."""
+    return TRANSACTION_LIST.page(session, params, *transaction_filters(**filters))
+
+
+def list_transactions_by_user(session: Session, transaction_user_id: int, params: PageParams, **filters) -> Page:
     """특정 유저의 거래만 조회 (최신순)."""
-    stmt = (
-        select(Transaction)
-        .where(Transaction.transaction_user_id == transaction_user_id)
-        .order_by(Transaction.created_at.desc())
-    )
-    return session.exec(stmt).all()
+    return list_transactions(session, params, transaction_user_id=transaction_user_id, **filters)
 
 
 def get_transaction_by_id(session: Session, transaction_id: int) -> Transaction:
@@ -58,6 +77,7 @@ def create_transaction(session: Session, payload: TransactionCreate) -> Transact
     session.add(tx)
     session.commit()
     session.refresh(tx)
+    reminder_queue.schedule_transaction(tx)
     return tx
 
 
@@ -77,6 +97,7 @@ def update_transaction(
     session.add(tx)
     session.commit()
     session.refresh(tx)
+    reminder_queue.schedule_transaction(tx)
     return tx
 
 
@@ -88,6 +109,7 @@ def delete_transaction(session: Session, transaction_id: int) -> None:
     tx = get_transaction_by_id(session, transaction_id)
     session.delete(tx)
     session.commit()
+    reminder_queue.remove(transaction_id)
     
     
 # -----------------------------
@@ -107,4 +129,5 @@ def update_transaction_recurring(session: Session, transaction_id: int) -> Trans
     session.add(tx)
     session.commit()
     session.refresh(tx)
+    reminder_queue.schedule_transaction(tx)
     return tx
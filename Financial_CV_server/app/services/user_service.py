@@ -1,21 +1,26 @@
-from typing import List, Optional
+import asyncio
+from datetime import datetime
+from typing import Optional
 from sqlmodel import Session, select
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
 
 from app.models.user_models import User
+from app.dependencies.pagination import ListSpec, Page, PageParams, range_filter
+from app.dependencies import password_hasher
+from app.dependencies.auth import invalidate_user
 
 # ----------------------------
 # 보안 설정
 # ----------------------------
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt 는 password_hasher 의 프로세스 풀에서 실행 (cost: BCRYPT_ROUNDS)
 MAX_FAILED_LOGIN = 5  # 허용 실패 횟수
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+# 목록: user_id 순 keyset, 비밀번호 해시/보안 상태 컬럼은 노출하지 않음
+USER_LIST = ListSpec(User, order_by=["user_id"], hidden=["user_login_pw", "user_failed_count", "user_locked"])
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+def get_password_hash(password: str) -> str:
+    """동기 라우트용 (해시 계산은 풀에서)"""
+    return password_hasher.hash_password_blocking(password)
 
 # ----------------------------
 # 기본 조회
@@ -30,24 +35,18 @@ def get_user_by_login_id(session: Session, login_id: str) -> Optional[User]:
     statement = select(User).where(User.user_login_id == login_id)
     return session.exec(statement).first()
 
-def list_users(session: Session) -> List[User]:
-    statement = select(User)
-    return session.exec(statement).all()
+def list_users(
+    session: Session,
+    params: PageParams,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+) -> Page:
+    return USER_LIST.page(session, params, *range_filter(User.created_at, created_from, created_to))
 
 # ----------------------------
 # 회원가입(신규 API용)
 # ----------------------------
-def register_user(
-    session: Session,
-    user_name: str,
-    user_login_id: str,
-    password: str
-) -> User:
-    # 중복 체크
-    if get_user_by_login_id(session, user_login_id):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="login_id already registered")
-
-    hashed_pw = get_password_hash(password)
+def _insert_user(session: Session, user_name: str, user_login_id: str, hashed_pw: str) -> User:
     user = User(
         user_name=user_name,
         user_login_id=user_login_id,
@@ -60,6 +59,19 @@ def register_user(
     session.refresh(user)
     return user
 
+async def register_user(
+    session: Session,
+    user_name: str,
+    user_login_id: str,
+    password: str
+) -> User:
+    # 중복 체크 (해시 계산 전에 먼저)
+    if await asyncio.to_thread(get_user_by_login_id, session, user_login_id):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="login_id already registered")
+
+    hashed_pw = await password_hasher.hash_password(password)
+    return await asyncio.to_thread(_insert_user, session, user_name, user_login_id, hashed_pw)
+
 # ----------------------------
 # 수정 / 삭제
 # ----------------------------
@@ -95,36 +107,52 @@ def update_user(
     session.add(user)
     session.commit()
     session.refresh(user)
+    # 캐시된 사용자 정보 삭제, 비밀번호/잠금이 바뀌면 세션도 끊는다
+    invalidate_user(user_id, drop_session=password is not None or bool(user_locked))
     return user
 
 def delete_user(session: Session, user_id: int) -> None:
     user = get_user_by_id(session, user_id)
     session.delete(user)
     session.commit()
+    invalidate_user(user_id, drop_session=True)
 
 # ----------------------------
 # 로그인
 # ----------------------------
-def signin(session: Session, login_id: str, pwd: str) -> Optional[User]:
-    user = get_user_by_login_id(session, login_id)
-    if not user:
-        return None
-    if user.user_locked:
-        return None
-    if not verify_password(pwd, user.user_login_pw):
+def _apply_login_result(session: Session, user: User, ok: bool, new_hash: Optional[str]) -> Optional[User]:
+    if not ok:
         user.user_failed_count += 1
         if user.user_failed_count >= MAX_FAILED_LOGIN:
             user.user_locked = True
         session.add(user)
         session.commit()
+        if user.user_locked:
+            invalidate_user(user.user_id, drop_session=True)
         return None
 
+    changed = False
     if user.user_failed_count != 0:
         user.user_failed_count = 0
+        changed = True
+    if new_hash is not None:
+        # 저장된 해시의 cost 가 BCRYPT_ROUNDS 와 다름 → 이번에 맞게 입력된 비밀번호로 재해시
+        user.user_login_pw = new_hash
+        changed = True
+    if changed:
         session.add(user)
         session.commit()
     return user
 
+async def signin(session: Session, login_id: str, pwd: str) -> Optional[User]:
+    user = await asyncio.to_thread(get_user_by_login_id, session, login_id)
+    if not user:
+        return None
+    if user.user_locked:
+        return None
+    ok, new_hash = await password_hasher.verify_password(pwd, user.user_login_pw)
+    return await asyncio.to_thread(_apply_login_result, session, user, ok, new_hash)
+
 # ----------------------------
 # 하위호환 래퍼(구 라우터용)
 # ----------------------------
@@ -0,0 +1,101 @@
+"""
+요청별 사용자 확인 지연 벤치마크 (user-014)
+
+토큰 1개로 get_current_user 를 N회(기본 5,000회) 호출
+  db     : JWT 검증 + DB 에서 사용자 조회 (캐시 없이 매번 get_user_by_id)
+  cached : get_current_user - JWT 검증 + Redis MGET 1회 (세션 + 사용자 캐시 적중)
+  miss   : get_current_user - 매번 캐시를 지워 DB 조회 + 캐시 기록까지 하는 경우
+
+Redis: --redis-url 을 주면 해당 서버, 없으면 fakeredis (pip install fakeredis)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_auth --n 5000
+  python -m benchmarks.bench_auth --redis-url redis://localhost:6379/15
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlmodel import Session, SQLModel
+
+from app.dependencies.auth import get_current_user, session_key, user_cache_key
+from app.dependencies.database import build_engine
+from app.dependencies.jwt_db import JWTUtil
+from app.models.user_models import User
+from app.services.user_service import get_user_by_id
+
+
+def _redis(url: str | None):
+    if url:
+        import redis
+        return redis.Redis.from_url(url, decode_responses=True)
+    import fakeredis
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def _timed_us(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) * 1e6 / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=5000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    redisDB = _redis(args.redis_url)
+    jwt = JWTUtil()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'users.db')}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            user = User(user_name="bench", user_login_id="bench", user_login_pw="x")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+            user_id = user.user_id
+
+        token = jwt.create_token({"user_id": user_id, "user_login_id": "bench", "user_name": "bench"})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        redisDB.setex(session_key(user_id), 3600, json.dumps({"access_token": token}))
+
+        with Session(engine) as session:
+            def db_path():
+                payload = jwt.decode_token(token)
+                get_user_by_id(session, payload["user_id"])
+                # 매 요청 새 세션과 같은 조건이 되도록 identity map 비움
+                session.expunge_all()
+
+            def cached_path():
+                get_current_user(credentials, session, redisDB)
+
+            def miss_path():
+                redisDB.delete(user_cache_key(user_id))
+                get_current_user(credentials, session, redisDB)
+                session.expunge_all()
+
+            get_current_user(credentials, session, redisDB)  # 캐시 채우기
+            results = {
+                "db": _timed_us(db_path, args.n),
+                "cached": _timed_us(cached_path, args.n),
+                "miss": _timed_us(miss_path, args.n),
+            }
+        engine.dispose()
+
+    print(f"n={args.n} redis={'fakeredis' if not args.redis_url else args.redis_url}")
+    for name, us in results.items():
+        print(f"{name:<7} {us:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
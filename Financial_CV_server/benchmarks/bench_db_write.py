@@ -0,0 +1,117 @@
+"""
+DB 쓰기 처리량 벤치마크 (user-001)
+
+비교 대상
+  legacy : 기존 방식 - 도메인별 파일 + create_engine 기본값 (rollback journal, synchronous=FULL)
+  tuned  : 공용 팩토리 - 도메인별 파일 + WAL/NORMAL/busy_timeout/mmap + 풀 크기 설정
+  single : 공용 팩토리 + 단일 파일 모드 (transaction/reminder 가 한 커넥션/한 커밋)
+
+워크로드: 스레드 N개가 동시에 '거래 1건 생성 + 리마인더 1건 생성'을 반복 (스케줄러와 같은 교차 도메인 쓰기)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_db_write --threads 8 --ops 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.dependencies.database import build_engine
+from app.models.transaction_models import Transaction
+from app.models.reminder_models import Reminder
+import app.models.user_models  # noqa: F401  (FK 대상 테이블 등록)
+import app.models.document_models  # noqa: F401
+
+
+def _legacy_engine(url: str):
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+
+def _make_engines(mode: str, workdir: str):
+    tx_url = f"sqlite:///{os.path.join(workdir, 'transaction.db')}"
+    rem_url = f"sqlite:///{os.path.join(workdir, 'reminders.db')}"
+    if mode == "legacy":
+        return _legacy_engine(tx_url), _legacy_engine(rem_url)
+    if mode == "tuned":
+        return build_engine(tx_url), build_engine(rem_url)
+    shared = build_engine(f"sqlite:///{os.path.join(workdir, 'financial_cv.db')}")
+    return shared, shared
+
+
+def _worker(tx_engine, rem_engine, ops: int, errors: list):
+    due = datetime.utcnow() + timedelta(hours=1)
+    for _ in range(ops):
+        try:
+            if tx_engine is rem_engine:
+                with Session(tx_engine) as sess:
+                    tx = Transaction(transaction_user_id=1, transaction_partner_id=1,
+                                     transaction_title="bench", transaction_balance=1000,
+                                     transaction_due=due)
+                    sess.add(tx)
+                    sess.flush()
+                    sess.add(Reminder(transaction_id=tx.transaction_id, reminder_user_id=1,
+                                      reminder_title="bench", due_at=due))
+                    sess.commit()
+            else:
+                with Session(tx_engine) as tx_sess, Session(rem_engine) as rem_sess:
+                    tx = Transaction(transaction_user_id=1, transaction_partner_id=1,
+                                     transaction_title="bench", transaction_balance=1000,
+                                     transaction_due=due)
+                    tx_sess.add(tx)
+                    tx_sess.commit()
+                    tx_sess.refresh(tx)
+                    rem_sess.add(Reminder(transaction_id=tx.transaction_id, reminder_user_id=1,
+                                          reminder_title="bench", due_at=due))
+                    rem_sess.commit()
+        except OperationalError as e:
+            errors.append(str(e.orig))
+
+
+def run(mode: str, threads: int, ops: int) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        tx_engine, rem_engine = _make_engines(mode, workdir)
+        SQLModel.metadata.create_all(tx_engine)
+        if rem_engine is not tx_engine:
+            SQLModel.metadata.create_all(rem_engine)
+
+        errors: list = []
+        workers = [threading.Thread(target=_worker, args=(tx_engine, rem_engine, ops, errors))
+                   for _ in range(threads)]
+        t0 = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - t0
+
+        tx_engine.dispose()
+        rem_engine.dispose()
+
+    done = threads * ops - len(errors)
+    return {"mode": mode, "elapsed_s": elapsed, "ops_per_s": done / elapsed, "errors": len(errors)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=200, help="스레드당 교차 도메인 쓰기 횟수")
+    parser.add_argument("--modes", default="legacy,tuned,single")
+    args = parser.parse_args()
+
+    print(f"threads={args.threads} ops/thread={args.ops}")
+    print(f"{'mode':<8} {'elapsed(s)':>10} {'ops/s':>10} {'errors':>7}")
+    for mode in args.modes.split(","):
+        r = run(mode, args.threads, args.ops)
+        print(f"{r['mode']:<8} {r['elapsed_s']:>10.2f} {r['ops_per_s']:>10.1f} {r['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
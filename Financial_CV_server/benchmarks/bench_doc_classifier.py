@@ -0,0 +1,143 @@
+"""
+로컬 서류 종류 분류기 벤치마크 (user-025)
+
+저장된 문서(Document.document_content = 8개 key-value 텍스트)를 흉내 낸 합성 문서 --docs 건을 임시 SQLite 에 넣고
+  1) 학습 CLI 실행: python -m app.services.doc_classifier train --db-url <임시 DB> --out <임시 모델>
+     (층화 holdout 정확도/클래스별 재현율/혼동행렬/문서당 지연 출력 + 모델 파일 저장)
+  2) 저장된 모델을 다시 로드해서 다른 seed 로 만든 새 문서 --fresh 건 정확도, 문서당 분류 지연 p50/p99
+  3) GPT 프롬프트 크기: 분류+추출(INSTRUCTIONS_TEXT) vs 추출 전용(INSTRUCTIONS_EXTRACT)
+합성 문서: bench_rule_extract 의 정형 문서 5종 + 거래내역서, 종류마다 제목 여러 개(일부는 종류끼리 겹침),
+필드마다 --blank-rate 확률로 빈 값, --label-noise 확률로 정답 라벨을 다른 종류로 (사용자 수정/오분류 흉내)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_doc_classifier --docs 1500
+"""
+import argparse
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 종류별 제목 후보 ("결제 안내", "납부 확인" 처럼 종류끼리 겹치는 제목 포함)
+TITLES = {
+    0: ("정기결제 안내", "구독 갱신 안내", "도시가스 요금 고지서", "관리비 고지서", "자동납부 내역", "결제 안내", "납부 확인"),
+    1: ("전자세금계산서", "세금계산서", "거래명세서", "청구서", "INVOICE", "납품 송장", "결제 안내"),
+    2: ("이체확인증", "송금확인증", "이체결과", "입금확인", "송금 완료", "납부 확인"),
+    3: ("거래내역조회", "입출금 거래내역", "통장 거래내역", "계좌 거래명세", "거래내역서"),
+    4: ("카드 이용대금 명세서", "카드명세서", "이용대금 청구서", "결제 예정 금액 안내", "결제 안내"),
+}
+
+
+def _statement(rng):
+    from benchmarks.bench_rule_extract import BANKS, _account, _date, _expected
+
+    bank = rng.choice(BANKS)
+    return None, _expected("은행 거래내역서", f"{bank} 거래내역", rng.randint(1, 900) * 1000, "", bank,
+                           _account(rng), "", _date(rng))
+
+
+def make_documents(docs: int, blank_rate: float, label_noise: float, seed: int) -> list:
+    """[(document_content, document_classification_id)] - content 는 서류 종류 줄 포함 8줄 (저장 형식 그대로)"""
+    from app.services.ocr_to_document import CATEGORY_LABELS, _classify_id_from_label
+    from app.services.rule_extractor import KV_KEYS
+    from benchmarks.bench_rule_extract import REGULAR_KINDS
+
+    generators = [gen for kind, gen in sorted(REGULAR_KINDS.items()) if kind != "transfer_words"] + [_statement]
+    rng = random.Random(seed)
+    out = []
+    for _ in range(docs):
+        _, fields = rng.choice(generators)(rng)
+        cid = _classify_id_from_label(fields["document_classification_label"])
+        fields["document_title"] = rng.choice(TITLES[cid])
+        for key in fields:
+            if key != "document_classification_label" and rng.random() < blank_rate:
+                fields[key] = ""
+        if rng.random() < label_noise:
+            cid = rng.choice([c for c in range(len(CATEGORY_LABELS)) if c != cid])
+        fields["document_classification_label"] = CATEGORY_LABELS[cid]
+        out.append(("\n".join(f"{key} : {fields[std_key]}" for key, std_key in KV_KEYS), cid))
+    return out
+
+
+def _write_db(path: str, documents: list):
+    from datetime import date, datetime, timedelta, timezone
+
+    from sqlalchemy import insert
+    from sqlmodel import SQLModel, create_engine
+
+    from app.models.document_models import Document
+    import app.models.user_models  # noqa: F401
+
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Document), [
+            {"document_user_id": 1, "document_title": "", "document_balance": 0, "document_partner": "",
+             "document_bank": "", "document_account_number": "", "document_partner_number": "",
+             "document_due": date(2025, 1, 1), "created_at": datetime(2025, 1, 1, 9, tzinfo=timezone(timedelta(hours=9))),
+             "document_classification_id": cid, "document_partner_id": 0, "document_content": content,
+             "document_path": None}
+            for content, cid in documents
+        ])
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=1500)
+    parser.add_argument("--fresh", type=int, default=1000)
+    parser.add_argument("--blank-rate", type=float, default=0.2)
+    parser.add_argument("--label-noise", type=float, default=0.03)
+    parser.add_argument("--seed", type=int, default=25)
+    args = parser.parse_args()
+
+    from app.dependencies.llm_ocr import INSTRUCTIONS_EXTRACT, INSTRUCTIONS_TEXT
+    from app.services.doc_classifier import DocClassifier, evaluate
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path, model_path = os.path.join(workdir, "documents.db"), os.path.join(workdir, "doc_classifier.npz")
+        _write_db(db_path, make_documents(args.docs, args.blank_rate, args.label_noise, args.seed))
+
+        t0 = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, "-m", "app.services.doc_classifier", "train", "--db-url", f"sqlite:///{db_path}",
+             "--out", model_path, "--seed", str(args.seed)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        train_s = time.perf_counter() - t0
+        print(out.stdout.rstrip())
+        model_kb = os.path.getsize(model_path) / 1024
+
+        t0 = time.perf_counter()
+        model = DocClassifier.load(model_path)
+        load_ms = (time.perf_counter() - t0) * 1000
+        # 새 문서는 라벨 잡음 없이 (정확도 = 분류기 자체)
+        fresh = make_documents(args.fresh, args.blank_rate, 0.0, args.seed + 1)
+        report = evaluate(model, [c for c, _ in fresh], [cid for _, cid in fresh])
+
+        samples = []
+        for content, _ in fresh[:200]:
+            t0 = time.perf_counter()
+            model.label_kv(content)   # GPT 결과에 서류 종류 줄을 붙이는 실제 호출 경로
+            samples.append((time.perf_counter() - t0) * 1e6)
+
+    print(f"\ndocs={args.docs} blank={args.blank_rate} label_noise={args.label_noise} "
+          f"train(CLI, 프로세스 시작 포함)={train_s:.1f}s model={model_kb:.0f}KB load={load_ms:.0f}ms")
+    print(f"fresh {args.fresh}건: accuracy={report['accuracy']} predict p50={report['latency_us']['p50']}us "
+          f"p99={report['latency_us']['p99']}us / label_kv p50={statistics.median(samples):.0f}us")
+    for label, r in report["per_class"].items():
+        print(f"  {label:<14} recall={r['recall']} precision={r['precision']}")
+    full, extract = INSTRUCTIONS_TEXT.encode(), INSTRUCTIONS_EXTRACT.encode()
+    print(f"prompt: 분류+추출 {len(full)}B → 추출 전용 {len(extract)}B ({1 - len(extract) / len(full):.0%} 감소), "
+          f"출력 8줄 → 7줄")
+
+
+if __name__ == "__main__":
+    main()
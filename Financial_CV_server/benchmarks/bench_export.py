@@ -0,0 +1,187 @@
+"""
+대용량 목록 스트리밍 벤치마크 (user-008)
+
+문서 N건(기본 100,000)을 한 번에 내려받을 때 첫 바이트까지 시간(TTFB), 전체 시간, 서버 프로세스 최대 RSS 증가량 비교
+  legacy      : 기존 방식 - select(Document).all() → CustomJSONResponse
+  stream-json : GET /documents/export?format=json  (전체 컬럼, legacy 와 바이트 단위로 같은 출력인지 확인)
+  stream-nd   : GET /documents/export              (NDJSON, 기본 필드 - document_content 제외)
+
+모드마다 새 프로세스에서 실제 HTTP(uvicorn)로 측정 (RSS 는 프로세스 생애 최대값 기준)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_export --rows 100000
+"""
+import argparse
+import hashlib
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ALL_DOCUMENT_FIELDS = (
+    "document_id,document_user_id,document_title,document_balance,document_partner,document_bank,"
+    "document_account_number,document_partner_number,document_due,created_at,"
+    "document_classification_id,document_partner_id,document_content,document_path"
+)
+
+
+def _seed(db_path: str, rows: int):
+    from sqlalchemy import create_engine, insert
+    from sqlmodel import SQLModel
+
+    from app.models.document_models import Document
+    import app.models.user_models  # noqa: F401
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine)
+    base = datetime(2025, 1, 1, 9, 0, 0)
+    content = "\n".join([
+        "서류 종류 : 이체 및 송금 전표", "제목 : 이체확인증", "거래금액 : 150000", "거래대상 : 홍길동",
+        "계좌 은행 : 국민은행", "계좌번호 : 123-456-789012", "거래대상 계좌번호 : 110-222-333444", "지불기일 : 2025-03-14",
+    ])
+    batch = []
+    with engine.begin() as conn:
+        for i in range(rows):
+            batch.append({
+                "document_user_id": 1,
+                "document_title": f"이체확인증 {i}",
+                "document_balance": 150000 + i,
+                "document_partner": "홍길동",
+                "document_bank": "국민은행",
+                "document_account_number": "123-456-789012",
+                "document_partner_number": "110-222-333444",
+                "document_due": date(2025, 3, 14),
+                "created_at": base + timedelta(seconds=i),
+                "document_classification_id": i % 5,
+                "document_partner_id": 1,
+                "document_content": content,
+                "document_path": None,
+            })
+            if len(batch) == 5000:
+                conn.execute(insert(Document), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Document), batch)
+    engine.dispose()
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _worker(mode: str) -> dict:
+    import httpx
+    import uvicorn
+    from fastapi import Depends, FastAPI
+    from fastapi.responses import JSONResponse
+    from sqlmodel import Session, select
+
+    import app.models.user_models  # noqa: F401
+    from app.dependencies.document_db import get_document_session
+    from app.dependencies.json_encoding import dumps
+    from app.models.document_models import Document
+    from app.routers import document_router
+
+    class CustomJSONResponse(JSONResponse):
+        # main.CustomJSONResponse 와 동일 (main 은 torch 를 import 해서 직접 가져오지 않음)
+        def render(self, content) -> bytes:
+            return dumps(content)
+
+    app = FastAPI(default_response_class=CustomJSONResponse)
+    app.include_router(document_router.router)
+
+    @app.get("/legacy/documents")
+    def legacy_documents(session: Session = Depends(get_document_session)):
+        # 라우트 반환값은 FastAPI 가 먼저 jsonable_encoder 로 바꾸므로 응답 객체를 직접 반환해 render 만 거치게 한다
+        return CustomJSONResponse(session.exec(select(Document)).all())
+
+    path = {
+        "legacy": "/legacy/documents",
+        "stream-json": f"/documents/export?format=json&fields={ALL_DOCUMENT_FIELDS}",
+        "stream-nd": "/documents/export",
+    }[mode]
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    baseline_kb = _rss_kb()
+    digest = hashlib.sha256()
+    size = 0
+    with httpx.Client(timeout=600) as client:
+        t0 = time.perf_counter()
+        ttfb = None
+        with client.stream("GET", f"http://127.0.0.1:{port}{path}") as r:
+            r.raise_for_status()
+            for chunk in r.iter_raw():
+                if ttfb is None:
+                    ttfb = time.perf_counter() - t0
+                digest.update(chunk)
+                size += len(chunk)
+        total = time.perf_counter() - t0
+
+    server.should_exit = True
+    thread.join(timeout=5)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "ttfb": ttfb, "total": total, "bytes": size, "sha256": digest.hexdigest(),
+        "peak_delta_mb": (peak_kb - baseline_kb) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--worker", choices=["legacy", "stream-json", "stream-nd"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker)))
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "bench.db")
+        t0 = time.perf_counter()
+        _seed(db_path, args.rows)
+        print(f"rows={args.rows} (seed {time.perf_counter() - t0:.1f}s)")
+
+        env = dict(os.environ, DB_SINGLE_FILE="true", DATABASE_URL=f"sqlite:///{db_path}")
+        results = {}
+        for mode in ("legacy", "stream-json", "stream-nd"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_export", "--worker", mode],
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                env=env, capture_output=True, text=True, check=True,
+            )
+            results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    print(f"{'mode':<12} {'ttfb(ms)':>10} {'total(s)':>9} {'MB sent':>8} {'peak RSS +MB':>13}")
+    for mode, r in results.items():
+        print(f"{mode:<12} {r['ttfb'] * 1000:>10.1f} {r['total']:>9.2f} {r['bytes'] / 1e6:>8.1f} {r['peak_delta_mb']:>13.1f}")
+    same = results["legacy"]["sha256"] == results["stream-json"]["sha256"]
+    print(f"legacy == stream-json output: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+첨부 파일 전송 벤치마크 (user-018)
+
+게시글 1개에 이미지 N개(기본 20개 x 2MB) + 큰 파일 1개(기본 50MB)를 두고 실제 HTTP(uvicorn)로 측정
+  legacy : 기존 방식 - FileResponse(file.url) / zip 은 BytesIO 에 아카이브 전체를 만든 뒤 응답
+  new    : GET /v1/post/files/{id} (ETag/304/Range) / GET /v1/post/{id}/files.zip (스트리밍)
+측정
+  revisit : 페이지 재진입 R회(기본 10) - 이전 응답의 ETag 로 If-None-Match 전송, 회당 지연과 받은 바이트
+  range   : 큰 파일의 마지막 1MB 요청 (Range: bytes=-1048576) 상태 코드와 받은 바이트
+  zip     : 전체 zip 다운로드 시간, 서버 프로세스 최대 RSS 증가량
+
+모드마다 새 프로세스에서 측정 (RSS 는 프로세스 생애 최대값 기준)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_file_serving --files 20 --file-mb 2 --big-mb 50 --revisits 10
+"""
+import argparse
+import hashlib
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+POST_ID = 1
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _seed(files: int, file_mb: int, big_mb: int):
+    from sqlmodel import Session
+
+    from app.dependencies import blob_store
+    from app.dependencies.file_db import create_file_db, file_db_engine
+    from app.models.file_models import Files
+
+    create_file_db()
+    sizes = [file_mb] * files + [big_mb]
+    with Session(file_db_engine) as session:
+        for i, size_mb in enumerate(sizes):
+            tmp = blob_store.temp_path()
+            digest = hashlib.sha256()
+            with open(tmp, "wb") as f:
+                for _ in range(size_mb):
+                    chunk = os.urandom(1024 * 1024)
+                    digest.update(chunk)
+                    f.write(chunk)
+            sha256 = digest.hexdigest()
+            is_big = i == len(sizes) - 1
+            session.add(Files(
+                post_id=POST_ID, url=blob_store.store_blob(tmp, sha256), created_at=int(time.time()),
+                file_name="big.pdf" if is_big else f"receipt{i}.jpg", file_size=size_mb * 1024 * 1024,
+                content_type="application/pdf" if is_big else "image/jpeg", sha256=sha256,
+            ))
+        session.commit()
+
+
+def _worker(mode: str, revisits: int) -> dict:
+    import io
+    import zipfile
+
+    import httpx
+    import uvicorn
+    from fastapi import Depends, FastAPI
+    from fastapi.responses import FileResponse, Response
+    from sqlmodel import select
+
+    from app.dependencies.file_db import get_files_session
+    from app.models.file_models import Files
+    from app.routers import file_router
+
+    app = FastAPI()
+    app.include_router(file_router.router)
+
+    @app.get("/legacy/files/{file_id}")
+    def legacy_file(file_id: int, file_db=Depends(get_files_session)):
+        # 변경 전 FileService.get_file 과 같은 응답
+        return FileResponse(file_db.get(Files, file_id).url)
+
+    @app.get("/legacy/{post_id}/files.zip")
+    def legacy_zip(post_id: int, file_db=Depends(get_files_session)):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as archive:
+            for file in file_db.exec(select(Files).filter(Files.post_id == post_id)).all():
+                archive.write(file.url, file.file_name)
+        return Response(buf.getvalue(), media_type="application/zip")
+
+    prefix = "/legacy" if mode == "legacy" else "/v1/post"
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    result = {}
+    with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=600) as client:
+        file_ids = sorted(row["file_id"] for row in client.get(f"/v1/post/{POST_ID}/files").json())
+        image_ids, big_id = file_ids[:-1], file_ids[-1]
+
+        # zip (RSS 기준선은 zip 전에)
+        baseline_kb = _rss_kb()
+        t0 = time.perf_counter()
+        size = 0
+        with client.stream("GET", f"{prefix}/{POST_ID}/files.zip") as r:
+            r.raise_for_status()
+            for chunk in r.iter_raw():
+                size += len(chunk)
+        result["zip_s"] = time.perf_counter() - t0
+        result["zip_mb"] = size / 1e6
+        result["zip_peak_delta_mb"] = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) / 1024
+
+        # 첫 방문 → ETag 기억
+        etags = {}
+        for file_id in image_ids:
+            r = client.get(f"{prefix}/files/{file_id}")
+            r.raise_for_status()
+            etags[file_id] = r.headers.get("etag")
+
+        received = 0
+        statuses = set()
+        t0 = time.perf_counter()
+        for _ in range(revisits):
+            for file_id in image_ids:
+                headers = {"If-None-Match": etags[file_id]} if etags[file_id] else {}
+                r = client.get(f"{prefix}/files/{file_id}", headers=headers)
+                statuses.add(r.status_code)
+                received += len(r.content)
+        result["revisit_ms"] = (time.perf_counter() - t0) * 1000 / max(1, revisits)
+        result["revisit_mb"] = received / 1e6
+        result["revisit_status"] = sorted(statuses)
+
+        t0 = time.perf_counter()
+        r = client.get(f"{prefix}/files/{big_id}", headers={"Range": "bytes=-1048576"})
+        result["range_ms"] = (time.perf_counter() - t0) * 1000
+        result["range_status"] = r.status_code
+        result["range_mb"] = len(r.content) / 1e6
+
+    server.should_exit = True
+    thread.join(timeout=5)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--file-mb", type=int, default=2)
+    parser.add_argument("--big-mb", type=int, default=50)
+    parser.add_argument("--revisits", type=int, default=10)
+    parser.add_argument("--worker", choices=["legacy", "new"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.revisits)))
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, DB_SINGLE_FILE="true", DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'file.db')}",
+                   FILE_STORAGE_DIR=os.path.join(workdir, "store"))
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        # 시드는 같은 환경변수로 별도 프로세스에서 (저장 위치/DB 는 import 시점에 결정)
+        subprocess.run(
+            [sys.executable, "-c",
+             f"from benchmarks.bench_file_serving import _seed; _seed({args.files}, {args.file_mb}, {args.big_mb})"],
+            cwd=root, env=env, check=True,
+        )
+        print(f"files={args.files} x {args.file_mb}MB + {args.big_mb}MB, revisits={args.revisits}")
+
+        results = {}
+        for mode in ("legacy", "new"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_file_serving", "--worker", mode,
+                 "--revisits", str(args.revisits)],
+                cwd=root, env=env, capture_output=True, text=True, check=True,
+            )
+            results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    print(f"{'mode':<7} {'revisit ms':>11} {'revisit MB':>11} {'status':>10} "
+          f"{'range ms':>9} {'range MB':>9} {'zip s':>7} {'zip RSS +MB':>12}")
+    for mode, r in results.items():
+        print(f"{mode:<7} {r['revisit_ms']:>11.1f} {r['revisit_mb']:>11.1f} {str(r['revisit_status']):>10} "
+              f"{r['range_ms']:>9.1f} {r['range_mb']:>9.1f} {r['zip_s']:>7.2f} {r['zip_peak_delta_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
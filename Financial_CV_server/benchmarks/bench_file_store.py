@@ -0,0 +1,141 @@
+"""
+첨부 파일 저장소 벤치마크 (user-017)
+
+1) 중복 저장: 같은 영수증 이미지를 게시글 R개(기본 20)에 업로드했을 때 디스크 사용량
+   legacy : app/files/{post_id}_{file_name} 에 게시글마다 1벌
+   blob   : FileService.save_uploads - sha256 기준 1벌 (참조 수는 Files 행 수)
+2) 파생 이미지: 목록 화면 썸네일을 N회(기본 50) 요청할 때 회당 지연
+   legacy : 매번 원본 전체 디코딩 후 축소
+   cached : blob_store.get_derivative - 첫 요청에서만 생성 (draft 디코딩), 이후 파일 경로 반환
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_file_store --repeats 20 --n 50 --width 4000 --height 3000
+"""
+import argparse
+import asyncio
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _make_receipt(path: str, width: int, height: int):
+    from PIL import Image, ImageDraw
+
+    # 노이즈 배경 + 글자 비슷한 줄 (JPEG 압축이 너무 잘 되지 않도록)
+    base = Image.merge("RGB", [Image.effect_noise((width, height), 40) for _ in range(3)])
+    draw = ImageDraw.Draw(base)
+    for y in range(100, height - 100, 60):
+        draw.rectangle((100, y, width - 100, y + 20), fill=(20, 20, 20))
+    base.save(path, "JPEG", quality=90)
+
+
+def _disk_usage(root: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+def _timed_ms(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) * 1000 / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--n", type=int, default=50)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    try:
+        # 저장 위치는 import 시점에 읽으므로 먼저 설정
+        os.environ["FILE_STORAGE_DIR"] = os.path.join(workdir, "store")
+        from PIL import Image, ImageOps
+        from sqlmodel import Session, SQLModel, select
+        from starlette.datastructures import Headers, UploadFile
+
+        from app.dependencies import blob_store
+        from app.dependencies.database import build_engine
+        from app.models.file_models import Files
+        from app.services.file_service import FileService
+
+        receipt = os.path.join(workdir, "receipt.jpg")
+        _make_receipt(receipt, args.width, args.height)
+        with open(receipt, "rb") as f:
+            data = f.read()
+        print(f"receipt {args.width}x{args.height} JPEG {len(data) / 1e6:.1f}MB, repeats={args.repeats}, n={args.n}")
+
+        # 1) 중복 저장
+        legacy_dir = os.path.join(workdir, "legacy")
+        os.makedirs(legacy_dir)
+        for post_id in range(args.repeats):
+            with open(os.path.join(legacy_dir, f"{post_id}_receipt.jpg"), "wb") as f:
+                f.write(data)
+
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'file.db')}")
+        SQLModel.metadata.create_all(engine)
+        service = FileService()
+        with Session(engine) as session:
+            for post_id in range(args.repeats):
+                upload = UploadFile(io.BytesIO(data), filename="receipt.jpg",
+                                    headers=Headers({"content-type": "image/jpeg"}))
+                saved = asyncio.run(service.save_uploads(post_id, session, [upload]))
+            sha256 = saved[0].sha256
+            file_id = saved[0].file_id
+
+        print(f"{'store':<7} {'files':>6} {'disk MB':>8}")
+        print(f"{'legacy':<7} {args.repeats:>6} {_disk_usage(legacy_dir) / 1e6:>8.1f}")
+        print(f"{'blob':<7} {args.repeats:>6} {_disk_usage(blob_store.BLOB_DIR) / 1e6:>8.1f}")
+
+        # 2) 파생 이미지
+        def legacy_derivative(kind: str):
+            spec = blob_store.DERIVATIVES[kind]
+            with Image.open(receipt) as im:
+                out = ImageOps.exif_transpose(im).convert(spec.mode)
+            out.thumbnail((spec.max_side, spec.max_side), Image.LANCZOS)
+            buf = io.BytesIO()
+            out.save(buf, spec.format)
+
+        print(f"{'kind':<10} {'legacy ms':>10} {'first ms':>9} {'cached ms':>10}")
+        with Session(engine) as session:
+            for kind in blob_store.DERIVATIVES:
+                legacy_ms = _timed_ms(lambda: legacy_derivative(kind), max(1, args.n // 5))
+                t0 = time.perf_counter()
+                service.get_derivative(file_id, kind, session)
+                first_ms = (time.perf_counter() - t0) * 1000
+
+                def cached():
+                    path, _, _ = service.get_derivative(file_id, kind, session)
+                    with open(path, "rb") as f:
+                        f.read()
+
+                cached_ms = _timed_ms(cached, args.n)
+                print(f"{kind:<10} {legacy_ms:>10.1f} {first_ms:>9.1f} {cached_ms:>10.3f}")
+
+        # 삭제 시 참조 수가 0 이 되어야 원본 삭제
+        with Session(engine) as session:
+            for post_id in range(args.repeats - 1):
+                service.delete_files(post_id, session)
+            still_there = os.path.exists(blob_store.blob_path(sha256))
+            service.delete_files(args.repeats - 1, session)
+            gone = not os.path.exists(blob_store.blob_path(sha256))
+            rows = len(session.exec(select(Files)).all())
+        print(f"refcount: blob kept while referenced={still_there}, removed after last delete={gone}, rows left={rows}")
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
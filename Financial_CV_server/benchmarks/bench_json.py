@@ -0,0 +1,143 @@
+"""
+CustomJSONResponse 직렬화 마이크로벤치마크 (user-009)
+
+Document / Transaction / Reminder 목록 payload N건(기본 1,000)을 직렬화하는 시간 비교
+  legacy : 기존 render - jsonable_encoder(custom_encoder=날짜 형식) + json.dumps
+  orjson : json_encoding.dumps (orjson 설치 시)
+  json   : json_encoding.dumps 표준 json 경로 (JSON_ENCODER=json 과 동일)
+
+payload 종류
+  rows   : 목록 API 가 돌려주는 행 dict 목록 (날짜는 datetime/date 객체 그대로)
+  models : SQLModel 인스턴스 목록
+rows 는 세 방식의 출력이 JSON 값으로 같은지도 확인 (legacy 는 구분자 공백만 다름)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_json --n 1000 --repeat 20
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+
+from app.dependencies import json_encoding
+from app.models.document_models import Document
+from app.models.reminder_models import Reminder
+from app.models.transaction_models import Transaction
+import app.models.user_models  # noqa: F401
+
+
+def _legacy(content) -> bytes:
+    encoded = jsonable_encoder(
+        content,
+        custom_encoder={
+            datetime: lambda v: v.strftime("%Y-%m-%d/%H:%M:%S"),
+            date: lambda v: v.strftime("%Y-%m-%d"),
+        },
+    )
+    return json.dumps(encoded, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+def _stdlib(content) -> bytes:
+    use_orjson = json_encoding.USE_ORJSON
+    json_encoding.USE_ORJSON = False
+    try:
+        return json_encoding.dumps(content)
+    finally:
+        json_encoding.USE_ORJSON = use_orjson
+
+
+def _payloads(n: int) -> dict:
+    base = datetime(2025, 1, 1, 9, 0, 0)
+    content = "서류 종류 : 이체 및 송금 전표\n제목 : 이체확인증\n거래금액 : 150000\n거래대상 : 홍길동"
+    documents = [
+        Document(
+            document_id=i,
+            document_user_id=1,
+            document_title=f"이체확인증 {i}",
+            document_balance=150000 + i,
+            document_partner="홍길동",
+            document_bank="국민은행",
+            document_account_number="123-456-789012",
+            document_partner_number="110-222-333444",
+            document_due=date(2025, 3, 14),
+            created_at=base + timedelta(seconds=i),
+            document_classification_id=i % 5,
+            document_partner_id=1,
+            document_content=content,
+        )
+        for i in range(n)
+    ]
+    transactions = [
+        Transaction(
+            transaction_id=i,
+            transaction_user_id=1,
+            transaction_partner_id=2,
+            transaction_title=f"월세 {i}",
+            transaction_balance=500000,
+            transaction_due=base + timedelta(days=i % 30),
+            transaction_close=bool(i % 2),
+            transaction_recurring=bool(i % 3 == 0),
+            created_at=base + timedelta(seconds=i),
+        )
+        for i in range(n)
+    ]
+    reminders = [
+        Reminder(
+            reminder_id=i,
+            transaction_id=i,
+            reminder_user_id=1,
+            reminder_title=f"월세 {i} 만기 알림",
+            due_at=base + timedelta(hours=i % 48),
+            status=False,
+            created_at=base + timedelta(seconds=i),
+        )
+        for i in range(n)
+    ]
+    models = {"Document": documents, "Transaction": transactions, "Reminder": reminders}
+    payloads = {}
+    for name, items in models.items():
+        payloads[f"{name} rows"] = [item.model_dump() for item in items]
+        payloads[f"{name} models"] = items
+    return payloads
+
+
+def _best_ms(fn, content, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    encoders = {"legacy": _legacy, "json": _stdlib}
+    if json_encoding.USE_ORJSON:
+        encoders["orjson"] = json_encoding.dumps
+
+    print(f"n={args.n} repeat={args.repeat} (best of, ms)")
+    print(f"{'payload':<20}" + "".join(f"{name:>10}" for name in encoders) + f"{'speedup':>10}")
+    for label, content in _payloads(args.n).items():
+        times = {name: _best_ms(fn, content, args.repeat) for name, fn in encoders.items()}
+        fastest = min(t for name, t in times.items() if name != "legacy")
+        print(f"{label:<20}" + "".join(f"{t:>10.2f}" for t in times.values()) + f"{times['legacy'] / fastest:>9.1f}x")
+
+        if label.endswith("rows"):
+            expected = json.loads(_legacy(content))
+            for name, fn in encoders.items():
+                assert json.loads(fn(content)) == expected, f"{label}: {name} output differs from legacy"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+계좌 원장 조회 벤치마크 (user-012)
+
+계좌 1개에 분개 N건(기본 200,000건, 1분 간격)을 넣고 비교
+  current      : 현재 잔액 - Account.account_balance 1행 조회 (materialized)
+  at (snap)    : 시점 T 잔액 - ledger_service.balance_at (스냅샷 1개 + 최대 LEDGER_SNAPSHOT_EVERY 건 합계)
+  at (full)    : 시점 T 잔액 - 스냅샷 없이 처음부터 T 까지 분개 합계
+  statement    : 30일 기간 요약 - ledger_service.statement
+  post         : 이체 1건 쓰기 비용 (apply_transfer + 분개 2행, 스냅샷 포함)
+at (snap) 과 at (full) 결과가 같은지도 확인
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_ledger --postings 200000 --queries 200
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, insert
+from sqlmodel import Session, SQLModel, select
+
+from app.dependencies.database import begin_write, build_engine
+from app.models.account_models import Account, AccountBalanceSnapshot, AccountPosting
+from app.services.account_service import apply_transfer
+from app.services.ledger_service import LEDGER_SNAPSHOT_EVERY, balance_at, statement
+import app.models.user_models  # noqa: F401  (FK 대상 테이블 등록)
+
+BASE = datetime(2024, 1, 1, 9, 0, 0)
+
+
+def _seed(engine, postings: int) -> tuple:
+    """post() 가 남기는 것과 같은 모양으로 분개/스냅샷을 한 번에 적재"""
+    rnd = random.Random(0)
+    with Session(engine) as session:
+        account = Account(account_user_id=1, account_number="300-0000", account_bank="bench",
+                          account_balance=0, created_at=BASE)
+        other = Account(account_user_id=1, account_number="300-0001", account_bank="bench",
+                        account_balance=10 ** 12, created_at=BASE)
+        session.add(account)
+        session.add(other)
+        session.commit()
+        account_id, other_id = account.account_id, other.account_id
+
+    balance = 0
+    rows, snapshots = [], []
+    with engine.begin() as conn:
+        for i in range(1, postings + 1):
+            amount = rnd.randint(1, 100_000) if balance < 100_000 or rnd.random() < 0.5 else -rnd.randint(1, 100_000)
+            balance += amount
+            created_at = BASE + timedelta(minutes=i)
+            rows.append({"posting_id": i, "account_id": account_id, "amount": amount,
+                         "kind": "transfer_in" if amount > 0 else "transfer_out", "created_at": created_at})
+            if i % LEDGER_SNAPSHOT_EVERY == 0:
+                snapshots.append({"account_id": account_id, "balance": balance, "last_posting_id": i, "as_of": created_at})
+            if len(rows) == 10_000:
+                conn.execute(insert(AccountPosting), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(AccountPosting), rows)
+        if snapshots:
+            conn.execute(insert(AccountBalanceSnapshot), snapshots)
+        conn.execute(Account.__table__.update().where(Account.account_id == account_id).values(account_balance=balance))
+    return account_id, other_id
+
+
+def _full_scan(session: Session, account_id: int, at: datetime) -> int:
+    return session.exec(
+        select(func.coalesce(func.sum(AccountPosting.amount), 0))
+        .where(AccountPosting.account_id == account_id, AccountPosting.created_at <= at)
+    ).one()
+
+
+def _timed_ms(fn, items) -> float:
+    t0 = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - t0) * 1000 / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--postings", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--writes", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'accounts.db')}")
+        SQLModel.metadata.create_all(engine)
+        t0 = time.perf_counter()
+        account_id, other_id = _seed(engine, args.postings)
+        print(f"postings={args.postings} snapshot_every={LEDGER_SNAPSHOT_EVERY} (seed {time.perf_counter() - t0:.1f}s)")
+
+        rnd = random.Random(1)
+        points = [BASE + timedelta(minutes=rnd.randint(1, args.postings)) for _ in range(args.queries)]
+
+        with Session(engine) as session:
+            current = _timed_ms(lambda _: session.exec(
+                select(Account.account_balance).where(Account.account_id == account_id)).one(), points)
+            snap = _timed_ms(lambda at: balance_at(session, account_id, at), points)
+            full = _timed_ms(lambda at: _full_scan(session, account_id, at), points)
+            stmt = _timed_ms(lambda at: statement(session, account_id, at, at + timedelta(days=30)), points)
+            mismatched = sum(1 for at in points if balance_at(session, account_id, at) != _full_scan(session, account_id, at))
+
+        def write(_):
+            with Session(engine) as session:
+                begin_write(session)
+                apply_transfer(session, other_id, account_id, 1_000)
+                session.commit()
+
+        post_ms = _timed_ms(write, range(args.writes))
+        engine.dispose()
+
+    print(f"current balance : {current:8.3f} ms")
+    print(f"at (snapshot)   : {snap:8.3f} ms")
+    print(f"at (full scan)  : {full:8.3f} ms")
+    print(f"statement 30d   : {stmt:8.3f} ms")
+    print(f"transfer write  : {post_ms:8.3f} ms (ledger + snapshot)")
+    print(f"snapshot == full scan: {mismatched == 0}")
+
+
+if __name__ == "__main__":
+    main()
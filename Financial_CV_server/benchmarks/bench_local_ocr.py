@@ -0,0 +1,85 @@
+"""
+로컬 EasyOCR 지연 벤치마크 (user-019)
+
+같은 이미지(기본 ocr_test_doc_en.png)를 N회(기본 5회) OCR
+  legacy : 기존 run_easyocr_ocr 방식 - 호출마다 easyocr.Reader 생성(모델 로드) 후 readtext
+  pool   : local_ocr.recognize - 시작 시 워커에서 리더 미리 로드, 이후 호출은 readtext 만
+           (캐시 효과를 빼기 위해 OCR_CACHE_BACKEND=none)
+측정: 준비 시간(풀 시작 + 리더 로드), 호출당 지연(평균/최대), 동시 C개 요청 처리 시간
+
+실행: (Financial_CV_server 디렉터리에서, easyocr 모델이 내려받아져 있어야 함)
+  python -m benchmarks.bench_local_ocr --n 5 --concurrency 4 --workers 2
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--image", default=os.path.join(ROOT, "ocr_test_doc_en.png"))
+    parser.add_argument("--n", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--languages", default="ko,en")
+    args = parser.parse_args()
+
+    # 모듈 상수는 import 시점에 읽으므로 먼저 설정
+    os.environ["OCR_CACHE_BACKEND"] = "none"
+    os.environ["EASYOCR_WORKERS"] = str(args.workers)
+    os.environ["EASYOCR_LANGUAGES"] = args.languages
+    import easyocr
+
+    from app.dependencies import local_ocr
+    from app.dependencies.ocr import preprocess_image
+
+    languages = args.languages.split(",")
+    with open(args.image, "rb") as f:
+        image_bytes = f.read()
+
+    legacy = []
+    for _ in range(args.n):
+        t0 = time.perf_counter()
+        reader = easyocr.Reader(languages, gpu=False, verbose=False)
+        reader.readtext(preprocess_image(image_bytes), detail=1)
+        legacy.append(time.perf_counter() - t0)
+        del reader
+
+    async def run_pool() -> dict:
+        t0 = time.perf_counter()
+        local_ocr.start_local_ocr()
+        await local_ocr.recognize(image_bytes)  # 워커 준비 + 첫 호출
+        ready = time.perf_counter() - t0
+
+        per_call = []
+        for _ in range(args.n):
+            t0 = time.perf_counter()
+            await local_ocr.recognize(image_bytes)
+            per_call.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(local_ocr.recognize(image_bytes) for _ in range(args.concurrency)))
+        concurrent = time.perf_counter() - t0
+        return {"ready": ready, "per_call": per_call, "concurrent": concurrent}
+
+    try:
+        pool = asyncio.run(run_pool())
+    finally:
+        local_ocr.close_local_ocr()
+
+    print(f"image={os.path.basename(args.image)} n={args.n} workers={args.workers} languages={args.languages}")
+    print(f"{'mode':<7} {'avg s':>7} {'max s':>7}")
+    print(f"{'legacy':<7} {statistics.mean(legacy):>7.2f} {max(legacy):>7.2f}")
+    print(f"{'pool':<7} {statistics.mean(pool['per_call']):>7.2f} {max(pool['per_call']):>7.2f}"
+          f"   (ready {pool['ready']:.2f}s, {args.concurrency} concurrent {pool['concurrent']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
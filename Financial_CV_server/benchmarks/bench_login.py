@@ -0,0 +1,157 @@
+"""
+로그인 처리량 벤치마크 (user-013)
+
+사용자 U명(기본 50명)이 동시에 로그인 N회(기본 200회) + 그동안 가벼운 엔드포인트(/ping)를 계속 호출
+  legacy : 기존 방식 - 동기 라우트에서 passlib bcrypt 직접 호출 (FastAPI 스레드풀 점유)
+  pool   : POST /users/login - async 라우트 + password_hasher 프로세스 풀
+측정: 로그인 처리량(logins/s), 로그인 p95, 로그인 몰림 중 /ping p95 (다른 엔드포인트가 막히는지)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_login --logins 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException
+from passlib.context import CryptContext
+from sqlmodel import Session, SQLModel
+
+from app.dependencies.database import build_engine
+from app.dependencies.password_hasher import (
+    BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, close_password_hasher, hash_password_sync, start_password_hasher,
+)
+from app.dependencies.redis_db import get_async_redis
+from app.dependencies.user_db import get_user_session
+from app.models.user_models import User
+from app.routers import user_router
+from app.routers.user_router import UserLoginModel
+from app.services.user_service import get_user_by_login_id
+
+PASSWORD = "bench-password-1234"
+
+
+class _NullPipeline:
+    def __init__(self):
+        self.commands = 0
+
+    def setex(self, *args, **kwargs):
+        self.commands += 1
+
+    def __len__(self):
+        return self.commands
+
+    async def execute(self):
+        return [True] * self.commands
+
+
+class _NullRedis:
+    # 세션 저장은 이 벤치마크 측정 대상이 아님
+    def pipeline(self, transaction=True):
+        return _NullPipeline()
+
+
+def _make_app(db_path: str, users: int) -> FastAPI:
+    engine = build_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine)
+    hashed = hash_password_sync(PASSWORD)
+    with Session(engine) as session:
+        for i in range(users):
+            session.add(User(user_name=f"bench{i}", user_login_id=f"bench{i}", user_login_pw=hashed,
+                             user_failed_count=0, user_locked=False))
+        session.commit()
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    legacy_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    app = FastAPI()
+    app.include_router(user_router.router)
+    app.dependency_overrides[get_user_session] = session_override
+    app.dependency_overrides[get_async_redis] = lambda: _NullRedis()
+
+    @app.post("/legacy/login")
+    def legacy_login(login_data: UserLoginModel, session: Session = Depends(get_user_session)):
+        # 변경 전 signin: 요청 스레드에서 bcrypt 검증
+        user = get_user_by_login_id(session, login_data.user_login_id)
+        if not user or not legacy_context.verify(login_data.password, user.user_login_pw):
+            raise HTTPException(status_code=401, detail="로그인 실패")
+        return {"user_id": user.user_id}
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    return app
+
+
+def _p95(values: list) -> float:
+    return statistics.quantiles(values, n=20)[-1] * 1000 if len(values) >= 2 else 0.0
+
+
+async def _run(app: FastAPI, path: str, logins: int, concurrency: int, users: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        sem = asyncio.Semaphore(concurrency)
+        login_lat, ping_lat = [], []
+        done = asyncio.Event()
+
+        async def login(i: int):
+            async with sem:
+                t0 = time.perf_counter()
+                r = await client.post(path, json={"user_login_id": f"bench{i % users}", "password": PASSWORD})
+                r.raise_for_status()
+                login_lat.append(time.perf_counter() - t0)
+
+        async def pinger():
+            while not done.is_set():
+                t0 = time.perf_counter()
+                (await client.get("/ping")).raise_for_status()
+                ping_lat.append(time.perf_counter() - t0)
+                await asyncio.sleep(0.01)
+
+        ping_task = asyncio.create_task(pinger())
+        t0 = time.perf_counter()
+        await asyncio.gather(*(login(i) for i in range(logins)))
+        elapsed = time.perf_counter() - t0
+        done.set()
+        await ping_task
+
+    return {
+        "throughput": logins / elapsed,
+        "login_p95": _p95(login_lat),
+        "ping_p95": _p95(ping_lat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--users", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app = _make_app(os.path.join(workdir, "users.db"), args.users)
+        start_password_hasher()
+        try:
+            print(f"logins={args.logins} concurrency={args.concurrency} "
+                  f"bcrypt_rounds={BCRYPT_ROUNDS} workers={PASSWORD_HASH_WORKERS}")
+            for label, path in (("legacy", "/legacy/login"), ("pool", "/users/login")):
+                r = asyncio.run(_run(app, path, args.logins, args.concurrency, args.users))
+                print(f"{label:<7} {r['throughput']:8.1f} logins/s  login p95 {r['login_p95']:8.1f} ms"
+                      f"  /ping p95 {r['ping_p95']:8.1f} ms")
+        finally:
+            close_password_hasher()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+provider 호출 전 이미지 정규화 벤치마크 (user-022)
+
+카메라 원본 사진(기본: 합성 영수증 4032x3024 JPEG N장, 절반은 EXIF Orientation=6 세로 사진 + 저장소 PNG 2장)을
+POST /ocr/ingest-preview/raw 로 provider 별 미리보기
+  off : IMAGE_NORMALIZE=false - 받은 바이트 그대로 provider 로 전송
+  on  : IMAGE_NORMALIZE=true  - 디코딩 1회, EXIF 방향 적용/제거, 긴 변 IMAGE_MAX_LONG_SIDE, IMAGE_MAX_BYTES 이하 재인코딩
+        (CLOVA 는 jpeg, OpenAI 는 webp)
+정규화 효과만 보도록 CLOVA_PREPROCESS_STEPS="" (문서 보정은 bench_preprocess), 캐시 OCR_CACHE_BACKEND=none
+스텁 업링크 --upload-mbps (기본 20Mbps) 로 본문 크기가 지연에 반영됨, 모드마다 새 프로세스
+측정: provider 가 받은 요청당 바이트, 요청당 지연(중앙값)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_normalize --photos 6 --upload-mbps 20
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROVIDERS = ("clova", "openai")
+
+
+def _camera_jpeg(seed: int, orientation: int) -> bytes:
+    """카메라처럼 EXIF(기기/방향) 가 붙은 고품질 JPEG"""
+    from PIL import Image
+
+    from benchmarks.bench_preprocess import make_synthetic_receipt
+
+    image = Image.fromarray(make_synthetic_receipt(seed)[..., ::-1])
+    if orientation == 6:
+        # 센서 방향 그대로 저장된 세로 사진: 픽셀은 눕혀 두고 EXIF 로 90도 회전 지시
+        image = image.transpose(Image.Transpose.ROTATE_90)
+    exif = Image.Exif()
+    exif[0x010F] = "BenchPhone"     # Make
+    exif[0x0112] = orientation      # Orientation
+    buf = io.BytesIO()
+    image.save(buf, "JPEG", quality=95, exif=exif.tobytes())
+    return buf.getvalue()
+
+
+def _fixtures(photos: int, workdir: str) -> list:
+    items = []
+    for i in range(photos):
+        path = os.path.join(workdir, f"photo{i}.jpg")
+        with open(path, "wb") as f:
+            f.write(_camera_jpeg(i, 6 if i % 2 else 1))
+        items.append((f"photo{i}.jpg", "image/jpeg", path))
+    for name in ("ocr_test_doc_en.png", "IMG_OCR_6_F_0022204.png"):
+        path = os.path.join(ROOT, name)
+        if os.path.exists(path):
+            items.append((name, "image/png", path))
+    return items
+
+
+def _worker(fixture_file: str, stub_url: str, repeat: int) -> dict:
+    import httpx
+    from fastapi import FastAPI
+
+    from app.routers import llm_ocr_router
+
+    with open(fixture_file) as f:
+        fixtures = json.load(f)
+    images = []
+    for name, media_type, path in fixtures:
+        with open(path, "rb") as f:
+            images.append((name, media_type, f.read()))
+
+    app = FastAPI()
+    app.include_router(llm_ocr_router.router)
+
+    async def run() -> dict:
+        result = {}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench",
+                                     timeout=120) as client, httpx.AsyncClient(base_url=stub_url) as stub:
+            for provider in PROVIDERS:
+                before = (await stub.get("/stats")).json()[provider]
+                latencies = {}
+                for name, media_type, raw in images:
+                    samples = []
+                    for _ in range(repeat):
+                        t0 = time.perf_counter()
+                        r = await client.post("/ocr/ingest-preview/raw", params={"provider": provider},
+                                              content=raw, headers={"Content-Type": media_type})
+                        r.raise_for_status()
+                        samples.append((time.perf_counter() - t0) * 1000)
+                    latencies[name] = statistics.median(samples)
+                after = (await stub.get("/stats")).json()[provider]
+                result[provider] = {
+                    "bytes_per_request": (after["bytes"] - before["bytes"]) / max(1, after["requests"] - before["requests"]),
+                    "latency_ms": latencies,
+                }
+        return result
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--photos", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--upload-mbps", type=float, default=20.0)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--fixture-file", help=argparse.SUPPRESS)
+    parser.add_argument("--stub-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.fixture_file, args.stub_url, args.repeat)))
+        return
+
+    from benchmarks.stub_providers import StubConfig, run_stub_server
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        fixtures = _fixtures(args.photos, workdir)
+        fixture_file = os.path.join(workdir, "fixtures.json")
+        with open(fixture_file, "w") as f:
+            json.dump(fixtures, f)
+        original_kb = sum(os.path.getsize(path) for _, _, path in fixtures) / len(fixtures) / 1024
+
+        config = StubConfig(clova_latency=0.2, openai_latency=0.3, upload_mbps=args.upload_mbps)
+        with run_stub_server(config) as stub_url:
+            for mode in ("off", "on"):
+                env = dict(os.environ, CLOVA_OCR_URL=f"{stub_url}/clova", CLOVA_OCR_SECRET="stub",
+                           OPENAI_BASE_URL=f"{stub_url}/v1", OPENAI_API_KEY="stub",
+                           OCR_CACHE_BACKEND="none", CLOVA_PREPROCESS_STEPS="",
+                           IMAGE_NORMALIZE="true" if mode == "on" else "false")
+                out = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_normalize", "--worker", "--fixture-file", fixture_file,
+                     "--stub-url", stub_url, "--repeat", str(args.repeat)],
+                    cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+                )
+                results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    print(f"fixtures={len(fixtures)} (avg {original_kb:.0f}KB) upload={args.upload_mbps}Mbps repeat={args.repeat}")
+    print(f"{'provider':<8} {'off KB/req':>11} {'on KB/req':>10} {'saved':>6} {'off ms':>8} {'on ms':>8} {'change':>8}")
+    for provider in PROVIDERS:
+        off, on = results["off"][provider], results["on"][provider]
+        off_ms = statistics.mean(off["latency_ms"].values())
+        on_ms = statistics.mean(on["latency_ms"].values())
+        saved = 1 - on["bytes_per_request"] / off["bytes_per_request"]
+        print(f"{provider:<8} {off['bytes_per_request'] / 1024:>11.0f} {on['bytes_per_request'] / 1024:>10.0f} "
+              f"{saved * 100:>5.0f}% {off_ms:>8.0f} {on_ms:>8.0f} {on_ms - off_ms:>+8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+OCR 미리보기 처리량 벤치마크 (user-003)
+
+로컬 스텁 서버(CLOVA/OpenAI 대역)에 대해 동시 미리보기 요청 N개(기본 200)를 보내 비교
+  legacy : 기존 동기 엔드포인트 - requests.post + OpenAI 동기 호출 (스레드풀 워커 점유)
+  async  : /ocr/ingest-preview - 공용 httpx.AsyncClient + AsyncOpenAI
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_ocr_async --concurrency 200 --clova-latency 0.2 --openai-latency 0.3
+"""
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from benchmarks.stub_providers import run_stub_server
+
+# 1x1 PNG
+TINY_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+IMAGE_DATA_URL = "data:image/png;base64," + base64.b64encode(TINY_PNG).decode()
+
+
+def _build_app():
+    import json
+    import uuid
+
+    import requests
+    from fastapi import FastAPI
+    from openai import OpenAI
+
+    from app.dependencies.llm_ocr import INSTRUCTIONS_TEXT
+    from app.routers import llm_ocr_router
+    from app.routers.llm_ocr_router import (
+        OcrPreviewRequest,
+        OcrPreviewResponse,
+        _extract_base64_from_data_url,
+        _extract_response_text,
+    )
+
+    app = FastAPI()
+    app.include_router(llm_ocr_router.router)
+
+    # 기존(동기) 구현 재현
+    @app.post("/legacy/ingest-preview", response_model=OcrPreviewResponse)
+    def legacy_preview(payload: OcrPreviewRequest):
+        client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+        ext, raw = _extract_base64_from_data_url(payload.image)
+        body = {
+            "version": "V2", "requestId": str(uuid.uuid4()), "timestamp": int(time.time() * 1000),
+            "images": [{"format": ext, "name": "preview", "data": base64.b64encode(raw).decode()}],
+        }
+        r = requests.post(os.environ["CLOVA_OCR_URL"], headers={"X-OCR-SECRET": "stub"},
+                          data=json.dumps(body), timeout=20)
+        fields = r.json()["images"][0]["fields"]
+        raw_text = "\n".join(f["inferText"] for f in fields)
+        resp = client.responses.create(
+            model=payload.model or "gpt-4o-mini",
+            input=[{"role": "system", "content": INSTRUCTIONS_TEXT},
+                   {"role": "user", "content": f"OCR TEXT:\n{raw_text}"}],
+            temperature=0.0,
+        )
+        return OcrPreviewResponse(ocr_text=_extract_response_text(resp))
+
+    return app
+
+
+async def _drive(app, path: str, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        async def one():
+            t0 = time.perf_counter()
+            r = await client.post(path, json={"image": IMAGE_DATA_URL})
+            r.raise_for_status()
+            latencies.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "rps": concurrency / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--clova-latency", type=float, default=0.2)
+    parser.add_argument("--openai-latency", type=float, default=0.3)
+    args = parser.parse_args()
+
+    with run_stub_server(clova_latency=args.clova_latency, openai_latency=args.openai_latency) as base_url:
+        os.environ["CLOVA_OCR_URL"] = f"{base_url}/clova"
+        os.environ["CLOVA_OCR_SECRET"] = "stub"
+        os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+        os.environ["OPENAI_API_KEY"] = "stub"
+        os.environ.setdefault("CLOVA_MAX_CONCURRENCY", str(args.concurrency))
+        os.environ.setdefault("OPENAI_MAX_CONCURRENCY", str(args.concurrency))
+
+        app = _build_app()
+        print(f"concurrency={args.concurrency} clova={args.clova_latency}s openai={args.openai_latency}s")
+        print(f"{'path':<8} {'elapsed(s)':>10} {'req/s':>8} {'p50(s)':>8} {'p95(s)':>8}")
+        for name, path in (("legacy", "/legacy/ingest-preview"), ("async", "/ocr/ingest-preview")):
+            r = asyncio.run(_drive(app, path, args.concurrency))
+            print(f"{name:<8} {r['elapsed']:>10.2f} {r['rps']:>8.1f} {r['p50']:>8.2f} {r['p95']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
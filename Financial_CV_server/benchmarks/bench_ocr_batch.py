@@ -0,0 +1,98 @@
+"""
+다중 페이지 일괄 처리 벤치마크 (user-005)
+
+N 페이지 문서 1건 기준 비교 (로컬 CLOVA/OpenAI 스텁, 캐시 비활성)
+  preview : /ocr/ingest-preview N회 순차 호출  vs  /ocr/batch-preview 1회
+  create  : /ocr/ingest-create  N회 순차 호출  vs  /ocr/batch-create  1회 (커밋 1회)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_ocr_batch --pages 8
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from benchmarks.bench_ocr_async import IMAGE_DATA_URL
+from benchmarks.stub_providers import SAMPLE_KV_TEXT, run_stub_server
+
+
+async def _run(pages: int, create_rounds: int) -> dict:
+    from fastapi import FastAPI
+    import app.models.user_models  # noqa: F401
+    from app.dependencies.document_db import create_document_db
+    from app.routers import llm_ocr_router
+
+    create_document_db()
+    app = FastAPI()
+    app.include_router(llm_ocr_router.router)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=120) as client:
+        async def timed(coro) -> float:
+            t0 = time.perf_counter()
+            r = await coro
+            r.raise_for_status()
+            return time.perf_counter() - t0
+
+        await client.post("/ocr/ingest-preview", json={"image": IMAGE_DATA_URL})  # 커넥션 워밍업
+
+        t0 = time.perf_counter()
+        for _ in range(pages):
+            await timed(client.post("/ocr/ingest-preview", json={"image": IMAGE_DATA_URL}))
+        seq_preview = time.perf_counter() - t0
+        batch_preview = await timed(client.post("/ocr/batch-preview", json={"images": [IMAGE_DATA_URL] * pages}))
+
+        t0 = time.perf_counter()
+        for _ in range(create_rounds):
+            for _ in range(pages):
+                await timed(client.post("/ocr/ingest-create", json={"user_id": 1, "ocr_text": SAMPLE_KV_TEXT}))
+        seq_create = (time.perf_counter() - t0) / create_rounds
+
+        t0 = time.perf_counter()
+        for _ in range(create_rounds):
+            await timed(client.post("/ocr/batch-create", json={"user_id": 1, "ocr_texts": [SAMPLE_KV_TEXT] * pages}))
+        batch_create = (time.perf_counter() - t0) / create_rounds
+
+    return {
+        "seq_preview": seq_preview, "batch_preview": batch_preview,
+        "seq_create": seq_create, "batch_create": batch_create,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--create-rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir, run_stub_server() as base_url:
+        os.environ.update({
+            "CLOVA_OCR_URL": f"{base_url}/clova",
+            "CLOVA_OCR_SECRET": "stub",
+            "OPENAI_BASE_URL": f"{base_url}/v1",
+            "OPENAI_API_KEY": "stub",
+            "OCR_CACHE_BACKEND": "none",
+            "DB_SINGLE_FILE": "true",
+            "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        })
+        r = asyncio.run(_run(args.pages, args.create_rounds))
+
+    print(f"pages={args.pages}")
+    rows = [
+        (f"preview  sequential x{args.pages}", r["seq_preview"]),
+        ("preview  batch x1", r["batch_preview"]),
+        (f"create   sequential x{args.pages}", r["seq_create"]),
+        ("create   batch x1", r["batch_create"]),
+    ]
+    for label, seconds in rows:
+        print(f"{label:<26}: {seconds * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
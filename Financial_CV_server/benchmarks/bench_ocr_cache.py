@@ -0,0 +1,74 @@
+"""
+OCR/LLM 결과 캐시 벤치마크 (user-004)
+
+같은 이미지를 반복 스캔했을 때 /ocr/ingest-preview 지연 비교 (로컬 CLOVA/OpenAI 스텁)
+  miss : 첫 스캔 - CLOVA + GPT 호출
+  hit  : 재스캔 - 캐시에서 바로 반환
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_ocr_cache --repeats 50 --backend disk
+  python -m benchmarks.bench_ocr_cache --backend redis      # 로컬 redis-server 필요
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from benchmarks.bench_ocr_async import IMAGE_DATA_URL
+from benchmarks.stub_providers import run_stub_server
+
+
+async def _run(repeats: int) -> dict:
+    from fastapi import FastAPI
+    from app.routers import llm_ocr_router
+
+    app = FastAPI()
+    app.include_router(llm_ocr_router.router)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def preview() -> float:
+            t0 = time.perf_counter()
+            r = await client.post("/ocr/ingest-preview", json={"image": IMAGE_DATA_URL})
+            r.raise_for_status()
+            return time.perf_counter() - t0
+
+        miss = await preview()
+        hits = [await preview() for _ in range(repeats)]
+        stats = (await client.get("/ocr/cache/stats")).json()
+    return {"miss": miss, "hit_p50": statistics.median(hits), "hit_max": max(hits), "stats": stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--backend", choices=["disk", "redis"], default="disk")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir, run_stub_server() as base_url:
+        os.environ.update({
+            "CLOVA_OCR_URL": f"{base_url}/clova",
+            "CLOVA_OCR_SECRET": "stub",
+            "OPENAI_BASE_URL": f"{base_url}/v1",
+            "OPENAI_API_KEY": "stub",
+            "OCR_CACHE_BACKEND": args.backend,
+            "OCR_CACHE_DIR": cache_dir,
+        })
+        r = asyncio.run(_run(args.repeats))
+
+    print(f"backend={args.backend} repeats={args.repeats}")
+    print(f"miss (CLOVA + GPT)  : {r['miss'] * 1000:8.1f} ms")
+    print(f"hit  p50            : {r['hit_p50'] * 1000:8.2f} ms")
+    print(f"hit  max            : {r['hit_max'] * 1000:8.2f} ms")
+    for ns, v in r["stats"]["namespaces"].items():
+        print(f"{ns:<8} hits={v['hits']} misses={v['misses']} hit_rate={v['hit_rate']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+OCR 미리보기 이미지 전달 방식 벤치마크 (user-021)
+
+폰 사진 1장(기본: 합성 영수증 4032x3024 JPEG, 약 4MB 또는 --image)으로 provider=clova 미리보기 N회
+  legacy    : 변경 전 - data URL JSON → 전체 문자열 정규식 + base64 디코딩 → CLOVA 에 base64 JSON 전송
+  dataurl   : POST /ocr/ingest-preview (data URL JSON, CLOVA 는 multipart 전송)
+  raw       : POST /ocr/ingest-preview/raw (본문 = 이미지 바이너리)
+  multipart : POST /ocr/ingest-preview/upload (multipart file)
+측정: 요청 본문 크기, CLOVA 스텁이 받은 본문 크기, 요청당 지연, 서버 프로세스 CPU 시간(요청당),
+      요청 1회 동안 파이썬 할당 최대치(tracemalloc, 지연/CPU 측정 후 별도 1회)
+      (전처리 효과를 빼기 위해 CLOVA_PREPROCESS_STEPS="", 캐시 OCR_CACHE_BACKEND=none)
+서버는 모드마다 새 프로세스(uvicorn), 클라이언트는 이 프로세스 → 서버 CPU/메모리만 측정
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_ocr_ingest --n 20
+"""
+import argparse
+import base64
+import json
+import os
+import re
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ("legacy", "dataurl", "raw", "multipart")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _serve():
+    """모드 공통 서버 (legacy 경로 포함), 포트를 stdout 에 출력 후 종료 신호(stdin 닫힘)까지 실행"""
+    import uuid
+
+    import uvicorn
+    from fastapi import FastAPI, HTTPException
+
+    from app.dependencies.http_clients import CLOVA_LIMITS, get_http_client
+    from app.routers import llm_ocr_router
+    from app.routers.llm_ocr_router import OcrPreviewRequest, OcrPreviewResponse
+
+    app = FastAPI()
+    app.include_router(llm_ocr_router.router)
+
+    legacy_re = re.compile(r"^data:image/(\w+);base64,(.+)$", re.DOTALL)
+
+    @app.post("/legacy/ingest-preview", response_model=OcrPreviewResponse)
+    async def legacy_preview(payload: OcrPreviewRequest):
+        # 변경 전 _extract_base64_from_data_url + _call_clova_ocr_bytes(base64 JSON) 와 같은 처리
+        m = legacy_re.match(payload.image)
+        if not m:
+            raise HTTPException(status_code=400)
+        ext, raw = m.group(1).lower(), base64.b64decode(m.group(2))
+        body = json.dumps({
+            "version": "V2", "requestId": str(uuid.uuid4()), "timestamp": int(time.time() * 1000),
+            "images": [{"format": ext, "name": "preview", "data": base64.b64encode(raw).decode("utf-8")}],
+        })
+        r = await get_http_client().post(os.environ["CLOVA_OCR_URL"], content=body, timeout=CLOVA_LIMITS.timeout,
+                                         headers={"Content-Type": "application/json; charset=UTF-8",
+                                                  "X-OCR-SECRET": os.environ["CLOVA_OCR_SECRET"]})
+        text = "\n".join(f["inferText"] for f in r.json()["images"][0]["fields"])
+        client = llm_ocr_router._ensure_openai_client()
+        return OcrPreviewResponse(ocr_text=await llm_ocr_router._call_openai_with_text(client, text, payload.model))
+
+    @app.get("/__bench/stats")
+    def bench_stats():
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {"cpu_s": usage.ru_utime + usage.ru_stime}
+
+    @app.post("/__bench/trace")
+    def bench_trace(start: bool):
+        # 서버 RSS 는 torch/cv2 import 가 대부분이라 요청별 복사본은 tracemalloc 최대치로 비교
+        if start:
+            tracemalloc.start()
+            return {}
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"peak_bytes": peak}
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    print(port, flush=True)
+    sys.stdin.read()
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+def _request(mode: str, image: bytes, ext: str) -> dict:
+    """httpx.post 인자 (본문 크기 계산을 위해 본문은 미리 만든 바이트)"""
+    media_type = f"image/{'jpeg' if ext == 'jpg' else ext}"
+    if mode in ("legacy", "dataurl"):
+        data_url = f"data:image/{ext};base64," + base64.b64encode(image).decode()
+        path = "/legacy/ingest-preview" if mode == "legacy" else "/ocr/ingest-preview"
+        return {"url": path, "content": json.dumps({"image": data_url, "provider": "clova"}).encode(),
+                "headers": {"Content-Type": "application/json"}}
+    if mode == "raw":
+        return {"url": "/ocr/ingest-preview/raw?provider=clova", "content": image,
+                "headers": {"Content-Type": media_type}}
+    import httpx
+
+    req = httpx.Request("POST", "http://bench/", data={"provider": "clova"},
+                        files={"file": (f"photo.{ext}", image, media_type)})
+    return {"url": "/ocr/ingest-preview/upload", "content": req.read(),
+            "headers": {"Content-Type": req.headers["Content-Type"]}}
+
+
+def _run_mode(mode: str, image: bytes, ext: str, n: int, env: dict, stub_url: str) -> dict:
+    import httpx
+
+    proc = subprocess.Popen([sys.executable, "-c", "from benchmarks.bench_ocr_ingest import _serve; _serve()"],
+                            cwd=ROOT, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(proc.stdout.readline())
+        request = _request(mode, image, ext)
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=120) as client, \
+                httpx.Client(base_url=stub_url) as stub:
+            client.post(request["url"], content=request["content"], headers=request["headers"]).raise_for_status()
+            before = client.get("/__bench/stats").json()
+            clova_before = stub.get("/stats").json()["clova"]
+            latencies = []
+            for _ in range(n):
+                t0 = time.perf_counter()
+                r = client.post(request["url"], content=request["content"], headers=request["headers"])
+                r.raise_for_status()
+                latencies.append((time.perf_counter() - t0) * 1000)
+            after = client.get("/__bench/stats").json()
+            clova_after = stub.get("/stats").json()["clova"]
+
+            client.post("/__bench/trace", params={"start": True})
+            client.post(request["url"], content=request["content"], headers=request["headers"]).raise_for_status()
+            peak = client.post("/__bench/trace", params={"start": False}).json()["peak_bytes"]
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=10)
+
+    return {
+        "request_kb": len(request["content"]) / 1024,
+        "clova_kb": (clova_after["bytes"] - clova_before["bytes"]) / max(1, clova_after["requests"] - clova_before["requests"]) / 1024,
+        "p50_ms": statistics.median(latencies),
+        "cpu_ms": (after["cpu_s"] - before["cpu_s"]) * 1000 / n,
+        "peak_mb": peak / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--image", default=None)
+    parser.add_argument("--n", type=int, default=20)
+    args = parser.parse_args()
+
+    from benchmarks.stub_providers import StubConfig, run_stub_server
+
+    if args.image:
+        with open(args.image, "rb") as f:
+            image = f.read()
+        ext = args.image.rsplit(".", 1)[-1].lower()
+    else:
+        import cv2
+
+        from benchmarks.bench_preprocess import make_synthetic_receipt
+
+        _, buf = cv2.imencode(".jpg", make_synthetic_receipt(0), [cv2.IMWRITE_JPEG_QUALITY, 95])
+        image, ext = buf.tobytes(), "jpg"
+
+    results = {}
+    with run_stub_server(StubConfig(clova_latency=0.05, openai_latency=0.05)) as stub_url:
+        env = dict(os.environ, CLOVA_OCR_URL=f"{stub_url}/clova", CLOVA_OCR_SECRET="stub",
+                   OPENAI_BASE_URL=f"{stub_url}/v1", OPENAI_API_KEY="stub",
+                   OCR_CACHE_BACKEND="none", CLOVA_PREPROCESS_STEPS="")
+        for mode in MODES:
+            results[mode] = _run_mode(mode, image, ext, args.n, env, stub_url)
+
+    print(f"image={len(image) / 1024:.0f}KB ({ext}) n={args.n} provider=clova")
+    print(f"{'mode':<10} {'request KB':>11} {'CLOVA KB':>9} {'p50 ms':>8} {'CPU ms/req':>11} {'peak MB':>8}")
+    for mode, r in results.items():
+        print(f"{mode:<10} {r['request_kb']:>11.0f} {r['clova_kb']:>9.0f} {r['p50_ms']:>8.1f} "
+              f"{r['cpu_ms']:>11.1f} {r['peak_mb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
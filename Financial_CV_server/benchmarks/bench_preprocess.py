@@ -0,0 +1,224 @@
+"""
+OCR 이미지 전처리 벤치마크 (user-020)
+
+영수증 사진 세트 (기본: 합성 폰 사진 N장 + 저장소의 ocr_test_doc_en.png, IMG_OCR_6_F_0022204.png)
+  합성 사진 : 흰 종이에 영수증 글자 → 원근 왜곡 + 약간 회전 → 노이즈 배경(4032x3024) 위에 합성
+              + 조명 그라데이션 → JPEG(q92), 시드 고정이라 매번 같은 세트
+  --fixtures DIR 을 주면 그 디렉터리의 jpg/png 도 포함 (실제 영수증 사진)
+측정
+  bytes   : 원본 vs CLOVA 전송 바이트 (CLOVA_PREPROCESS_STEPS) vs 로컬 OCR 입력 (OCR_PREPROCESS_STEPS, PNG)
+  ms      : 전처리 시간 (사진당)
+  clova   : 스텁 CLOVA(업링크 --upload-mbps, 기본 5Mbps 모바일 환경)에 _call_clova_ocr_bytes 로 보낸 왕복 시간
+            raw(CLOVA_PREPROCESS_STEPS="") vs preprocess, 모드마다 새 프로세스 (캐시 OCR_CACHE_BACKEND=none)
+  --easyocr 를 주면 로컬 EasyOCR 인식 시간도 (전처리 없음 vs 전처리)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_preprocess --synthetic 8 --upload-mbps 5
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RECEIPT_LINES = [
+    "RECEIPT  No. {n:06d}",
+    "STORE  GS25 Busan Univ.",
+    "DATE   2025-03-{day:02d} 12:{minute:02d}",
+    "-" * 30,
+    "AMERICANO        1   4,500",
+    "SANDWICH         2   9,800",
+    "WATER 500ml      1   1,200",
+    "-" * 30,
+    "TOTAL               15,500",
+    "CARD  ****-****-****-1234",
+    "APPROVAL  {n:08d}",
+]
+
+
+def make_synthetic_receipt(seed: int, size=(4032, 3024)):
+    """폰으로 비스듬히 찍은 영수증 사진 (BGR ndarray)"""
+    import cv2
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    page = np.full((1800, 1000), 245, np.uint8)
+    for i, line in enumerate(RECEIPT_LINES):
+        text = line.format(n=seed * 7919, day=1 + seed % 28, minute=seed % 60)
+        cv2.putText(page, text, (60, 140 + i * 140), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 20, 3, cv2.LINE_AA)
+
+    w, h = size
+    background = rng.normal(110, 25, (h, w)).astype(np.float32)
+    background = cv2.GaussianBlur(background, (0, 0), 8)
+
+    # 사진 중앙 부근에 원근 왜곡된 사각형으로 배치
+    cx, cy = w / 2 + rng.uniform(-200, 200), h / 2 + rng.uniform(-150, 150)
+    ph, pw = h * 0.8, h * 0.8 * page.shape[1] / page.shape[0]
+    jitter = rng.uniform(-0.06, 0.06, (4, 2)) * [pw, ph]
+    dst = np.array([[cx - pw / 2, cy - ph / 2], [cx + pw / 2, cy - ph / 2],
+                    [cx + pw / 2, cy + ph / 2], [cx - pw / 2, cy + ph / 2]]) + jitter
+    angle = np.deg2rad(rng.uniform(-6, 6))
+    rot = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    dst = ((dst - [cx, cy]) @ rot.T + [cx, cy]).astype(np.float32)
+    src = np.array([[0, 0], [page.shape[1], 0], [page.shape[1], page.shape[0]], [0, page.shape[0]]], np.float32)
+    matrix = cv2.getPerspectiveTransform(src, dst)
+    warped = cv2.warpPerspective(page.astype(np.float32), matrix, (w, h))
+    mask = cv2.warpPerspective(np.ones_like(page, np.float32), matrix, (w, h))
+    photo = warped * mask + background * (1 - mask)
+
+    # 조명 그라데이션 + 센서 노이즈
+    gradient = np.linspace(0.7, 1.1, w, dtype=np.float32)[None, :] * np.linspace(1.05, 0.8, h, dtype=np.float32)[:, None]
+    photo = photo * gradient + rng.normal(0, 6, (h, w)).astype(np.float32)
+    gray = np.clip(photo, 0, 255).astype(np.uint8)
+    tint = np.array([0.95, 1.0, 1.05], np.float32)  # 약한 색 온도
+    return np.clip(gray[..., None] * tint, 0, 255).astype(np.uint8)
+
+
+def load_fixtures(synthetic: int, fixtures_dir: str | None) -> list:
+    import cv2
+
+    items = []
+    for i in range(synthetic):
+        ok, buf = cv2.imencode(".jpg", make_synthetic_receipt(i), [cv2.IMWRITE_JPEG_QUALITY, 92])
+        items.append((f"synthetic{i}.jpg", "jpg", buf.tobytes()))
+    paths = [os.path.join(ROOT, "ocr_test_doc_en.png"), os.path.join(ROOT, "IMG_OCR_6_F_0022204.png")]
+    if fixtures_dir:
+        paths += sorted(glob.glob(os.path.join(fixtures_dir, "*.jpg")) + glob.glob(os.path.join(fixtures_dir, "*.png")))
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                items.append((os.path.basename(path), path.rsplit(".", 1)[-1].lower(), f.read()))
+    return items
+
+
+def _clova_worker(fixture_file: str, base_url: str, repeat: int) -> dict:
+    import asyncio
+
+    os.environ["CLOVA_OCR_URL"] = f"{base_url}/clova"
+    os.environ.setdefault("CLOVA_OCR_SECRET", "bench")
+    os.environ["OCR_CACHE_BACKEND"] = "none"
+    from app.routers import llm_ocr_router
+
+    with open(fixture_file) as f:
+        fixtures = json.load(f)
+
+    async def run() -> dict:
+        latencies = {}
+        for name, ext, path in fixtures:
+            with open(path, "rb") as f:
+                raw = f.read()
+            samples = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                await llm_ocr_router._call_clova_ocr_bytes(ext, raw)
+                samples.append((time.perf_counter() - t0) * 1000)
+            latencies[name] = statistics.median(samples)
+        return latencies
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--synthetic", type=int, default=8)
+    parser.add_argument("--fixtures", default=None)
+    parser.add_argument("--upload-mbps", type=float, default=5.0)
+    parser.add_argument("--clova-latency", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--easyocr", action="store_true")
+    parser.add_argument("--worker", choices=["raw", "preprocess"], help=argparse.SUPPRESS)
+    parser.add_argument("--fixture-file", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_clova_worker(args.fixture_file, args.base_url, args.repeat)))
+        return
+
+    from app.dependencies import image_preprocess
+    from benchmarks.stub_providers import StubConfig, run_stub_server
+
+    fixtures = load_fixtures(args.synthetic, args.fixtures)
+
+    rows = []
+    for name, ext, raw in fixtures:
+        t0 = time.perf_counter()
+        clova = image_preprocess.preprocess_bytes(raw, image_preprocess.CLOVA_PREPROCESS_STEPS)
+        clova_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        result = image_preprocess.run_pipeline(raw, image_preprocess.OCR_PREPROCESS_STEPS)
+        local_ms = (time.perf_counter() - t0) * 1000
+        _, local_bytes = image_preprocess.encode(result)
+        rows.append({
+            "name": name, "raw": len(raw), "clova": len(clova[1]) if clova else len(raw), "clova_ms": clova_ms,
+            "local": len(local_bytes), "local_ms": local_ms, "steps": ",".join(result.steps),
+        })
+
+    latencies = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        listing = []
+        for name, ext, raw in fixtures:
+            path = os.path.join(workdir, name)
+            with open(path, "wb") as f:
+                f.write(raw)
+            listing.append((name, ext, path))
+        fixture_file = os.path.join(workdir, "fixtures.json")
+        with open(fixture_file, "w") as f:
+            json.dump(listing, f)
+
+        config = StubConfig(clova_latency=args.clova_latency, upload_mbps=args.upload_mbps)
+        with run_stub_server(config) as base_url:
+            for mode in ("raw", "preprocess"):
+                env = dict(os.environ)
+                if mode == "raw":
+                    env["CLOVA_PREPROCESS_STEPS"] = ""
+                out = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_preprocess", "--worker", mode,
+                     "--fixture-file", fixture_file, "--base-url", base_url, "--repeat", str(args.repeat)],
+                    cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+                )
+                latencies[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    easyocr_ms = {}
+    if args.easyocr:
+        os.environ["EASYOCR_WORKERS"] = "0"
+        from app.dependencies import local_ocr
+
+        local_ocr.get_reader()
+        for use_preprocess in (False, True):
+            samples = []
+            for _, _, raw in fixtures:
+                t0 = time.perf_counter()
+                local_ocr.recognize_sync(raw, use_preprocess=use_preprocess)
+                samples.append((time.perf_counter() - t0) * 1000)
+            easyocr_ms["preprocess" if use_preprocess else "raw"] = statistics.mean(samples)
+
+    print(f"fixtures={len(fixtures)} upload={args.upload_mbps}Mbps clova_latency={args.clova_latency}s")
+    print(f"CLOVA_PREPROCESS_STEPS={','.join(image_preprocess.CLOVA_PREPROCESS_STEPS)} "
+          f"OCR_PREPROCESS_STEPS={','.join(image_preprocess.OCR_PREPROCESS_STEPS)} "
+          f"target={image_preprocess.TARGET_LONG_SIDE}px")
+    print(f"{'fixture':<26} {'raw KB':>8} {'clova KB':>9} {'prep ms':>8} {'local KB':>9} {'prep ms':>8} "
+          f"{'raw rt ms':>10} {'prep rt ms':>11}  applied")
+    for row in rows:
+        print(f"{row['name'][:26]:<26} {row['raw'] / 1024:>8.0f} {row['clova'] / 1024:>9.0f} {row['clova_ms']:>8.0f} "
+              f"{row['local'] / 1024:>9.0f} {row['local_ms']:>8.0f} {latencies['raw'][row['name']]:>10.0f} "
+              f"{latencies['preprocess'][row['name']]:>11.0f}  {row['steps']}")
+    total_raw = sum(row["raw"] for row in rows)
+    total_clova = sum(row["clova"] for row in rows)
+    print(f"CLOVA upload bytes {total_raw / 1e6:.1f}MB → {total_clova / 1e6:.1f}MB "
+          f"({100 * (1 - total_clova / total_raw):.0f}% less), round trip "
+          f"{statistics.mean(latencies['raw'].values()):.0f}ms → {statistics.mean(latencies['preprocess'].values()):.0f}ms")
+    if easyocr_ms:
+        print(f"EasyOCR recognize {easyocr_ms['raw']:.0f}ms → {easyocr_ms['preprocess']:.0f}ms (mean per fixture)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+OCR provider 라우터 벤치마크 (user-023)
+
+장애 주입 스텁(seed 고정 → 같은 장애 순서 재현)에 /ocr/ingest-preview/raw (provider=clova) N건, 동시 C개
+  direct : 라우터 기능 끔 - 헤지 없음, 서킷 브레이커 없음, 폴백 없음 (기존 동작)
+  router : 기본 설정 - p95 기준 헤지, 연속 실패 시 서킷 open, --fallback 으로 폴백
+시나리오
+  tail   : CLOVA 요청의 --slow-rate(기본 5%)가 --slow-latency(기본 3초) 지연 → 꼬리 지연(p95/p99) 비교
+  outage : 전체 요청 중 가운데 1/3 동안 CLOVA 가 전부 503 → 성공률, 지연, 서킷 open/폴백 횟수
+폴백 대상 기본값은 openai(비전, 스텁) - 실제 서버 기본값은 로컬 EasyOCR (--fallback easyocr 는 모델 필요)
+모드마다 새 프로세스 + 새 스텁 (같은 seed), 캐시 OCR_CACHE_BACKEND=none
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_provider_router --requests 300 --concurrency 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS = ("tail", "outage")
+MODES = ("direct", "router")
+
+
+def _percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _worker(scenario: str, stub_url: str, requests: int, concurrency: int) -> dict:
+    import httpx
+    from fastapi import FastAPI
+
+    from app.routers import llm_ocr_router
+    from benchmarks.bench_ocr_async import TINY_PNG
+
+    app = FastAPI()
+    app.include_router(llm_ocr_router.router)
+
+    async def run() -> dict:
+        latencies = [0.0] * requests
+        statuses = [0] * requests
+        providers = {}
+        counter = iter(range(requests))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench",
+                                     timeout=120) as client, httpx.AsyncClient(base_url=stub_url) as stub:
+
+            async def one(i: int):
+                if scenario == "outage" and i == requests // 3:
+                    await stub.post("/faults", json={"provider": "clova", "error_rate": 1.0})
+                if scenario == "outage" and i == 2 * requests // 3:
+                    await stub.post("/faults", json={"provider": "clova"})
+                t0 = time.perf_counter()
+                r = await client.post("/ocr/ingest-preview/raw", params={"provider": "clova"},
+                                      content=TINY_PNG, headers={"Content-Type": "image/png"})
+                latencies[i] = (time.perf_counter() - t0) * 1000
+                statuses[i] = r.status_code
+                if r.status_code == 200:
+                    used = r.json().get("provider") or "clova"
+                    providers[used] = providers.get(used, 0) + 1
+
+            async def lane():
+                for i in counter:
+                    await one(i)
+
+            await asyncio.gather(*(lane() for _ in range(concurrency)))
+            router_stats = (await client.get("/ocr/providers/stats")).json()
+        return {"latencies": latencies, "statuses": statuses, "providers": providers, "router": router_stats}
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--clova-latency", type=float, default=0.2)
+    parser.add_argument("--slow-rate", type=float, default=0.05)
+    parser.add_argument("--slow-latency", type=float, default=3.0)
+    parser.add_argument("--fallback", default="openai")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--scenario", choices=SCENARIOS, nargs="*", default=list(SCENARIOS))
+    parser.add_argument("--worker", choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument("--stub-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.stub_url, args.requests, args.concurrency)))
+        return
+
+    from benchmarks.stub_providers import StubConfig, run_stub_server
+
+    rows = []
+    for scenario in args.scenario:
+        slow_rate = args.slow_rate if scenario == "tail" else 0.0
+        for mode in MODES:
+            config = StubConfig(clova_latency=args.clova_latency, openai_latency=0.05, slow_rate=0.0,
+                                seed=args.seed)
+            with run_stub_server(config) as stub_url:
+                if slow_rate:
+                    # OpenAI(텍스트 추출)는 정상, CLOVA 만 꼬리 지연
+                    import httpx
+
+                    httpx.post(f"{stub_url}/faults", json={"provider": "clova", "slow_rate": slow_rate,
+                                                           "slow_latency": args.slow_latency})
+                env = dict(os.environ, CLOVA_OCR_URL=f"{stub_url}/clova", CLOVA_OCR_SECRET="stub",
+                           OPENAI_BASE_URL=f"{stub_url}/v1", OPENAI_API_KEY="stub", OCR_CACHE_BACKEND="none")
+                if mode == "direct":
+                    env.update(OCR_FALLBACK="", OCR_HEDGE_PROVIDERS="", OCR_BREAKER_FAILURES="0",
+                               OCR_PROVIDER_DEADLINE_SECONDS="0")
+                else:
+                    env.update(OCR_FALLBACK=args.fallback)
+                out = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_provider_router", "--worker", scenario,
+                     "--stub-url", stub_url, "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+                    cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+                )
+                result = json.loads(out.stdout.strip().splitlines()[-1])
+            rows.append((scenario, mode, result))
+
+    print(f"requests={args.requests} concurrency={args.concurrency} clova={args.clova_latency}s "
+          f"tail={args.slow_rate:.0%}x{args.slow_latency}s fallback={args.fallback} seed={args.seed}")
+    print(f"{'scenario':<8} {'mode':<7} {'ok %':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+          f"{'hedges':>7} {'h.wins':>7} {'opens':>6} {'served by':<20}")
+    for scenario, mode, r in rows:
+        ok = [lat for lat, code in zip(r["latencies"], r["statuses"]) if code == 200]
+        clova = r["router"]["providers"].get("clova", {})
+        served = ",".join(f"{k}:{v}" for k, v in sorted(r["providers"].items()))
+        print(f"{scenario:<8} {mode:<7} {100 * len(ok) / len(r['statuses']):>6.1f} "
+              f"{statistics.median(r['latencies']):>8.0f} {_percentile(r['latencies'], 0.95):>8.0f} "
+              f"{_percentile(r['latencies'], 0.99):>8.0f} {max(r['latencies']):>8.0f} "
+              f"{clova.get('hedges', 0):>7} {clova.get('hedge_wins', 0):>7} {clova.get('breaker_opens', 0):>6} "
+              f"{served:<20}")
+
+
+if __name__ == "__main__":
+    main()
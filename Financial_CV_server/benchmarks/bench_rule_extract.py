@@ -0,0 +1,263 @@
+"""
+규칙 기반 추출 빠른 경로 벤치마크 (user-024)
+
+합성 OCR 코퍼스(--docs 건, seed 고정): 정형 문서 (이체확인증 - 줄 단위/CLOVA 단어 단위, 정기결제 안내, 요금 고지서,
+전자세금계산서, 카드 이용대금 명세서) + 비정형 문서 --irregular-ratio (거래내역서 - 날짜 여러 개, 영수증 - 2025/03/14 날짜,
+점 날짜 이체확인증, 카드 결제 + 정기결제 혼합, 메모)
+1) 프로세스 안: 규칙 추출 confidence 통과율, 통과 건의 8개 필드 정답률(정형 문서 정답과 비교),
+   비정형 문서 잘못 통과 건수, 문서당 추출 시간
+2) 종단 지연: 스텁 CLOVA 가 코퍼스 텍스트를 순서대로 반환 (POST /clova/texts) → /ocr/ingest-preview/raw 를 순서대로 호출
+  off : OCR_RULE_EXTRACTOR=false - 모든 문서 GPT 분류/추출 (기존 동작)
+  on  : OCR_RULE_EXTRACTOR=true  - confidence >= OCR_RULE_MIN_CONFIDENCE 이면 GPT 생략
+  측정: GPT 호출 비율(스텁 OpenAI 요청 수), 문서당 지연 p50/p95, 평균
+모드마다 새 프로세스, 캐시 OCR_CACHE_BACKEND=none, 헤지 끔 (CLOVA 결과 순서 유지)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_rule_extract --docs 40 --openai-latency 0.8
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BANKS = ("국민은행", "신한은행", "우리은행", "하나은행", "카카오뱅크", "토스뱅크", "농협은행", "기업은행")
+NAMES = ("홍길동", "김민준", "이서연", "박지훈", "최수아", "정도윤")
+SERVICES = ("넷플릭스", "유튜브 프리미엄", "멜론", "쿠팡 와우", "왓챠")
+COMPANIES = ("(주)한빛상사", "대성산업(주)", "(주)누리소프트", "미래물산", "(주)바른유통")
+CARDS = ("신한", "삼성", "현대", "KB국민", "롯데")
+GAS = ("서울도시가스", "코원에너지서비스", "예스코")
+
+
+def _account(rng: random.Random) -> str:
+    return f"{rng.randint(100, 999)}-{rng.randint(10, 999999):06d}-{rng.randint(10, 99999):05d}"
+
+
+def _date(rng: random.Random) -> str:
+    return f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def _expected(label: str, title: str, amount="", partner="", bank="", account="", partner_number="",
+              due="") -> dict:
+    return {
+        "document_classification_label": label, "document_title": title, "document_balance": str(amount),
+        "document_partner": partner, "document_bank": bank, "document_account_number": account,
+        "document_partner_number": partner_number, "document_due": due,
+    }
+
+
+def _transfer(rng, words: bool):
+    bank, bank2, name = rng.choice(BANKS), rng.choice(BANKS), rng.choice(NAMES)
+    acct, acct2, amount, due = _account(rng), _account(rng), rng.randint(1, 5000) * 1000, _date(rng)
+    lines = ["이체확인증", f"출금계좌 {bank} {acct}", f"입금계좌 {bank2} {acct2}", f"받는분 {name}",
+             f"이체금액 {amount:,}원", f"이체일자 {due}"]
+    if words:
+        # CLOVA fields 처럼 단어마다 한 줄
+        lines = [word for line in lines for word in line.split()]
+    return lines, _expected("이체 및 송금 전표", "이체확인증", amount, name, bank, acct, acct2, due)
+
+
+def _subscription(rng):
+    service, amount, due = rng.choice(SERVICES), rng.randint(50, 300) * 100, _date(rng)
+    title = f"{service} 정기결제 안내"
+    lines = [title, f"서비스명 : {service} 플랜", f"결제금액 : {amount:,}원", "결제수단 : 자동납부", f"결제일 : {due}"]
+    return lines, _expected("정기구독 및 납부", title, amount, f"{service} 플랜", due=due)
+
+
+def _utility(rng):
+    gas, bank, acct = rng.choice(GAS), rng.choice(BANKS), _account(rng)
+    amount, due = rng.randint(10, 200) * 1000 + rng.randint(0, 9) * 10, _date(rng)
+    title = f"{rng.randint(1, 12)}월분 도시가스 요금 고지서"
+    lines = [title, f"납부처 {gas}", f"납부자 {rng.choice(NAMES)}", f"고객번호 {rng.randint(10**9, 10**10 - 1)}",
+             f"납부금액 {amount:,}원", f"납부기한 {due}", f"가상계좌 {bank} {acct}"]
+    return lines, _expected("정기구독 및 납부", title, amount, gas, partner_number=acct, due=due)
+
+
+def _tax_invoice(rng):
+    supplier, buyer = rng.sample(COMPANIES, 2)
+    supply = rng.randint(10, 900) * 10000
+    tax, due = supply // 10, _date(rng)
+    lines = ["전자세금계산서", f"작성일자 {due}", f"공급자 상호 {supplier}",
+             f"사업자등록번호 {rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(10000, 99999)}",
+             f"공급받는자 상호 {buyer}", f"공급가액 {supply:,}", f"세액 {tax:,}", f"합계금액 {supply + tax:,}"]
+    return lines, _expected("송장 및 세금 계산서", "전자세금계산서", supply + tax, supplier, due=due)
+
+
+def _card_statement(rng):
+    card, bank, acct = rng.choice(CARDS), rng.choice(BANKS), _account(rng)
+    total, due = rng.randint(100, 30000) * 100, _date(rng)
+    title = f"{card}카드 이용대금 명세서"
+    lines = [title, f"카드번호 {rng.randint(1000, 9999)}-****-****-{rng.randint(1000, 9999)}", f"결제예정일 {due}",
+             f"이용금액 {total - 1500:,}", "연회비 1,500", f"청구금액 {total:,}", f"결제계좌 {bank} {acct}"]
+    return lines, _expected("카드명세서", title, total, bank=bank, account=acct, due=due)
+
+
+def _irregular(rng, kind: str):
+    """GPT 로 보내야 하는 문서 (정답 없음)"""
+    d1, d2 = sorted((_date(rng), _date(rng)))
+    if kind == "statement":
+        return [f"{rng.choice(BANKS)} 거래내역", f"계좌번호 {_account(rng)}", f"조회기간 {d1} ~ {d2}",
+                "거래일시 적요 출금액 입금액 잔액", f"{d1} 급여 0 3,000,000 5,200,000",
+                f"{d2} 카드대금 820,000 0 4,380,000"]
+    if kind == "receipt":
+        return ["스타벅스 강남R점", "아메리카노 2 9,000", f"카드승인 {d1.replace('-', '/')}", "합계 9,000"]
+    if kind == "dotted":
+        return ["이체확인증", f"출금계좌 {rng.choice(BANKS)} {_account(rng)}", f"받는분 {rng.choice(NAMES)}",
+                f"입금계좌 {rng.choice(BANKS)} {_account(rng)}", "이체금액 50,000원", f"이체일자 {d1.replace('-', '.')}"]
+    if kind == "mixed":
+        service = rng.choice(SERVICES)
+        return [f"{service} 정기결제 카드 승인", f"가맹점 {service}", "이용금액 17,000원", f"결제일 {d1}"]
+    return ["메모", f"{rng.choice(NAMES)}에게 5만원 보내기", "다음 주 중"]
+
+
+IRREGULAR_KINDS = ("statement", "receipt", "dotted", "mixed", "memo")
+REGULAR_KINDS = {
+    "transfer": lambda rng: _transfer(rng, words=False),
+    "transfer_words": lambda rng: _transfer(rng, words=True),
+    "subscription": _subscription,
+    "utility": _utility,
+    "tax_invoice": _tax_invoice,
+    "card_statement": _card_statement,
+}
+
+
+def make_corpus(docs: int, irregular_ratio: float, seed: int) -> list:
+    """[(종류, OCR 줄 목록, 정답 필드 또는 None)]"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(docs):
+        if rng.random() < irregular_ratio:
+            kind = rng.choice(IRREGULAR_KINDS)
+            corpus.append((kind, _irregular(rng, kind), None))
+        else:
+            kind = rng.choice(sorted(REGULAR_KINDS))
+            lines, expected = REGULAR_KINDS[kind](rng)
+            corpus.append((kind, lines, expected))
+    return corpus
+
+
+def _offline(corpus: list) -> dict:
+    from app.services.rule_extractor import OCR_RULE_MIN_CONFIDENCE, extract_fields
+
+    accepted = correct = false_accepts = 0
+    wrong = []
+    for kind, lines, expected in corpus:
+        result = extract_fields("\n".join(lines))
+        if result.confidence < OCR_RULE_MIN_CONFIDENCE:
+            continue
+        accepted += 1
+        if expected is None:
+            false_accepts += 1
+        elif result.fields == expected:
+            correct += 1
+        else:
+            wrong.append(kind)
+
+    texts = ["\n".join(lines) for _, lines, _ in corpus]
+    rounds = max(1, 20000 // len(texts))
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            extract_fields(text)
+    per_doc_us = (time.perf_counter() - t0) / (rounds * len(texts)) * 1e6
+    return {"accepted": accepted, "correct": correct, "false_accepts": false_accepts, "wrong": wrong,
+            "per_doc_us": per_doc_us, "min_confidence": OCR_RULE_MIN_CONFIDENCE}
+
+
+def _worker(stub_url: str, docs: int) -> dict:
+    import httpx
+    from fastapi import FastAPI
+
+    from app.routers import llm_ocr_router
+    from benchmarks.bench_ocr_async import TINY_PNG
+
+    app = FastAPI()
+    app.include_router(llm_ocr_router.router)
+
+    async def run() -> dict:
+        latencies, extractors = [], {}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench",
+                                     timeout=120) as client:
+            for _ in range(docs):
+                t0 = time.perf_counter()
+                r = await client.post("/ocr/ingest-preview/raw", params={"provider": "clova"},
+                                      content=TINY_PNG, headers={"Content-Type": "image/png"})
+                r.raise_for_status()
+                latencies.append((time.perf_counter() - t0) * 1000)
+                extractor = r.json()["extractor"]
+                extractors[extractor] = extractors.get(extractor, 0) + 1
+            stats = (await client.get("/ocr/extract/stats")).json()
+        return {"latencies": latencies, "extractors": extractors, "stats": stats}
+
+    return asyncio.run(run())
+
+
+def _percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=40)
+    parser.add_argument("--irregular-ratio", type=float, default=0.3)
+    parser.add_argument("--clova-latency", type=float, default=0.2)
+    parser.add_argument("--openai-latency", type=float, default=0.8)   # 긴 INSTRUCTIONS 프롬프트 텍스트 추출
+    parser.add_argument("--seed", type=int, default=24)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--stub-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.stub_url, args.docs)))
+        return
+
+    import httpx
+
+    from benchmarks.stub_providers import StubConfig, run_stub_server
+
+    corpus = make_corpus(args.docs, args.irregular_ratio, args.seed)
+    regular = sum(1 for _, _, expected in corpus if expected is not None)
+    offline = _offline(corpus)
+
+    results = {}
+    config = StubConfig(clova_latency=args.clova_latency, openai_latency=args.openai_latency, seed=args.seed)
+    with run_stub_server(config) as stub_url:
+        for mode in ("off", "on"):
+            httpx.post(f"{stub_url}/clova/texts", json={"texts": [lines for _, lines, _ in corpus]})
+            before = httpx.get(f"{stub_url}/stats").json()["openai"]["requests"]
+            env = dict(os.environ, CLOVA_OCR_URL=f"{stub_url}/clova", CLOVA_OCR_SECRET="stub",
+                       OPENAI_BASE_URL=f"{stub_url}/v1", OPENAI_API_KEY="stub", OCR_CACHE_BACKEND="none",
+                       CLOVA_PREPROCESS_STEPS="", OCR_HEDGE_PROVIDERS="",
+                       OCR_RULE_EXTRACTOR="true" if mode == "on" else "false")
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_rule_extract", "--worker", "--stub-url", stub_url,
+                 "--docs", str(args.docs)],
+                cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+            )
+            results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+            results[mode]["openai_requests"] = httpx.get(f"{stub_url}/stats").json()["openai"]["requests"] - before
+
+    print(f"docs={args.docs} (정형 {regular}, 비정형 {args.docs - regular}) clova={args.clova_latency}s "
+          f"openai={args.openai_latency}s min_confidence={offline['min_confidence']} seed={args.seed}")
+    print(f"rules: 통과 {offline['accepted']}/{args.docs}, 통과 건 8개 필드 정답 {offline['correct']}/"
+          f"{offline['accepted'] - offline['false_accepts']}, 비정형 잘못 통과 {offline['false_accepts']}, "
+          f"추출 {offline['per_doc_us']:.0f}us/doc" + (f", 오답 {offline['wrong']}" if offline["wrong"] else ""))
+    print(f"{'mode':<5} {'LLM calls':>10} {'LLM rate':>9} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8} {'extractor':<20}")
+    for mode, r in results.items():
+        extractors = ",".join(f"{k}:{v}" for k, v in sorted(r["extractors"].items()))
+        print(f"{mode:<5} {r['openai_requests']:>10} {r['openai_requests'] / args.docs:>9.0%} "
+              f"{statistics.median(r['latencies']):>8.0f} {_percentile(r['latencies'], 0.95):>8.0f} "
+              f"{statistics.mean(r['latencies']):>8.0f} {extractors:<20}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+리마인더 스케줄러 벤치마크 (user-002)
+
+미종료 거래 N건(기본 100,000)을 임시 DB에 넣고 비교
+  legacy tick : 기존 60초 폴링 1회 비용 - 전체 Transaction 로딩 + 거래마다 임계값 6개 계산
+  heap build  : 시작 시 1회 - 필요한 컬럼만 조회 + 힙 구성
+  heap update : create/update 훅 1회당 비용 (schedule)
+  heap idle   : 도래한 항목이 없을 때 pop_due 1회 비용
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_scheduler --n 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session, SQLModel, select
+
+from app.dependencies.database import build_engine
+from app.models.transaction_models import Transaction
+from app.services.reminder_queue import ReminderQueue, THRESHOLDS_SECONDS, KST, to_datetime_due
+import app.models.user_models  # noqa: F401
+import app.models.document_models  # noqa: F401
+
+LEGACY_INTERVAL_SECONDS = 60
+
+
+def _seed(engine, n: int):
+    now_kst = datetime.utcnow() + timedelta(hours=9)
+    rows = [
+        {
+            "transaction_user_id": random.randint(1, 1000),
+            "transaction_partner_id": 0,
+            "transaction_title": f"bench-{i}",
+            "transaction_balance": 1000,
+            "transaction_due": now_kst + timedelta(seconds=random.randint(600, 86400)),
+            "transaction_close": False,
+            "transaction_recurring": False,
+            "created_at": now_kst,
+        }
+        for i in range(n)
+    ]
+    with Session(engine) as sess:
+        sess.execute(Transaction.__table__.insert(), rows)
+        sess.commit()
+
+
+def _legacy_tick(engine) -> int:
+    """기존 scheduler_loop 의 1회 tick (리마인더 생성 제외)"""
+    now_kst = datetime.now(KST)
+    hits = 0
+    with Session(engine) as sess:
+        tx_list = sess.exec(select(Transaction).where(Transaction.transaction_close == False)).all()
+        for tx in tx_list:
+            due_dt_kst = to_datetime_due(tx.transaction_due)
+            for seconds in THRESHOLDS_SECONDS:
+                fire_at = due_dt_kst - timedelta(seconds=seconds)
+                delta = (now_kst - fire_at).total_seconds()
+                if 0 <= delta < LEGACY_INTERVAL_SECONDS:
+                    hits += 1
+    return hits
+
+
+def _heap_build(engine, queue: ReminderQueue):
+    queue.begin_rebuild()
+    with Session(engine) as sess:
+        rows = sess.exec(
+            select(
+                Transaction.transaction_id,
+                Transaction.transaction_user_id,
+                Transaction.transaction_title,
+                Transaction.transaction_due,
+            ).where(Transaction.transaction_close == False)
+        ).all()
+    queue.rebuild(rows)
+
+
+def _timeit(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=100_000, help="미종료 거래 수")
+    parser.add_argument("--updates", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'transaction.db')}")
+        SQLModel.metadata.create_all(engine)
+        _seed(engine, args.n)
+
+        legacy = _timeit(lambda: _legacy_tick(engine), 3)
+
+        queue = ReminderQueue()
+        build = _timeit(lambda: _heap_build(engine, queue), 3)
+
+        now_kst = datetime.utcnow() + timedelta(hours=9)
+        ids = random.sample(range(1, args.n + 1), args.updates)
+        t0 = time.perf_counter()
+        for tx_id in ids:
+            queue.schedule(tx_id, 1, "updated", now_kst + timedelta(seconds=random.randint(600, 86400)))
+        update = (time.perf_counter() - t0) / args.updates
+
+        idle = _timeit(queue.pop_due, 10_000)
+        engine.dispose()
+
+    print(f"open transactions = {args.n:,}")
+    print(f"legacy tick (every {LEGACY_INTERVAL_SECONDS}s)      : {legacy * 1000:10.1f} ms  "
+          f"-> {legacy * 1000 * 1440 / 1000:.1f} s CPU/day")
+    print(f"heap build (startup/hourly)  : {build * 1000:10.1f} ms")
+    print(f"heap update (per tx change)  : {update * 1e6:10.2f} us")
+    print(f"heap pop_due (nothing due)   : {idle * 1e6:10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
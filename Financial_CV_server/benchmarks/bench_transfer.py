@@ -0,0 +1,155 @@
+"""
+이체 동시성 스트레스 벤치마크 (user-010)
+
+계좌 K개(기본 4개, 각 1,000,000원)에 스레드 N개가 동시에 무작위 이체를 반복하고, 끝난 뒤 잔액이 맞는지 검증
+  legacy : 기존 방식 - 두 계좌 잔액을 읽어 파이썬에서 더하고 빼고 커밋 (lost update 발생 가능)
+  engine : account_service.transfer_between_accounts - BEGIN IMMEDIATE + 조건부 UPDATE + 원장 기록
+
+검증 항목
+  - 전체 잔액 합이 그대로인지
+  - 계좌별 잔액 == 초기 잔액 + 성공한 이체의 입금 합 - 출금 합 (engine 은 원장 기준)
+  - 음수 잔액이 없는지
+  - engine: 일부 이체를 같은 Idempotency-Key 로 다시 보내도 한 번만 적용되는지
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_transfer --threads 16 --ops 200
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlmodel import Session, SQLModel, select
+
+from app.dependencies.database import build_engine
+from app.models.account_models import Account, AccountTransfer
+from app.services.account_service import get_account_by_number, transfer_between_accounts
+import app.models.user_models  # noqa: F401  (FK 대상 테이블 등록)
+
+INITIAL_BALANCE = 1_000_000
+
+
+def _legacy_transfer(session: Session, from_no: str, to_no: str, amount: int):
+    # 변경 전 transfer_between_accounts 와 같은 read-modify-write
+    from_acc = get_account_by_number(session, from_no)
+    to_acc = get_account_by_number(session, to_no)
+    if amount > from_acc.account_balance:
+        raise HTTPException(status_code=400, detail="Insufficient balance")
+    from_acc.account_balance -= amount
+    to_acc.account_balance += amount
+    from_acc.account_count = (from_acc.account_count or 0) + 1
+    session.add(from_acc)
+    session.add(to_acc)
+    session.commit()
+
+
+def _seed(engine, accounts: int) -> list:
+    numbers = [f"100-{i:04d}" for i in range(accounts)]
+    with Session(engine) as session:
+        for number in numbers:
+            session.add(Account(account_user_id=1, account_number=number, account_bank="bench",
+                                account_balance=INITIAL_BALANCE))
+        session.commit()
+    return numbers
+
+
+def _worker(engine, mode: str, numbers: list, ops: int, seed: int, applied: list, stats: Counter, lock):
+    rnd = random.Random(seed)
+    for _ in range(ops):
+        from_no, to_no = rnd.sample(numbers, 2)
+        amount = rnd.randint(1, 50_000)
+        key = str(uuid.uuid4())
+        # engine 모드는 20% 확률로 같은 키를 한 번 더 보내 클라이언트 재시도를 흉내
+        attempts = 2 if mode == "engine" and rnd.random() < 0.2 else 1
+        for attempt in range(attempts):
+            try:
+                with Session(engine) as session:
+                    if mode == "legacy":
+                        _legacy_transfer(session, from_no, to_no, amount)
+                    else:
+                        transfer_between_accounts(session, from_no, amount, to_no, amount, idempotency_key=key)
+                with lock:
+                    stats["replayed" if attempt else "ok"] += 1
+                    if attempt == 0:
+                        applied.append((from_no, to_no, amount))
+            except HTTPException as e:
+                with lock:
+                    stats[f"http_{e.status_code}"] += 1
+                break
+            except Exception as e:
+                with lock:
+                    stats[type(e).__name__] += 1
+                break
+
+
+def run(mode: str, threads: int, ops: int, accounts: int) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{os.path.join(workdir, 'accounts.db')}")
+        SQLModel.metadata.create_all(engine)
+        numbers = _seed(engine, accounts)
+
+        applied, stats, lock = [], Counter(), threading.Lock()
+        workers = [
+            threading.Thread(target=_worker, args=(engine, mode, numbers, ops, i, applied, stats, lock))
+            for i in range(threads)
+        ]
+        t0 = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - t0
+
+        expected = {number: INITIAL_BALANCE for number in numbers}
+        for from_no, to_no, amount in applied:
+            expected[from_no] -= amount
+            expected[to_no] += amount
+
+        with Session(engine) as session:
+            actual = {a.account_number: a.account_balance for a in session.exec(select(Account)).all()}
+            ledger_rows = session.exec(select(func.count()).select_from(AccountTransfer)).one()
+        engine.dispose()
+
+    mismatched = sum(1 for number in numbers if actual[number] != expected[number])
+    return {
+        "elapsed": elapsed,
+        "stats": dict(stats),
+        "total_ok": sum(actual.values()) == INITIAL_BALANCE * accounts,
+        "mismatched_accounts": mismatched,
+        "negative": sum(1 for v in actual.values() if v < 0),
+        "ledger_rows": ledger_rows,
+        "applied": len(applied),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--accounts", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"threads={args.threads} ops/thread={args.ops} accounts={args.accounts}")
+    for mode in ("legacy", "engine"):
+        r = run(mode, args.threads, args.ops, args.accounts)
+        print(f"\n[{mode}] {r['elapsed']:.2f}s  {r['stats']}")
+        print(f"  total conserved : {r['total_ok']}")
+        print(f"  accounts off    : {r['mismatched_accounts']} / {args.accounts}")
+        print(f"  negative        : {r['negative']}")
+        if mode == "engine":
+            print(f"  ledger rows     : {r['ledger_rows']} (applied transfers {r['applied']})")
+            assert r["total_ok"] and r["mismatched_accounts"] == 0 and r["negative"] == 0
+            assert r["ledger_rows"] == r["applied"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+일괄 이체 처리량 벤치마크 (user-011)
+
+계좌 K개(기본 20개) 사이 이체 N건(기본 50건, 급여/정기 납부처럼 한 번에 예약되는 묶음) 기준 비교
+  loop  : POST /accounts/transfer 를 N회 순차 호출 (건마다 트랜잭션/커밋)
+  batch : POST /accounts/transfer/batch 1회 (계좌 잠금 1회, 커밋 1회)
+두 방식이 끝난 뒤 잔액이 같은지도 확인
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_transfer_batch --legs 50 --rounds 10
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+from sqlmodel import Session, SQLModel, select
+
+from app.dependencies.account_db import get_account_session
+from app.dependencies.database import build_engine
+from app.models.account_models import Account
+from app.routers import account_router
+import app.models.user_models  # noqa: F401  (FK 대상 테이블 등록)
+
+INITIAL_BALANCE = 10_000_000
+
+
+def _make_app(db_path: str, accounts: int):
+    engine = build_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for i in range(accounts):
+            session.add(Account(account_user_id=1, account_number=f"200-{i:04d}", account_bank="bench",
+                                account_balance=INITIAL_BALANCE))
+        session.commit()
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(account_router.router)
+    app.dependency_overrides[get_account_session] = session_override
+    return app, engine
+
+
+def _legs(accounts: int, n: int, seed: int) -> list:
+    rnd = random.Random(seed)
+    numbers = [f"200-{i:04d}" for i in range(accounts)]
+    legs = []
+    for _ in range(n):
+        from_no, to_no = rnd.sample(numbers, 2)
+        legs.append({"from_account_number": from_no, "to_account_number": to_no, "amount": rnd.randint(1, 10_000)})
+    return legs
+
+
+async def _run(mode: str, legs: int, rounds: int, accounts: int) -> tuple:
+    with tempfile.TemporaryDirectory() as workdir:
+        app, engine = _make_app(os.path.join(workdir, "accounts.db"), accounts)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            elapsed = 0.0
+            for r in range(rounds):
+                batch = _legs(accounts, legs, seed=r)
+                t0 = time.perf_counter()
+                if mode == "loop":
+                    for leg in batch:
+                        resp = await client.post("/accounts/transfer", json={
+                            "from_account_number": leg["from_account_number"],
+                            "withdraw_amount": leg["amount"],
+                            "to_account_number": leg["to_account_number"],
+                            "deposit_amount": leg["amount"],
+                        })
+                        resp.raise_for_status()
+                else:
+                    resp = await client.post("/accounts/transfer/batch", json={"transfers": batch})
+                    resp.raise_for_status()
+                elapsed += time.perf_counter() - t0
+
+        with Session(engine) as session:
+            balances = {a.account_number: a.account_balance for a in session.exec(select(Account)).all()}
+        engine.dispose()
+    return elapsed / rounds, balances
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--legs", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--accounts", type=int, default=20)
+    args = parser.parse_args()
+
+    loop_s, loop_balances = asyncio.run(_run("loop", args.legs, args.rounds, args.accounts))
+    batch_s, batch_balances = asyncio.run(_run("batch", args.legs, args.rounds, args.accounts))
+
+    print(f"legs={args.legs} rounds={args.rounds} accounts={args.accounts}")
+    print(f"loop  : {loop_s * 1000:8.1f} ms/batch  ({args.legs / loop_s:8.0f} transfers/s)")
+    print(f"batch : {batch_s * 1000:8.1f} ms/batch  ({args.legs / batch_s:8.0f} transfers/s)  x{loop_s / batch_s:.1f}")
+    print(f"same final balances: {loop_balances == batch_balances}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+첨부 파일 업로드 메모리 벤치마크 (user-016)
+
+50MB 파일 F개(기본 3개)를 한 요청으로 업로드할 때 전체 시간, 서버 프로세스 최대 RSS 증가량, 업로드 중 /ping p95 비교
+  legacy : 기존 방식 - await upload.read() 로 파일 전체를 메모리에 올린 뒤 동기 write + 파일마다 커밋
+  stream : POST /v1/post/{id}/upload - 청크 복사(스레드) + SHA-256 동시 계산 + 커밋 1회
+
+모드마다 새 프로세스에서 실제 HTTP(uvicorn)로 측정 (RSS 는 프로세스 생애 최대값 기준)
+
+실행: (Financial_CV_server 디렉터리에서)
+  python -m benchmarks.bench_upload --size-mb 50 --files 3
+"""
+import argparse
+import hashlib
+import json
+import os
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _make_payload(path: str, size_mb: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            chunk = os.urandom(1024 * 1024)
+            digest.update(chunk)
+            f.write(chunk)
+    return digest.hexdigest()
+
+
+def _worker(mode: str, payload: str, files: int) -> dict:
+    import httpx
+    import uvicorn
+    from fastapi import Depends, FastAPI, File, UploadFile
+    from typing import List
+
+    from app.dependencies.file_db import create_file_db, get_files_session
+    from app.models.file_models import Files
+    from app.routers import file_router
+    from app.dependencies.blob_store import FILE_STORAGE_DIR
+
+    create_file_db()
+    app = FastAPI()
+    app.include_router(file_router.router)
+
+    @app.post("/legacy/{post_id}/upload")
+    async def legacy_upload(post_id: int, files: List[UploadFile] = File(...), file_db=Depends(get_files_session)):
+        # 변경 전 upload_files + FileService.save_file
+        saved = []
+        for upload in files:
+            data = await upload.read()
+            path = os.path.join(FILE_STORAGE_DIR, f"{post_id}_{upload.filename}")
+            with open(path, "wb") as f:
+                f.write(data)
+            model = Files(post_id=post_id, url=path, created_at=int(time.time()))
+            file_db.add(model)
+            file_db.commit()
+            file_db.refresh(model)
+            saved.append(model.dict())
+        return saved
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    path = {"legacy": "/legacy/1/upload", "stream": "/v1/post/1/upload"}[mode]
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    base_url = f"http://127.0.0.1:{port}"
+    ping_lat = []
+    done = threading.Event()
+
+    def pinger():
+        with httpx.Client(base_url=base_url, timeout=60) as client:
+            while not done.is_set():
+                t0 = time.perf_counter()
+                client.get("/ping").raise_for_status()
+                ping_lat.append(time.perf_counter() - t0)
+                time.sleep(0.01)
+
+    baseline_kb = _rss_kb()
+    ping_thread = threading.Thread(target=pinger, daemon=True)
+    ping_thread.start()
+    handles = [open(payload, "rb") for _ in range(files)]
+    try:
+        with httpx.Client(base_url=base_url, timeout=600) as client:
+            t0 = time.perf_counter()
+            # httpx 는 파일 객체를 청크 단위로 읽어 보냄 (클라이언트 쪽 메모리는 거의 늘지 않음)
+            r = client.post(path, files=[("files", (f"receipt{i}.bin", h, "application/octet-stream"))
+                                         for i, h in enumerate(handles)])
+            r.raise_for_status()
+            total = time.perf_counter() - t0
+    finally:
+        for h in handles:
+            h.close()
+    done.set()
+    ping_thread.join(timeout=5)
+
+    server.should_exit = True
+    thread.join(timeout=5)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    hashes = [row.get("sha256") for row in r.json()]
+    return {
+        "total": total,
+        "peak_delta_mb": (peak_kb - baseline_kb) / 1024,
+        "ping_p95": statistics.quantiles(ping_lat, n=20)[-1] * 1000 if len(ping_lat) >= 2 else 0.0,
+        "sha256": hashes[0] if hashes else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--files", type=int, default=3)
+    parser.add_argument("--worker", choices=["legacy", "stream"], help=argparse.SUPPRESS)
+    parser.add_argument("--payload", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.payload, args.files)))
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        payload = os.path.join(workdir, "payload.bin")
+        expected = _make_payload(payload, args.size_mb)
+        print(f"files={args.files} x {args.size_mb}MB")
+
+        results = {}
+        for mode in ("legacy", "stream"):
+            storage = os.path.join(workdir, f"files-{mode}")
+            os.makedirs(storage)
+            env = dict(
+                os.environ, DB_SINGLE_FILE="true", DATABASE_URL=f"sqlite:///{os.path.join(workdir, mode + '.db')}",
+                FILE_STORAGE_DIR=storage,
+                UPLOAD_MAX_FILE_MB=str(args.size_mb + 1), UPLOAD_MAX_TOTAL_MB=str((args.size_mb + 1) * args.files),
+            )
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_upload", "--worker", mode,
+                 "--payload", payload, "--files", str(args.files)],
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                env=env, capture_output=True, text=True, check=True,
+            )
+            results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    print(f"{'mode':<7} {'total(s)':>9} {'peak RSS +MB':>13} {'/ping p95(ms)':>14}")
+    for mode, r in results.items():
+        print(f"{mode:<7} {r['total']:>9.2f} {r['peak_delta_mb']:>13.1f} {r['ping_p95']:>14.1f}")
+    print(f"stream sha256 matches payload: {results['stream']['sha256'] == expected}")
+
+
+if __name__ == "__main__":
+    main()
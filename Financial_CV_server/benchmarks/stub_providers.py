@@ -0,0 +1,185 @@
+"""
+CLOVA OCR / OpenAI Responses API 대역 로컬 스텁 서버 (벤치마크 전용)
+
+- POST /clova         : CLOVA General OCR 응답 형식 (images[].fields[].inferText)
+- POST /v1/responses  : OpenAI Responses API 응답 형식 (output[0].content[].output_text)
+- 지연(latency)과 오류율을 인자로 조절해서 꼬리 지연/장애 상황 재현
+- 측정 대상과 GIL 을 나눠 쓰지 않도록 별도 프로세스에서 실행
+- GET /stats : 경로별 받은 요청 수/본문 바이트 (업로드 바이트 비교용)
+- POST /faults {"provider": "clova", "error_rate": 1.0, "slow_rate": ..., "slow_latency": ..., "latency": ...}
+  : 실행 중 provider 별 장애 주입 (빈 값 {} 이면 해제), seed 를 주면 같은 순서로 같은 장애 재현
+- POST /clova/texts {"texts": [["줄1", "줄2"], ...]} : 이후 CLOVA 요청마다 앞에서 하나씩 OCR 결과로 사용
+  (비면 SAMPLE_OCR_LINES, 문서 코퍼스 재생용 → 요청은 순서대로 보내야 함)
+
+사용:
+    with run_stub_server(clova_latency=0.2, openai_latency=0.3) as base_url:
+        os.environ["CLOVA_OCR_URL"] = f"{base_url}/clova"
+        os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+"""
+import asyncio
+import collections
+import multiprocessing
+import random
+import socket
+import time
+import uuid
+from contextlib import contextmanager
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+SAMPLE_OCR_LINES = [
+    "이체확인증",
+    "출금계좌 국민은행 123-456-789012",
+    "입금계좌 신한은행 110-222-333444",
+    "받는분 홍길동",
+    "이체금액 150,000원",
+    "이체일자 2025-03-14",
+]
+
+SAMPLE_KV_TEXT = "\n".join([
+    "서류 종류 : 이체 및 송금 전표",
+    "제목 : 이체확인증",
+    "거래금액 : 150000",
+    "거래대상 : 홍길동",
+    "계좌 은행 : 국민은행",
+    "계좌번호 : 123-456-789012",
+    "거래대상 계좌번호 : 110-222-333444",
+    "지불기일 : 2025-03-14",
+])
+
+
+class StubConfig:
+    def __init__(self, clova_latency: float = 0.2, openai_latency: float = 0.3,
+                 error_rate: float = 0.0, slow_rate: float = 0.0, slow_latency: float = 3.0,
+                 upload_mbps: float = 0.0, seed: int | None = None):
+        self.clova_latency = clova_latency
+        self.openai_latency = openai_latency
+        self.error_rate = error_rate      # 이 확률로 503 응답
+        self.slow_rate = slow_rate        # 이 확률로 slow_latency 만큼 지연 (꼬리 지연 재현)
+        self.slow_latency = slow_latency
+        self.upload_mbps = upload_mbps    # > 0 이면 요청 본문 크기 / 업링크 속도만큼 추가 지연 (모바일 업로드 재현)
+        self.seed = seed                  # 장애/지연 난수 시드 (꼬리 지연 재현)
+
+
+def create_stub_app(config: StubConfig) -> FastAPI:
+    app = FastAPI()
+    received = {"clova": {"requests": 0, "bytes": 0}, "openai": {"requests": 0, "bytes": 0}}
+    faults = {"clova": {}, "openai": {}}   # provider 별 config 덮어쓰기 (POST /faults)
+    rng = random.Random(config.seed)
+    clova_texts = collections.deque()      # POST /clova/texts 로 넣은 OCR 결과 (요청마다 1개씩 소비)
+
+    def _setting(provider: str, key: str, default):
+        return faults[provider].get(key, default)
+
+    async def _delay(provider: str, base: float):
+        slow_rate = _setting(provider, "slow_rate", config.slow_rate)
+        if slow_rate and rng.random() < slow_rate:
+            await asyncio.sleep(_setting(provider, "slow_latency", config.slow_latency))
+        else:
+            await asyncio.sleep(_setting(provider, "latency", base))
+
+    async def _upload(provider: str, size: int):
+        received[provider]["requests"] += 1
+        received[provider]["bytes"] += size
+        if config.upload_mbps > 0:
+            await asyncio.sleep(size * 8 / (config.upload_mbps * 1e6))
+
+    def _fail(provider: str) -> bool:
+        error_rate = _setting(provider, "error_rate", config.error_rate)
+        return bool(error_rate) and rng.random() < error_rate
+
+    @app.post("/clova")
+    async def clova(request: Request):
+        await _upload("clova", len(await request.body()))
+        await _delay("clova", config.clova_latency)
+        if _fail("clova"):
+            return JSONResponse({"message": "stub failure"}, status_code=503)
+        return {
+            "version": "V2",
+            "requestId": str(uuid.uuid4()),
+            "timestamp": int(time.time() * 1000),
+            "images": [{
+                "name": "preview",
+                "inferResult": "SUCCESS",
+                "fields": [{"inferText": line} for line in (clova_texts.popleft() if clova_texts else SAMPLE_OCR_LINES)],
+            }],
+        }
+
+    @app.post("/v1/responses")
+    async def responses(request: Request):
+        await _upload("openai", len(await request.body()))
+        body = await request.json()
+        await _delay("openai", config.openai_latency)
+        if _fail("openai"):
+            return JSONResponse({"error": {"message": "stub failure"}}, status_code=503)
+        return {
+            "id": f"resp_{uuid.uuid4().hex}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "status": "completed",
+            "model": body.get("model", "gpt-4o-mini"),
+            "output": [{
+                "type": "message",
+                "id": f"msg_{uuid.uuid4().hex}",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": SAMPLE_KV_TEXT, "annotations": []}],
+            }],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+        }
+
+    @app.post("/clova/texts")
+    async def set_clova_texts(request: Request):
+        body = await request.json()
+        clova_texts.clear()
+        clova_texts.extend(body.get("texts", []))
+        return {"queued": len(clova_texts)}
+
+    @app.get("/stats")
+    async def stats():
+        return received
+
+    @app.post("/faults")
+    async def set_faults(request: Request):
+        body = await request.json()
+        provider = body.pop("provider")
+        faults[provider] = body
+        return faults
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _serve(config: StubConfig, port: int):
+    uvicorn.run(create_stub_app(config), host="127.0.0.1", port=port,
+                log_level="warning", backlog=4096)
+
+
+@contextmanager
+def run_stub_server(config: StubConfig | None = None, **kwargs):
+    """별도 프로세스에서 스텁 서버 실행 후 base URL 반환"""
+    config = config or StubConfig(**kwargs)
+    port = _free_port()
+    proc = multiprocessing.Process(target=_serve, args=(config, port), daemon=True)
+    proc.start()
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                break
+        except OSError:
+            time.sleep(0.05)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        proc.terminate()
+        proc.join(timeout=5)
@@ -1,8 +1,5 @@
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
-import json
-from datetime import datetime, date
 import logging
 import os
 import tempfile
@@ -19,23 +16,25 @@ from app.dependencies.document_db import create_document_db
 from app.dependencies.account_db import create_account_db
 from app.dependencies.transaction_db import create_transaction_db
 from app.dependencies.reminder_db import create_reminder_db
+from app.dependencies.ocr_job_db import create_ocr_job_db
+from app.dependencies.database import dispose_engines
+from app.dependencies.http_clients import close_http_clients
+from app.dependencies.password_hasher import close_password_hasher, start_password_hasher
+from app.dependencies.local_ocr import close_local_ocr, start_local_ocr
+from app.dependencies.redis_db import close_redis, redis_health
+from app.dependencies.json_encoding import dumps
 
 from app.routers import file_router, user_router, document_router, account_router, llm_ocr_router, transaction_router, reminder_router
 # from app.dependencies import tts as tts_router
 
 from app.services.scheduler_service import start_scheduler_thread, stop_scheduler_thread
+from app.services.ocr_job_service import fail_interrupted_jobs, ocr_job_queue
 
 
 class CustomJSONResponse(JSONResponse):
     def render(self, content) -> bytes:
-        encoded = jsonable_encoder(
-            content,
-            custom_encoder={
-                datetime: lambda v: v.strftime("%Y-%m-%d/%H:%M:%S"),
-                date: lambda v: v.strftime("%Y-%m-%d"),
-            },
-        )
-        return json.dumps(encoded, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        # 중간 dict 트리 없이 바로 직렬화 (날짜 형식/한글 처리는 json_encoding 참고)
+        return dumps(content)
 
 
 # Reduce noisy per-request access logs (e.g., /health checks every second)
@@ -52,6 +51,8 @@ async def lifespan(app: FastAPI):
     create_account_db()
     create_transaction_db()
     create_reminder_db()
+    create_ocr_job_db()
+    fail_interrupted_jobs()
 
     # from app.dependencies.MeloTTS.melo.api import TTS  
     # device =  "cpu"
@@ -60,11 +61,20 @@ async def lifespan(app: FastAPI):
     # app.state.speakers = tts_model.hps.data.spk2id
     # print(f"[TTS] 모델 로드 완료 (device={device}, speakers={list(app.state.speakers.keys())})")
     
+    start_password_hasher()
+    start_local_ocr()
     thread = start_scheduler_thread()
+    await ocr_job_queue.start()
     try:
         yield
     finally:
+        await ocr_job_queue.stop()
         stop_scheduler_thread()
+        await close_http_clients()
+        close_password_hasher()
+        close_local_ocr()
+        await close_redis()
+        dispose_engines()
 
 app = FastAPI(
     title="Financial CV Server",
@@ -112,6 +122,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 목록 API 다음 페이지 커서
 )
 
 # 임시/헬스체크
@@ -122,3 +133,8 @@ def hello():
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+@app.get("/health/redis")
+def health_redis():
+    # PING 지연, 명령/파이프라인 수, 오류 수, 커넥션 풀 사용량
+    return redis_health()